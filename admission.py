@@ -0,0 +1,127 @@
+# admission.py
+"""Admission control primitives: per-user token buckets and priority-aware concurrency limits"""
+import sqlite3
+import threading
+import time
+
+
+class TokenBucketStore:
+    """Pluggable storage for per-key token buckets.
+
+    take() refills a key's bucket at `rate` tokens per second up to `burst`,
+    then spends one token. It returns 0 when the request is admitted, or the
+    seconds until a token will be available when it is not.
+    """
+
+    def take(self, key, rate, burst, now=None):
+        raise NotImplementedError
+
+    def sweep(self, now=None):
+        """Forget buckets idle long enough to be full again, returning how many were removed"""
+        raise NotImplementedError
+
+    @staticmethod
+    def _refill(tokens, updated, rate, burst, now):
+        tokens = min(burst, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            return tokens - 1, 0.0
+        return tokens, (1 - tokens) / rate
+
+
+class MemoryTokenBucketStore(TokenBucketStore):
+    """Buckets held in this process; each worker process limits independently"""
+
+    def __init__(self, idle_seconds=600):
+        self.idle_seconds = idle_seconds
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens, wait = self._refill(tokens, updated, rate, burst, now)
+            self._buckets[key] = (tokens, now)
+        return wait
+
+    def sweep(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            before = len(self._buckets)
+            self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < self.idle_seconds}
+            return before - len(self._buckets)
+
+
+class SQLiteTokenBucketStore(TokenBucketStore):
+    """Buckets in a local SQLite file (WAL mode), shared by every worker process on the host"""
+
+    def __init__(self, path, idle_seconds=600):
+        self.path = path
+        self.idle_seconds = idle_seconds
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_buckets (
+                    bucket_key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL
+                )
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=1, isolation_level=None)
+
+    def take(self, key, rate, burst, now=None):
+        # Wall-clock time, since buckets are shared between processes
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT tokens, updated FROM token_buckets WHERE bucket_key=?", (key,)).fetchone()
+            tokens, wait = self._refill(*(row or (burst, now)), rate, burst, now)
+            conn.execute("INSERT OR REPLACE INTO token_buckets (bucket_key, tokens, updated) VALUES (?, ?, ?)",
+                         (key, tokens, now))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return wait
+
+    def sweep(self, now=None):
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM token_buckets WHERE updated < ?",
+                                (now - self.idle_seconds,)).rowcount
+
+
+def create_bucket_store(backend, sqlite_path):
+    """Build the configured TokenBucketStore ('memory' or 'sqlite')"""
+    if backend == 'sqlite':
+        return SQLiteTokenBucketStore(sqlite_path)
+    return MemoryTokenBucketStore()
+
+
+class ConcurrencyLimiter:
+    """Non-blocking cap on requests in flight, with slots reserved for the priority lane.
+
+    Normal requests may use `limit - reserved` slots; priority requests may use
+    all of them, so a surge of normal traffic can never starve the priority lane.
+    """
+
+    def __init__(self, limit, reserved=0):
+        self.limit = limit
+        self.reserved = min(reserved, limit)
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, priority=False):
+        with self._lock:
+            if self.in_use >= (self.limit if priority else self.limit - self.reserved):
+                return False
+            self.in_use += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self.in_use -= 1
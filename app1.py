@@ -1,16 +1,51 @@
 # app.py
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_from_directory
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_from_directory, g, Response, has_request_context, stream_with_context
 import mysql.connector
+import atexit
+import click
+import csv
+import decimal
+import json
+import math
+import mimetypes
+import multiprocessing
 import os
+import queue
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from werkzeug.utils import secure_filename
-from werkzeug.security import check_password_hash
-from flask_mail import Mail
-from datetime import datetime
+from werkzeug.security import check_password_hash, generate_password_hash
+from flask.cli import AppGroup
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+from werkzeug.middleware.proxy_fix import ProxyFix
+from flask_mail import Mail, Message
+from datetime import date, datetime, timedelta
 from pdfminer.high_level import extract_text as extract_text_from_pdf
 from docx import Document as DocxDocument
 from pyresparser import ResumeParser
 import nltk
 
+from admission import ConcurrencyLimiter, create_bucket_store
+import asset_pipeline
+import audit_log
+import db_layer
+import interview_scheduler
+from json_provider import FastJSONProvider, iter_cursor_rows, stream_json_array
+import resume_fingerprint
+from resume_parser import PARSER_VERSION, parse_text_chunk, simple_text_parsing
+from replica_router import ReplicaRouter
+from search_index import SearchIndex
+from session_store import create_session_store
+import tenants
+
 # Download required NLTK data
 nltk.download('stopwords', quiet=True)
 nltk.download('punkt', quiet=True)
@@ -18,34 +53,838 @@ nltk.download('punkt', quiet=True)
 # ==================== APP CONFIGURATION ====================
 app = Flask(__name__)
 app.secret_key = "secret_key"
+app.json = FastJSONProvider(app)   # orjson when installed; dates as ISO 8601, Decimals as strings
 UPLOAD_FOLDER = 'static/uploads'
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
-# Flask-Mail Configuration
+# Flask-Mail Configuration (MAIL_SERVER=localhost MAIL_PORT=1025 MAIL_USE_TLS=0 targets a local aiosmtpd)
 app.config.update(
-    MAIL_SERVER='smtp.gmail.com',
-    MAIL_PORT=587,
-    MAIL_USE_TLS=True,
-    MAIL_USERNAME='your_sending_email@gmail.com',
-    MAIL_PASSWORD='your_email_app_password',
+    MAIL_SERVER=os.environ.get('MAIL_SERVER', 'smtp.gmail.com'),
+    MAIL_PORT=int(os.environ.get('MAIL_PORT', 587)),
+    MAIL_USE_TLS=os.environ.get('MAIL_USE_TLS', '1') == '1',
+    MAIL_USERNAME=os.environ.get('MAIL_USERNAME', 'your_sending_email@gmail.com'),
+    MAIL_PASSWORD=os.environ.get('MAIL_PASSWORD', 'your_email_app_password'),
     MAIL_DEFAULT_SENDER='your_sending_email@gmail.com'
 )
 mail = Mail(app)
 
+# Notification outbox sender
+app.config.update(
+    NOTIFICATIONS_ENABLED=os.environ.get('NOTIFICATIONS_ENABLED', '1') == '1',
+    MAIL_SEND_INTERVAL=60,          # seconds between outbox flushes
+    MAIL_RATE_PER_MINUTE=int(os.environ.get('MAIL_RATE_PER_MINUTE', 30)),
+    MAIL_MAX_ATTEMPTS=5,
+    EVENT_REMINDER_DAYS=1,
+    DEADLINE_REMINDER_DAYS=2
+)
+
+# Server-side sessions: the cookie only carries an opaque session id
+app.config.update(
+    SESSION_BACKEND=os.environ.get('SESSION_BACKEND', 'sqlite'),   # 'sqlite' or 'mysql'
+    SESSION_SQLITE_PATH='sessions.sqlite3',
+    SESSION_IDLE_TIMEOUT=timedelta(hours=12),
+    SESSION_SWEEP_INTERVAL=600
+)
+
+# Admission control: shed load with fast 429s instead of queueing until timeouts.
+# Concurrency limits are per worker process; token buckets are shared when the backend is 'sqlite'.
+app.config.update(
+    ADMISSION_ENABLED=os.environ.get('ADMISSION_ENABLED', '1') == '1',
+    ADMISSION_BUCKET_BACKEND=os.environ.get('ADMISSION_BUCKET_BACKEND', 'memory'),   # 'memory' or 'sqlite'
+    ADMISSION_BUCKET_PATH='rate_limits.sqlite3',
+    ADMISSION_MAX_CONCURRENT=int(os.environ.get('ADMISSION_MAX_CONCURRENT', 48)),
+    ADMISSION_PRIORITY_RESERVED=8,     # of ADMISSION_MAX_CONCURRENT, usable only by the priority lane
+    ADMISSION_PRIORITY_ROLES=('tpo', 'recruiter'),
+    ADMISSION_ROUTE_LIMITS={           # max requests in flight per route
+        '/student_jobs': 16,
+        '/apply_job': 8,
+        '/dashboard_bootstrap': 16,
+        '/search': 8,
+        '/similar_jobs': 4
+    },
+    ADMISSION_RATE_LIMITS={            # role -> (requests per second, burst); 'anonymous' is keyed by IP
+        'student': (2.0, 20),
+        'recruiter': (5.0, 40),
+        'tpo': (10.0, 80),
+        'anonymous': (1.0, 10),
+        'login': (5.0, 50)             # anonymous /login, per IP: a campus NAT logs many students in at once
+    },
+    ADMISSION_EXEMPT_ENDPOINTS=('static', 'serve_asset', 'metrics', 'favicon', 'rum'),
+    ADMISSION_RETRY_AFTER=2,           # seconds suggested when a concurrency limit is full
+    ADMISSION_SWEEP_INTERVAL=600
+)
+
+# Reverse proxies in front of the app. With PROXY_HOPS set, the client address and scheme come from the
+# X-Forwarded-For/-Proto entries those proxies append, so rate limits and audit entries see the real
+# client instead of the proxy. Leave it 0 when clients connect directly, or they could forge the headers.
+app.config['PROXY_HOPS'] = int(os.environ.get('PROXY_HOPS', 0))
+if app.config['PROXY_HOPS']:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_HOPS'], x_proto=app.config['PROXY_HOPS'])
+
+# Dashboard render timings reported by browsers to /rum (logged-in users only)
+app.config.update(
+    RUM_RATE_LIMIT=(0.2, 5),           # (beacons per second, burst) per user
+    RUM_MAX_SECONDS=60                 # longer reported timings are recorded as this
+)
+
+# Local SQLite FTS5 index for job and resource search
+app.config['SEARCH_INDEX_PATH'] = os.environ.get('SEARCH_INDEX_PATH', 'search_index.sqlite3')
+
+# Semantic resume/job matching; needs numpy, hnswlib and sentence-transformers
+app.config.update(
+    SEMANTIC_INDEX_ENABLED=os.environ.get('SEMANTIC_INDEX_ENABLED', '1') == '1',
+    SEMANTIC_INDEX_DIR='vector_index',
+    SEMANTIC_MODEL='sentence-transformers/all-MiniLM-L6-v2',
+    SEMANTIC_DIM=384,
+    SEMANTIC_BATCH_SIZE=32
+)
+
+# Read replicas (db_layer.DB_REPLICA_CONFIGS): lag-aware routing for @read_only views
+app.config.update(
+    DB_REPLICA_MAX_LAG=float(os.environ.get('DB_REPLICA_MAX_LAG', 2)),      # seconds
+    DB_REPLICA_CHECK_INTERVAL=5,
+    DB_STICKY_PRIMARY_SECONDS=float(os.environ.get('DB_STICKY_PRIMARY_SECONDS', 5)),
+    DB_POOL_SIZE=int(os.environ.get('DB_POOL_SIZE', 5))     # per tenant and worker, at most 32; 0 disables pooling
+)
+
+# Log SQL statements slower than this many milliseconds (None disables the slow-query log)
+app.config['SLOW_QUERY_MS'] = float(os.environ['SLOW_QUERY_MS']) if os.environ.get('SLOW_QUERY_MS') else None
+
+# /metrics needs "Authorization: Bearer <METRICS_TOKEN>"; without a token it is disabled. Loopback is not
+# trusted instead, because behind a reverse proxy on the same host every request arrives from loopback.
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+
+# Request profiling (see REQUEST PROFILING section); disabled unless a rate, route or header opts in
+app.config.update(
+    PROFILE_DIR='profiles',
+    PROFILE_SAMPLE_RATE=float(os.environ.get('PROFILE_SAMPLE_RATE', 0.0)),
+    PROFILE_ROUTE_RATES={},            # e.g. {'/student_jobs': 0.1} overrides the global rate per route
+    PROFILE_HEADER='X-Profile-Request',
+    PROFILE_HEADER_TOKEN=os.environ.get('PROFILE_HEADER_TOKEN'),
+    PROFILE_THRESHOLD_MS=float(os.environ.get('PROFILE_THRESHOLD_MS', 500)),
+    PROFILE_INTERVAL_MS=5,
+    PROFILE_MAX_FILES=200
+)
+
+# ==================== PERFORMANCE INSTRUMENTATION ====================
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Metrics:
+    """Thread-safe in-process metrics registry rendered in Prometheus text format"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._meta = {}
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+    def describe(self, name, metric_type, help_text):
+        self._meta[name] = (metric_type, help_text)
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def add_gauge(self, name, delta, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + delta
+
+    def set_gauge(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist[0][i] += 1
+            hist[1] += value
+            hist[2] += 1
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def _labels(pairs):
+        if not pairs:
+            return ""
+        escaped = []
+        for k, v in pairs:
+            v = str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            escaped.append(f'{k}="{v}"')
+        return "{" + ",".join(escaped) + "}"
+
+    def render(self):
+        """Render every metric in the Prometheus text exposition format"""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {k: (list(v[0]), v[1], v[2]) for k, v in self._histograms.items()}
+
+        lines = []
+        for name, (metric_type, help_text) in sorted(self._meta.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if metric_type == "histogram":
+                for (metric, pairs), (counts, total, count) in sorted(histograms.items()):
+                    if metric != name:
+                        continue
+                    for bound, bucket_count in zip(self.buckets, counts):
+                        lines.append(f"{name}_bucket{self._labels(pairs + (('le', bound),))} {bucket_count}")
+                    lines.append(f"{name}_bucket{self._labels(pairs + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{name}_sum{self._labels(pairs)} {total}")
+                    lines.append(f"{name}_count{self._labels(pairs)} {count}")
+            else:
+                source = counters if metric_type == "counter" else gauges
+                for (metric, pairs), value in sorted(source.items()):
+                    if metric == name:
+                        lines.append(f"{name}{self._labels(pairs)} {value}")
+        return "\n".join(lines) + "\n"
+
+METRICS = Metrics()
+METRICS.describe('erp_http_request_duration_seconds', 'histogram', 'Latency of HTTP requests by route.')
+METRICS.describe('erp_http_requests_in_flight', 'gauge', 'HTTP requests currently being served.')
+METRICS.describe('erp_sql_query_duration_seconds', 'histogram', 'Latency of SQL statements.')
+METRICS.describe('erp_sql_rows_total', 'counter', 'Rows fetched or affected by SQL statements.')
+METRICS.describe('erp_sql_slow_queries_total', 'counter', 'SQL statements slower than SLOW_QUERY_MS.')
+METRICS.describe('erp_resume_parse_stage_seconds', 'histogram', 'Time spent in each resume parsing stage.')
+METRICS.describe('erp_section_duration_seconds', 'histogram', 'Time spent in named sections of request handlers.')
+METRICS.describe('erp_client_render_seconds', 'histogram', 'Dashboard time-to-first-render reported by browsers.')
+
+SQL_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|%\(\w+\)s|%s|\b\d+(?:\.\d+)?\b")
+SQL_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+SQL_ROWS_RE = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+MAX_STATEMENT_LABELS = 500
+_statement_labels = set()
+_statement_labels_lock = threading.Lock()
+
+def normalize_statement(operation):
+    """Collapse a SQL statement into a short metric label with bounded cardinality.
+
+    Literals and placeholders become ?, and placeholder lists and multi-row
+    VALUES become a single (?), so `IN (%s, %s)` and `IN (1, 2, 3)` share a
+    label. Past MAX_STATEMENT_LABELS distinct labels, new shapes are reported
+    as "other" rather than growing the series count without limit.
+    """
+    if isinstance(operation, bytes):
+        operation = operation.decode('utf-8', 'replace')
+    statement = SQL_LITERAL_RE.sub('?', re.sub(r'\s+', ' ', operation).strip())
+    statement = SQL_ROWS_RE.sub('(?)', SQL_LIST_RE.sub('(?)', statement))[:120]
+    if statement in _statement_labels:
+        return statement
+    with _statement_labels_lock:
+        if len(_statement_labels) >= MAX_STATEMENT_LABELS:
+            return "other"
+        _statement_labels.add(statement)
+    return statement
+
+def record_query(statement, elapsed):
+    """Record timing of one SQL statement and feed the slow-query log"""
+    METRICS.observe('erp_sql_query_duration_seconds', elapsed, statement=statement)
+    threshold = app.config.get('SLOW_QUERY_MS')
+    if threshold is not None and elapsed * 1000 >= threshold:
+        METRICS.inc('erp_sql_slow_queries_total', statement=statement)
+        app.logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {statement}")
+    if has_request_context() and g.get('profiler') is not None:
+        g.sql_timings.append({"statement": statement, "ms": round(elapsed * 1000, 3)})
+
+class InstrumentedCursor:
+    """Cursor wrapper that times each statement and counts returned/affected rows"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._statement = None
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._statement = normalize_statement(operation)
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            record_query(self._statement, time.perf_counter() - start)
+            if not getattr(self._cursor, 'with_rows', False) and self._cursor.rowcount > 0:
+                METRICS.inc('erp_sql_rows_total', self._cursor.rowcount, statement=self._statement)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        self._statement = normalize_statement(operation)
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            record_query(self._statement, time.perf_counter() - start)
+            if self._cursor.rowcount > 0:
+                METRICS.inc('erp_sql_rows_total', self._cursor.rowcount, statement=self._statement)
+
+    def _count_rows(self, rows):
+        if rows and self._statement:
+            METRICS.inc('erp_sql_rows_total', rows, statement=self._statement)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        self._count_rows(1 if row is not None else 0)
+        return row
+
+    def fetchmany(self, size=1):
+        rows = self._cursor.fetchmany(size)
+        self._count_rows(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count_rows(len(rows))
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+class InstrumentedConnection:
+    """Connection wrapper whose cursors are InstrumentedCursor instances"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs))
+
+    def commit(self):
+        self._conn.commit()
+        if has_request_context():
+            g.db_committed = True
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    g.request_observed = False
+    METRICS.add_gauge('erp_http_requests_in_flight', 1)
+
+@app.after_request
+def record_request_metrics(response):
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    METRICS.observe('erp_http_request_duration_seconds', time.perf_counter() - g.request_started,
+                    route=route, method=request.method, status=response.status_code)
+    g.request_observed = True
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    if 'request_started' not in g:
+        return
+    if not g.get('request_observed'):
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        METRICS.observe('erp_http_request_duration_seconds', time.perf_counter() - g.request_started,
+                        route=route, method=request.method, status=500)
+    METRICS.add_gauge('erp_http_requests_in_flight', -1)
+
+# ==================== REQUEST PROFILING ====================
+class StackSampler:
+    """Statistical profiler that samples one thread's stack on a background thread"""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.samples.append(stack)
+
+    def to_speedscope(self, name, duration, metadata):
+        """Convert the collected samples into a speedscope 'sampled' profile document"""
+        frame_index = {}
+        frames = []
+        samples = []
+        for stack in self.samples:
+            indices = []
+            for key in stack:
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                indices.append(frame_index[key])
+            samples.append(indices)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "placement-erp",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": duration,
+                "samples": samples,
+                "weights": [self.interval] * len(samples)
+            }],
+            "metadata": metadata
+        }
+
+def should_profile_request():
+    """Decide cheaply whether this request is profiled (header opt-in, per-route or global rate)"""
+    token = app.config.get('PROFILE_HEADER_TOKEN')
+    if token and request.headers.get(app.config['PROFILE_HEADER']) == token:
+        return True
+    rule = request.url_rule.rule if request.url_rule else None
+    rate = app.config['PROFILE_ROUTE_RATES'].get(rule, app.config['PROFILE_SAMPLE_RATE'])
+    return rate > 0 and random.random() < rate
+
+def save_profile(sampler, duration, status):
+    """Write a speedscope file for a slow request and prune the oldest captures"""
+    route = request.url_rule.rule if request.url_rule else request.path
+    metadata = {
+        "route": route,
+        "method": request.method,
+        "status": status,
+        "role": session.get("role"),
+        "tenant": getattr(tenants.current(), "slug", None),
+        "duration_ms": round(duration * 1000, 3),
+        "captured_at": datetime.now().isoformat(timespec="seconds"),
+        "sql": g.sql_timings
+    }
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or 'root'
+    filename = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}_{slug}.speedscope.json"
+    profile_dir = app.config['PROFILE_DIR']
+    os.makedirs(profile_dir, exist_ok=True)
+    with open(os.path.join(profile_dir, filename), 'w') as fh:
+        json.dump(sampler.to_speedscope(f"{request.method} {route}", duration, metadata), fh)
+
+    captures = sorted(f for f in os.listdir(profile_dir) if f.endswith('.speedscope.json'))
+    for old in captures[:-app.config['PROFILE_MAX_FILES']]:
+        os.remove(os.path.join(profile_dir, old))
+
+@app.before_request
+def start_request_profiler():
+    g.profiler = None
+    if not should_profile_request():
+        return
+    g.sql_timings = []
+    g.profiler = StackSampler(threading.get_ident(), app.config['PROFILE_INTERVAL_MS'] / 1000.0)
+    g.profiler.start()
+
+@app.after_request
+def finish_request_profiler(response):
+    sampler = g.get('profiler')
+    if sampler is None:
+        return response
+    g.profiler = None
+    sampler.stop()
+    duration = time.perf_counter() - g.request_started
+    if duration * 1000 >= app.config['PROFILE_THRESHOLD_MS']:
+        try:
+            save_profile(sampler, duration, response.status_code)
+        except OSError as e:
+            app.logger.error(f"Error saving request profile: {e}")
+    return response
+
+@app.teardown_request
+def stop_request_profiler(exc):
+    sampler = g.get('profiler')
+    if sampler is not None:
+        g.profiler = None
+        sampler.stop()
+
+# ==================== TENANCY ====================
+# Each college is a tenant with its own database and local files (see tenants.py).
+# The Host header picks the tenant for a request; background jobs and CLI commands
+# loop over TENANTS and select each one with tenants.use().
+TENANTS = tenants.TenantRegistry.load(os.environ.get('TENANTS_FILE', 'tenants.json'), db_layer.DB_CONFIG)
+# Sessions are keyed by random ids, so one store serves every tenant
+SESSION_TENANT = TENANTS.default or next(iter(TENANTS))
+
+METRICS.describe('erp_tenant_requests_total', 'counter', 'Requests served by tenant.')
+
+def current_tenant():
+    tenant = tenants.current()
+    if tenant is None:
+        raise RuntimeError("no tenant selected; wrap background work in tenants.use()")
+    return tenant
+
+def upload_folder():
+    return current_tenant().path(app.config['UPLOAD_FOLDER'])
+
+def in_each_tenant(job):
+    """job wrapped to run once per tenant, for startup and periodic background work"""
+    def run():
+        for tenant in TENANTS:
+            with tenants.use(tenant):
+                job()
+    return run
+
+@app.before_request
+def resolve_tenant():
+    tenant = TENANTS.resolve(request.host)
+    if tenant is None:
+        return jsonify({"error": "Unknown college"}), 404
+    g.tenant_token = tenants.enter(tenant)
+    # A session belongs to the tenant it logged in to
+    if session.get("user_id") and session.get("tenant", SESSION_TENANT.slug) != tenant.slug:
+        session.clear()
+    METRICS.inc('erp_tenant_requests_total', tenant=tenant.slug)
+
+@app.teardown_request
+def release_tenant(exc):
+    token = g.pop('tenant_token', None)
+    if token is not None:
+        tenants.leave(token)
+
 # ==================== DATABASE CONNECTION ====================
-def get_db_connection():
-    return mysql.connector.connect(
-        host="localhost",
-        user="BBBB",
-        password="XXXXX",
-        database="placement_erp"
-    )
+# Views marked @read_only read from a healthy replica; everything else, and any
+# logged-in session that committed a write within DB_STICKY_PRIMARY_SECONDS, uses
+# the primary so users always see their own writes. Replicas serve the tenants that live on the primary
+# server; primary connections come from a per-tenant pool of DB_POOL_SIZE.
+REPLICA_ROUTER = ReplicaRouter(db_layer.DB_REPLICA_CONFIGS, mysql.connector.connect,
+                               app.config['DB_REPLICA_MAX_LAG'], logger=app.logger)
+DB_POOLS = tenants.ConnectionPools(app.config['DB_POOL_SIZE'], mysql.connector.connect)
+
+METRICS.describe('erp_db_connections_total', 'counter', 'Database connections opened by target.')
+METRICS.describe('erp_db_replica_lag_seconds', 'gauge', 'Replication lag at the last health check.')
+METRICS.describe('erp_db_replica_healthy', 'gauge', '1 if the replica is in the read rotation.')
+METRICS.describe('erp_db_pool_overflow_total', 'counter', 'Connections opened outside an exhausted tenant pool.')
+
+def read_only(view):
+    """Mark a view as safe to serve from a read replica (it must not write or run DDL)"""
+    view.db_read_only = True
+    return view
+
+def get_db_connection(primary=False, tenant=None):
+    tenant = tenant or current_tenant()
+    if not primary and has_request_context() and g.get('db_use_replica'):
+        replica = REPLICA_ROUTER.choose()
+        if replica is not None:
+            try:
+                conn = mysql.connector.connect(**{**replica['config'], 'database': tenant.database})
+                METRICS.inc('erp_db_connections_total', target='replica')
+                return InstrumentedConnection(conn)
+            except mysql.connector.Error as e:
+                REPLICA_ROUTER.mark_down(replica, e)
+        METRICS.inc('erp_db_connections_total', target='primary_fallback')
+    else:
+        METRICS.inc('erp_db_connections_total', target='primary')
+    conn, pooled = DB_POOLS.connect(tenant)
+    if not pooled and DB_POOLS.size > 0:
+        METRICS.inc('erp_db_pool_overflow_total', tenant=tenant.slug)
+    return InstrumentedConnection(conn)
+
+def stream_rows(conn, cursor):
+    """Stream an executed query's rows as a JSON array instead of building it with fetchall().
+
+    The cursor and connection are released when the server closes the
+    response, including when the client disconnects mid-stream or the body is
+    never iterated: rows still unread are drained first, so the connection
+    goes back to the pool without a pending result.
+    """
+    released = False
+
+    def release():
+        nonlocal released
+        if released:
+            return
+        released = True
+        try:
+            for _ in iter_cursor_rows(cursor):
+                pass
+            cursor.close()
+        except mysql.connector.Error as e:
+            app.logger.warning(f"Error draining streamed rows: {e}")
+        finally:
+            conn.close()
+
+    def generate():
+        try:
+            yield from stream_json_array(iter_cursor_rows(cursor))
+        finally:
+            release()
+
+    response = Response(stream_with_context(generate()), mimetype="application/json")
+    response.call_on_close(release)
+    return response
+
+@app.before_request
+def route_db_reads():
+    view = app.view_functions.get(request.endpoint)
+    g.db_use_replica = bool(REPLICA_ROUTER.replicas and getattr(view, 'db_read_only', False)
+                            and current_tenant().db_config.get('host') == db_layer.DB_CONFIG['host']
+                            and time.time() >= session.get('db_primary_until', 0))
+
+@app.after_request
+def stick_to_primary_after_write(response):
+    # Only logged-in users get the marker: anonymous POSTs (login attempts, sign-ups)
+    # would otherwise create a session just to hold it
+    if (REPLICA_ROUTER.replicas and g.get('db_committed') and session.get('user_id') is not None
+            and response.status_code < 400):
+        session['db_primary_until'] = time.time() + app.config['DB_STICKY_PRIMARY_SECONDS']
+    return response
+
+def check_replicas_forever():
+    while True:
+        REPLICA_ROUTER.check_all()
+        for replica in REPLICA_ROUTER.status():
+            METRICS.set_gauge('erp_db_replica_healthy', int(replica['healthy']), replica=replica['name'])
+            if replica['lag'] is not None:
+                METRICS.set_gauge('erp_db_replica_lag_seconds', replica['lag'], replica=replica['name'])
+        time.sleep(app.config['DB_REPLICA_CHECK_INTERVAL'])
+
+if REPLICA_ROUTER.replicas:
+    threading.Thread(target=check_replicas_forever, daemon=True).start()
+
+# ==================== SERVER-SIDE SESSIONS ====================
+class ServerSideSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        def on_update(self):
+            self.modified = True
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.modified = False
+
+class ServerSideSessionInterface(SessionInterface):
+    """Keeps session data in a SessionStore and only an opaque id in the cookie"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            loaded = self.store.load(sid)
+            if loaded is not None:
+                data, expires_at = loaded
+                return ServerSideSession(data, sid=sid, expires_at=expires_at)
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified:
+                if not session.new:
+                    self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        idle_timeout = app.config['SESSION_IDLE_TIMEOUT'].total_seconds()
+        expires_at = time.time() + idle_timeout
+        if session.modified or session.new:
+            self.store.save(session.sid, dict(session), expires_at)
+        elif session.expires_at - time.time() < idle_timeout / 2:
+            # Slide the idle window without rewriting the session on every request
+            self.store.touch(session.sid, expires_at)
+        else:
+            return
+
+        response.set_cookie(
+            name, session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain, path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+def regenerate_session():
+    """Discard the current session and its items and continue under a fresh id.
+
+    Called when the user logs in or out, so an id planted before login is never
+    authenticated and one user's stored items never carry over to the next.
+    """
+    app.session_interface.store.delete(session.sid)
+    session.clear()
+    session.sid = secrets.token_urlsafe(32)
+    session.new = True
+
+def load_session_item(key, default=None):
+    """Lazily load a large value stored alongside the current session"""
+    value = app.session_interface.store.load_item(session.sid, key)
+    return default if value is None else value
+
+def save_session_item(key, value):
+    """Store a large value alongside the current session instead of inside it"""
+    app.session_interface.store.save_item(session.sid, key, value)
+    session.modified = True  # make sure the session row and cookie exist
+
+def sweep_sessions_forever():
+    while True:
+        time.sleep(app.config['SESSION_SWEEP_INTERVAL'])
+        try:
+            removed = app.session_interface.store.sweep(time.time())
+            if removed:
+                app.logger.info(f"Swept {removed} expired sessions")
+        except Exception as e:
+            app.logger.error(f"Error sweeping sessions: {e}")
+
+app.session_interface = ServerSideSessionInterface(
+    create_session_store(app.config['SESSION_BACKEND'], app.config['SESSION_SQLITE_PATH'],
+                         lambda: get_db_connection(primary=True, tenant=SESSION_TENANT))
+)
+threading.Thread(target=sweep_sessions_forever, daemon=True).start()
+
+# ==================== ADMISSION CONTROL ====================
+# Every non-exempt request spends a token from its user's bucket, then takes a slot
+# in the global and per-route concurrency limiters. TPO and recruiter requests use
+# the priority lane, which may also use the slots reserved from normal traffic.
+ADMISSION_BUCKETS = create_bucket_store(app.config['ADMISSION_BUCKET_BACKEND'], app.config['ADMISSION_BUCKET_PATH'])
+ADMISSION_LIMITER = ConcurrencyLimiter(app.config['ADMISSION_MAX_CONCURRENT'], app.config['ADMISSION_PRIORITY_RESERVED'])
+ROUTE_LIMITERS = {route: ConcurrencyLimiter(limit) for route, limit in app.config['ADMISSION_ROUTE_LIMITS'].items()}
+
+METRICS.describe('erp_admission_rejected_total', 'counter', 'Requests shed with 429 by admission control.')
+METRICS.describe('erp_admission_in_flight', 'gauge', 'Admitted requests in flight by lane.')
+
+def admission_rejection(route, lane, reason, retry_after):
+    METRICS.inc('erp_admission_rejected_total', route=route, lane=lane, reason=reason)
+    retry_after = max(1, math.ceil(retry_after))
+    response = jsonify({"error": "Server busy, please retry shortly.", "reason": reason, "retry_after": retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+def release_admission_slots():
+    for limiter in g.pop('admission_slots', []):
+        limiter.release()
+    lane = g.pop('admission_lane', None)
+    if lane:
+        METRICS.add_gauge('erp_admission_in_flight', -1, lane=lane)
+
+@app.before_request
+def admit_request():
+    if not app.config['ADMISSION_ENABLED'] or request.endpoint in app.config['ADMISSION_EXEMPT_ENDPOINTS']:
+        return
+    role = session.get("role")
+    lane = "priority" if role in app.config['ADMISSION_PRIORITY_ROLES'] else "normal"
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+
+    rates = app.config['ADMISSION_RATE_LIMITS']
+    rate, burst = rates.get(role) or rates['anonymous']
+    if session.get("user_id"):
+        bucket_key = f"{current_tenant().slug}:{role}:{session['user_id']}"
+    elif request.endpoint == 'login':
+        # A budget of its own, so other anonymous traffic from a shared address cannot lock logins out
+        rate, burst = rates['login']
+        bucket_key = f"login:ip:{request.remote_addr}"
+    else:
+        bucket_key = f"ip:{request.remote_addr}"
+    try:
+        wait = ADMISSION_BUCKETS.take(bucket_key, rate, burst)
+    except Exception as e:
+        # Fail open: a broken limiter store must not take the site down with it
+        app.logger.error(f"Error checking rate limit: {e}")
+        wait = 0
+    if wait:
+        return admission_rejection(route, lane, "rate_limit", wait)
+
+    g.admission_slots = []
+    for reason, limiter in (("concurrency", ADMISSION_LIMITER), ("route_concurrency", ROUTE_LIMITERS.get(route))):
+        if limiter is None:
+            continue
+        if not limiter.try_acquire(priority=lane == "priority"):
+            release_admission_slots()
+            return admission_rejection(route, lane, reason, app.config['ADMISSION_RETRY_AFTER'])
+        g.admission_slots.append(limiter)
+    g.admission_lane = lane
+    METRICS.add_gauge('erp_admission_in_flight', 1, lane=lane)
+
+@app.teardown_request
+def finish_admitted_request(exc):
+    release_admission_slots()
+
+def sweep_rate_limits_forever():
+    while True:
+        time.sleep(app.config['ADMISSION_SWEEP_INTERVAL'])
+        try:
+            ADMISSION_BUCKETS.sweep()
+        except Exception as e:
+            app.logger.error(f"Error sweeping rate limit buckets: {e}")
+
+threading.Thread(target=sweep_rate_limits_forever, daemon=True).start()
+
+# ==================== STATIC ASSETS ====================
+# Templates link bundles through asset_url(). After `admin build-assets` the URLs
+# carry a content hash, so they are cached for a year and served precompressed;
+# without a build the plain sources are served uncached. Restart after a build.
+ASSET_MANIFEST = asset_pipeline.load_manifest()
+ASSET_FILES = set(ASSET_MANIFEST.values())
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@app.template_global()
+def asset_url(name):
+    return url_for("serve_asset", filename=ASSET_MANIFEST.get(name, name))
+
+@app.route("/assets/<path:filename>")
+def serve_asset(filename):
+    if filename in ASSET_FILES:
+        mimetype = mimetypes.guess_type(filename)[0]
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if encoding in request.accept_encodings and \
+                    os.path.exists(os.path.join(asset_pipeline.DIST_DIR, filename + suffix)):
+                response = send_from_directory(asset_pipeline.DIST_DIR, filename + suffix, mimetype=mimetype)
+                response.headers["Content-Encoding"] = encoding
+                break
+        else:
+            response = send_from_directory(asset_pipeline.DIST_DIR, filename, mimetype=mimetype)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    if filename in asset_pipeline.ASSET_BUNDLES:
+        response = Response(asset_pipeline.read_bundle(filename), mimetype=mimetypes.guess_type(filename)[0])
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    return jsonify({"error": "Not found"}), 404
 
 # ==================== DATABASE INITIALIZATION ====================
 def ensure_tables_exist():
     """Ensure required tables exist with correct structure"""
+    conn = None
     try:
-        conn = get_db_connection()
+        conn = get_db_connection(primary=True)
         cursor = conn.cursor()
         
         # Check and create applications table if it doesn't exist
@@ -75,7 +914,7 @@ def ensure_tables_exist():
                 FROM information_schema.COLUMNS 
                 WHERE TABLE_NAME = 'applications' 
                 AND COLUMN_NAME = 'submitted_resume_path'
-                AND TABLE_SCHEMA = 'placement_erp'
+                AND TABLE_SCHEMA = DATABASE()
             """)
             column_exists = cursor.fetchone()[0] > 0
             
@@ -86,133 +925,1020 @@ def ensure_tables_exist():
         
         conn.commit()
         cursor.close()
-        conn.close()
     except Exception as e:
         print(f"Error ensuring tables exist: {e}")
+    finally:
+        if conn:
+            conn.close()
 
-# ==================== RESUME PARSING UTILITIES ====================
-def extract_resume_text(file_path):
-    """Extract text from PDF or DOCX files"""
+# ==================== ELIGIBILITY SNAPSHOT ====================
+# Per-student branch code and effective CGPA, kept current on every profile write, and
+# per-job branch codes, written with the job, so job eligibility is an index lookup
+# instead of per-request COALESCE and substring matching. live_backlogs and year_gap are
+# snapshotted for the TPO but not matched: jobs have no backlog or year-gap criteria yet.
+ELIGIBILITY_CHUNK_SIZE = 1000
+
+eligibility_table_ready = set()   # tenant slugs
+
+def ensure_eligibility_table(cursor):
+    if current_tenant().slug in eligibility_table_ready:
+        return
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS student_eligibility (
+            student_id INT PRIMARY KEY,
+            branch_code VARCHAR(16),
+            effective_cgpa DECIMAL(4,2) NOT NULL DEFAULT 0,
+            live_backlogs INT NOT NULL DEFAULT 0,
+            year_gap INT NOT NULL DEFAULT 0,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            INDEX idx_eligibility_branch_cgpa (branch_code, effective_cgpa),
+            INDEX idx_eligibility_cgpa (effective_cgpa)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_branch_codes (
+            job_id INT NOT NULL,
+            branch_code VARCHAR(16) NOT NULL,
+            PRIMARY KEY (job_id, branch_code),
+            INDEX idx_job_branch_code (branch_code),
+            FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+        )
+    """)
+    eligibility_table_ready.add(current_tenant().slug)
+
+def refresh_eligibility_snapshot(conn, student_ids):
+    """Recompute the snapshot rows of student_ids; the caller commits"""
+    if not student_ids:
+        return
+    cursor = conn.cursor(dictionary=True)
     try:
-        if file_path.lower().endswith('.pdf'):
-            try:
-                text = extract_text_from_pdf(file_path)
-                if text and text.strip():
-                    return text.replace("%", "").replace(":", " ")
-            except Exception:
-                pass
-            
-            try:
-                from PyPDF2 import PdfReader
-                with open(file_path, 'rb') as file:
-                    reader = PdfReader(file)
-                    text = "".join([page.extract_text() or "" for page in reader.pages])
-                    if text.strip():
-                        return text
-            except Exception:
-                pass
-                
-        elif file_path.lower().endswith(('.docx', '.doc')):
-            try:
-                doc = DocxDocument(file_path)
-                return '\n'.join([p.text for p in doc.paragraphs])
-            except Exception:
-                return ""
-                
-        return ""
+        ensure_eligibility_table(cursor)
+        ids = ", ".join(["%s"] * len(student_ids))
+        cursor.execute(db_layer.ELIGIBILITY_SOURCE_SQL.format(ids=ids), tuple(student_ids))
+        rows = [db_layer.eligibility_snapshot_row(row) for row in cursor.fetchall()]
+        if rows:
+            cursor.executemany("""
+                REPLACE INTO student_eligibility (student_id, branch_code, effective_cgpa, live_backlogs, year_gap)
+                VALUES (%s, %s, %s, %s, %s)
+            """, rows)
+    finally:
+        cursor.close()
+
+def refresh_job_branch_codes(cursor, job_id, target_branches):
+    """Rewrite one job's branch codes; the caller commits"""
+    ensure_eligibility_table(cursor)
+    cursor.execute("DELETE FROM job_branch_codes WHERE job_id = %s", (job_id,))
+    cursor.executemany("INSERT INTO job_branch_codes (job_id, branch_code) VALUES (%s, %s)",
+                       db_layer.job_branch_rows(job_id, target_branches))
+
+def backfill_job_branch_codes(chunk_size=ELIGIBILITY_CHUNK_SIZE):
+    """Write branch codes for every job that has none yet (existing data, seeded jobs), returning the count"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    filled = 0
+    try:
+        ensure_eligibility_table(cursor)
+        last_id = 0
+        while True:
+            cursor.execute("""
+                SELECT j.job_id, j.target_branches FROM jobs j
+                WHERE j.job_id > %s
+                  AND NOT EXISTS (SELECT 1 FROM job_branch_codes jb WHERE jb.job_id = j.job_id)
+                ORDER BY j.job_id LIMIT %s
+            """, (last_id, chunk_size))
+            jobs = cursor.fetchall()
+            if not jobs:
+                break
+            for job_id, target_branches in jobs:
+                refresh_job_branch_codes(cursor, job_id, target_branches)
+            conn.commit()
+            filled += len(jobs)
+            last_id = jobs[-1][0]
+    finally:
+        cursor.close()
+        conn.close()
+    return filled
+
+def backfill_eligibility_snapshot(chunk_size=ELIGIBILITY_CHUNK_SIZE):
+    """Snapshot every student that has no row yet (existing data, bulk imports), returning the count"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    filled = 0
+    try:
+        ensure_eligibility_table(cursor)
+        last_id = 0
+        while True:
+            cursor.execute("""
+                SELECT s.student_id FROM students s
+                LEFT JOIN student_eligibility se ON s.student_id = se.student_id
+                WHERE se.student_id IS NULL AND s.student_id > %s
+                ORDER BY s.student_id LIMIT %s
+            """, (last_id, chunk_size))
+            student_ids = [row[0] for row in cursor.fetchall()]
+            if not student_ids:
+                break
+            refresh_eligibility_snapshot(conn, student_ids)
+            conn.commit()
+            filled += len(student_ids)
+            last_id = student_ids[-1]
+    finally:
+        cursor.close()
+        conn.close()
+    return filled
+
+def backfill_eligibility_snapshot_on_startup():
+    try:
+        filled = backfill_eligibility_snapshot()
+        if filled:
+            app.logger.info(f"Eligibility snapshot built for {filled} students")
+        filled = backfill_job_branch_codes()
+        if filled:
+            app.logger.info(f"Branch codes written for {filled} jobs")
     except Exception as e:
-        app.logger.error(f"Error extracting text: {e}")
-        return ""
+        app.logger.error(f"Error building eligibility snapshot: {e}")
 
-def simple_text_parsing(text):
-    """Parse resume text using regex patterns"""
-    import re
-    
-    if not text:
-        return {}
-    
-    parsed = {}
-    
-    # Extract contact information
-    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-    if email_match:
-        parsed['email'] = email_match.group(0)
-
-    phone_match = re.search(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]', text.replace(' ', ''))
-    if phone_match:
-        parsed['mobile_number'] = phone_match.group(0)
-
-    # Extract name
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    if lines and len(lines[0].split()) <= 4:
-        parsed['name'] = lines[0]
-
-    # Extract skills
-    common_skills = [
-        'python', 'java', 'javascript', 'sql', 'html', 'css', 'c++', 'react', 
-        'node.js', 'mongodb', 'mysql', 'php', 'angular', 'vue', 'django', 
-        'flask', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 
-        'opencv', 'computer vision', 'nlp', 'gan', 'predictive analysis', 
-        'hugging face', 'aws', 'ec2', 's3', 'langchain', 'faiss'
-    ]
-    
-    found_skills = []
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text.lower()):
-            found_skills.append(skill)
-    
-    if found_skills:
-        parsed['skills'] = found_skills
-
-    # Extract projects
-    projects = []
-    project_keywords = {
-        'AI-Powered Placement ERP System': 'AI-Powered Placement ERP System with Flask & MySQL',
-        'RAG-based PDF Chatbot': 'RAG-based PDF Chatbot with LangChain & Hugging Face'
-    }
-    
-    for keyword, project_name in project_keywords.items():
-        if keyword in text:
-            projects.append(project_name)
-    
-    if projects:
-        parsed['projects'] = projects
-
-    # Extract certifications
-    certs = []
-    cert_keywords = ['IIT Kharagpur', 'YHILLS', 'Coursera', 'Forage', 'IEEE']
-    for cert in cert_keywords:
-        if cert in text:
-            certs.append(cert)
-    
-    if certs:
-        parsed['certifications'] = certs
+threading.Thread(target=in_each_tenant(backfill_eligibility_snapshot_on_startup), daemon=True).start()
+
+# ==================== STUDENT ACCOUNTS ====================
+# Every way of creating students (the TPO form, admin import-students) goes through
+# create_students so passwords are always hashed and the eligibility snapshot is current.
+STUDENT_ACCOUNT_COLUMNS = ("name", "email", "password", "cgpa", "passing_year", "branch", "phone")
 
-    return parsed
+def student_account_row(fields):
+    """INSERT values for one student: the password hashed (a random one when blank), blank fields NULL"""
+    password = fields.get("password") or secrets.token_urlsafe(12)
+    return ((fields.get("name"), fields.get("email"), generate_password_hash(password))
+            + tuple(fields.get(k) or None for k in STUDENT_ACCOUNT_COLUMNS[3:]))
 
-def parse_resume_local(file_path):
-    """Main resume parsing function"""
+def create_students(conn, rows):
+    """Insert students from dicts keyed by STUDENT_ACCOUNT_COLUMNS and snapshot their eligibility,
+    returning their ids; the caller commits"""
+    cursor = conn.cursor()
     try:
-        text = extract_resume_text(file_path)
-        data = simple_text_parsing(text)
+        cursor.executemany(f"""
+            INSERT INTO students ({', '.join(STUDENT_ACCOUNT_COLUMNS)})
+            VALUES ({', '.join(['%s'] * len(STUDENT_ACCOUNT_COLUMNS))})
+        """, [student_account_row(row) for row in rows])
+        emails = [row["email"] for row in rows]
+        cursor.execute(f"SELECT student_id FROM students WHERE email IN ({', '.join(['%s'] * len(emails))})",
+                       emails)
+        student_ids = [row[0] for row in cursor.fetchall()]
+        refresh_eligibility_snapshot(conn, student_ids)
+        return student_ids
+    finally:
+        cursor.close()
 
-        # Fallback to PyResParser if simple parsing fails
-        if not data or all(not v for v in data.values() if v not in ([], {})):
-            try:
-                pyres_data = ResumeParser(file_path).get_extracted_data()
-                if pyres_data:
-                    data.update(pyres_data)
-            except Exception as pyres_error:
-                app.logger.error(f"PyResParser failed: {pyres_error}")
+# ==================== EVENT AND RESOURCE FEEDS ====================
+# Students read events by date window and resources by page (see db_layer). The first
+# page of the upcoming window is cached per process; add_event clears this process's
+# cache, other worker processes pick new events up within UPCOMING_EVENTS_CACHE_TTL.
+app.config['UPCOMING_EVENTS_CACHE_TTL'] = int(os.environ.get('UPCOMING_EVENTS_CACHE_TTL', 60))   # seconds
 
-        return data if data else {}
+METRICS.describe('erp_upcoming_events_cache_total', 'counter', 'Upcoming-events cache lookups by result.')
+
+EVENT_KEYS = {}   # tenant slug -> placement_events key column
+
+upcoming_events_cache = {}
+upcoming_events_generation = 0
+upcoming_events_lock = threading.Lock()
+
+def prepare_event_feed(cursor):
+    """Read placement_events' key column and add the date index if it is missing"""
+    cursor.execute(db_layer.EVENT_KEY_SQL)
+    keys = cursor.fetchall()
+    if keys:
+        EVENT_KEYS[current_tenant().slug] = keys[0]["Column_name"]
+    cursor.execute(db_layer.EVENT_DATE_INDEX_SQL)
+    if not cursor.fetchall():
+        cursor.execute(db_layer.CREATE_EVENT_DATE_INDEX_SQL)
+        app.logger.info("Created index idx_placement_events_date")
+
+def prepare_event_feed_on_startup():
+    try:
+        conn = get_db_connection(primary=True)
+        cursor = conn.cursor(dictionary=True)
+        try:
+            prepare_event_feed(cursor)
+        finally:
+            cursor.close()
+            conn.close()
     except Exception as e:
-        app.logger.error(f"Error in parse_resume_local: {e}")
-        return {}
+        app.logger.error(f"Error preparing event feed: {e}")
 
-def map_resume_to_profile(parsed_data):
-    """Map parsed resume data to student profile fields"""
-    mapped = {
+threading.Thread(target=in_each_tenant(prepare_event_feed_on_startup), daemon=True).start()
+
+def fetch_events(cursor, start, end, limit, descending=False, after=None):
+    """(events, next cursor) for one page of events dated in [start, end)"""
+    key = EVENT_KEYS.get(current_tenant().slug, db_layer.DEFAULT_EVENT_KEY)
+    cursor.execute(*db_layer.event_range_query(key, start, end, limit, descending, after))
+    return db_layer.feed_page(cursor.fetchall(), limit, db_layer.event_cursor)
+
+def fetch_resources(cursor, limit, after=None):
+    cursor.execute(*db_layer.resource_page_query(limit, after))
+    return db_layer.feed_page(cursor.fetchall(), limit, db_layer.resource_cursor)
+
+def upcoming_events(cursor, days, limit):
+    """First page of the next `days` days of events, from the cache while it is fresh"""
+    today = date.today()
+    key = (current_tenant().slug, today, days, limit)
+    now = time.monotonic()
+    with upcoming_events_lock:
+        cached = upcoming_events_cache.get(key)
+        generation = upcoming_events_generation
+    if cached and cached[0] > now:
+        METRICS.inc('erp_upcoming_events_cache_total', result='hit')
+        return cached[1]
+
+    METRICS.inc('erp_upcoming_events_cache_total', result='miss')
+    page = fetch_events(cursor, today, today + timedelta(days=days), limit)
+    with upcoming_events_lock:
+        # Don't store a page read before an add_event that cleared the cache
+        if generation == upcoming_events_generation:
+            if len(upcoming_events_cache) >= 64:
+                upcoming_events_cache.clear()
+            upcoming_events_cache[key] = (now + app.config['UPCOMING_EVENTS_CACHE_TTL'], page)
+    return page
+
+def clear_upcoming_events_cache():
+    global upcoming_events_generation
+    with upcoming_events_lock:
+        upcoming_events_cache.clear()
+        upcoming_events_generation += 1
+
+def feed_response(page):
+    """JSON list of a feed page, with the next page's cursor in X-Next-Cursor"""
+    rows, next_cursor = page
+    response = jsonify(rows)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+# ==================== STUDENT ARCHIVAL ====================
+ARCHIVE_CHUNK_SIZE = 500
+
+# Supported cohort filters for archive_students, mapped to their WHERE clause
+STUDENT_ARCHIVE_FILTERS = {
+    "passing_year": "passing_year = %s",
+    "branch": "branch = %s"
+}
+
+# Child tables first so no foreign key is violated; {ids} expands to the chunk's placeholders
+STUDENT_ARCHIVE_STEPS = (
+    ("application_details", "application_id IN (SELECT application_id FROM applications WHERE student_id IN ({ids}))"),
+    ("applications", "student_id IN ({ids})"),
+    ("student_profile", "student_id IN ({ids})"),
+    ("students", "student_id IN ({ids})")
+)
+
+# Archive tables carry no unique keys; these columns are indexed for lookups and joins
+ARCHIVE_INDEX_COLUMNS = {
+    "students": ("student_id",),
+    "student_profile": ("student_id",),
+    "applications": ("application_id", "student_id", "job_id"),
+    "application_details": ("application_id",),
+    "jobs": ("job_id", "company_id")
+}
+
+RESUME_DELETE_QUEUE = queue.Queue()
+
+def delete_resume_files_forever():
+    """Remove resume files of archived students off the request path"""
+    while True:
+        file_path = RESUME_DELETE_QUEUE.get()
+        try:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        except OSError as e:
+            app.logger.error(f"Error deleting resume file {file_path}: {e}")
+        finally:
+            RESUME_DELETE_QUEUE.task_done()
+
+threading.Thread(target=delete_resume_files_forever, daemon=True).start()
+
+def archive_table_sql(table):
+    """CREATE TABLE for <table>_archive: the table's columns without its keys, an archived_at stamp and lookup indexes"""
+    indexes = "".join(f", INDEX idx_archive_{column} ({column})" for column in ARCHIVE_INDEX_COLUMNS.get(table, ()))
+    return (f"CREATE TABLE {table}_archive (archived_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP{indexes}) "
+            f"AS SELECT t.* FROM {table} t WHERE 1 = 0")
+
+def ensure_archive_tables(conn, steps=None):
+    """Create column-compatible <table>_archive tables, and add lookup indexes missing from older ones"""
+    cursor = conn.cursor(buffered=True)
+    for table, _ in steps or STUDENT_ARCHIVE_STEPS:
+        cursor.execute(f"SHOW TABLES LIKE '{table}_archive'")
+        if not cursor.fetchone():
+            cursor.execute(archive_table_sql(table))
+            print(f"{table}_archive table created successfully!")
+            continue
+        cursor.execute(f"SHOW INDEX FROM {table}_archive")
+        existing = {row[2] for row in cursor.fetchall()}
+        for column in ARCHIVE_INDEX_COLUMNS.get(table, ()):
+            if f"idx_archive_{column}" not in existing:
+                cursor.execute(f"ALTER TABLE {table}_archive ADD INDEX idx_archive_{column} ({column})")
+    conn.commit()
+    cursor.close()
+
+def archive_columns(cursor, table):
+    """Columns shared by a table and its archive, so schema additions never break archiving"""
+    cursor.execute(f"SHOW COLUMNS FROM {table}_archive")
+    archived = {row[0] for row in cursor.fetchall()}
+    cursor.execute(f"SHOW COLUMNS FROM {table}")
+    return ", ".join(f"`{row[0]}`" for row in cursor.fetchall() if row[0] in archived)
+
+def move_to_archive(cursor, steps, ids, params):
+    """Copy each step's rows into its archive table, then delete them from the hot table.
+
+    Returns how many rows the last step (the parent table) moved.
+    """
+    moved = 0
+    for table, where in steps:
+        columns = archive_columns(cursor, table)
+        where = where.format(ids=ids)
+        cursor.execute(f"INSERT INTO {table}_archive ({columns}, archived_at) "
+                       f"SELECT {columns}, NOW() FROM {table} WHERE {where}", params)
+        cursor.execute(f"DELETE FROM {table} WHERE {where}", params)
+        moved = cursor.rowcount
+    return moved
+
+def archive_student_chunk(conn, student_ids):
+    """Move one bounded chunk of students and their dependent rows into archive tables in one transaction.
+
+    Returns how many of the students existed and were archived.
+    """
+    cursor = conn.cursor()
+    ids = ", ".join(["%s"] * len(student_ids))
+    params = tuple(student_ids)
+
+    cursor.execute(f"""
+        SELECT resume_path FROM students WHERE student_id IN ({ids}) AND resume_path IS NOT NULL
+        UNION
+        SELECT submitted_resume_path FROM applications WHERE student_id IN ({ids}) AND submitted_resume_path IS NOT NULL
+    """, params + params)
+    resume_files = [row[0] for row in cursor.fetchall()]
+
+    archived = move_to_archive(cursor, STUDENT_ARCHIVE_STEPS, ids, params)
+    ensure_eligibility_table(cursor)
+    cursor.execute(f"DELETE FROM student_eligibility WHERE student_id IN ({ids})", params)
+    delete_resume_fingerprints(cursor, student_ids)
+    delete_resume_texts(cursor, student_ids)
+    conn.commit()
+    cursor.close()
+
+    for filename in resume_files:
+        RESUME_DELETE_QUEUE.put(os.path.join(upload_folder(), os.path.basename(filename)))
+    semantic_delete("resumes", student_ids)
+    return archived
+
+def student_filter_clause(filters):
+    clauses = [STUDENT_ARCHIVE_FILTERS[k] for k in filters]
+    return " AND ".join(clauses), [filters[k] for k in filters]
+
+def count_students_matching(conn, filters):
+    where, params = student_filter_clause(filters)
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT COUNT(*) FROM students WHERE {where}", params)
+    count = cursor.fetchone()[0]
+    cursor.close()
+    return count
+
+def archive_students_matching(conn, filters, chunk_size=ARCHIVE_CHUNK_SIZE, progress=None):
+    """Archive every student matching filters, chunk by chunk, returning (archived, chunks)"""
+    ensure_archive_tables(conn)
+    where, params = student_filter_clause(filters)
+    archived = chunks = 0
+    last_id = 0
+    while True:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT student_id FROM students
+            WHERE {where} AND student_id > %s
+            ORDER BY student_id LIMIT %s
+        """, params + [last_id, chunk_size])
+        student_ids = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        if not student_ids:
+            break
+        archived += archive_student_chunk(conn, student_ids)
+        chunks += 1
+        last_id = student_ids[-1]
+        if progress:
+            progress(archived)
+    return archived, chunks
+
+# ==================== SEARCH INDEX ====================
+SEARCH_INDEXES = {}   # tenant slug -> SearchIndex
+search_indexes_lock = threading.Lock()
+
+def search_index():
+    """The current tenant's search index, opened on first use"""
+    tenant = current_tenant()
+    index = SEARCH_INDEXES.get(tenant.slug)
+    if index is None:
+        with search_indexes_lock:
+            index = SEARCH_INDEXES.get(tenant.slug)
+            if index is None:
+                path = tenant.path(app.config['SEARCH_INDEX_PATH'])
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                index = SEARCH_INDEXES[tenant.slug] = SearchIndex(path)
+    return index
+
+def sync_search_index(operation, *args):
+    """Apply a change to the search index without letting an index error fail the write"""
+    try:
+        operation(*args)
+    except Exception as e:
+        app.logger.error(f"Error updating search index: {e}")
+
+def rebuild_search_index():
+    """Rebuild the search index from MySQL, returning (jobs, resources) indexed"""
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("""
+            SELECT j.job_id, j.title, j.description, j.location, j.deadline, j.company_id, r.company_name, r.status
+            FROM jobs j
+            JOIN recruiters r ON j.company_id = r.company_id
+        """)
+        jobs = cursor.fetchall()
+        cursor.execute("SELECT resource_id, title, description, file_path FROM prep_resources")
+        resources = cursor.fetchall()
+    finally:
+        cursor.close()
+        conn.close()
+    search_index().rebuild(jobs, resources)
+    return len(jobs), len(resources)
+
+def rebuild_search_index_if_empty():
+    try:
+        if search_index().is_empty():
+            jobs, resources = rebuild_search_index()
+            app.logger.info(f"Search index built with {jobs} jobs and {resources} resources")
+    except Exception as e:
+        app.logger.error(f"Error building search index: {e}")
+
+threading.Thread(target=in_each_tenant(rebuild_search_index_if_empty), daemon=True).start()
+
+# ==================== SEMANTIC MATCHING ====================
+SEMANTIC_STORES = {}   # (tenant slug, collection) -> VectorStore, shared with the embedding worker
+semantic_stores_lock = threading.Lock()
+EMBEDDING_WORKER = None
+
+def init_semantic_index():
+    """Start the embedding worker, if dependencies exist; vector stores open per tenant on first use"""
+    global EMBEDDING_WORKER
+    if not app.config['SEMANTIC_INDEX_ENABLED']:
+        return
+    try:
+        from semantic_index import Embedder, EmbeddingWorker
+        import hnswlib, numpy  # noqa: F401  -- needed by the vector stores, which open lazily
+        EMBEDDING_WORKER = EmbeddingWorker(Embedder(app.config['SEMANTIC_MODEL']), SEMANTIC_STORES,
+                                           batch_size=app.config['SEMANTIC_BATCH_SIZE'], logger=app.logger)
+    except ImportError as e:
+        app.logger.warning(f"Semantic matching disabled, missing dependency: {e}")
+
+def semantic_store(collection):
+    """(key, store) of the current tenant's "resumes" or "jobs" vectors, or (key, None) when disabled"""
+    tenant = current_tenant()
+    key = (tenant.slug, collection)
+    if EMBEDDING_WORKER is None:
+        return key, None
+    store = SEMANTIC_STORES.get(key)
+    if store is None:
+        from semantic_index import VectorStore
+        with semantic_stores_lock:
+            store = SEMANTIC_STORES.get(key)
+            if store is None:
+                store = SEMANTIC_STORES[key] = VectorStore(tenant.path(app.config['SEMANTIC_INDEX_DIR']),
+                                                           collection, app.config['SEMANTIC_DIM'])
+    return key, store
+
+def job_embedding_text(title, description, location):
+    return "\n".join(part for part in (title, description, location) if part)
+
+def semantic_submit(collection, item_id, text):
+    """Queue text for background embedding; a no-op when semantic matching is disabled"""
+    key, store = semantic_store(collection)
+    if store is not None and not EMBEDDING_WORKER.submit(key, item_id, text):
+        app.logger.warning(f"Embedding queue full, dropped {collection} {item_id}")
+
+def semantic_delete(collection, item_ids):
+    if EMBEDDING_WORKER is None:
+        return
+    try:
+        _, store = semantic_store(collection)
+        store.delete(item_ids)
+        store.flush()
+    except Exception as e:
+        app.logger.error(f"Error deleting {collection} vectors: {e}")
+
+init_semantic_index()
+
+# ==================== DUPLICATE RESUME DETECTION ====================
+fingerprint_tables_ready = set()   # tenant slugs
+
+def ensure_fingerprint_tables(cursor):
+    if current_tenant().slug in fingerprint_tables_ready:
+        return
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS resume_fingerprints (
+            student_id INT PRIMARY KEY,
+            resume_path VARCHAR(500),
+            signature BLOB NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS resume_lsh_bands (
+            band TINYINT NOT NULL,
+            bucket BIGINT NOT NULL,
+            student_id INT NOT NULL,
+            PRIMARY KEY (band, bucket, student_id),
+            INDEX idx_resume_lsh_student (student_id)
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS resume_duplicate_pairs (
+            student_a INT NOT NULL,
+            student_b INT NOT NULL,
+            similarity DECIMAL(5,4) NOT NULL,
+            detected_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (student_a, student_b)
+        )
+    """)
+    fingerprint_tables_ready.add(current_tenant().slug)
+
+def register_resume_fingerprint(student_id, resume_path, text):
+    """Store the resume's MinHash fingerprint and record near-duplicates found through its LSH bands.
+
+    Only students sharing at least one band bucket are compared, so the cost per
+    upload does not grow with the number of stored resumes.
+    """
+    signature = resume_fingerprint.minhash_signature(text)
+    if signature is None:
+        return []
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        duplicates = store_resume_fingerprint(cursor, student_id, resume_path, signature)
+        conn.commit()
+        return duplicates
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+def store_resume_fingerprint(cursor, student_id, resume_path, signature):
+    """Replace a student's fingerprint and LSH bands and record its near-duplicate pairs; the caller commits"""
+    bands = resume_fingerprint.band_hashes(signature)
+    ensure_fingerprint_tables(cursor)
+    cursor.execute("DELETE FROM resume_lsh_bands WHERE student_id = %s", (student_id,))
+    cursor.execute("DELETE FROM resume_duplicate_pairs WHERE student_a = %s OR student_b = %s",
+                   (student_id, student_id))
+    cursor.execute("""
+        REPLACE INTO resume_fingerprints (student_id, resume_path, signature) VALUES (%s, %s, %s)
+    """, (student_id, resume_path, resume_fingerprint.pack_signature(signature)))
+    cursor.executemany("INSERT INTO resume_lsh_bands (band, bucket, student_id) VALUES (%s, %s, %s)",
+                       [(band, bucket, student_id) for band, bucket in bands])
+
+    matches = " OR ".join(["(band = %s AND bucket = %s)"] * len(bands))
+    cursor.execute(f"""
+        SELECT f.student_id, f.signature
+        FROM resume_fingerprints f
+        WHERE f.student_id IN (
+            SELECT DISTINCT student_id FROM resume_lsh_bands WHERE {matches}
+        ) AND f.student_id != %s
+    """, tuple(v for pair in bands for v in pair) + (student_id,))
+
+    duplicates = []
+    for other_id, blob in cursor.fetchall():
+        similarity = resume_fingerprint.estimate_similarity(
+            signature, resume_fingerprint.unpack_signature(blob))
+        if similarity >= resume_fingerprint.DUPLICATE_THRESHOLD:
+            duplicates.append((min(student_id, other_id), max(student_id, other_id), similarity))
+    if duplicates:
+        cursor.executemany("""
+            REPLACE INTO resume_duplicate_pairs (student_a, student_b, similarity) VALUES (%s, %s, %s)
+        """, duplicates)
+    return [b if a == student_id else a for a, b, _ in duplicates]
+
+def delete_resume_fingerprints(cursor, student_ids):
+    """Remove students' fingerprints, LSH band rows and duplicate pairs; the caller commits"""
+    ensure_fingerprint_tables(cursor)
+    ids = ", ".join(["%s"] * len(student_ids))
+    params = tuple(student_ids)
+    cursor.execute(f"DELETE FROM resume_lsh_bands WHERE student_id IN ({ids})", params)
+    cursor.execute(f"DELETE FROM resume_duplicate_pairs WHERE student_a IN ({ids}) OR student_b IN ({ids})",
+                   params + params)
+    cursor.execute(f"DELETE FROM resume_fingerprints WHERE student_id IN ({ids})", params)
+
+# ==================== EMAIL NOTIFICATIONS ====================
+# Notifications are written to email_outbox in the same transaction as the change
+# that causes them; a background sender coalesces each recipient's pending rows
+# into one digest and sends batches over a single SMTP connection.
+outbox_table_ready = set()   # tenant slugs
+
+def ensure_outbox_table(cursor):
+    if current_tenant().slug in outbox_table_ready:
+        return
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS email_outbox (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            recipient VARCHAR(255) NOT NULL,
+            kind VARCHAR(32) NOT NULL,
+            subject VARCHAR(255) NOT NULL,
+            body TEXT NOT NULL,
+            dedupe_key VARCHAR(191) UNIQUE,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            sent_at DATETIME NULL,
+            attempts INT DEFAULT 0,
+            last_error VARCHAR(500),
+            INDEX idx_email_outbox_pending (sent_at, attempts, recipient)
+        )
+    """)
+    outbox_table_ready.add(current_tenant().slug)
+
+def eligible_students_clause(target_branches):
+    """WHERE fragment and params selecting snapshotted students (se) in a job's target branches"""
+    codes = db_layer.target_branch_codes(target_branches)
+    if codes is None:
+        return "", []
+    return f" AND se.branch_code IN ({', '.join(['%s'] * len(codes))})", sorted(codes)
+
+def enqueue_new_job_notifications(cursor, job_id):
+    """Queue a new-job notification for every student eligible for the job"""
+    ensure_outbox_table(cursor)
+    ensure_eligibility_table(cursor)
+    cursor.execute("""
+        SELECT j.title, j.eligibility, j.target_branches, j.deadline, r.company_name
+        FROM jobs j JOIN recruiters r ON j.company_id = r.company_id
+        WHERE j.job_id = %s
+    """, (job_id,))
+    row = cursor.fetchone()
+    if not row:
+        return
+    title, eligibility, target_branches, deadline, company_name = row
+    branch_clause, branch_params = eligible_students_clause(target_branches)
+    cursor.execute(f"""
+        INSERT IGNORE INTO email_outbox (recipient, kind, subject, body, dedupe_key)
+        SELECT s.email, 'new_job', %s, %s, CONCAT('new_job:', %s, ':', s.student_id)
+        FROM student_eligibility se
+        JOIN students s ON s.student_id = se.student_id
+        WHERE s.email IS NOT NULL
+          AND se.effective_cgpa >= %s{branch_clause}
+    """, [f"New job: {title} at {company_name}",
+          f"{company_name} posted {title}. You are eligible to apply before {deadline}.",
+          job_id, eligibility or 0] + branch_params)
+
+def enqueue_status_change_notification(cursor, application_id, status):
+    """Queue a notification to the student whose application changed status"""
+    ensure_outbox_table(cursor)
+    cursor.execute("""
+        INSERT INTO email_outbox (recipient, kind, subject, body)
+        SELECT s.email, 'application_status', CONCAT('Application update: ', j.title),
+               CONCAT('Your application for ', j.title, ' at ', r.company_name, ' is now ', %s, '.')
+        FROM applications a
+        JOIN students s ON a.student_id = s.student_id
+        JOIN jobs j ON a.job_id = j.job_id
+        JOIN recruiters r ON j.company_id = r.company_id
+        WHERE a.application_id = %s AND s.email IS NOT NULL
+    """, (status, application_id))
+
+def enqueue_scheduled_reminders(cursor):
+    """Queue event and application-deadline reminders; dedupe keys make reruns harmless"""
+    ensure_outbox_table(cursor)
+    ensure_eligibility_table(cursor)
+    cursor.execute("""
+        INSERT IGNORE INTO email_outbox (recipient, kind, subject, body, dedupe_key)
+        SELECT s.email, 'event_reminder', CONCAT('Reminder: ', e.title, ' on ', e.date),
+               CONCAT(e.title, ' takes place on ', e.date, '. ', COALESCE(e.description, '')),
+               CONCAT('event:', MD5(CONCAT(e.title, e.date)), ':', s.student_id)
+        FROM placement_events e
+        CROSS JOIN students s
+        WHERE e.date BETWEEN CURDATE() AND CURDATE() + INTERVAL %s DAY
+          AND s.email IS NOT NULL
+    """, (app.config['EVENT_REMINDER_DAYS'],))
+
+    cursor.execute("""
+        SELECT job_id, title, eligibility, target_branches, deadline
+        FROM jobs
+        WHERE deadline BETWEEN CURDATE() AND CURDATE() + INTERVAL %s DAY
+    """, (app.config['DEADLINE_REMINDER_DAYS'],))
+    for job_id, title, eligibility, target_branches, deadline in cursor.fetchall():
+        branch_clause, branch_params = eligible_students_clause(target_branches)
+        cursor.execute(f"""
+            INSERT IGNORE INTO email_outbox (recipient, kind, subject, body, dedupe_key)
+            SELECT s.email, 'deadline_reminder', %s, %s, CONCAT('deadline:', %s, ':', s.student_id)
+            FROM student_eligibility se
+            JOIN students s ON s.student_id = se.student_id
+            LEFT JOIN applications a ON a.student_id = s.student_id AND a.job_id = %s
+            WHERE a.application_id IS NULL AND s.email IS NOT NULL
+              AND se.effective_cgpa >= %s{branch_clause}
+        """, [f"Last chance to apply: {title}", f"Applications for {title} close on {deadline}.",
+              job_id, job_id, eligibility or 0] + branch_params)
+
+def build_digest(rows):
+    """Coalesce one recipient's pending notifications into a single message"""
+    if len(rows) == 1:
+        return rows[0]["subject"], rows[0]["body"]
+    lines = [f"You have {len(rows)} placement updates:", ""]
+    for row in rows:
+        lines.append(f"- {row['subject']}")
+        lines.append(f"  {row['body']}")
+    return f"Placement updates ({len(rows)})", "\n".join(lines)
+
+class SendRateLimiter:
+    """Sliding one-minute window capping messages sent per minute"""
+
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self.sent = deque()
+
+    def allowance(self):
+        cutoff = time.monotonic() - 60
+        while self.sent and self.sent[0] < cutoff:
+            self.sent.popleft()
+        return max(self.per_minute - len(self.sent), 0)
+
+    def record(self):
+        self.sent.append(time.monotonic())
+
+MAIL_RATE_LIMITER = SendRateLimiter(app.config['MAIL_RATE_PER_MINUTE'])
+
+def send_outbox_batch():
+    """Send one rate-limited batch of digests over a single SMTP connection; returns digests sent"""
+    allowance = MAIL_RATE_LIMITER.allowance()
+    if allowance == 0:
+        return 0
+
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        ensure_outbox_table(cursor)
+        cursor.execute("""
+            SELECT DISTINCT recipient FROM email_outbox
+            WHERE sent_at IS NULL AND attempts < %s
+            LIMIT %s
+        """, (app.config['MAIL_MAX_ATTEMPTS'], allowance))
+        recipients = [row["recipient"] for row in cursor.fetchall()]
+        if not recipients:
+            return 0
+        placeholders = ", ".join(["%s"] * len(recipients))
+        cursor.execute(f"""
+            SELECT id, recipient, subject, body FROM email_outbox
+            WHERE sent_at IS NULL AND attempts < %s AND recipient IN ({placeholders})
+            ORDER BY id
+        """, [app.config['MAIL_MAX_ATTEMPTS']] + recipients)
+        pending = {}
+        for row in cursor.fetchall():
+            pending.setdefault(row["recipient"], []).append(row)
+
+        sent_ids, failed, digests = [], [], 0
+        with app.app_context():
+            with mail.connect() as smtp:
+                for recipient, rows in pending.items():
+                    subject, body = build_digest(rows)
+                    try:
+                        smtp.send(Message(subject=subject, recipients=[recipient], body=body))
+                        MAIL_RATE_LIMITER.record()
+                        sent_ids.extend(row["id"] for row in rows)
+                        digests += 1
+                    except Exception as e:
+                        failed.extend((str(e)[:500], row["id"]) for row in rows)
+
+        if sent_ids:
+            placeholders = ", ".join(["%s"] * len(sent_ids))
+            cursor.execute(f"UPDATE email_outbox SET sent_at = NOW() WHERE id IN ({placeholders})", sent_ids)
+        if failed:
+            cursor.executemany("UPDATE email_outbox SET attempts = attempts + 1, last_error = %s WHERE id = %s",
+                               failed)
+        conn.commit()
+        return digests
+    finally:
+        cursor.close()
+        conn.close()
+
+def send_notifications():
+    """Queue scheduled reminders and flush the current tenant's outbox, unless another process holds its lock"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    lock = current_tenant().lock_name('mail_sender')
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (lock,))
+        if not cursor.fetchone()[0]:
+            return
+        try:
+            enqueue_scheduled_reminders(cursor)
+            conn.commit()
+            send_outbox_batch()
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (lock,))
+            cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+def notification_worker_forever():
+    """Send notifications for every tenant; a MySQL named lock per tenant keeps one sender per fleet"""
+    while True:
+        time.sleep(app.config['MAIL_SEND_INTERVAL'])
+        for tenant in TENANTS:
+            with tenants.use(tenant):
+                try:
+                    send_notifications()
+                except Exception as e:
+                    app.logger.error(f"Error sending notifications for {tenant.slug}: {e}")
+
+if app.config['NOTIFICATIONS_ENABLED']:
+    threading.Thread(target=notification_worker_forever, daemon=True).start()
+
+# ==================== JOB RETENTION ====================
+# Jobs whose deadline passed more than JOB_RETENTION_DAYS ago move to jobs_archive with their applications,
+# unless an application arrived within that window
+app.config.update(
+    JOB_RETENTION_DAYS=int(os.environ.get('JOB_RETENTION_DAYS', 180)),
+    JOB_ARCHIVE_INTERVAL=int(os.environ.get('JOB_ARCHIVE_INTERVAL', 6 * 3600)),
+    JOB_ARCHIVE_ENABLED=os.environ.get('JOB_ARCHIVE_ENABLED', '1') == '1'
+)
+
+JOB_ARCHIVE_STEPS = (
+    ("application_details", "application_id IN (SELECT application_id FROM applications WHERE job_id IN ({ids}))"),
+    ("applications", "job_id IN ({ids})"),
+    ("jobs", "job_id IN ({ids})")
+)
+
+# Reporting queries read these views to see hot and archived rows together
+ARCHIVE_UNION_VIEWS = {
+    "jobs_all": "jobs",
+    "applications_all": "applications",
+    "application_details_all": "application_details"
+}
+
+METRICS.describe('erp_hot_table_rows', 'gauge', 'Rows in hot tables after the last retention run.')
+
+last_retention_report = {}   # tenant slug -> report of its last run
+
+def ensure_archive_views(conn):
+    """(Re)create <table>_all views so analytics can query hot and archived rows transparently"""
+    cursor = conn.cursor()
+    for view, table in ARCHIVE_UNION_VIEWS.items():
+        columns = archive_columns(cursor, table)
+        cursor.execute(f"""
+            CREATE OR REPLACE VIEW {view} AS
+            SELECT {columns}, NULL AS archived_at FROM {table}
+            UNION ALL
+            SELECT {columns}, archived_at FROM {table}_archive
+        """)
+    conn.commit()
+    cursor.close()
+
+def measure_hot_tables(conn):
+    """Row counts of the hot tables and the latency of the student_jobs active-jobs query"""
+    cursor = conn.cursor()
+    report = {}
+    for table in ("jobs", "applications"):
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        report[f"{table}_rows"] = cursor.fetchone()[0]
+    start = time.perf_counter()
+    cursor.execute(db_layer.ACTIVE_JOBS_SQL)
+    cursor.fetchall()
+    report["active_jobs_query_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    cursor.close()
+    return report
+
+def expired_job_ids(cursor, cutoff, chunk_size):
+    """Jobs whose deadline is before `cutoff` and that received no application since it"""
+    cursor.execute("""
+        SELECT j.job_id FROM jobs j
+        WHERE j.deadline < %s
+          AND NOT EXISTS (SELECT 1 FROM applications a WHERE a.job_id = j.job_id AND a.applied_date >= %s)
+        ORDER BY j.job_id LIMIT %s
+    """, (cutoff, cutoff, chunk_size))
+    return [row[0] for row in cursor.fetchall()]
+
+def archive_expired_jobs(conn, retention_days, chunk_size=ARCHIVE_CHUNK_SIZE):
+    """Move expired jobs and their applications to archive tables in chunked transactions"""
+    ensure_archive_tables(conn, JOB_ARCHIVE_STEPS)
+    before = measure_hot_tables(conn)
+    cutoff = date.today() - timedelta(days=retention_days)
+    archived = 0
+    while True:
+        cursor = conn.cursor()
+        job_ids = expired_job_ids(cursor, cutoff, chunk_size)
+        if not job_ids:
+            cursor.close()
+            break
+        move_to_archive(cursor, JOB_ARCHIVE_STEPS, ", ".join(["%s"] * len(job_ids)), tuple(job_ids))
+        conn.commit()
+        cursor.close()
+        sync_search_index(search_index().delete_jobs, job_ids)
+        semantic_delete("jobs", job_ids)
+        archived += len(job_ids)
+    ensure_archive_views(conn)
+    after = measure_hot_tables(conn)
+
+    for table in ("jobs", "applications"):
+        METRICS.set_gauge('erp_hot_table_rows', after[f"{table}_rows"], table=table)
+    return {"archived_jobs": archived, "before": before, "after": after,
+            "finished_at": datetime.now().isoformat(timespec="seconds")}
+
+def run_job_retention():
+    """One retention pass, guarded by a MySQL named lock so only one worker process runs it"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    lock = current_tenant().lock_name('job_retention')
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (lock,))
+        if not cursor.fetchone()[0]:
+            return None
+        try:
+            report = archive_expired_jobs(conn, app.config['JOB_RETENTION_DAYS'])
+            last_retention_report[current_tenant().slug] = report
+            app.logger.info(f"Job retention run for {current_tenant().slug}: {report}")
+            return report
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (lock,))
+            cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+def job_retention_forever():
+    while True:
+        time.sleep(app.config['JOB_ARCHIVE_INTERVAL'])
+        for tenant in TENANTS:
+            with tenants.use(tenant):
+                try:
+                    run_job_retention()
+                except Exception as e:
+                    app.logger.error(f"Error archiving expired jobs for {tenant.slug}: {e}")
+
+if app.config['JOB_ARCHIVE_ENABLED']:
+    threading.Thread(target=job_retention_forever, daemon=True).start()
+
+# ==================== RESUME PARSING UTILITIES ====================
+def extract_resume_text(file_path):
+    """Extract text from PDF or DOCX files"""
+    try:
+        if file_path.lower().endswith('.pdf'):
+            try:
+                text = extract_text_from_pdf(file_path)
+                if text and text.strip():
+                    return text.replace("%", "").replace(":", " ")
+            except Exception:
+                pass
+            
+            try:
+                from PyPDF2 import PdfReader
+                with open(file_path, 'rb') as file:
+                    reader = PdfReader(file)
+                    text = "".join([page.extract_text() or "" for page in reader.pages])
+                    if text.strip():
+                        return text
+            except Exception:
+                pass
+                
+        elif file_path.lower().endswith(('.docx', '.doc')):
+            try:
+                doc = DocxDocument(file_path)
+                return '\n'.join([p.text for p in doc.paragraphs])
+            except Exception:
+                return ""
+                
+        return ""
+    except Exception as e:
+        app.logger.error(f"Error extracting text: {e}")
+        return ""
+
+def parse_resume_local(file_path, text=None):
+    """Main resume parsing function (pass text when it was already extracted)"""
+    try:
+        if text is None:
+            with METRICS.timer('erp_resume_parse_stage_seconds', stage='extract'):
+                text = extract_resume_text(file_path)
+        with METRICS.timer('erp_resume_parse_stage_seconds', stage='regex'):
+            data = simple_text_parsing(text)
+
+        # Fallback to PyResParser if simple parsing fails
+        if not data or all(not v for v in data.values() if v not in ([], {})):
+            try:
+                with METRICS.timer('erp_resume_parse_stage_seconds', stage='pyresparser'):
+                    pyres_data = ResumeParser(file_path).get_extracted_data()
+                if pyres_data:
+                    data.update(pyres_data)
+            except Exception as pyres_error:
+                app.logger.error(f"PyResParser failed: {pyres_error}")
+
+        return data if data else {}
+    except Exception as e:
+        app.logger.error(f"Error in parse_resume_local: {e}")
+        return {}
+
+def map_resume_to_profile(parsed_data):
+    """Map parsed resume data to student profile fields"""
+    mapped = {
         "first_name": None,
         "last_name": None,
         "email": parsed_data.get("email"),
@@ -244,6 +1970,181 @@ def map_resume_to_profile(parsed_data):
     
     return mapped
 
+# ==================== INCREMENTAL RESUME REPARSE ====================
+# Raw extracted text is stored once per resume so parser improvements only rerun the
+# cheap text -> fields stage instead of pdfminer extraction.
+REPARSE_CHUNK_SIZE = 200
+
+# Profile columns filled from a parse; the remaining map_resume_to_profile fields are defaults
+PARSED_PROFILE_FIELDS = ("first_name", "last_name", "email", "phone",
+                         "programming_languages", "academic_projects", "certificates")
+
+# Stored texts of resumes the student still has; deleted and archived resumes are
+# removed in the same transaction, this join also skips any left over from before
+LIVE_RESUME_TEXTS = "resume_texts t JOIN students s ON s.student_id = t.student_id AND s.resume_path IS NOT NULL"
+
+reparse_tables_ready = set()   # tenant slugs
+reparse_progress = {}   # tenant slug -> progress of its last reparse
+reparse_running = set()   # tenant slugs with a reparse in flight
+reparse_lock = threading.Lock()
+
+def ensure_reparse_tables(cursor):
+    if current_tenant().slug in reparse_tables_ready:
+        return
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS resume_texts (
+            student_id INT PRIMARY KEY,
+            resume_path VARCHAR(500),
+            raw_text MEDIUMTEXT,
+            extracted_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS resume_parses (
+            student_id INT PRIMARY KEY,
+            parser_version INT NOT NULL,
+            parsed_data MEDIUMTEXT,
+            parsed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_resume_parses_version (parser_version)
+        )
+    """)
+    reparse_tables_ready.add(current_tenant().slug)
+
+def save_parse_result(cursor, student_id, parsed):
+    cursor.execute("""
+        REPLACE INTO resume_parses (student_id, parser_version, parsed_data, parsed_at)
+        VALUES (%s, %s, %s, NOW())
+    """, (student_id, PARSER_VERSION, json.dumps(parsed, default=str)))
+
+def delete_resume_texts(cursor, student_ids):
+    """Remove students' stored resume texts and parses; the caller commits"""
+    ensure_reparse_tables(cursor)
+    ids = ", ".join(["%s"] * len(student_ids))
+    cursor.execute(f"DELETE FROM resume_parses WHERE student_id IN ({ids})", tuple(student_ids))
+    cursor.execute(f"DELETE FROM resume_texts WHERE student_id IN ({ids})", tuple(student_ids))
+
+def store_resume_text_and_parse(student_id, resume_path, text, parsed):
+    """Persist a freshly uploaded resume's raw text and its versioned parse"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        ensure_reparse_tables(cursor)
+        cursor.execute("""
+            REPLACE INTO resume_texts (student_id, resume_path, raw_text, extracted_at)
+            VALUES (%s, %s, %s, NOW())
+        """, (student_id, resume_path, text))
+        save_parse_result(cursor, student_id, parsed)
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+def apply_parse_to_profile(cursor, student_id, parsed):
+    """Fill empty parse-derived profile columns; profiles the student has edited are never touched.
+
+    Columns that already hold a value are kept even on unedited profiles:
+    rows saved before edited_by_student was set on creation hold the student's input too.
+    """
+    mapped = map_resume_to_profile(parsed)
+    assignments = ", ".join(f"{field} = COALESCE(NULLIF({field}, ''), NULLIF(%s, ''))"
+                            for field in PARSED_PROFILE_FIELDS)
+    cursor.execute(f"""
+        UPDATE student_profile SET {assignments}, row_version = row_version + 1, last_updated = NOW()
+        WHERE student_id = %s AND NOT COALESCE(edited_by_student, FALSE)
+    """, [mapped.get(field) for field in PARSED_PROFILE_FIELDS] + [student_id])
+
+def keyset_chunks(cursor, sql, chunk_size, last_id=0, params=()):
+    """Yield row chunks of sql, whose first column is the key; sql ends in '... > %s ORDER BY key LIMIT %s'"""
+    while True:
+        cursor.execute(sql, tuple(params) + (last_id, chunk_size))
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield rows
+
+def map_chunks_in_pool(fn, chunks, workers=None):
+    """Yield fn(chunk) for each chunk, in order, from worker processes with a bounded number in flight"""
+    # spawn: workers import only the small parsing modules, never the web app and its threads
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        in_flight = 2 * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk))
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def count_stale_parses(cursor):
+    cursor.execute(f"""
+        SELECT COUNT(*) FROM {LIVE_RESUME_TEXTS}
+        LEFT JOIN resume_parses p ON t.student_id = p.student_id
+        WHERE p.student_id IS NULL OR p.parser_version < %s
+    """, (PARSER_VERSION,))
+    return cursor.fetchone()[0]
+
+def backfill_resume_parses(workers=None, chunk_size=REPARSE_CHUNK_SIZE, progress=None, dry_run=False):
+    """Re-run the text -> fields stage for every resume parsed by an older PARSER_VERSION.
+
+    Chunks are parsed in parallel worker processes while the main process
+    writes results back, one transaction per chunk. Returns the number of
+    resumes reparsed.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    ensure_reparse_tables(cursor)
+    ensure_profile_version_column(cursor)
+    total = count_stale_parses(cursor)
+    if progress:
+        progress(0, total)
+    if dry_run or total == 0:
+        cursor.close()
+        conn.close()
+        return 0 if not dry_run else total
+
+    stale_chunks = keyset_chunks(cursor, f"""
+        SELECT t.student_id, t.raw_text FROM {LIVE_RESUME_TEXTS}
+        LEFT JOIN resume_parses p ON t.student_id = p.student_id
+        WHERE (p.student_id IS NULL OR p.parser_version < %s) AND t.student_id > %s
+        ORDER BY t.student_id LIMIT %s
+    """, chunk_size, params=(PARSER_VERSION,))
+
+    done = 0
+    try:
+        for results in map_chunks_in_pool(parse_text_chunk, stale_chunks, workers):
+            for student_id, parsed in results:
+                save_parse_result(cursor, student_id, parsed)
+                apply_parse_to_profile(cursor, student_id, parsed)
+            conn.commit()
+            done += len(results)
+            if progress:
+                progress(done, total)
+    finally:
+        cursor.close()
+        conn.close()
+    return done
+
+def run_reparse_in_background():
+    slug = current_tenant().slug
+    progress = reparse_progress[slug] = {"state": "idle"}
+
+    def report(done, total):
+        progress.update(done=done, total=total)
+
+    try:
+        progress.update(state="running", started_at=datetime.now().isoformat(timespec="seconds"),
+                        parser_version=PARSER_VERSION, done=0, total=None, error=None)
+        backfill_resume_parses(progress=report)
+        progress.update(state="finished", finished_at=datetime.now().isoformat(timespec="seconds"))
+    except Exception as e:
+        app.logger.error(f"Error reparsing resumes for {slug}: {e}")
+        progress.update(state="failed", error=str(e))
+    finally:
+        with reparse_lock:
+            reparse_running.discard(slug)
+
 # ==================== AUTHENTICATION ROUTES ====================
 @app.route("/")
 def index():
@@ -292,7 +2193,9 @@ def login():
                     pw_ok = (stored_pw == password)
 
                 if pw_ok:
+                    regenerate_session()
                     session["user_id"] = user.get("user_id")
+                    session["tenant"] = current_tenant().slug
                     session["role"] = role
                     session["email"] = user.get("email")
                     session["name"] = user.get("name")
@@ -316,7 +2219,7 @@ def login():
 
 @app.route("/logout")
 def logout():
-    session.clear()
+    regenerate_session()
     return redirect(url_for("login"))
 
 # ==================== DASHBOARD ROUTES ====================
@@ -346,7 +2249,7 @@ def student_dashboard():
         conn.close()
     
     # Merge parsed data with profile
-    parsed = session.get('parsed_profile_data', {})
+    parsed = load_session_item('parsed_profile_data', {})
     for k, v in parsed.items():
         if v and (not profile.get(k) or profile.get(k) in ("", None)): 
             profile[k] = v
@@ -383,28 +2286,45 @@ def upload_resume():
     
     # Save file
     filename = secure_filename(f"{student_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}_{file.filename}")
-    save_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    save_path = os.path.join(upload_folder(), filename)
+    os.makedirs(upload_folder(), exist_ok=True)
     file.save(save_path)
 
     # Parse resume
-    parsed = parse_resume_local(save_path)
+    with METRICS.timer('erp_resume_parse_stage_seconds', stage='extract'):
+        resume_text = extract_resume_text(save_path)
+    parsed = parse_resume_local(save_path, resume_text)
     mapped = map_resume_to_profile(parsed)
+    semantic_submit("resumes", student_id, resume_text)
     
     # Store parsed data
     if any(parsed.get(f) for f in ['email', 'mobile_number', 'skills', 'certifications', 'projects']):
-        session['parsed_profile_data'] = mapped
+        save_session_item('parsed_profile_data', mapped)
         flash("Resume uploaded & parsed!", "success")
     else: 
         flash("Resume uploaded, but limited data parsed.", "warning")
     
     # Update database
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE students SET resume_path=%s WHERE student_id=%s", (filename, student_id))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE students SET resume_path=%s WHERE student_id=%s", (filename, student_id))
+        conn.commit()
+        cursor.close()
+    finally:
+        conn.close()
+
+    try:
+        store_resume_text_and_parse(student_id, filename, resume_text, parsed)
+    except Exception as e:
+        app.logger.error(f"Error storing resume text: {e}")
+
+    try:
+        duplicates = register_resume_fingerprint(student_id, filename, resume_text)
+        if duplicates:
+            app.logger.warning(f"Resume of student {student_id} resembles students {duplicates}")
+    except Exception as e:
+        app.logger.error(f"Error fingerprinting resume: {e}")
     
     return redirect(url_for("student_dashboard"))
 
@@ -412,7 +2332,7 @@ def upload_resume():
 def download_resume(filename):
     if session.get("role") not in ["student", "recruiter", "tpo"]: 
         return redirect(url_for("login"))
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename, as_attachment=False)
+    return send_from_directory(upload_folder(), filename, as_attachment=False)
 
 @app.route("/delete_resume", methods=["POST"])
 def delete_resume():
@@ -430,13 +2350,16 @@ def delete_resume():
 
         if result and result[0]:
             old_resume_filename = result[0]
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], old_resume_filename)
+            file_path = os.path.join(upload_folder(), old_resume_filename)
 
             if os.path.exists(file_path):
                 os.remove(file_path)
 
             cursor.execute("UPDATE students SET resume_path=NULL WHERE student_id=%s", (student_id,))
+            delete_resume_fingerprints(cursor, [student_id])
+            delete_resume_texts(cursor, [student_id])
             conn.commit()
+            semantic_delete("resumes", [student_id])
             flash("Resume deleted successfully!", "success")
         else:
             flash("No resume found to delete.", "warning")
@@ -449,9 +2372,69 @@ def delete_resume():
         cursor.close()
         conn.close()
 
-    return redirect(url_for("student_dashboard"))
+    return redirect(url_for("student_dashboard"))
+
+# ==================== STUDENT PROFILE MANAGEMENT ====================
+# Every student_profile write bumps row_version; PATCH /student/profile only applies
+# when the client's row_version is still current, so concurrent saves (another
+# session, a resume reparse) are reported as conflicts instead of overwritten.
+STUDENT_PROFILE_FIELDS = (
+    "roll_no", "prn_no", "department", "first_name", "last_name", "dob", "gender", "phone", "email",
+    "tenth_percentage", "tenth_year", "tenth_board",
+    "twelfth_percentage", "twelfth_year", "twelfth_board",
+    "diploma_percentage", "diploma_year", "diploma_branch",
+    "sem1", "sem2", "sem3", "sem4", "sem5", "sem6", "sem7", "sem8", "average",
+    "engg_passing_year", "live_backlogs", "year_gap",
+    "extracurricular", "academic_projects", "programming_languages", "certificates", "hobbies",
+    "linkedin_url", "github_url", "local_address", "permanent_address", "native_place"
+)
+
+# (name, source columns, refresh(conn, student_id)): rebuilt only when a PATCH changes a source column
+PROFILE_DERIVED_DATA = (
+    ("eligibility", db_layer.ELIGIBILITY_PROFILE_FIELDS,
+     lambda conn, student_id: refresh_eligibility_snapshot(conn, [student_id])),
+)
+
+profile_version_ready = set()   # tenant slugs
+
+def ensure_profile_version_column(cursor):
+    if current_tenant().slug in profile_version_ready:
+        return
+    cursor.execute("SHOW COLUMNS FROM student_profile LIKE 'row_version'")
+    if not cursor.fetchall():
+        cursor.execute("ALTER TABLE student_profile ADD COLUMN row_version INT NOT NULL DEFAULT 0")
+    profile_version_ready.add(current_tenant().slug)
+
+def profile_value_changed(current, value):
+    """Whether a submitted value differs from the stored column value ('' and None both mean NULL)"""
+    value = None if value == "" else value
+    if current is None or value is None:
+        return current is not value
+    if isinstance(current, (int, float, decimal.Decimal)) and not isinstance(current, bool):
+        try:
+            return decimal.Decimal(str(current)) != decimal.Decimal(str(value))
+        except decimal.InvalidOperation:
+            return True
+    if isinstance(current, (date, datetime)):
+        current = current.isoformat()
+    return str(current) != str(value)
+
+def refresh_profile_derived_data(conn, student_id, changed):
+    """Refresh the derived data fed by the changed columns, returning the names refreshed"""
+    refreshed = []
+    for name, fields, refresh in PROFILE_DERIVED_DATA:
+        if fields.intersection(changed):
+            refresh(conn, student_id)
+            refreshed.append(name)
+    return refreshed
+
+def profile_conflict(profile):
+    return jsonify({
+        "error": "Your profile was changed elsewhere since you loaded it. Reload and reapply your edits.",
+        "row_version": profile["row_version"],
+        "profile": profile
+    }), 409
 
-# ==================== STUDENT PROFILE MANAGEMENT ====================
 @app.route("/student/profile", methods=["GET", "POST"])
 def student_profile():
     if session.get("role") != "student":
@@ -472,6 +2455,7 @@ def student_profile():
                 data[k] = None
 
         try:
+            ensure_profile_version_column(cursor)
             cursor.execute("SELECT profile_id FROM student_profile WHERE student_id=%s", (student_id,))
             existing_profile = cursor.fetchone()
 
@@ -490,9 +2474,10 @@ def student_profile():
                         extracurricular=%(extracurricular)s, academic_projects=%(academic_projects)s, programming_languages=%(programming_languages)s,
                         certificates=%(certificates)s, hobbies=%(hobbies)s,
                         linkedin_url=%(linkedin_url)s, github_url=%(github_url)s, local_address=%(local_address)s, permanent_address=%(permanent_address)s, native_place=%(native_place)s,
-                        last_updated=NOW(), edited_by_student=TRUE
+                        last_updated=NOW(), edited_by_student=TRUE, row_version=row_version + 1
                     WHERE student_id=%(student_id)s
                 """, data)
+                profile_action = "update_profile"
                 flash("Profile updated successfully!", "success")
             else:
                 # Create new profile
@@ -516,12 +2501,15 @@ def student_profile():
                         %(engg_passing_year)s, %(live_backlogs)s, %(year_gap)s,
                         %(extracurricular)s, %(academic_projects)s, %(programming_languages)s, %(certificates)s, %(hobbies)s,
                         %(linkedin_url)s, %(github_url)s, %(local_address)s, %(permanent_address)s, %(native_place)s,
-                        NOW(), FALSE
+                        NOW(), TRUE
                     )
                 """, data)
+                profile_action = "create_profile"
                 flash("Profile created successfully!", "success")
 
+            refresh_eligibility_snapshot(conn, [student_id])
             conn.commit()
+            audit(profile_action, "student", student_id, source="form")
         except Exception as e:
             conn.rollback()
             app.logger.error(f"Error saving profile: {e}")
@@ -540,649 +2528,1588 @@ def student_profile():
 
     return render_template("student_dashboard.html", profile=profile)
 
+@app.route("/student/profile", methods=["PATCH"])
+def patch_student_profile():
+    """Save only the profile fields that changed, if nobody else saved since the client loaded it.
+
+    Body: {"row_version": <version the client loaded>, "fields": {column: value}}.
+    Returns the new row_version, or 409 with the current profile on a conflict.
+    """
+    if session.get("role") != "student":
+        return jsonify({"error": "Access denied"}), 403
+
+    payload = request.get_json(silent=True) or {}
+    fields = payload.get("fields")
+    version = payload.get("row_version")
+    if not isinstance(fields, dict) or not isinstance(version, int) or isinstance(version, bool):
+        return jsonify({"error": "Expected {\"row_version\": int, \"fields\": {...}}"}), 400
+    unknown = sorted(set(fields) - set(STUDENT_PROFILE_FIELDS))
+    if unknown:
+        return jsonify({"error": f"Unknown profile fields: {', '.join(unknown)}"}), 400
+    if any(isinstance(value, (dict, list)) for value in fields.values()):
+        return jsonify({"error": "Profile field values must be strings, numbers or null"}), 400
+
+    student_id = session.get("user_id")
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True, buffered=True)
+    try:
+        ensure_profile_version_column(cursor)
+        cursor.execute("SELECT * FROM student_profile WHERE student_id=%s", (student_id,))
+        current = cursor.fetchone()
+        if not current:
+            return jsonify({"error": "No profile yet; save the full profile form first"}), 404
+        if current["row_version"] != version:
+            return profile_conflict(current)
+
+        changed = {field: (None if value == "" else value) for field, value in fields.items()
+                   if profile_value_changed(current[field], value)}
+        if not changed:
+            return jsonify({"row_version": version, "updated": [], "refreshed": []})
+
+        assignments = ", ".join(f"{field}=%s" for field in changed)
+        cursor.execute(f"""
+            UPDATE student_profile SET {assignments},
+                row_version=row_version + 1, last_updated=NOW(), edited_by_student=TRUE
+            WHERE student_id=%s AND row_version=%s
+        """, (*changed.values(), student_id, version))
+        if cursor.rowcount == 0:
+            # Saved by someone else after our read; re-read outside this transaction's snapshot
+            conn.rollback()
+            cursor.execute("SELECT * FROM student_profile WHERE student_id=%s", (student_id,))
+            return profile_conflict(cursor.fetchone())
+
+        refreshed = refresh_profile_derived_data(conn, student_id, changed)
+        conn.commit()
+        audit("update_profile", "student", student_id, source="patch", fields=sorted(changed),
+              row_version=version + 1)
+    except Exception as e:
+        conn.rollback()
+        app.logger.error(f"Error patching profile: {e}")
+        return jsonify({"error": "Failed to save profile"}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+    return jsonify({"row_version": version + 1, "updated": sorted(changed), "refreshed": refreshed})
+
 # ==================== API ROUTES FOR DATA FETCHING ====================
 @app.route("/student_events")
+@read_only
 def student_events():
+    """Events in a window: ?window=upcoming|past&days=N&limit=N&after=<X-Next-Cursor>"""
     if session.get("role") != "student":
         return jsonify([])
 
+    try:
+        window = request.args.get("window", "upcoming")
+        days = db_layer.bounded_int(request.args.get("days"), db_layer.FEED_DEFAULT_DAYS, db_layer.FEED_MAX_DAYS)
+        limit = db_layer.bounded_int(request.args.get("limit"), db_layer.FEED_PAGE_SIZE, db_layer.FEED_MAX_PAGE_SIZE)
+        start, end, descending = db_layer.event_window(window, days, date.today())
+        after = db_layer.parse_event_cursor(request.args["after"]) if request.args.get("after") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     conn = get_db_connection()
     cursor = conn.cursor(dictionary=True)
-    cursor.execute("""
-        SELECT e.title, e.description, e.date, t.name AS created_by_name
-        FROM placement_events e
-        LEFT JOIN tpos t ON e.created_by = t.tpo_id
-        ORDER BY e.date ASC
-    """)
-    events = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    try:
+        if window == "upcoming" and not after:
+            page = upcoming_events(cursor, days, limit)
+        else:
+            page = fetch_events(cursor, start, end, limit, descending, after)
+    finally:
+        cursor.close()
+        conn.close()
+    return feed_response(page)
+
+@app.route("/student_events/calendar")
+@read_only
+def student_events_calendar():
+    """Events dated from ?start= to ?end= (inclusive YYYY-MM-DD, at most CALENDAR_MAX_DAYS apart)"""
+    if session.get("role") != "student":
+        return jsonify([])
+
+    try:
+        start, end = db_layer.calendar_range(request.args.get("start"), request.args.get("end"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        # The dashboard's default range starts today, which is the cached upcoming window
+        if start == date.today():
+            events, _ = upcoming_events(cursor, (end - start).days, db_layer.CALENDAR_MAX_EVENTS)
+        else:
+            events, _ = fetch_events(cursor, start, end, db_layer.CALENDAR_MAX_EVENTS)
+    finally:
+        cursor.close()
+        conn.close()
     return jsonify(events)
 
 @app.route("/prep_resources_student")
+@read_only
 def prep_resources_student():
+    """Resources newest first, a page at a time: ?limit=N&after=<X-Next-Cursor>"""
     if session.get("role") != "student":
         return jsonify([])
 
+    try:
+        limit = db_layer.bounded_int(request.args.get("limit"), db_layer.FEED_PAGE_SIZE, db_layer.FEED_MAX_PAGE_SIZE)
+        after = db_layer.parse_resource_cursor(request.args["after"]) if request.args.get("after") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     conn = get_db_connection()
     cursor = conn.cursor(dictionary=True)
-    cursor.execute("""
-        SELECT r.title, r.description, r.file_path, t.name AS created_by_name
-        FROM prep_resources r
-        LEFT JOIN tpos t ON r.created_by = t.tpo_id
-        ORDER BY r.resource_id DESC
-    """)
-    resources = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    try:
+        page = fetch_resources(cursor, limit, after)
+    finally:
+        cursor.close()
+        conn.close()
+    return feed_response(page)
+
+@app.route("/search")
+def search():
+    """Ranked, prefix-matching search over jobs and/or resources.
+
+    Query args: q, type (jobs | resources | all), page, per_page.
+    Students only see jobs whose deadline has not passed and whose recruiter is active.
+    """
+    role = session.get("role")
+    if role not in ("student", "tpo"):
+        return jsonify({"error": "Access denied"}), 403
+
+    query = request.args.get("q", "")
+    search_type = request.args.get("type", "all")
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 20, type=int), 1), 100)
+    offset = (page - 1) * per_page
+
+    try:
+        result = {"query": query, "page": page, "per_page": per_page}
+        if search_type in ("jobs", "all"):
+            student = role == "student"
+            min_deadline = datetime.now().date() if student else None
+            hits, has_more = search_index().search_jobs(query, per_page, offset, min_deadline, active_only=student)
+            result["jobs"] = {"results": hits, "has_more": has_more}
+        if search_type in ("resources", "all"):
+            hits, has_more = search_index().search_resources(query, per_page, offset)
+            result["resources"] = {"results": hits, "has_more": has_more}
+        return jsonify(result)
+    except Exception as e:
+        app.logger.error(f"Error searching: {e}")
+        return jsonify({"error": "Search failed"}), 500
+
+@app.route('/download_resource/<path:filename>')
+def download_resource(filename):
+    if session.get("role") not in ["student", "recruiter", "tpo"]:
+        return redirect(url_for("login"))
+    
+    clean_filename = os.path.basename(filename)
+    possible_paths = [current_tenant().path(p) for p in ('static/resources', 'static/uploads', 'resources', 'uploads')]
+    
+    for path in possible_paths:
+        file_path = os.path.join(path, clean_filename)
+        if os.path.exists(file_path):
+            return send_from_directory(path, clean_filename, as_attachment=True)
+    
+    flash(f"Resource file '{clean_filename}' not found.", "error")
+    return redirect(url_for("student_dashboard"))
+
+# ==================== TPO MANAGEMENT ROUTES ====================
+@app.route("/add_student", methods=["POST"])
+def add_student():
+    if session.get("role") != "tpo":
+        flash("Access denied.", "error")
+        return redirect(url_for("login"))
+    
+    try:
+        if not request.form.get("name") or not request.form.get("email"):
+            flash("Name and email are required.", "error")
+            return redirect(url_for("tpo_dashboard"))
+
+        conn = get_db_connection()
+        try:
+            create_students(conn, [{k: request.form.get(k) for k in STUDENT_ACCOUNT_COLUMNS}])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        
+        flash("Student added successfully!", "success")
+    except Exception as e:
+        flash(f"Error adding student: {e}", "error")
+    
+    return redirect(url_for("tpo_dashboard"))
+
+@app.route("/add_event", methods=["POST"])
+def add_event():
+    if session.get("role") != "tpo":
+        flash("Access denied.", "error")
+        return redirect(url_for("login"))
+    
+    try:
+        title = request.form.get("title")
+        description = request.form.get("description")
+        date = request.form.get("date")
+        
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO placement_events (title, description, date, created_by)
+                VALUES (%s, %s, %s, %s)
+            """, (title, description, date, session.get("user_id")))
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+        clear_upcoming_events_cache()
+        
+        flash("Event posted successfully!", "success")
+    except Exception as e:
+        flash(f"Error posting event: {e}", "error")
     
-    return jsonify(resources)
+    return redirect(url_for("tpo_dashboard"))
+
+@app.route("/add_resource", methods=["POST"])
+def add_resource():
+    if session.get("role") != "tpo":
+        flash("Access denied.", "error")
+        return redirect(url_for("login"))
+    
+    try:
+        title = request.form.get("title")
+        description = request.form.get("description")
+        file = request.files.get("file")
+        
+        if file and file.filename:
+            filename = secure_filename(file.filename)
+            os.makedirs(upload_folder(), exist_ok=True)
+            save_path = os.path.join(upload_folder(), filename)
+            file.save(save_path)
+            
+            conn = get_db_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO prep_resources (title, description, file_path, created_by)
+                    VALUES (%s, %s, %s, %s)
+                """, (title, description, filename, session.get("user_id")))
+                conn.commit()
+                resource_id = cursor.lastrowid
+                cursor.close()
+            finally:
+                conn.close()
+
+            sync_search_index(search_index().upsert_resource, {
+                "resource_id": resource_id, "title": title, "description": description, "file_path": filename
+            })
+            
+            flash("Resource uploaded successfully!", "success")
+        else:
+            flash("Please select a file.", "error")
+            
+    except Exception as e:
+        flash(f"Error uploading resource: {e}", "error")
+    
+    return redirect(url_for("tpo_dashboard"))
+
+# ==================== TPO API ROUTES ====================
+@app.route('/all_student_profiles')
+@read_only
+def all_student_profiles():
+    """Get all student profiles for TPO dashboard"""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(db_layer.ALL_STUDENT_PROFILES_SQL)
+        return stream_rows(conn, cursor)
+    except Exception as e:
+        app.logger.error(f"Error fetching student profiles: {e}")
+        if conn:
+            conn.close()
+        return jsonify([])
+
+@app.route('/all_applications')
+@read_only
+def all_applications():
+    """Get all job applications for TPO dashboard"""
+    if session.get("role") != "tpo":
+        return jsonify([])
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        
+        # Check if applications table exists
+        cursor.execute(db_layer.APPLICATIONS_TABLE_EXISTS_SQL)
+        table_exists = cursor.fetchone()
+        
+        if not table_exists:
+            cursor.close()
+            conn.close()
+            return jsonify([])
+        
+        cursor.execute(db_layer.ALL_APPLICATIONS_SQL)
+        return stream_rows(conn, cursor)
+    except Exception as e:
+        app.logger.error(f"Error fetching applications: {e}")
+        if conn:
+            conn.close()
+        return jsonify([])
+
+@app.route('/all_resources')
+@read_only
+def all_resources():
+    """Get all preparation resources"""
+    try:
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(db_layer.ALL_RESOURCES_SQL)
+            resources = cursor.fetchall()
+            cursor.close()
+        finally:
+            conn.close()
+        
+        return jsonify(resources)
+    except Exception as e:
+        app.logger.error(f"Error fetching resources: {e}")
+        return jsonify([])
+
+@app.route('/get_student_profile/<int:student_id>')
+@read_only
+def get_student_profile(student_id):
+    """Get complete profile of a specific student"""
+    conn = None
+    cursor = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        
+        cursor.execute("SELECT * FROM student_profile WHERE student_id = %s", (student_id,))
+        student = cursor.fetchone()
+        
+        if not student:
+            return jsonify({'error': 'Student not found'}), 404
+            
+        return jsonify(student)
+        
+    except Exception as e:
+        app.logger.error(f"Error fetching student profile: {e}")
+        return jsonify({'error': 'Failed to fetch student profile'}), 500
+        
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+@app.route("/delete_student/<int:student_id>", methods=["POST"])
+def delete_student(student_id):
+    """Archive a single student together with their profile and applications"""
+    if session.get("role") != "tpo":
+        return jsonify({"message": "Access denied"}), 403
+
+    conn = get_db_connection()
+    try:
+        app.logger.info(f"Attempting to delete student with ID: {student_id}")
+        ensure_archive_tables(conn)
+        if not archive_student_chunk(conn, [student_id]):
+            return jsonify({"message": "Student not found"}), 404
+        audit("delete_student", "student", student_id)
+        app.logger.info(f"Student {student_id} deleted successfully.")
+        return jsonify({"message": "Student and related records deleted successfully."})
+    except Exception as e:
+        app.logger.error(f"Error deleting student {student_id}: {e}")
+        conn.rollback()
+        return jsonify({"message": f"Error deleting student: {str(e)}"}), 500
+    finally:
+        conn.close()
+
+@app.route("/archive_students", methods=["POST"])
+def archive_students():
+    """Archive a whole cohort, e.g. passing_year=2024, in chunked transactions"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
 
-@app.route('/download_resource/<path:filename>')
-def download_resource(filename):
-    if session.get("role") not in ["student", "recruiter", "tpo"]:
-        return redirect(url_for("login"))
-    
-    clean_filename = os.path.basename(filename)
-    possible_paths = ['static/resources', 'static/uploads', 'resources', 'uploads']
-    
-    for path in possible_paths:
-        file_path = os.path.join(path, clean_filename)
-        if os.path.exists(file_path):
-            return send_from_directory(path, clean_filename, as_attachment=True)
-    
-    flash(f"Resource file '{clean_filename}' not found.", "error")
-    return redirect(url_for("student_dashboard"))
+    filters = {k: request.form.get(k) for k in STUDENT_ARCHIVE_FILTERS if request.form.get(k)}
+    if not filters:
+        return jsonify({"error": "At least one filter (passing_year, branch) is required"}), 400
 
-# ==================== TPO MANAGEMENT ROUTES ====================
-@app.route("/add_student", methods=["POST"])
-def add_student():
+    conn = get_db_connection()
+    try:
+        if request.form.get("dry_run"):
+            return jsonify({"matched": count_students_matching(conn, filters), "dry_run": True})
+        archived, chunks = archive_students_matching(conn, filters)
+        app.logger.info(f"Archived {archived} students in {chunks} chunks for {filters}")
+        return jsonify({"message": f"Archived {archived} students.", "archived": archived, "chunks": chunks})
+    except Exception as e:
+        app.logger.error(f"Error archiving students {filters}: {e}")
+        conn.rollback()
+        return jsonify({"error": f"Error archiving students: {str(e)}"}), 500
+    finally:
+        conn.close()
+
+@app.route("/delete_resource/<int:resource_id>", methods=["POST"])
+def delete_resource(resource_id):
+    """Delete a preparation resource"""
     if session.get("role") != "tpo":
-        flash("Access denied.", "error")
-        return redirect(url_for("login"))
+        return jsonify({"error": "Access denied"}), 403
     
     try:
-        name = request.form.get("name")
-        email = request.form.get("email")
-        password = request.form.get("password")
-        cgpa = request.form.get("cgpa")
-        passing_year = request.form.get("passing_year")
-        branch = request.form.get("branch")
-        phone = request.form.get("phone")
-        
         conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO students (name, email, password, cgpa, passing_year, branch, phone)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (name, email, password, cgpa, passing_year, branch, phone))
-        conn.commit()
-        cursor.close()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+
+            # Get file path before deleting
+            cursor.execute("SELECT file_path, title FROM prep_resources WHERE resource_id = %s", (resource_id,))
+            result = cursor.fetchone()
+
+            if result:
+                file_path = os.path.join(upload_folder(), result[0])
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
+            # Delete from database
+            cursor.execute("DELETE FROM prep_resources WHERE resource_id = %s", (resource_id,))
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+        sync_search_index(search_index().delete_resource, resource_id)
+        if result:
+            audit("delete_resource", "resource", resource_id, title=result[1], file_path=result[0])
         
-        flash("Student added successfully!", "success")
+        return jsonify({"message": "Resource deleted successfully"})
     except Exception as e:
-        flash(f"Error adding student: {e}", "error")
-    
-    return redirect(url_for("tpo_dashboard"))
+        app.logger.error(f"Error deleting resource: {e}")
 
-@app.route("/add_event", methods=["POST"])
-def add_event():
-    if session.get("role") != "tpo":
-        flash("Access denied.", "error")
-        return redirect(url_for("login"))
+        return jsonify({"error": str(e)}), 500
     
+@app.route("/recruiter_status/<int:company_id>", methods=["POST"])
+def set_recruiter_status(company_id):
+    """Activate or deactivate a recruiter; a deactivated recruiter's jobs leave the student feed and search"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
+    status = (request.get_json(silent=True) or request.form).get("status")
+    if status not in ("active", "inactive"):
+        return jsonify({"error": "status must be 'active' or 'inactive'"}), 400
+
+    conn = get_db_connection()
+    cursor = conn.cursor(buffered=True)
     try:
-        title = request.form.get("title")
-        description = request.form.get("description")
-        date = request.form.get("date")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO placement_events (title, description, date, created_by)
-            VALUES (%s, %s, %s, %s)
-        """, (title, description, date, session.get("user_id")))
+        cursor.execute("SELECT status FROM recruiters WHERE company_id = %s", (company_id,))
+        row = cursor.fetchone()
+        if not row:
+            return jsonify({"error": "Recruiter not found"}), 404
+        cursor.execute("UPDATE recruiters SET status = %s WHERE company_id = %s", (status, company_id))
         conn.commit()
+    except Exception as e:
+        app.logger.error(f"Error updating recruiter {company_id}: {e}")
+        conn.rollback()
+        return jsonify({"error": "Failed to update recruiter"}), 500
+    finally:
         cursor.close()
         conn.close()
-        
-        flash("Event posted successfully!", "success")
-    except Exception as e:
-        flash(f"Error posting event: {e}", "error")
-    
-    return redirect(url_for("tpo_dashboard"))
 
-@app.route("/add_resource", methods=["POST"])
-def add_resource():
-    if session.get("role") != "tpo":
+    sync_search_index(search_index().set_recruiter_active, company_id, status == "active")
+    audit("set_recruiter_status", "recruiter", company_id, status=status, previous=row[0])
+    return jsonify({"message": f"Recruiter marked {status}"})
+
+# ==================== JOB MANAGEMENT ROUTES ====================
+
+@app.route("/post_job", methods=["POST"])
+def post_job():
+    if session.get("role") != "recruiter":
         flash("Access denied.", "error")
         return redirect(url_for("login"))
     
     try:
+        ensure_tables_exist()  # Ensure tables exist before posting job
+        
         title = request.form.get("title")
         description = request.form.get("description")
-        file = request.files.get("file")
+        location = request.form.get("location")
+        salary = request.form.get("salary")
+        deadline = request.form.get("deadline")
+        eligibility_criteria = request.form.get("description", "")  # Using description as fallback
+        eligibility = request.form.get("eligibility")  # Minimum CGPA
+        target_branches = request.form.getlist("target_branches")  # Multiple branches
         
-        if file and file.filename:
-            filename = secure_filename(file.filename)
-            save_path = os.path.join('static/uploads', filename)
-            file.save(save_path)
-            
-            conn = get_db_connection()
+        # Convert target_branches list to string for storage
+        target_branches_str = ",".join(target_branches)
+        
+        conn = get_db_connection()
+        try:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO prep_resources (title, description, file_path, created_by)
-                VALUES (%s, %s, %s, %s)
-            """, (title, description, filename, session.get("user_id")))
+                INSERT INTO jobs (company_id, title, description, location, salary, deadline,
+                                eligibility_criteria, eligibility, target_branches)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (session.get("user_id"), title, description, location, salary, deadline,
+                  eligibility_criteria, eligibility, target_branches_str))
+            job_id = cursor.lastrowid
+            refresh_job_branch_codes(cursor, job_id, target_branches_str)
+            enqueue_new_job_notifications(cursor, job_id)
             conn.commit()
+            cursor.execute("SELECT status FROM recruiters WHERE company_id = %s", (session.get("user_id"),))
+            recruiter = cursor.fetchone()
             cursor.close()
+        finally:
             conn.close()
-            
-            flash("Resource uploaded successfully!", "success")
-        else:
-            flash("Please select a file.", "error")
-            
+
+        sync_search_index(search_index().upsert_job, {
+            "job_id": job_id, "title": title, "description": description, "location": location,
+            "company_name": session.get("name"), "deadline": deadline,
+            "company_id": session.get("user_id"), "status": recruiter[0] if recruiter else None
+        })
+        semantic_submit("jobs", job_id, job_embedding_text(title, description, location))
+        
+        flash("Job posted successfully!", "success")
     except Exception as e:
-        flash(f"Error uploading resource: {e}", "error")
+        flash(f"Error posting job: {e}", "error")
     
-    return redirect(url_for("tpo_dashboard"))
+    return redirect(url_for("recruiter_dashboard"))
 
-# ==================== TPO API ROUTES ====================
-@app.route('/all_student_profiles')
-def all_student_profiles():
-    """Get all student profiles for TPO dashboard"""
+@app.route("/recruiter_jobs")
+@read_only
+def recruiter_jobs():
+    if session.get("role") != "recruiter":
+        return jsonify([])
+    
     try:
+        ensure_tables_exist()  # Ensure tables exist before fetching jobs
+        
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT sp.*, s.name as student_name, s.email as student_email, s.resume_path
-            FROM student_profile sp
-            JOIN students s ON sp.student_id = s.student_id
-        """)
-        students = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(db_layer.RECRUITER_JOBS_SQL, (session.get("user_id"),))
+            jobs = cursor.fetchall()
+            cursor.close()
+        finally:
+            conn.close()
         
-        return jsonify(students)
+        return jsonify(db_layer.split_target_branches(jobs))
     except Exception as e:
-        app.logger.error(f"Error fetching student profiles: {e}")
+        app.logger.error(f"Error fetching recruiter jobs: {e}")
+        return jsonify([])
+
+@app.route("/student_jobs")
+def student_jobs():
+    """Fetch jobs visible to students based on eligibility and active recruiters."""
+    if session.get("role") != "student":
         return jsonify([])
 
-@app.route('/all_applications')
-def all_applications():
-    """Get all job applications for TPO dashboard"""
     try:
+        with METRICS.timer('erp_section_duration_seconds', section='student_jobs.ensure_tables'):
+            ensure_tables_exist()
+        student_id = session.get("user_id")
+
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor = conn.cursor(dictionary=True)
+
+            # 🎓 Get student's branch and CGPA
+            cursor.execute(db_layer.STUDENT_ELIGIBILITY_SQL, (student_id,))
+            student = cursor.fetchone()
+
+            if not student:
+                cursor.close()
+                return jsonify([])
+
+            # 💼 Fetch only active jobs (deadline not passed + active recruiter), matched in SQL
+            cursor.execute(db_layer.STUDENT_JOBS_SQL, db_layer.student_jobs_params(student))
+            all_jobs = cursor.fetchall()
+            cursor.close()
+        finally:
+            conn.close()
+
+        eligibility_started = time.perf_counter()
+        job_list = db_layer.build_student_job_list(student, all_jobs)
+        METRICS.observe('erp_section_duration_seconds', time.perf_counter() - eligibility_started,
+                        section='student_jobs.eligibility')
+        return jsonify(job_list)
+
+    except Exception as e:
+        app.logger.error(f"Error fetching student jobs: {e}")
+        return jsonify({"error": "Failed to fetch jobs"}), 500
+
+@app.route("/tpo_jobs")
+@read_only
+def tpo_jobs():
+    if session.get("role") != "tpo":
+        return jsonify([])
+    
+    try:
+        ensure_tables_exist()  # Ensure tables exist before fetching jobs
         
-        # Check if applications table exists
-        cursor.execute("SHOW TABLES LIKE 'applications'")
-        table_exists = cursor.fetchone()
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(db_layer.TPO_JOBS_SQL)
+            jobs = cursor.fetchall()
+            cursor.close()
+        finally:
+            conn.close()
         
-        if not table_exists:
+        return jsonify(db_layer.split_target_branches(jobs))
+    except Exception as e:
+        app.logger.error(f"Error fetching TPO jobs: {e}")
+        return jsonify([])
+
+@app.route("/apply_job", methods=["POST"])
+def apply_job():
+    if session.get("role") != "student":
+        return jsonify({"error": "Access denied"}), 403
+    
+    try:
+        ensure_tables_exist()  # Ensure tables exist before applying
+        
+        job_id = request.form.get("job_id")
+        experience_years = request.form.get("experience_years", 0)
+        commitment_hours = request.form.get("commitment_hours", 0)
+        
+        student_id = session.get("user_id")
+        
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor(dictionary=True)
+
+            # Check if student has already applied
+            cursor.execute("""
+                SELECT * FROM applications
+                WHERE student_id = %s AND job_id = %s
+            """, (student_id, job_id))
+
+            existing_application = cursor.fetchone()
+            if existing_application:
+                return jsonify({"error": "You have already applied for this job"}), 400
+
+            # Get student's resume path
+            cursor.execute("SELECT resume_path FROM students WHERE student_id = %s", (student_id,))
+            student = cursor.fetchone()
+            resume_path = student['resume_path'] if student else None
+
+            if not resume_path:
+                return jsonify({"error": "Please upload your resume before applying"}), 400
+
+            # Create application
+            cursor.execute("""
+                INSERT INTO applications (job_id, student_id, submitted_resume_path,
+                                        experience_years, commitment_hours, status)
+                VALUES (%s, %s, %s, %s, %s, 'applied')
+            """, (job_id, student_id, resume_path, experience_years, commitment_hours))
+
+            conn.commit()
             cursor.close()
+        finally:
             conn.close()
-            return jsonify([])
         
-        cursor.execute("""
-            SELECT a.*, s.name as student_name, s.email as student_email
-            FROM applications a
-            JOIN students s ON a.student_id = s.student_id
-            ORDER BY a.applied_date DESC
-        """)
-        applications = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        return jsonify({"message": "Application submitted successfully!"})
         
-        return jsonify(applications)
     except Exception as e:
-        app.logger.error(f"Error fetching applications: {e}")
-        return jsonify([])
+        app.logger.error(f"Error applying for job: {e}")
+        return jsonify({"error": "Failed to apply for job"}), 500
 
-@app.route('/all_resources')
-def all_resources():
-    """Get all preparation resources"""
+@app.route("/recruiter_applicants")
+@read_only
+def recruiter_applicants():
+    if session.get("role") != "recruiter":
+        return jsonify([])
+    
     try:
+        ensure_tables_exist()  # Ensure tables exist before fetching applicants
+        
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM prep_resources ORDER BY resource_id DESC")
-        resources = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(db_layer.RECRUITER_APPLICANTS_SQL, (session.get("user_id"),))
+            applications = cursor.fetchall()
+            cursor.close()
+        finally:
+            conn.close()
         
-        return jsonify(resources)
+        return jsonify(applications)
     except Exception as e:
-        app.logger.error(f"Error fetching resources: {e}")
+        app.logger.error(f"Error fetching recruiter applicants: {e}")
         return jsonify([])
 
-@app.route('/get_student_profile/<int:student_id>')
-def get_student_profile(student_id):
-    """Get complete profile of a specific student"""
-    conn = None
-    cursor = None
+@app.route("/update_application", methods=["POST"])
+def update_application():
+    if session.get("role") != "recruiter":
+        return jsonify({"error": "Access denied"}), 403
+    
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        ensure_tables_exist()  # Ensure tables exist before updating
         
-        cursor.execute("SELECT * FROM student_profile WHERE student_id = %s", (student_id,))
-        student = cursor.fetchone()
+        application_id = request.form.get("application_id")
+        status = request.form.get("status")
         
-        if not student:
-            return jsonify({'error': 'Student not found'}), 404
-            
-        return jsonify(student)
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            ensure_interview_tables(cursor)
+            cursor.execute("SELECT student_id, job_id, status FROM applications WHERE application_id = %s",
+                           (application_id,))
+            before = cursor.fetchone()
+            cursor.execute("""
+                UPDATE applications
+                SET status = %s
+                WHERE application_id = %s
+            """, (status, application_id))
+            enqueue_status_change_notification(cursor, application_id, status)
+            interview_job_id = interview_status_changed(cursor, application_id, status)
+
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+        if before:
+            audit("update_application", "application", application_id, student_id=before[0], job_id=before[1],
+                  old_status=before[2], status=status)
+        if interview_job_id:
+            schedule_job_interviews_in_background(interview_job_id)
+        
+        return jsonify({"message": f"Application {status} successfully!"})
         
     except Exception as e:
-        app.logger.error(f"Error fetching student profile: {e}")
-        return jsonify({'error': 'Failed to fetch student profile'}), 500
+        app.logger.error(f"Error updating application: {e}")
+        return jsonify({"error": "Failed to update application"}), 500
+
+@app.route("/delete_job/<int:job_id>", methods=["POST"])
+def delete_job(job_id):
+    if session.get("role") != "recruiter":
+        return jsonify({"error": "Access denied"}), 403
+    
+    try:
+        ensure_tables_exist()  # Ensure tables exist before deleting
         
-    finally:
-        if cursor:
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+
+            # Check if job belongs to this recruiter
+            cursor.execute("SELECT company_id, title FROM jobs WHERE job_id = %s", (job_id,))
+            job = cursor.fetchone()
+
+            if not job or job[0] != session.get("user_id"):
+                return jsonify({"error": "Job not found or access denied"}), 404
+
+            # Delete applications first (due to foreign key constraints)
+            cursor.execute("DELETE FROM applications WHERE job_id = %s", (job_id,))
+            deleted_applications = cursor.rowcount
+
+            # Delete the job
+            cursor.execute("DELETE FROM jobs WHERE job_id = %s", (job_id,))
+
+            conn.commit()
             cursor.close()
-        if conn:
+        finally:
             conn.close()
+        sync_search_index(search_index().delete_jobs, [job_id])
+        semantic_delete("jobs", [job_id])
+        audit("delete_job", "job", job_id, title=job[1], deleted_applications=deleted_applications)
+        
+        return jsonify({"message": "Job deleted successfully"})
+        
+    except Exception as e:
+        app.logger.error(f"Error deleting job: {e}")
+        return jsonify({"error": "Failed to delete job"}), 500
 
-@app.route("/delete_student/<int:student_id>", methods=["POST"])
-def delete_student(student_id):
-    conn = get_db_connection()
-    try:
-        with conn.cursor() as cursor:
-            app.logger.info(f"Attempting to delete student with ID: {student_id}")
+@app.route("/job_retention_report")
+def job_retention_report():
+    """Hot-table sizes and query latency before/after the last retention run (TPO only)"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
+    if request.args.get("run"):
+        try:
+            report = run_job_retention()
+        except Exception as e:
+            app.logger.error(f"Error archiving expired jobs: {e}")
+            return jsonify({"error": "Failed to archive expired jobs"}), 500
+        if report is None:
+            return jsonify({"error": "A retention run is already in progress"}), 409
+    return jsonify(last_retention_report.get(current_tenant().slug, {}))
 
-            # Delete related application details first
-            cursor.execute("""
-                DELETE FROM application_details 
-                WHERE application_id IN (
-                    SELECT application_id FROM applications WHERE student_id = %s
-                )
-            """, (student_id,))
+# ==================== AUDIT LOG ====================
+# Who changed which application, job, student, resource or profile. audit() buffers the
+# event in memory and an AuditWriter thread inserts batches into the current tenant's
+# append-only audit_log table, so hot writes pay no extra round trip. Events still
+# buffered at exit are flushed; a full buffer drops events and counts them.
+app.config.update(
+    AUDIT_ENABLED=os.environ.get('AUDIT_ENABLED', '1') == '1',
+    AUDIT_MAX_PENDING=int(os.environ.get('AUDIT_MAX_PENDING', 10000)),   # events held in memory per process
+    AUDIT_BATCH_SIZE=200,
+    AUDIT_FLUSH_INTERVAL=1.0,          # seconds an event may wait for its batch to fill
+    AUDIT_SUBMIT_TIMEOUT=0.05          # seconds a request waits on a full buffer before dropping
+)
 
-            # Delete applications related to this student
-            cursor.execute("DELETE FROM applications WHERE student_id = %s", (student_id,))
+METRICS.describe('erp_audit_events_total', 'counter', 'Audit events by result (written, buffer_full, write_failed).')
 
-            # Delete student profile
-            cursor.execute("DELETE FROM student_profile WHERE student_id = %s", (student_id,))
+audit_tables_ready = set()   # tenant slugs
+audit_partitions_checked = {}   # tenant slug -> date partitions were last extended
 
-            # Delete student account
-            cursor.execute("DELETE FROM students WHERE student_id = %s", (student_id,))
+def ensure_audit_table(cursor):
+    """Create the partitioned audit_log table with its triggers, and add partitions for the months ahead"""
+    slug = current_tenant().slug
+    today = date.today()
+    if slug not in audit_tables_ready:
+        cursor.execute(audit_log.AUDIT_TABLE_EXISTS_SQL)
+        if not cursor.fetchall():
+            cursor.execute(audit_log.create_table_sql(today))
+            for trigger_sql in audit_log.AUDIT_TRIGGERS_SQL:
+                try:
+                    cursor.execute(trigger_sql)
+                except mysql.connector.Error as e:
+                    # e.g. missing TRIGGER privilege; the table is then append-only by convention
+                    app.logger.warning(f"Could not create audit_log trigger: {e}")
+            app.logger.info("Created table audit_log")
+        audit_tables_ready.add(slug)
+    if audit_partitions_checked.get(slug) != today:
+        cursor.execute(audit_log.AUDIT_PARTITIONS_SQL)
+        alter_sql = audit_log.add_partitions_sql([row[0] for row in cursor.fetchall()], today)
+        if alter_sql:
+            cursor.execute(alter_sql)
+        audit_partitions_checked[slug] = today
 
+def write_audit_batch(tenant, rows):
+    with tenants.use(tenant):
+        conn = get_db_connection(primary=True)
+        cursor = conn.cursor()
+        try:
+            ensure_audit_table(cursor)
+            cursor.executemany(audit_log.INSERT_AUDIT_SQL, rows)
             conn.commit()
-            app.logger.info(f"Student {student_id} deleted successfully.")
-            return jsonify({"message": "Student and related records deleted successfully."})
-    except Exception as e:
-        app.logger.error(f"Error deleting student {student_id}: {e}")
-        conn.rollback()
-        return jsonify({"message": f"Error deleting student: {str(e)}"}), 500
-    finally:
-        conn.close()
+        finally:
+            cursor.close()
+            conn.close()
+    METRICS.inc('erp_audit_events_total', len(rows), result='written')
 
+def audit_events_dropped(count, reason):
+    METRICS.inc('erp_audit_events_total', count, result=reason)
+    app.logger.warning(f"Dropped {count} audit events ({reason})")
 
-@app.route("/delete_resource/<int:resource_id>", methods=["POST"])
-def delete_resource(resource_id):
-    """Delete a preparation resource"""
+AUDIT_WRITER = None
+if app.config['AUDIT_ENABLED']:
+    AUDIT_WRITER = audit_log.AuditWriter(
+        write_audit_batch,
+        max_pending=app.config['AUDIT_MAX_PENDING'],
+        batch_size=app.config['AUDIT_BATCH_SIZE'],
+        flush_interval=app.config['AUDIT_FLUSH_INTERVAL'],
+        submit_timeout=app.config['AUDIT_SUBMIT_TIMEOUT'],
+        on_drop=audit_events_dropped,
+        logger=app.logger
+    )
+    atexit.register(AUDIT_WRITER.close)
+
+def audit(action, target_type, target_id, **details):
+    """Record that the logged-in user did action to a target; call after the change is committed"""
+    if AUDIT_WRITER is None:
+        return
+    AUDIT_WRITER.submit(current_tenant(), audit_log.event_row(
+        datetime.now(), session.get("role"), session.get("user_id"), action, target_type, target_id,
+        details, request.remote_addr if has_request_context() else None))
+
+@app.route("/audit_log")
+@read_only
+def audit_log_view():
+    """Audit events, newest first (TPO only).
+
+    ?since&until (YYYY-MM-DD, inclusive, default the last 30 days), equality filters
+    action, actor_role, actor_id, target_type, target_id, and limit/after paging
+    with the X-Next-Cursor header.
+    """
     if session.get("role") != "tpo":
         return jsonify({"error": "Access denied"}), 403
-    
+
+    args = request.args
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get file path before deleting
-        cursor.execute("SELECT file_path FROM prep_resources WHERE resource_id = %s", (resource_id,))
-        result = cursor.fetchone()
-        
-        if result:
-            file_path = os.path.join('static/uploads', result[0])
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        
-        # Delete from database
-        cursor.execute("DELETE FROM prep_resources WHERE resource_id = %s", (resource_id,))
-        conn.commit()
+        start, end = audit_log.audit_range(args.get("since"), args.get("until"), date.today())
+        limit = db_layer.bounded_int(args.get("limit"), audit_log.AUDIT_PAGE_SIZE, audit_log.AUDIT_MAX_PAGE_SIZE)
+        after = audit_log.parse_audit_cursor(args["after"]) if args.get("after") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    filters = {key: args[key] for key in audit_log.AUDIT_FILTERS if args.get(key)}
+
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        if current_tenant().slug not in audit_tables_ready:
+            cursor.execute(audit_log.AUDIT_TABLE_EXISTS_SQL)
+            if not cursor.fetchall():
+                return jsonify([])
+        cursor.execute(*audit_log.audit_page_query(start, end, limit, filters, after))
+        rows, next_cursor = db_layer.feed_page(cursor.fetchall(), limit, audit_log.audit_cursor)
+    except Exception as e:
+        app.logger.error(f"Error fetching audit log: {e}")
+        return jsonify({"error": "Failed to fetch audit log"}), 500
+    finally:
         cursor.close()
         conn.close()
-        
-        return jsonify({"message": "Resource deleted successfully"})
-    except Exception as e:
-        app.logger.error(f"Error deleting resource: {e}")
+    return feed_response(([audit_log.shape_audit_row(row) for row in rows], next_cursor))
 
-        return jsonify({"error": str(e)}), 500
-    
+# ==================== INTERVIEW SCHEDULING ====================
+# Shortlisted applications are seated into their job's interview plan (interview_scheduler.py),
+# around the student's interviews for other jobs, other jobs' use of the same rooms and placement
+# events. Runs hold one MySQL named lock so concurrent runs for different jobs cannot double-book
+# a student or a room. Runs after a drop-out or a new shortlist only fill open seats; scheduled
+# interviews never move. Those runs are queued per job to one worker thread, so a burst of
+# shortlists for a job is one run.
+app.config.update(
+    INTERVIEW_EVENT_BLOCK_MINUTES=120,   # a timed placement event blocks this long; date-only events block the day
+    INTERVIEW_LOCK_TIMEOUT=30            # seconds to wait for another scheduling run to finish
+)
 
-# ==================== JOB MANAGEMENT ROUTES ====================
+METRICS.describe('erp_interview_schedule_seconds', 'histogram', 'Duration of interview scheduling runs.')
 
-@app.route("/post_job", methods=["POST"])
-def post_job():
-    if session.get("role") != "recruiter":
-        flash("Access denied.", "error")
-        return redirect(url_for("login"))
-    
+interview_tables_ready = set()   # tenant slugs
+interview_run_locks = {}   # tenant slug -> lock serialising this process's scheduling runs
+INTERVIEW_RUN_QUEUE = queue.Queue()
+interview_runs_pending = set()   # (tenant slug, job_id) queued and not yet started
+interview_runs_lock = threading.Lock()
+
+def ensure_interview_tables(cursor):
+    if current_tenant().slug in interview_tables_ready:
+        return
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS interview_plans (
+            job_id INT PRIMARY KEY,
+            plan_json TEXT NOT NULL,
+            updated_by_role VARCHAR(16),
+            updated_by INT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        )
+    """)
+    # 'cancelled' slots may be rescheduled; 'dropped' means the candidate withdrew
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS interview_slots (
+            slot_id INT AUTO_INCREMENT PRIMARY KEY,
+            job_id INT NOT NULL,
+            application_id INT NOT NULL,
+            student_id INT NOT NULL,
+            starts_at DATETIME NOT NULL,
+            ends_at DATETIME NOT NULL,
+            room VARCHAR(64) NOT NULL,
+            panel VARCHAR(64) NOT NULL,
+            status ENUM('scheduled', 'cancelled', 'dropped') NOT NULL DEFAULT 'scheduled',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            cancelled_at DATETIME NULL,
+            INDEX idx_interview_slots_job (job_id, status, starts_at),
+            INDEX idx_interview_slots_student (student_id, status, starts_at),
+            INDEX idx_interview_slots_application (application_id, status)
+        )
+    """)
+    interview_tables_ready.add(current_tenant().slug)
+
+def create_read_path_tables():
+    """Create the tables read-only views query, on the primary, so no request runs DDL on a replica"""
+    conn = None
     try:
-        ensure_tables_exist()  # Ensure tables exist before posting job
-        
-        title = request.form.get("title")
-        description = request.form.get("description")
-        location = request.form.get("location")
-        salary = request.form.get("salary")
-        deadline = request.form.get("deadline")
-        eligibility_criteria = request.form.get("description", "")  # Using description as fallback
-        eligibility = request.form.get("eligibility")  # Minimum CGPA
-        target_branches = request.form.getlist("target_branches")  # Multiple branches
-        
-        # Convert target_branches list to string for storage
-        target_branches_str = ",".join(target_branches)
-        
-        conn = get_db_connection()
+        conn = get_db_connection(primary=True)
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO jobs (company_id, title, description, location, salary, deadline, 
-                            eligibility_criteria, eligibility, target_branches)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (session.get("user_id"), title, description, location, salary, deadline, 
-              eligibility_criteria, eligibility, target_branches_str))
+        ensure_eligibility_table(cursor)
+        ensure_interview_tables(cursor)
         conn.commit()
         cursor.close()
-        conn.close()
-        
-        flash("Job posted successfully!", "success")
-    except Exception as e:
-        flash(f"Error posting job: {e}", "error")
-    
-    return redirect(url_for("recruiter_dashboard"))
+    except mysql.connector.Error as e:
+        app.logger.error(f"Error creating eligibility and interview tables: {e}")
+    finally:
+        if conn:
+            conn.close()
 
-@app.route("/recruiter_jobs")
-def recruiter_jobs():
-    if session.get("role") != "recruiter":
-        return jsonify([])
-    
+in_each_tenant(create_read_path_tables)()
+
+def load_interview_plan(cursor, job_id):
+    cursor.execute("SELECT plan_json FROM interview_plans WHERE job_id = %s", (job_id,))
+    row = cursor.fetchone()
+    return interview_scheduler.InterviewPlan.from_dict(json.loads(row[0])) if row else None
+
+def event_busy_intervals(cursor, start, end):
+    """Intervals between start and end that placement events block for every student"""
+    cursor.execute("SELECT date FROM placement_events WHERE date >= %s AND date < %s", (start.date(), end))
+    block = timedelta(minutes=app.config['INTERVIEW_EVENT_BLOCK_MINUTES'])
+    intervals = []
+    for (day,) in cursor.fetchall():
+        if isinstance(day, datetime):
+            intervals.append((day, day + block))
+        else:
+            midnight = datetime.combine(day, datetime.min.time())
+            intervals.append((midnight, midnight + timedelta(days=1)))
+    return intervals
+
+def other_interview_intervals(cursor, job_id, student_ids, start, end, chunk_size=1000):
+    """student_id -> intervals of the student's interviews for other jobs between start and end"""
+    student_ids = list(student_ids)
+    busy = {}
+    for offset in range(0, len(student_ids), chunk_size):
+        chunk = student_ids[offset:offset + chunk_size]
+        ids = ", ".join(["%s"] * len(chunk))
+        cursor.execute(f"""
+            SELECT student_id, starts_at, ends_at FROM interview_slots
+            WHERE status = 'scheduled' AND job_id <> %s AND student_id IN ({ids})
+              AND ends_at > %s AND starts_at < %s
+        """, (job_id, *chunk, start, end))
+        for student_id, starts_at, ends_at in cursor.fetchall():
+            busy.setdefault(student_id, []).append((starts_at, ends_at))
+    return busy
+
+def other_room_intervals(cursor, job_id, rooms, start, end):
+    """(start, end, room) of other jobs' interviews in rooms between start and end"""
+    rooms = list(rooms)
+    placeholders = ", ".join(["%s"] * len(rooms))
+    cursor.execute(f"""
+        SELECT starts_at, ends_at, room FROM interview_slots
+        WHERE status = 'scheduled' AND job_id <> %s AND room IN ({placeholders})
+          AND ends_at > %s AND starts_at < %s
+    """, (job_id, *rooms, start, end))
+    return cursor.fetchall()
+
+def schedule_job_interviews(job_id, reset=False):
+    """Seat the job's shortlisted applications that have no interview yet, returning a summary.
+
+    With reset, the job's upcoming interviews are cancelled and everyone is
+    seated afresh. Returns None when the job has no interview plan. Runs in this
+    process wait for each other before opening a connection; only runs in other
+    processes are waited for on the MySQL lock.
+    """
+    with interview_runs_lock:
+        run_lock = interview_run_locks.setdefault(current_tenant().slug, threading.Lock())
+    if not run_lock.acquire(timeout=app.config['INTERVIEW_LOCK_TIMEOUT']):
+        raise RuntimeError("Another interview scheduling run is still in progress")
     try:
-        ensure_tables_exist()  # Ensure tables exist before fetching jobs
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT j.*, r.company_name 
-            FROM jobs j 
-            JOIN recruiters r ON j.company_id = r.company_id 
-            WHERE j.company_id = %s 
-            ORDER BY j.posted_date DESC
-        """, (session.get("user_id"),))
-        jobs = cursor.fetchall()
+        return seat_job_interviews(job_id, reset)
+    finally:
+        run_lock.release()
+
+def seat_job_interviews(job_id, reset):
+    started = time.perf_counter()
+    conn = get_db_connection(primary=True)
+    cursor = conn.cursor()
+    try:
+        ensure_interview_tables(cursor)
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (current_tenant().lock_name('interview_scheduler'),
+                                                   app.config['INTERVIEW_LOCK_TIMEOUT']))
+        if not cursor.fetchone()[0]:
+            raise RuntimeError("Another interview scheduling run is still in progress")
+        # Read other jobs' slots as committed by the run we may have waited for
+        conn.commit()
+        try:
+            plan = load_interview_plan(cursor, job_id)
+            if plan is None:
+                return None
+            now = datetime.now()
+            if reset:
+                cursor.execute("""
+                    UPDATE interview_slots SET status = 'cancelled', cancelled_at = NOW()
+                    WHERE job_id = %s AND status = 'scheduled' AND starts_at >= %s
+                """, (job_id, now))
+
+            cursor.execute("""
+                SELECT a.application_id, a.student_id FROM applications a
+                WHERE a.job_id = %s AND a.status = 'shortlisted'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM interview_slots s
+                      WHERE s.application_id = a.application_id AND s.status IN ('scheduled', 'dropped')
+                  )
+                ORDER BY a.applied_date, a.application_id
+            """, (job_id,))
+            student_of = dict(cursor.fetchall())
+            cursor.execute("SELECT starts_at, panel FROM interview_slots WHERE job_id = %s AND status = 'scheduled'",
+                           (job_id,))
+            fixed = cursor.fetchall()
+
+            by_student = other_interview_intervals(cursor, job_id, student_of.values(), plan.start, plan.end)
+            busy = {application_id: by_student[student_id]
+                    for application_id, student_id in student_of.items() if student_id in by_student}
+            assigned, unassigned = interview_scheduler.schedule(
+                plan, list(student_of), busy, event_busy_intervals(cursor, plan.start, plan.end),
+                fixed, not_before=now,
+                room_busy=other_room_intervals(cursor, job_id, plan.rooms, plan.start, plan.end))
+
+            if assigned:
+                cursor.executemany("""
+                    INSERT INTO interview_slots (job_id, application_id, student_id, starts_at, ends_at, room, panel)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """, [(job_id, application_id, student_of[application_id], *seat)
+                      for application_id, seat in assigned.items()])
+            conn.commit()
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (current_tenant().lock_name('interview_scheduler'),))
+            cursor.fetchone()
+    finally:
         cursor.close()
         conn.close()
-        
-        # Convert target_branches string back to list for frontend
-        for job in jobs:
-            if job['target_branches']:
-                job['target_branches'] = job['target_branches'].split(',')
-            else:
-                job['target_branches'] = ['all']
-                
-        return jsonify(jobs)
-    except Exception as e:
-        app.logger.error(f"Error fetching recruiter jobs: {e}")
-        return jsonify([])
 
-@app.route("/student_jobs")
-def student_jobs():
-    """Fetch jobs visible to students based on eligibility and active recruiters."""
-    if session.get("role") != "student":
-        return jsonify([])
+    elapsed = time.perf_counter() - started
+    METRICS.observe('erp_interview_schedule_seconds', elapsed)
+    return {
+        "job_id": job_id,
+        "scheduled": len(assigned),
+        "already_scheduled": len(fixed),
+        "unscheduled": unassigned,
+        "seconds": round(elapsed, 3)
+    }
 
-    try:
-        ensure_tables_exist()
-        student_id = session.get("user_id")
+def schedule_job_interviews_in_background(job_id):
+    """Queue a run for the job unless one is already waiting; that run will see this trigger's changes"""
+    tenant = current_tenant()
+    with interview_runs_lock:
+        if (tenant.slug, job_id) in interview_runs_pending:
+            return
+        interview_runs_pending.add((tenant.slug, job_id))
+    INTERVIEW_RUN_QUEUE.put((tenant, job_id))
 
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+def run_queued_interview_schedule(tenant, job_id):
+    # Triggers from here on queue a new run, since this one may read the job before their commit
+    with interview_runs_lock:
+        interview_runs_pending.discard((tenant.slug, job_id))
+    with tenants.use(tenant):
+        try:
+            summary = schedule_job_interviews(job_id)
+            if summary and summary["scheduled"]:
+                app.logger.info(f"Scheduled {summary['scheduled']} interviews for job {job_id}")
+        except Exception as e:
+            app.logger.error(f"Error scheduling interviews for job {job_id}: {e}")
 
-        # 🎓 Get student's branch and CGPA
-        cursor.execute("""
-            SELECT 
-                COALESCE(sp.department, s.branch) AS branch,
-                COALESCE(sp.average, s.cgpa, 0) AS cgpa
-            FROM students s
-            LEFT JOIN student_profile sp ON s.student_id = sp.student_id
-            WHERE s.student_id = %s
-        """, (student_id,))
-        student = cursor.fetchone()
+def schedule_interviews_forever():
+    while True:
+        run_queued_interview_schedule(*INTERVIEW_RUN_QUEUE.get())
 
-        if not student:
-            cursor.close()
-            conn.close()
-            return jsonify([])
+threading.Thread(target=schedule_interviews_forever, daemon=True).start()
 
-        student_branch = (student["branch"] or "").strip().lower()
-        student_cgpa = float(student["cgpa"] or 0.0)
+def interview_status_changed(cursor, application_id, status):
+    """Free the application's upcoming interview unless it is still shortlisted.
 
-        # 💼 Fetch only active jobs (deadline not passed + active recruiter)
+    Returns the job whose open seats should be refilled, or None. The caller
+    commits, then passes the job to schedule_job_interviews_in_background().
+    """
+    cursor.execute("""
+        SELECT a.job_id FROM applications a JOIN interview_plans p ON a.job_id = p.job_id
+        WHERE a.application_id = %s
+    """, (application_id,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    if status != 'shortlisted':
         cursor.execute("""
-            SELECT 
-                j.job_id, j.title, j.description, j.location, j.salary, j.deadline,
-                j.eligibility, j.target_branches, r.company_name, r.status
-            FROM jobs j
-            JOIN recruiters r ON j.company_id = r.company_id
-            WHERE j.deadline >= CURDATE()
-              AND (r.status IS NULL OR r.status = 'active')
-            ORDER BY j.posted_date DESC
-        """)
-        all_jobs = cursor.fetchall()
-
-        job_list = []
-        for job in all_jobs:
-            target_branches = [b.strip().lower() for b in (job["target_branches"] or "").split(",") if b.strip()]
-            if not target_branches:
-                target_branches = ["all"]
-
-            branch_eligible = (
-                "all" in target_branches or 
-                any(b in student_branch for b in target_branches)
-            )
-            cgpa_eligible = student_cgpa >= float(job["eligibility"] or 0.0)
-            can_apply = branch_eligible and cgpa_eligible
-
-            job_list.append({
-                "job_id": job["job_id"],
-                "title": job["title"],
-                "description": job["description"],
-                "location": job["location"],
-                "salary": job["salary"],
-                "deadline": job["deadline"].strftime("%Y-%m-%d") if job["deadline"] else None,
-                "eligibility": job["eligibility"],
-                "target_branches": target_branches,
-                "company_name": job["company_name"],
-                "branch_eligible": branch_eligible,
-                "cgpa_eligible": cgpa_eligible,
-                "can_apply": can_apply
-            })
+            UPDATE interview_slots SET status = 'cancelled', cancelled_at = NOW()
+            WHERE application_id = %s AND status = 'scheduled' AND starts_at >= NOW()
+        """, (application_id,))
+        if cursor.rowcount == 0:
+            return None
+    return row[0]
+
+def manages_job_interviews(cursor, job_id):
+    """TPOs manage every job's interviews, recruiters only their own jobs'"""
+    if session.get("role") == "tpo":
+        return True
+    if session.get("role") != "recruiter":
+        return False
+    cursor.execute("SELECT 1 FROM jobs WHERE job_id = %s AND company_id = %s", (job_id, session.get("user_id")))
+    return cursor.fetchone() is not None
+
+@app.route("/interview_plans/<int:job_id>", methods=["GET", "POST"])
+def interview_plan(job_id):
+    """Get or replace a job's interview plan.
+
+    POST body: {"slot_minutes": 30, "buffer_minutes": 10,
+                "windows": [{"start": "2026-11-02T09:00", "end": "2026-11-02T17:00"}],
+                "rooms": {"Lab 1": 2}, "panels": [{"name": "Panel A", "room": "Lab 1"}]}
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        ensure_interview_tables(cursor)
+        if not manages_job_interviews(cursor, job_id):
+            return jsonify({"error": "Job not found or access denied"}), 404
 
+        if request.method == "POST":
+            try:
+                plan = interview_scheduler.InterviewPlan.from_dict(request.get_json(silent=True) or {})
+            except interview_scheduler.PlanError as e:
+                return jsonify({"error": str(e)}), 400
+            cursor.execute("""
+                REPLACE INTO interview_plans (job_id, plan_json, updated_by_role, updated_by)
+                VALUES (%s, %s, %s, %s)
+            """, (job_id, json.dumps(plan.to_dict()), session.get("role"), session.get("user_id")))
+            conn.commit()
+            return jsonify({"job_id": job_id, "plan": plan.to_dict(), "seats_per_slot": len(plan.seats()),
+                            "slots": len(plan.slots())})
+
+        plan = load_interview_plan(cursor, job_id)
+        if plan is None:
+            return jsonify({"error": "No interview plan for this job"}), 404
+        cursor.execute("SELECT status, COUNT(*) FROM interview_slots WHERE job_id = %s GROUP BY status", (job_id,))
+        return jsonify({"job_id": job_id, "plan": plan.to_dict(), "slot_counts": dict(cursor.fetchall())})
+    finally:
         cursor.close()
         conn.close()
-        return jsonify(job_list)
 
+@app.route("/interview_plans/<int:job_id>/schedule", methods=["POST"])
+def run_interview_schedule(job_id):
+    """Seat every unscheduled shortlisted application; ?reset=1 reschedules upcoming interviews too"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        allowed = manages_job_interviews(cursor, job_id)
+    finally:
+        cursor.close()
+        conn.close()
+    if not allowed:
+        return jsonify({"error": "Job not found or access denied"}), 404
+
+    try:
+        summary = schedule_job_interviews(job_id, reset=request.args.get("reset") == "1")
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 409
     except Exception as e:
-        app.logger.error(f"Error fetching student jobs: {e}")
-        return jsonify({"error": "Failed to fetch jobs"}), 500
+        app.logger.error(f"Error scheduling interviews for job {job_id}: {e}")
+        return jsonify({"error": "Failed to schedule interviews"}), 500
+    if summary is None:
+        return jsonify({"error": "No interview plan for this job"}), 404
+    return jsonify(summary)
 
-@app.route("/tpo_jobs")
-def tpo_jobs():
-    if session.get("role") != "tpo":
-        return jsonify([])
-    
+@app.route("/interview_plans/<int:job_id>/slots")
+def interview_plan_slots(job_id):
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
     try:
-        ensure_tables_exist()  # Ensure tables exist before fetching jobs
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT j.*, r.company_name 
-            FROM jobs j 
-            JOIN recruiters r ON j.company_id = r.company_id 
-            ORDER BY j.posted_date DESC
-        """)
-        jobs = cursor.fetchall()
+        ensure_interview_tables(cursor)
+        if not manages_job_interviews(cursor, job_id):
+            return jsonify({"error": "Job not found or access denied"}), 404
+        cursor.execute("""
+            SELECT i.slot_id, i.application_id, i.student_id, s.name AS student_name, s.email AS student_email,
+                   i.starts_at, i.ends_at, i.room, i.panel, i.status
+            FROM interview_slots i
+            JOIN students s ON i.student_id = s.student_id
+            WHERE i.job_id = %s AND i.status = 'scheduled'
+            ORDER BY i.starts_at, i.panel
+        """, (job_id,))
+        return jsonify(cursor.fetchall())
+    finally:
         cursor.close()
         conn.close()
-        
-        # Convert target_branches string back to list for frontend
-        for job in jobs:
-            if job['target_branches']:
-                job['target_branches'] = job['target_branches'].split(',')
-            else:
-                job['target_branches'] = ['all']
-                
-        return jsonify(jobs)
-    except Exception as e:
-        app.logger.error(f"Error fetching TPO jobs: {e}")
-        return jsonify([])
 
-@app.route("/apply_job", methods=["POST"])
-def apply_job():
+@app.route("/my_interviews")
+@read_only
+def my_interviews():
     if session.get("role") != "student":
-        return jsonify({"error": "Access denied"}), 403
-    
+        return jsonify([])
+
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
     try:
-        ensure_tables_exist()  # Ensure tables exist before applying
-        
-        job_id = request.form.get("job_id")
-        experience_years = request.form.get("experience_years", 0)
-        commitment_hours = request.form.get("commitment_hours", 0)
-        
-        student_id = session.get("user_id")
-        
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        # Check if student has already applied
         cursor.execute("""
-            SELECT * FROM applications 
-            WHERE student_id = %s AND job_id = %s
-        """, (student_id, job_id))
-        
-        existing_application = cursor.fetchone()
-        if existing_application:
-            return jsonify({"error": "You have already applied for this job"}), 400
-        
-        # Get student's resume path
-        cursor.execute("SELECT resume_path FROM students WHERE student_id = %s", (student_id,))
-        student = cursor.fetchone()
-        resume_path = student['resume_path'] if student else None
-        
-        if not resume_path:
-            return jsonify({"error": "Please upload your resume before applying"}), 400
-        
-        # Create application
+            SELECT i.slot_id, i.job_id, j.title AS job_title, i.starts_at, i.ends_at, i.room, i.panel
+            FROM interview_slots i
+            JOIN jobs j ON i.job_id = j.job_id
+            WHERE i.student_id = %s AND i.status = 'scheduled' AND i.ends_at >= NOW()
+            ORDER BY i.starts_at
+        """, (session.get("user_id"),))
+        return jsonify(cursor.fetchall())
+    finally:
+        cursor.close()
+        conn.close()
+
+@app.route("/interview_slots/<int:slot_id>/cancel", methods=["POST"])
+def cancel_interview_slot(slot_id):
+    """Cancel an interview; its seat is offered to the job's waiting candidates.
+
+    The candidate (a student dropping out) is not rescheduled. A recruiter or
+    TPO may pass reschedule=1 to seat the candidate again elsewhere.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        ensure_interview_tables(cursor)
+        cursor.execute("SELECT job_id, student_id, status FROM interview_slots WHERE slot_id = %s", (slot_id,))
+        slot = cursor.fetchone()
+        if not slot:
+            return jsonify({"error": "Interview not found"}), 404
+        job_id, student_id, status = slot
+        if session.get("role") == "student":
+            allowed = student_id == session.get("user_id")
+        else:
+            allowed = manages_job_interviews(cursor, job_id)
+        if not allowed:
+            return jsonify({"error": "Interview not found"}), 404
+        if status != 'scheduled':
+            return jsonify({"error": f"Interview is already {status}"}), 409
+
+        reschedule = session.get("role") != "student" and request.values.get("reschedule") == "1"
         cursor.execute("""
-            INSERT INTO applications (job_id, student_id, submitted_resume_path, 
-                                    experience_years, commitment_hours, status)
-            VALUES (%s, %s, %s, %s, %s, 'applied')
-        """, (job_id, student_id, resume_path, experience_years, commitment_hours))
-        
+            UPDATE interview_slots SET status = %s, cancelled_at = NOW()
+            WHERE slot_id = %s AND status = 'scheduled'
+        """, ('cancelled' if reschedule else 'dropped', slot_id))
         conn.commit()
+    finally:
         cursor.close()
         conn.close()
-        
-        return jsonify({"message": "Application submitted successfully!"})
-        
-    except Exception as e:
-        app.logger.error(f"Error applying for job: {e}")
-        return jsonify({"error": "Failed to apply for job"}), 500
 
-@app.route("/recruiter_applicants")
-def recruiter_applicants():
-    if session.get("role") != "recruiter":
+    schedule_job_interviews_in_background(job_id)
+    return jsonify({"message": "Interview cancelled"})
+
+# ==================== SEMANTIC MATCHING ROUTES ====================
+@app.route("/similar_jobs")
+def similar_jobs():
+    """Top-K active jobs closest to the logged-in student's resume"""
+    if session.get("role") != "student":
         return jsonify([])
-    
+    if EMBEDDING_WORKER is None:
+        return jsonify({"error": "Semantic matching is not enabled"}), 503
+
+    k = min(max(request.args.get("k", 10, type=int), 1), 50)
+    vector = semantic_store("resumes")[1].get(session.get("user_id"))
+    if vector is None:
+        return jsonify([])
+
+    # Over-fetch so expired postings can be dropped without returning fewer than k
+    hits = semantic_store("jobs")[1].query(vector, k * 3)
+    if not hits:
+        return jsonify([])
+
     try:
-        ensure_tables_exist()  # Ensure tables exist before fetching applicants
-        
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute("""
-            SELECT a.*, j.title as job_title, s.name as student_name, 
-                   s.email as student_email, s.branch as student_branch, sp.average as student_cgpa,
-                   s.phone as student_phone
-            FROM applications a
-            JOIN jobs j ON a.job_id = j.job_id
-            JOIN students s ON a.student_id = s.student_id
-            LEFT JOIN student_profile sp ON s.student_id = sp.student_id
-            WHERE j.company_id = %s
-            ORDER BY a.applied_date DESC
-        """, (session.get("user_id"),))
-        
-        applications = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        
-        return jsonify(applications)
+        try:
+            cursor = conn.cursor(dictionary=True)
+            ids = ", ".join(["%s"] * len(hits))
+            cursor.execute(f"""
+                SELECT j.job_id, j.title, j.location, j.salary, j.deadline, r.company_name
+                FROM jobs j
+                JOIN recruiters r ON j.company_id = r.company_id
+                WHERE j.job_id IN ({ids}) AND j.deadline >= CURDATE()
+            """, tuple(job_id for job_id, _ in hits))
+            jobs = {job["job_id"]: job for job in cursor.fetchall()}
+            cursor.close()
+        finally:
+            conn.close()
     except Exception as e:
-        app.logger.error(f"Error fetching recruiter applicants: {e}")
-        return jsonify([])
+        app.logger.error(f"Error fetching similar jobs: {e}")
+        return jsonify({"error": "Failed to fetch similar jobs"}), 500
 
-@app.route("/update_application", methods=["POST"])
-def update_application():
-    if session.get("role") != "recruiter":
+    results = [{**jobs[job_id], "similarity": score} for job_id, score in hits if job_id in jobs]
+    return jsonify(results[:k])
+
+@app.route("/similar_candidates/<int:job_id>")
+def similar_candidates(job_id):
+    """Top-K students whose resumes are closest to a job description"""
+    role = session.get("role")
+    if role not in ("recruiter", "tpo"):
         return jsonify({"error": "Access denied"}), 403
-    
+    if EMBEDDING_WORKER is None:
+        return jsonify({"error": "Semantic matching is not enabled"}), 503
+
+    k = min(max(request.args.get("k", 10, type=int), 1), 100)
     try:
-        ensure_tables_exist()  # Ensure tables exist before updating
-        
-        application_id = request.form.get("application_id")
-        status = request.form.get("status")
-        
         conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE applications 
-            SET status = %s 
-            WHERE application_id = %s
-        """, (status, application_id))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        return jsonify({"message": f"Application {status} successfully!"})
-        
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("SELECT company_id FROM jobs WHERE job_id = %s", (job_id,))
+            job = cursor.fetchone()
+            if not job or (role == "recruiter" and job["company_id"] != session.get("user_id")):
+                cursor.close()
+                return jsonify({"error": "Job not found or access denied"}), 404
+
+            vector = semantic_store("jobs")[1].get(job_id)
+            hits = semantic_store("resumes")[1].query(vector, k) if vector is not None else []
+            students = {}
+            if hits:
+                ids = ", ".join(["%s"] * len(hits))
+                cursor.execute(f"""
+                    SELECT s.student_id, s.name, s.email, s.branch, sp.average AS cgpa
+                    FROM students s
+                    LEFT JOIN student_profile sp ON s.student_id = sp.student_id
+                    WHERE s.student_id IN ({ids})
+                """, tuple(student_id for student_id, _ in hits))
+                students = {row["student_id"]: row for row in cursor.fetchall()}
+            cursor.close()
+        finally:
+            conn.close()
     except Exception as e:
-        app.logger.error(f"Error updating application: {e}")
-        return jsonify({"error": "Failed to update application"}), 500
+        app.logger.error(f"Error fetching similar candidates: {e}")
+        return jsonify({"error": "Failed to fetch similar candidates"}), 500
 
-@app.route("/delete_job/<int:job_id>", methods=["POST"])
-def delete_job(job_id):
-    if session.get("role") != "recruiter":
+    return jsonify([{**students[sid], "similarity": score} for sid, score in hits if sid in students])
+
+@app.route("/duplicate_resumes")
+def duplicate_resumes():
+    """Clusters of students whose resumes are near-duplicates (TPO only)"""
+    if session.get("role") != "tpo":
         return jsonify({"error": "Access denied"}), 403
-    
+
     try:
-        ensure_tables_exist()  # Ensure tables exist before deleting
-        
         conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Check if job belongs to this recruiter
-        cursor.execute("SELECT company_id FROM jobs WHERE job_id = %s", (job_id,))
-        job = cursor.fetchone()
-        
-        if not job or job[0] != session.get("user_id"):
-            return jsonify({"error": "Job not found or access denied"}), 404
-        
-        # Delete applications first (due to foreign key constraints)
-        cursor.execute("DELETE FROM applications WHERE job_id = %s", (job_id,))
-        
-        # Delete the job
-        cursor.execute("DELETE FROM jobs WHERE job_id = %s", (job_id,))
-        
-        conn.commit()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            ensure_fingerprint_tables(cursor)
+            cursor.execute("""
+                SELECT p.student_a, p.student_b, p.similarity
+                FROM resume_duplicate_pairs p
+                JOIN students a ON p.student_a = a.student_id
+                JOIN students b ON p.student_b = b.student_id
+            """)
+            pairs = cursor.fetchall()
+
+            students = {}
+            if pairs:
+                ids = sorted({p["student_a"] for p in pairs} | {p["student_b"] for p in pairs})
+                placeholders = ", ".join(["%s"] * len(ids))
+                cursor.execute(f"""
+                    SELECT s.student_id, s.name, s.email, s.resume_path, f.created_at AS fingerprinted_at
+                    FROM students s
+                    LEFT JOIN resume_fingerprints f ON s.student_id = f.student_id
+                    WHERE s.student_id IN ({placeholders})
+                """, tuple(ids))
+                students = {row["student_id"]: row for row in cursor.fetchall()}
+            cursor.close()
+        finally:
+            conn.close()
+    except Exception as e:
+        app.logger.error(f"Error fetching duplicate resumes: {e}")
+        return jsonify({"error": "Failed to fetch duplicate resumes"}), 500
+
+    clusters = []
+    for members in resume_fingerprint.cluster_pairs((p["student_a"], p["student_b"]) for p in pairs):
+        member_set = set(members)
+        cluster_pairs = [p for p in pairs if p["student_a"] in member_set]
+        clusters.append({
+            "students": [students[m] for m in members if m in students],
+            "pairs": cluster_pairs,
+            "max_similarity": max(p["similarity"] for p in cluster_pairs)
+        })
+    clusters.sort(key=lambda c: (len(c["students"]), c["max_similarity"]), reverse=True)
+    return jsonify(clusters)
+
+@app.route("/reparse_resumes", methods=["GET", "POST"])
+def reparse_resumes():
+    """POST starts the stale-parse backfill in the background; GET reports its progress (TPO only)"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
+    slug = current_tenant().slug
+    if request.method == "POST":
+        with reparse_lock:
+            if slug in reparse_running:
+                return jsonify({"error": "A reparse is already running", **reparse_progress.get(slug, {})}), 409
+            reparse_running.add(slug)
+        threading.Thread(target=tenants.bound(run_reparse_in_background), daemon=True).start()
+        return jsonify({"message": "Reparse started", "parser_version": PARSER_VERSION}), 202
+    return jsonify(reparse_progress.get(slug, {"state": "idle"}))
+
+# ==================== DASHBOARD BOOTSTRAP ====================
+def load_student_jobs_widget(cursor, user_id):
+    cursor.execute(db_layer.STUDENT_ELIGIBILITY_SQL, (user_id,))
+    student = cursor.fetchone()
+    if not student:
+        return []
+    cursor.execute(db_layer.STUDENT_JOBS_SQL, db_layer.student_jobs_params(student))
+    return db_layer.build_student_job_list(student, cursor.fetchall())
+
+def load_all_applications_widget(cursor, user_id):
+    cursor.execute(db_layer.APPLICATIONS_TABLE_EXISTS_SQL)
+    if not cursor.fetchone():
+        return []
+    cursor.execute(db_layer.ALL_APPLICATIONS_SQL)
+    return cursor.fetchall()
+
+def load_query_widget(sql, with_user=False, shape=None):
+    def load(cursor, user_id):
+        cursor.execute(sql, (user_id,) if with_user else ())
+        rows = cursor.fetchall()
+        return shape(rows) if shape else rows
+    return load
+
+def load_upcoming_events_widget(cursor, user_id):
+    # Same window as the student dashboard's calendar request
+    events, _ = upcoming_events(cursor, db_layer.FEED_DEFAULT_DAYS, db_layer.CALENDAR_MAX_EVENTS)
+    return events
+
+def load_resources_widget(cursor, user_id):
+    resources, _ = fetch_resources(cursor, db_layer.FEED_PAGE_SIZE)
+    return resources
+
+# Widgets each dashboard renders on load, keyed by the field name clients select
+DASHBOARD_WIDGETS = {
+    "student": {
+        "events": load_upcoming_events_widget,
+        "resources": load_resources_widget,
+        "jobs": load_student_jobs_widget
+    },
+    "recruiter": {
+        "applications": load_query_widget(db_layer.RECRUITER_APPLICANTS_SQL, with_user=True),
+        "jobs": load_query_widget(db_layer.RECRUITER_JOBS_SQL, with_user=True,
+                                  shape=db_layer.split_target_branches)
+    },
+    "tpo": {
+        "students": load_query_widget(db_layer.ALL_STUDENT_PROFILES_SQL),
+        "applications": load_all_applications_widget,
+        "resources": load_query_widget(db_layer.ALL_RESOURCES_SQL)
+    }
+}
+
+@app.route("/dashboard_bootstrap")
+@read_only
+def dashboard_bootstrap():
+    """Return the data for every dashboard widget of the current role in one request.
+
+    Pass ?fields=events,jobs to load only the widgets the client renders. All
+    widgets are read on a single connection; a failing widget is reported under
+    "errors" without failing the others.
+    """
+    widgets = DASHBOARD_WIDGETS.get(session.get("role"))
+    if widgets is None:
+        return jsonify({"error": "Access denied"}), 403
+
+    requested = request.args.get("fields")
+    fields = [f.strip() for f in requested.split(",") if f.strip() in widgets] if requested else list(widgets)
+
+    data = {}
+    errors = {}
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True, buffered=True)
+    try:
+        for field in fields:
+            try:
+                data[field] = widgets[field](cursor, session.get("user_id"))
+            except Exception as e:
+                app.logger.error(f"Error loading dashboard widget {field}: {e}")
+                errors[field] = "Failed to load"
+    finally:
         cursor.close()
         conn.close()
-        
-        return jsonify({"message": "Job deleted successfully"})
-        
+
+    if errors:
+        data["errors"] = errors
+    return jsonify(data)
+
+@app.route("/rum", methods=["POST"])
+def rum():
+    """Record a browser-reported time-to-first-render of the current user's dashboard"""
+    role = session.get("role")
+    if role not in DASHBOARD_WIDGETS:
+        return "", 403
+    rate, burst = app.config['RUM_RATE_LIMIT']
+    try:
+        if ADMISSION_BUCKETS.take(f"rum:{current_tenant().slug}:{role}:{session.get('user_id')}", rate, burst):
+            return "", 429
     except Exception as e:
-        app.logger.error(f"Error deleting job: {e}")
-        return jsonify({"error": "Failed to delete job"}), 500
+        app.logger.error(f"Error checking rate limit: {e}")
+
+    payload = request.get_json(silent=True, force=True) or {}
+    mode = payload.get("mode")
+    try:
+        seconds = float(payload.get("ms")) / 1000.0
+    except (TypeError, ValueError):
+        return "", 400
+    if payload.get("page") != role or mode not in ("bootstrap", "fanout") or not 0 <= seconds < math.inf:
+        return "", 400
+    METRICS.observe('erp_client_render_seconds', min(seconds, app.config['RUM_MAX_SECONDS']), page=role, mode=mode)
+    return "", 204
 
 # ==================== TEST ROUTE ====================
 @app.route("/test_recruiter_routes")
@@ -1196,16 +4123,18 @@ def test_recruiter_routes():
         
         # Test jobs table access
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        cursor.execute("SELECT COUNT(*) as count FROM jobs WHERE company_id = %s", (session.get("user_id"),))
-        job_count = cursor.fetchone()
-        
-        cursor.execute("SELECT COUNT(*) as count FROM applications a JOIN jobs j ON a.job_id = j.job_id WHERE j.company_id = %s", (session.get("user_id"),))
-        app_count = cursor.fetchone()
-        
-        cursor.close()
-        conn.close()
+        try:
+            cursor = conn.cursor(dictionary=True)
+
+            cursor.execute("SELECT COUNT(*) as count FROM jobs WHERE company_id = %s", (session.get("user_id"),))
+            job_count = cursor.fetchone()
+
+            cursor.execute("SELECT COUNT(*) as count FROM applications a JOIN jobs j ON a.job_id = j.job_id WHERE j.company_id = %s", (session.get("user_id"),))
+            app_count = cursor.fetchone()
+
+            cursor.close()
+        finally:
+            conn.close()
         
         return jsonify({
             "status": "success",
@@ -1216,7 +4145,58 @@ def test_recruiter_routes():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# ==================== PROFILE ADMIN ROUTES ====================
+@app.route("/admin/profiles")
+def list_profiles():
+    """List captured request profiles (TPO only)"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
+
+    profile_dir = app.config['PROFILE_DIR']
+    if not os.path.isdir(profile_dir):
+        return jsonify([])
+
+    profiles = []
+    for filename in sorted(os.listdir(profile_dir), reverse=True):
+        if not filename.endswith('.speedscope.json'):
+            continue
+        try:
+            with open(os.path.join(profile_dir, filename)) as fh:
+                metadata = json.load(fh).get("metadata", {})
+        except (OSError, ValueError):
+            continue
+        metadata.pop("sql", None)
+        profiles.append({"filename": filename, **metadata})
+    return jsonify(profiles)
+
+@app.route("/admin/profiles/<filename>")
+def download_profile(filename):
+    """Download one speedscope profile; open it at https://www.speedscope.app"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
+    return send_from_directory(app.config['PROFILE_DIR'], secure_filename(filename), as_attachment=True)
+
 # ==================== UTILITY ROUTES ====================
+@app.route("/db_replicas")
+def db_replicas():
+    """Health, lag and rotation state of each read replica (TPO only)"""
+    if session.get("role") != "tpo":
+        return jsonify({"error": "Access denied"}), 403
+    return jsonify({"max_lag": app.config['DB_REPLICA_MAX_LAG'], "replicas": REPLICA_ROUTER.status()})
+
+def metrics_scrape_allowed():
+    token = app.config['METRICS_TOKEN']
+    return secrets.compare_digest(request.headers.get('Authorization', ''), f"Bearer {token}")
+
+@app.route("/metrics")
+def metrics():
+    """Expose request, SQL and resume-parse metrics for Prometheus (only when METRICS_TOKEN is set)"""
+    if not app.config.get('METRICS_TOKEN'):
+        return jsonify({"error": "Not found"}), 404
+    if not metrics_scrape_allowed():
+        return jsonify({"error": "Access denied"}), 403
+    return Response(METRICS.render(), mimetype="text/plain; version=0.0.4")
+
 @app.route("/about")
 def about(): 
     return render_template("about.html")
@@ -1230,6 +4210,307 @@ def contact():
 def favicon():
     return send_from_directory('static', 'favicon.ico', mimetype='image/vnd.microsoft.icon')
 
+# ==================== ADMIN CLI ====================
+# Offline bulk jobs: `flask --app app1 admin <command>`. Each command reuses the function
+# behind its web endpoint, commits in chunks and can be interrupted and rerun. Commands
+# act on one college: `flask --app app1 admin --tenant <slug> <command>`.
+app.config['CLI_CHECKPOINT_DIR'] = os.environ.get('CLI_CHECKPOINT_DIR', 'checkpoints')
+
+@click.group("admin", cls=AppGroup, help="Offline bulk operations (reparse, reindex, analytics, archive, import).")
+@click.option("--tenant", "tenant_slug", help="College to operate on (default: the default tenant).")
+def admin_cli(tenant_slug):
+    tenant = TENANTS.get(tenant_slug) if tenant_slug else TENANTS.default
+    if tenant is None:
+        raise click.UsageError(f"Unknown tenant {tenant_slug!r}." if tenant_slug else "--tenant is required.")
+    tenants.enter(tenant)   # for the rest of the command
+
+class Checkpoint:
+    """JSON progress marker in CLI_CHECKPOINT_DIR so an interrupted command resumes where it stopped"""
+
+    def __init__(self, name, fresh=False):
+        self.path = os.path.join(current_tenant().path(app.config['CLI_CHECKPOINT_DIR']), f"{name}.json")
+        self.state = {}
+        if fresh:
+            self.clear()
+        elif os.path.exists(self.path):
+            with open(self.path) as f:
+                self.state = json.load(f)
+
+    def get(self, key, default=None):
+        return self.state.get(key, default)
+
+    def save(self, **state):
+        self.state.update(state)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.state = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+@contextmanager
+def cli_progress(label):
+    """Yield a progress(done, total) callback drawing a click progress bar"""
+    bars = []
+
+    def report(done, total):
+        if not bars:
+            bars.append(click.progressbar(length=total or 0, label=label, show_pos=True))
+        bars[0].update(done - bars[0].pos)
+
+    try:
+        yield report
+    finally:
+        if bars:
+            bars[0].render_finish()
+
+workers_option = click.option("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+dry_run_option = click.option("--dry-run", is_flag=True, help="Report what would be done without writing.")
+fresh_option = click.option("--fresh", is_flag=True, help="Ignore any checkpoint and start over.")
+
+def chunk_size_option(default):
+    return click.option("--chunk-size", type=int, default=default, show_default=True, help="Rows per DB batch.")
+
+@admin_cli.command("reparse-resumes")
+@workers_option
+@chunk_size_option(REPARSE_CHUNK_SIZE)
+@dry_run_option
+def reparse_resumes_command(workers, chunk_size, dry_run):
+    """Re-run the text parser over resumes parsed by an older PARSER_VERSION."""
+    # Resumable without a checkpoint file: finished rows already carry the current version
+    with cli_progress("Reparsing resumes") as progress:
+        count = backfill_resume_parses(workers=workers, chunk_size=chunk_size, progress=progress, dry_run=dry_run)
+    click.echo(f"{'Would reparse' if dry_run else 'Reparsed'} {count} resumes (parser version {PARSER_VERSION}).")
+
+@admin_cli.command("rebuild-search-index")
+@dry_run_option
+def rebuild_search_index_command(dry_run):
+    """Rebuild the full-text search index from MySQL."""
+    if dry_run:
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT (SELECT COUNT(*) FROM jobs), (SELECT COUNT(*) FROM prep_resources)")
+            jobs, resources = cursor.fetchone()
+            cursor.close()
+        finally:
+            conn.close()
+        click.echo(f"Would index {jobs} jobs and {resources} resources.")
+        return
+    jobs, resources = rebuild_search_index()
+    click.echo(f"Indexed {jobs} jobs and {resources} resources.")
+
+MATCH_INDEX_SOURCES = {
+    "jobs": ("SELECT COUNT(*) FROM jobs",
+             "SELECT job_id, title, description, location FROM jobs WHERE job_id > %s ORDER BY job_id LIMIT %s"),
+    "resumes": (f"SELECT COUNT(*) FROM {LIVE_RESUME_TEXTS}",
+                f"SELECT t.student_id, t.raw_text FROM {LIVE_RESUME_TEXTS} "
+                "WHERE t.student_id > %s ORDER BY t.student_id LIMIT %s")
+}
+
+@admin_cli.command("rebuild-match-index")
+@chunk_size_option(256)
+@dry_run_option
+@fresh_option
+def rebuild_match_index_command(chunk_size, dry_run, fresh):
+    """Re-embed every job and stored resume text into the semantic match index."""
+    if EMBEDDING_WORKER is None:
+        raise click.ClickException("Semantic matching is disabled or its dependencies are missing.")
+    checkpoint = Checkpoint("rebuild-match-index", fresh=fresh)
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    ensure_reparse_tables(cursor)
+    try:
+        for collection, (count_sql, chunk_sql) in MATCH_INDEX_SOURCES.items():
+            cursor.execute(count_sql)
+            total = cursor.fetchone()[0]
+            if dry_run:
+                click.echo(f"Would embed {total} {collection}.")
+                continue
+            _, store = semantic_store(collection)
+            done = 0
+            with cli_progress(f"Embedding {collection}") as progress:
+                progress(done, total)
+                for rows in keyset_chunks(cursor, chunk_sql, chunk_size, checkpoint.get(collection, 0)):
+                    if collection == "jobs":
+                        texts = [job_embedding_text(*row[1:]) for row in rows]
+                    else:
+                        texts = [(row[1] or "")[:20000] for row in rows]
+                    store.add([row[0] for row in rows], EMBEDDING_WORKER.embedder.encode(texts))
+                    store.flush()
+                    checkpoint.save(**{collection: rows[-1][0]})
+                    done += len(rows)
+                    progress(done, total)
+            click.echo(f"Compacted {collection}: freed {store.compact()} rows.")
+        if not dry_run:
+            checkpoint.clear()
+    finally:
+        cursor.close()
+        conn.close()
+
+@admin_cli.command("compact-match-index")
+def compact_match_index_command():
+    """Drop deleted vectors from the semantic match index and shrink its files."""
+    if EMBEDDING_WORKER is None:
+        raise click.ClickException("Semantic matching is disabled or its dependencies are missing.")
+    for collection in MATCH_INDEX_SOURCES:
+        _, store = semantic_store(collection)
+        click.echo(f"Compacted {collection}: freed {store.compact()} rows, {len(store.rows)} live.")
+
+@admin_cli.command("recompute-analytics")
+@workers_option
+@chunk_size_option(ELIGIBILITY_CHUNK_SIZE)
+@dry_run_option
+@fresh_option
+def recompute_analytics_command(workers, chunk_size, dry_run, fresh):
+    """Recompute eligibility snapshots, job branch codes and duplicate-resume fingerprints."""
+    checkpoint = Checkpoint("recompute-analytics", fresh=fresh)
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        ensure_eligibility_table(cursor)
+        ensure_reparse_tables(cursor)
+        cursor.execute(f"SELECT (SELECT COUNT(*) FROM students), (SELECT COUNT(*) FROM {LIVE_RESUME_TEXTS})")
+        students, resumes = cursor.fetchone()
+        if dry_run:
+            click.echo(f"Would recompute eligibility for {students} students and fingerprints for {resumes} resumes.")
+            return
+
+        done = 0
+        with cli_progress("Eligibility snapshots") as progress:
+            progress(done, students)
+            for rows in keyset_chunks(cursor, "SELECT student_id FROM students WHERE student_id > %s "
+                                      "ORDER BY student_id LIMIT %s", chunk_size, checkpoint.get("eligibility", 0)):
+                refresh_eligibility_snapshot(conn, [row[0] for row in rows])
+                conn.commit()
+                checkpoint.save(eligibility=rows[-1][0])
+                done += len(rows)
+                progress(done, students)
+
+        for rows in keyset_chunks(cursor, "SELECT job_id, target_branches FROM jobs WHERE job_id > %s "
+                                  "ORDER BY job_id LIMIT %s", chunk_size, checkpoint.get("job_branches", 0)):
+            for job_id, target_branches in rows:
+                refresh_job_branch_codes(cursor, job_id, target_branches)
+            conn.commit()
+            checkpoint.save(job_branches=rows[-1][0])
+
+        # MinHash is CPU-bound, so signatures are computed in worker processes and stored here
+        done = 0
+        rows = keyset_chunks(cursor, f"SELECT t.student_id, t.resume_path, t.raw_text FROM {LIVE_RESUME_TEXTS} "
+                             "WHERE t.student_id > %s ORDER BY t.student_id LIMIT %s",
+                             chunk_size, checkpoint.get("fingerprints", 0))
+        chunks = ([((student_id, path), text) for student_id, path, text in chunk] for chunk in rows)
+        with cli_progress("Resume fingerprints") as progress:
+            progress(done, resumes)
+            for signatures in map_chunks_in_pool(resume_fingerprint.signature_chunk, chunks, workers):
+                for (student_id, path), signature in signatures:
+                    if signature is not None:
+                        store_resume_fingerprint(cursor, student_id, path, signature)
+                conn.commit()
+                checkpoint.save(fingerprints=signatures[-1][0][0])
+                done += len(signatures)
+                progress(done, resumes)
+        checkpoint.clear()
+    finally:
+        cursor.close()
+        conn.close()
+
+@admin_cli.command("archive-students")
+@click.option("--passing-year", help="Archive students with this passing year.")
+@click.option("--branch", help="Archive students of this branch.")
+@chunk_size_option(ARCHIVE_CHUNK_SIZE)
+@dry_run_option
+def archive_students_command(passing_year, branch, chunk_size, dry_run):
+    """Archive a cohort of students in chunked transactions (rerun to resume)."""
+    filters = {k: v for k, v in (("passing_year", passing_year), ("branch", branch)) if v}
+    if not filters:
+        raise click.UsageError("At least one of --passing-year or --branch is required.")
+    conn = get_db_connection()
+    try:
+        total = count_students_matching(conn, filters)
+        if dry_run:
+            click.echo(f"Would archive {total} students matching {filters}.")
+            return
+        with cli_progress("Archiving students") as progress:
+            progress(0, total)
+            archived, chunks = archive_students_matching(conn, filters, chunk_size,
+                                                         progress=lambda done: progress(done, total))
+        click.echo(f"Archived {archived} students in {chunks} chunks.")
+    finally:
+        conn.close()
+
+@admin_cli.command("import-students")
+@click.argument("csv_file", type=click.Path(exists=True, dir_okay=False))
+@chunk_size_option(500)
+@dry_run_option
+@fresh_option
+def import_students_command(csv_file, chunk_size, dry_run, fresh):
+    """Import students from a CSV with columns name,email,password,cgpa,passing_year,branch,phone."""
+    with open(csv_file, newline="") as f:
+        rows = list(csv.DictReader(f))
+    invalid = [i for i, row in enumerate(rows, start=2) if not row.get("name") or not row.get("email")]
+    if invalid:
+        raise click.ClickException(f"Rows missing name or email (line numbers): {invalid[:20]}")
+    if dry_run:
+        click.echo(f"Would import {len(rows)} students from {csv_file}.")
+        return
+
+    checkpoint = Checkpoint(f"import-students-{os.path.basename(csv_file)}", fresh=fresh)
+    imported = checkpoint.get("rows", 0)
+    conn = get_db_connection()
+    try:
+        with cli_progress("Importing students") as progress:
+            progress(imported, len(rows))
+            while imported < len(rows):
+                chunk = rows[imported:imported + chunk_size]
+                create_students(conn, chunk)
+                conn.commit()
+                imported += len(chunk)
+                checkpoint.save(rows=imported)
+                progress(imported, len(rows))
+        checkpoint.clear()
+        click.echo(f"Imported {len(rows)} students.")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+@admin_cli.command("build-assets")
+def build_assets_command():
+    """Minify, fingerprint and precompress static bundles and print the page-weight report."""
+    click.echo(asset_pipeline.format_report(asset_pipeline.build()))
+    click.echo(f"Wrote {asset_pipeline.DIST_DIR}; restart the app to serve the new bundles.")
+
+@admin_cli.command("schedule-interviews")
+@click.argument("job_ids", nargs=-1, type=int)
+@click.option("--reset", is_flag=True, help="Cancel upcoming interviews and reschedule everyone.")
+def schedule_interviews_command(job_ids, reset):
+    """Seat shortlisted applications into interview slots (every job with a plan if no JOB_IDS)."""
+    if not job_ids:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            ensure_interview_tables(cursor)
+            cursor.execute("SELECT job_id FROM interview_plans ORDER BY job_id")
+            job_ids = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+            conn.close()
+    for job_id in job_ids:
+        summary = schedule_job_interviews(job_id, reset=reset)
+        if summary is None:
+            click.echo(f"Job {job_id}: no interview plan.")
+            continue
+        click.echo(f"Job {job_id}: scheduled {summary['scheduled']}, kept {summary['already_scheduled']}, "
+                   f"unscheduled {len(summary['unscheduled'])} in {summary['seconds']}s.")
+
+app.cli.add_command(admin_cli)
+
 # ==================== MAIN EXECUTION ====================
 if __name__ == "__main__":
     os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -0,0 +1,240 @@
+# asgi_app.py
+"""Optional ASGI serving mode for the I/O-bound read endpoints.
+
+The Flask app (app1.py) stays the system of record; this app serves only the
+read-only JSON endpoints below, concurrently on one event loop, using the same
+SQL and row shaping (db_layer.py) and the same server-side sessions
+(session_store.py). Route these paths to it in the reverse proxy:
+
+    /student_jobs  /student_events  /student_events/calendar  /prep_resources_student
+    /tpo_jobs      /recruiter_applicants  /all_applications
+
+Tenants (tenants.py) are resolved from the Host header exactly as in the
+Flask app, each with its own connection pool.
+
+Requires: starlette, aiomysql, uvicorn.
+
+    uvicorn asgi_app:app --host 127.0.0.1 --port 5001
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from datetime import date
+
+import aiomysql
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import Response
+from starlette.routing import Route
+
+import db_layer
+import json_provider
+import tenants
+from session_store import create_session_store
+
+logger = logging.getLogger("asgi_app")
+
+SESSION_COOKIE_NAME = os.environ.get("SESSION_COOKIE_NAME", "session")
+DB_POOL_SIZE = int(os.environ.get("ASGI_DB_POOL_SIZE", 20))   # per tenant
+
+TENANTS = tenants.TenantRegistry.load(os.environ.get("TENANTS_FILE", "tenants.json"), db_layer.DB_CONFIG)
+SESSION_TENANT = TENANTS.default or next(iter(TENANTS))
+
+def sync_connect():
+    import mysql.connector
+    return mysql.connector.connect(**SESSION_TENANT.db_config)
+
+session_store = create_session_store(os.environ.get("SESSION_BACKEND", "sqlite"),
+                                     os.environ.get("SESSION_SQLITE_PATH", "sessions.sqlite3"),
+                                     sync_connect)
+
+def jsonify(data, status=200):
+    """Encode with the same provider as the Flask app so both serving modes return identical bodies"""
+    return Response(json_provider.dumps_bytes(data) + b"\n", status_code=status, media_type="application/json")
+
+async def load_session(request):
+    sid = request.cookies.get(SESSION_COOKIE_NAME)
+    if not sid:
+        return {}
+    loaded = await asyncio.to_thread(session_store.load, sid)
+    if not loaded or loaded[0].get("tenant", SESSION_TENANT.slug) != tenants.current().slug:
+        return {}
+    return loaded[0]
+
+def pool():
+    return app.state.pools[tenants.current().slug]
+
+async def fetch_all(sql, params=()):
+    async with pool().acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(sql, params)
+            return list(await cursor.fetchall())
+
+async def fetch_one(sql, params=()):
+    async with pool().acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(sql, params)
+            return await cursor.fetchone()
+
+# ==================== READ ENDPOINTS ====================
+async def student_jobs(request):
+    session = await load_session(request)
+    if session.get("role") != "student":
+        return jsonify([])
+
+    try:
+        student = await fetch_one(db_layer.STUDENT_ELIGIBILITY_SQL, (session.get("user_id"),))
+        if not student:
+            return jsonify([])
+        jobs = await fetch_all(db_layer.STUDENT_JOBS_SQL, db_layer.student_jobs_params(student))
+        return jsonify(db_layer.build_student_job_list(student, jobs))
+    except Exception as e:
+        logger.error(f"Error fetching student jobs: {e}")
+        return jsonify({"error": "Failed to fetch jobs"}, 500)
+
+def feed_response(page):
+    rows, next_cursor = page
+    response = jsonify(rows)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+async def fetch_events(start, end, limit, descending=False, after=None):
+    key = app.state.event_keys[tenants.current().slug]
+    sql, params = db_layer.event_range_query(key, start, end, limit, descending, after)
+    return db_layer.feed_page(await fetch_all(sql, params), limit, db_layer.event_cursor)
+
+async def student_events(request):
+    session = await load_session(request)
+    if session.get("role") != "student":
+        return jsonify([])
+
+    args = request.query_params
+    try:
+        days = db_layer.bounded_int(args.get("days"), db_layer.FEED_DEFAULT_DAYS, db_layer.FEED_MAX_DAYS)
+        limit = db_layer.bounded_int(args.get("limit"), db_layer.FEED_PAGE_SIZE, db_layer.FEED_MAX_PAGE_SIZE)
+        start, end, descending = db_layer.event_window(args.get("window", "upcoming"), days, date.today())
+        after = db_layer.parse_event_cursor(args["after"]) if args.get("after") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}, 400)
+    return feed_response(await fetch_events(start, end, limit, descending, after))
+
+async def student_events_calendar(request):
+    session = await load_session(request)
+    if session.get("role") != "student":
+        return jsonify([])
+
+    try:
+        start, end = db_layer.calendar_range(request.query_params.get("start"), request.query_params.get("end"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}, 400)
+    events, _ = await fetch_events(start, end, db_layer.CALENDAR_MAX_EVENTS)
+    return jsonify(events)
+
+async def prep_resources_student(request):
+    session = await load_session(request)
+    if session.get("role") != "student":
+        return jsonify([])
+
+    args = request.query_params
+    try:
+        limit = db_layer.bounded_int(args.get("limit"), db_layer.FEED_PAGE_SIZE, db_layer.FEED_MAX_PAGE_SIZE)
+        after = db_layer.parse_resource_cursor(args["after"]) if args.get("after") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}, 400)
+    sql, params = db_layer.resource_page_query(limit, after)
+    return feed_response(db_layer.feed_page(await fetch_all(sql, params), limit, db_layer.resource_cursor))
+
+async def tpo_jobs(request):
+    session = await load_session(request)
+    if session.get("role") != "tpo":
+        return jsonify([])
+
+    try:
+        jobs = await fetch_all(db_layer.TPO_JOBS_SQL)
+        return jsonify(db_layer.split_target_branches(jobs))
+    except Exception as e:
+        logger.error(f"Error fetching TPO jobs: {e}")
+        return jsonify([])
+
+async def recruiter_applicants(request):
+    session = await load_session(request)
+    if session.get("role") != "recruiter":
+        return jsonify([])
+
+    try:
+        return jsonify(await fetch_all(db_layer.RECRUITER_APPLICANTS_SQL, (session.get("user_id"),)))
+    except Exception as e:
+        logger.error(f"Error fetching recruiter applicants: {e}")
+        return jsonify([])
+
+async def all_applications(request):
+    session = await load_session(request)
+    if session.get("role") != "tpo":
+        return jsonify([])
+
+    try:
+        if not await fetch_one(db_layer.APPLICATIONS_TABLE_EXISTS_SQL):
+            return jsonify([])
+        return jsonify(await fetch_all(db_layer.ALL_APPLICATIONS_SQL))
+    except Exception as e:
+        logger.error(f"Error fetching applications: {e}")
+        return jsonify([])
+
+# ==================== APP ====================
+class TenantMiddleware:
+    """Select the request's tenant from its Host header for everything below it"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        host = dict(scope["headers"]).get(b"host", b"").decode("latin-1")
+        tenant = TENANTS.resolve(host)
+        if tenant is None:
+            return await jsonify({"error": "Unknown college"}, 404)(scope, receive, send)
+        with tenants.use(tenant):
+            await self.app(scope, receive, send)
+
+async def open_pools():
+    app.state.pools = {}
+    app.state.event_keys = {}
+    for tenant in TENANTS:
+        config = dict(tenant.db_config)
+        config["db"] = config.pop("database")
+        app.state.pools[tenant.slug] = await aiomysql.create_pool(minsize=1, maxsize=DB_POOL_SIZE,
+                                                                  autocommit=True, **config)
+        # The Flask app creates the events date index; this app only needs the key column
+        with tenants.use(tenant):
+            key = await fetch_one(db_layer.EVENT_KEY_SQL)
+        app.state.event_keys[tenant.slug] = key["Column_name"] if key else db_layer.DEFAULT_EVENT_KEY
+
+async def close_pools():
+    for pool in app.state.pools.values():
+        pool.close()
+        await pool.wait_closed()
+
+@asynccontextmanager
+async def lifespan(app):
+    await open_pools()
+    try:
+        yield
+    finally:
+        await close_pools()
+
+app = Starlette(
+    routes=[
+        Route("/student_jobs", student_jobs),
+        Route("/student_events", student_events),
+        Route("/student_events/calendar", student_events_calendar),
+        Route("/prep_resources_student", prep_resources_student),
+        Route("/tpo_jobs", tpo_jobs),
+        Route("/recruiter_applicants", recruiter_applicants),
+        Route("/all_applications", all_applications),
+    ],
+    middleware=[Middleware(TenantMiddleware)],
+    lifespan=lifespan,
+)
@@ -0,0 +1,181 @@
+# asset_pipeline.py
+"""Static asset build: minify, content-hash and precompress bundles, then report page weight.
+
+Usage:
+    python asset_pipeline.py            # or: flask --app app1 admin build-assets
+
+Writes <name>.<hash>.min.<ext> plus .gz/.br variants and manifest.json into
+DIST_DIR. The app's asset_url() helper reads the manifest; without a build it
+serves the unminified sources instead. rjsmin, rcssmin and brotli are optional:
+a missing minifier ships the source as-is and a missing brotli skips .br files.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DIST_DIR = os.path.join(ROOT, "static", "dist")
+MANIFEST_NAME = "manifest.json"
+REPORT_NAME = "page-weight.json"
+
+# Bundle name -> source files (relative to ROOT), concatenated in order
+ASSET_BUNDLES = {
+    "style.css": ["style.css"],
+    "main.js": ["main.js"],
+    "student_dashboard.js": ["student_dashboard.js"],
+    "recruiter_dashboard.js": ["recruiter_dashboard.js"],
+    "tpo_dashboard.js": ["tpo_dashboard.js"],
+}
+
+PAGE_TEMPLATES = ["index.html", "about.html", "contact.html",
+                  "student_dashboard.html", "recruiter_dashboard.html", "tpo_dashboard.html"]
+
+ASSET_URL_RE = re.compile(r"asset_url\(\s*['\"]([^'\"]+)['\"]\s*\)")
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def read_bundle(name):
+    parts = []
+    for source in ASSET_BUNDLES[name]:
+        with open(os.path.join(ROOT, source), encoding="utf-8") as f:
+            parts.append(f.read())
+    return "\n".join(parts)
+
+
+def minify(name, text):
+    """Minified text and the minifier used (None when it is not installed)"""
+    if name.endswith(".js") and rjsmin is not None:
+        return rjsmin.jsmin(text), "rjsmin"
+    if name.endswith(".css") and rcssmin is not None:
+        return rcssmin.cssmin(text), "rcssmin"
+    return text, None
+
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}.min{ext}"
+
+
+def write_file(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def build_bundle(name, dist_dir):
+    source = read_bundle(name)
+    minified, minifier = minify(name, source)
+    data = minified.encode("utf-8")
+    filename = hashed_name(name, data)
+    write_file(os.path.join(dist_dir, filename), data)
+
+    # mtime=0 keeps .gz output identical across builds of the same content
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    write_file(os.path.join(dist_dir, f"{filename}.gz"), gz)
+    br = None
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        write_file(os.path.join(dist_dir, f"{filename}.br"), br)
+
+    return {
+        "file": filename,
+        "minifier": minifier,
+        "source_bytes": len(source.encode("utf-8")),
+        "minified_bytes": len(data),
+        "gzip_bytes": len(gz),
+        "brotli_bytes": len(br) if br is not None else None,
+    }
+
+
+def page_weight(bundles):
+    """Per template: bytes of the HTML and of every bundle it references, raw and compressed"""
+    pages = {}
+    for template in PAGE_TEMPLATES:
+        with open(os.path.join(ROOT, template), encoding="utf-8") as f:
+            html = f.read()
+        names = list(dict.fromkeys(ASSET_URL_RE.findall(html)))
+        html_bytes = html.encode("utf-8")
+        page = {
+            "assets": names,
+            "html_bytes": len(html_bytes),
+            "html_gzip_bytes": len(gzip.compress(html_bytes, mtime=0)),
+        }
+        for key in ("source_bytes", "minified_bytes", "gzip_bytes", "brotli_bytes"):
+            values = [bundles[n][key] for n in names if n in bundles]
+            page[f"assets_{key}"] = sum(values) if all(v is not None for v in values) else None
+        pages[template] = page
+    return pages
+
+
+def build(dist_dir=DIST_DIR):
+    """Build every bundle into dist_dir, returning the page-weight report"""
+    os.makedirs(dist_dir, exist_ok=True)
+    bundles = {name: build_bundle(name, dist_dir) for name in ASSET_BUNDLES}
+
+    manifest = {name: info["file"] for name, info in bundles.items()}
+    write_file(os.path.join(dist_dir, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode())
+
+    report = {"bundles": bundles, "pages": page_weight(bundles)}
+    write_file(os.path.join(dist_dir, REPORT_NAME), json.dumps(report, indent=2).encode())
+
+    # Keep only the files of this build
+    keep = {MANIFEST_NAME, REPORT_NAME}
+    for filename in manifest.values():
+        keep.update({filename, f"{filename}.gz", f"{filename}.br"})
+    for filename in os.listdir(dist_dir):
+        if filename not in keep:
+            os.remove(os.path.join(dist_dir, filename))
+    return report
+
+
+def load_manifest(dist_dir=DIST_DIR):
+    """Bundle name -> hashed filename from the last build, or {} if assets were never built"""
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def format_report(report):
+    def kb(value):
+        return f"{value / 1024:8.1f}" if value is not None else "     n/a"
+
+    lines = [f"{'bundle':<26}{'source KB':>10}{'min KB':>10}{'gzip KB':>10}{'br KB':>10}  minifier"]
+    for name, info in report["bundles"].items():
+        lines.append(f"{name:<26}{kb(info['source_bytes']):>10}{kb(info['minified_bytes']):>10}"
+                     f"{kb(info['gzip_bytes']):>10}{kb(info['brotli_bytes']):>10}  {info['minifier'] or 'none'}")
+    lines.append("")
+    lines.append(f"{'page (html + assets)':<26}{'html KB':>10}{'source KB':>10}{'min KB':>10}{'gzip KB':>10}{'br KB':>10}")
+    for template, page in report["pages"].items():
+        lines.append(f"{template:<26}{kb(page['html_bytes']):>10}{kb(page['assets_source_bytes']):>10}"
+                     f"{kb(page['assets_minified_bytes']):>10}{kb(page['assets_gzip_bytes']):>10}"
+                     f"{kb(page['assets_brotli_bytes']):>10}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dist", default=DIST_DIR)
+    args = parser.parse_args()
+    print(format_report(build(args.dist)))
+
+
+if __name__ == "__main__":
+    main()
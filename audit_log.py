@@ -0,0 +1,275 @@
+# audit_log.py
+"""Append-only audit trail of state-changing actions, written in batches off the request path.
+
+Requests hand events to an AuditWriter, which holds at most max_pending of
+them in memory and inserts them in batches from a background thread. When
+the buffer is full, submit() waits submit_timeout for the writer to catch up
+and then drops the event (reported through on_drop) rather than stall the
+request. close() writes whatever is still buffered; call it at shutdown.
+
+The audit_log table is range-partitioned by month on occurred_at: date-bounded
+queries only read the months they cover and old months can be dropped whole.
+Triggers reject UPDATE and DELETE on its rows.
+"""
+import json
+import queue
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+AUDIT_DEFAULT_DAYS = 30
+AUDIT_MAX_DAYS = 366
+AUDIT_PAGE_SIZE = 50
+AUDIT_MAX_PAGE_SIZE = 200
+PARTITION_MONTHS_AHEAD = 2
+
+_STOP = object()
+
+# ==================== TABLE ====================
+AUDIT_TABLE_EXISTS_SQL = "SHOW TABLES LIKE 'audit_log'"
+
+AUDIT_PARTITIONS_SQL = """
+    SELECT PARTITION_NAME FROM information_schema.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'audit_log' AND PARTITION_NAME IS NOT NULL
+"""
+
+CREATE_AUDIT_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS audit_log (
+        audit_id BIGINT NOT NULL AUTO_INCREMENT,
+        occurred_at DATETIME(6) NOT NULL,
+        actor_role VARCHAR(16),
+        actor_id INT,
+        action VARCHAR(48) NOT NULL,
+        target_type VARCHAR(32) NOT NULL,
+        target_id VARCHAR(64),
+        details JSON,
+        ip VARCHAR(45),
+        PRIMARY KEY (audit_id, occurred_at),
+        INDEX idx_audit_time (occurred_at, audit_id),
+        INDEX idx_audit_target (target_type, target_id, occurred_at),
+        INDEX idx_audit_actor (actor_role, actor_id, occurred_at),
+        INDEX idx_audit_action (action, occurred_at)
+    )
+    PARTITION BY RANGE (TO_DAYS(occurred_at)) ({partitions})
+"""
+
+# Partition drops stay possible: they do not fire DELETE triggers
+AUDIT_TRIGGERS_SQL = [
+    f"""
+    CREATE TRIGGER audit_log_no_{event.lower()} BEFORE {event} ON audit_log FOR EACH ROW
+    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'audit_log is append-only'
+    """
+    for event in ("UPDATE", "DELETE")
+]
+
+INSERT_AUDIT_SQL = """
+    INSERT INTO audit_log (occurred_at, actor_role, actor_id, action, target_type, target_id, details, ip)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+AUDIT_COLUMNS = "audit_id, occurred_at, actor_role, actor_id, action, target_type, target_id, details, ip"
+
+# Query parameter -> column for the TPO audit view's equality filters
+AUDIT_FILTERS = {
+    "action": "action",
+    "actor_role": "actor_role",
+    "actor_id": "actor_id",
+    "target_type": "target_type",
+    "target_id": "target_id",
+}
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_clause(month):
+    """Partition of the rows dated in month (a first of month)"""
+    return f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{add_months(month, 1).isoformat()}'))"
+
+
+def wanted_months(today, months_ahead=PARTITION_MONTHS_AHEAD):
+    first = month_start(today)
+    return [add_months(first, i) for i in range(months_ahead + 1)]
+
+
+def create_table_sql(today):
+    """CREATE TABLE with partitions from this month through PARTITION_MONTHS_AHEAD, then a catch-all"""
+    partitions = [partition_clause(m) for m in wanted_months(today)]
+    partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+    return CREATE_AUDIT_TABLE_SQL.format(partitions=", ".join(partitions))
+
+
+def add_partitions_sql(existing, today):
+    """ALTER splitting the months ahead out of pmax, or None when they all exist.
+
+    Months older than the newest existing partition are never added: their
+    rows already live in pmax's predecessors or in pmax itself.
+    """
+    months = sorted(int(name[1:]) for name in existing if name[1:].isdigit())
+    newest = months[-1] if months else 0
+    missing = [m for m in wanted_months(today) if int(f"{m:%Y%m}") > newest]
+    if not missing:
+        return None
+    partitions = ", ".join([partition_clause(m) for m in missing] + ["PARTITION pmax VALUES LESS THAN MAXVALUE"])
+    return f"ALTER TABLE audit_log REORGANIZE PARTITION pmax INTO ({partitions})"
+
+
+def event_row(occurred_at, actor_role, actor_id, action, target_type, target_id, details=None, ip=None):
+    """INSERT_AUDIT_SQL parameters for one event"""
+    return (occurred_at, actor_role, actor_id, action, target_type,
+            None if target_id is None else str(target_id),
+            json.dumps(details, default=str, sort_keys=True) if details else None, ip)
+
+
+# ==================== QUERIES ====================
+def audit_range(since, until, today):
+    """(start, exclusive end) for inclusive ISO dates; the last AUDIT_DEFAULT_DAYS when both are missing"""
+    try:
+        end = date.fromisoformat(until) if until else today
+        start = date.fromisoformat(since) if since else end - timedelta(days=AUDIT_DEFAULT_DAYS - 1)
+    except ValueError:
+        raise ValueError("since and until must be YYYY-MM-DD dates")
+    if end < start:
+        raise ValueError("until is before since")
+    if (end - start).days >= AUDIT_MAX_DAYS:
+        raise ValueError(f"range is longer than {AUDIT_MAX_DAYS} days")
+    return start, end + timedelta(days=1)
+
+
+def audit_page_query(start, end, limit, filters=None, after=None):
+    """SQL and params for one page of events in [start, end), newest first.
+
+    filters maps AUDIT_FILTERS keys to values; `after` is a parsed cursor.
+    limit + 1 rows are fetched so the caller can tell whether another page
+    follows. The date bounds let MySQL prune partitions outside the range.
+    """
+    where, params = ["occurred_at >= %s", "occurred_at < %s"], [start, end]
+    for key, value in (filters or {}).items():
+        where.append(f"{AUDIT_FILTERS[key]} = %s")
+        params.append(value)
+    if after is not None:
+        where.append("(occurred_at < %s OR (occurred_at = %s AND audit_id < %s))")
+        params += [after[0], after[0], after[1]]
+    sql = f"""
+        SELECT {AUDIT_COLUMNS} FROM audit_log
+        WHERE {' AND '.join(where)}
+        ORDER BY occurred_at DESC, audit_id DESC
+        LIMIT %s
+    """
+    return sql, params + [limit + 1]
+
+
+def audit_cursor(row):
+    return f"{row['occurred_at'].isoformat()}_{row['audit_id']}"
+
+
+def parse_audit_cursor(value):
+    """(occurred_at, audit_id) from an audit cursor; ValueError when it is malformed"""
+    moment, _, audit_id = value.rpartition("_")
+    try:
+        return datetime.fromisoformat(moment), int(audit_id)
+    except ValueError:
+        raise ValueError("malformed cursor")
+
+
+def shape_audit_row(row):
+    if isinstance(row.get("details"), (str, bytes)):
+        row["details"] = json.loads(row["details"])
+    return row
+
+
+# ==================== WRITER ====================
+class AuditWriter:
+    """Bounded in-memory buffer drained into the database in batches by a background thread.
+
+    write(group, rows) inserts one batch of rows for one destination (e.g. a
+    tenant) and raises on failure; a failed batch is retried `attempts` times
+    before its rows are dropped. on_drop(count, reason) is told about every
+    event lost, with reason "buffer_full" or "write_failed".
+    """
+
+    def __init__(self, write, max_pending=10000, batch_size=200, flush_interval=1.0,
+                 submit_timeout=0.05, attempts=3, on_drop=None, logger=None):
+        self.write = write
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.submit_timeout = submit_timeout
+        self.attempts = attempts
+        self.on_drop = on_drop
+        self.logger = logger
+        self.queue = queue.Queue(maxsize=max_pending)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, group, row):
+        """Buffer one event; returns False if it was dropped"""
+        if not self._closed.is_set():
+            try:
+                self.queue.put((group, row), timeout=self.submit_timeout)
+                return True
+            except queue.Full:
+                pass
+        self._dropped(1, "buffer_full")
+        return False
+
+    def pending(self):
+        return self.queue.qsize()
+
+    def close(self, timeout=5.0):
+        """Stop accepting events and write the buffered ones; False if that did not finish within timeout"""
+        if not self._closed.is_set():
+            self._closed.set()
+            try:
+                self.queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                return False
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _dropped(self, count, reason):
+        if self.on_drop:
+            self.on_drop(count, reason)
+
+    def _next_batch(self):
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            stop = batch[-1] is _STOP
+            groups = {}
+            for group, row in batch[:-1] if stop else batch:
+                groups.setdefault(group, []).append(row)
+            for group, rows in groups.items():
+                self._write(group, rows)
+            if stop:
+                return
+
+    def _write(self, group, rows):
+        for attempt in range(1, self.attempts + 1):
+            try:
+                self.write(group, rows)
+                return
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error writing {len(rows)} audit events (attempt {attempt}): {e}")
+                if attempt < self.attempts:
+                    time.sleep(min(2 ** (attempt - 1), 5))
+        self._dropped(len(rows), "write_failed")
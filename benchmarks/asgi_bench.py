@@ -0,0 +1,119 @@
+# benchmarks/asgi_bench.py
+"""Compare requests/sec per MB of RSS between the sync (WSGI) and ASGI deployments.
+
+Start both deployments against the same seeded database, then:
+
+    python -m benchmarks.asgi_bench \
+        --sync-url http://127.0.0.1:5000 --sync-pid <gunicorn master pid> \
+        --async-url http://127.0.0.1:5001 --async-pid <uvicorn pid> \
+        --scale 10k --concurrency 64 --requests 2000 --output asgi.json
+
+The ASGI app only serves the read endpoints, so logins go to --sync-url and the
+session cookie is reused against both deployments.
+"""
+import argparse
+import os
+import random
+
+from benchmarks.common import SCALES, run_metadata, write_results
+from benchmarks.load_bench import Client, run_level
+from benchmarks.seed_data import plan_counts
+
+READ_ENDPOINTS = {
+    "student_jobs": "student",
+    "student_events": "student",
+    "prep_resources_student": "student",
+    "tpo_jobs": "tpo",
+    "recruiter_applicants": "recruiter",
+    "all_applications": "tpo",
+}
+
+
+def process_tree_rss_mb(root_pid):
+    """Sum resident memory of a process and all of its descendants (Linux /proc)"""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as fh:
+                ppid = int(fh.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total_kb = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            with open(f"/proc/{pid}/status") as fh:
+                for line in fh:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+        except OSError:
+            pass
+        stack.extend(children.get(pid, []))
+    return round(total_kb / 1024.0, 1)
+
+
+class ReadScenario:
+    def __init__(self, endpoint, login_url, counts, rng):
+        self.endpoint = endpoint
+        self.login_url = login_url
+        self.counts = counts
+        self.rng = rng
+
+    def prepare(self, client):
+        role = READ_ENDPOINTS[self.endpoint]
+        key = {"student": "students", "recruiter": "recruiters", "tpo": "tpos"}[role]
+        login_client = Client(self.login_url)
+        login_client.opener = client.opener
+        login_client.login(f"{role}{self.rng.randrange(self.counts[key])}@bench.local")
+
+    def run(self, client):
+        return client.request(f"/{self.endpoint}") == 200
+
+
+def bench_deployment(base_url, pid, login_url, counts, concurrency, total_requests):
+    results = {}
+    for endpoint in READ_ENDPOINTS:
+        factory = lambda rng, endpoint=endpoint: ReadScenario(endpoint, login_url, counts, rng)
+        summary = run_level(base_url, factory, concurrency, total_requests)
+        rss_mb = process_tree_rss_mb(pid)
+        summary["rss_mb"] = rss_mb
+        summary["rps_per_mb"] = round(summary["throughput_rps"] / rss_mb, 4) if rss_mb and summary["throughput_rps"] else None
+        results[endpoint] = summary
+        print(f"{base_url} {endpoint:<24} rps={summary['throughput_rps']} rss={rss_mb}MB "
+              f"rps/MB={summary['rps_per_mb']} p99={summary['p99_ms']}ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sync-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--sync-pid", type=int, required=True)
+    parser.add_argument("--async-url", default="http://127.0.0.1:5001")
+    parser.add_argument("--async-pid", type=int, required=True)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    random.seed(0)
+    counts = plan_counts(SCALES[args.scale])
+    results = {
+        "meta": run_metadata(),
+        "scale": args.scale,
+        "concurrency": args.concurrency,
+        "sync": bench_deployment(args.sync_url, args.sync_pid, args.sync_url, counts,
+                                 args.concurrency, args.requests),
+        "async": bench_deployment(args.async_url, args.async_pid, args.sync_url, counts,
+                                  args.concurrency, args.requests),
+    }
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/common.py
+"""Shared helpers for the benchmark scripts"""
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime
+
+import mysql.connector
+
+SCALES = {"1k": 1000, "10k": 10000, "100k": 100000}
+BENCH_PASSWORD = "bench123"
+
+
+def get_bench_connection():
+    """Connect to the benchmark database (override with BENCH_DB_* environment variables)"""
+    return mysql.connector.connect(
+        host=os.environ.get("BENCH_DB_HOST", "localhost"),
+        port=int(os.environ.get("BENCH_DB_PORT", 3306)),
+        user=os.environ.get("BENCH_DB_USER", "BBBB"),
+        password=os.environ.get("BENCH_DB_PASSWORD", "XXXXX"),
+        database=os.environ.get("BENCH_DB_NAME", "placement_erp"),
+    )
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies, errors, elapsed):
+    """Summarize latencies (seconds) into the JSON shape shared by all benchmarks"""
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "p50_ms": _ms(percentile(latencies, 50)),
+        "p95_ms": _ms(percentile(latencies, 95)),
+        "p99_ms": _ms(percentile(latencies, 99)),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+    }
+
+
+def _ms(value):
+    return round(value * 1000, 3) if value is not None else None
+
+
+def run_metadata():
+    """Describe the commit and machine a run was taken on so results can be compared"""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True,
+                                         stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_results(results, output_path):
+    """Write results as JSON to output_path, or to stdout when output_path is None"""
+    payload = json.dumps(results, indent=2, default=str)
+    if output_path:
+        with open(output_path, "w") as fh:
+            fh.write(payload + "\n")
+        print(f"Results written to {output_path}")
+    else:
+        print(payload)
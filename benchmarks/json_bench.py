@@ -0,0 +1,142 @@
+# benchmarks/json_bench.py
+"""Serialization benchmark for the all_student_profiles response.
+
+Compares Flask's default provider over fetchall() (the old path), the
+json_provider encoder over fetchall(), and streaming rows off an unbuffered
+cursor with stream_json_array (the new path).
+
+Usage:
+    python -m benchmarks.json_bench --rows 10000 --repeat 5          # synthetic rows, no database
+    python -m benchmarks.json_bench --db --repeat 5 --output json.json  # seeded database (see seed_data)
+"""
+import argparse
+import decimal
+import random
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+import db_layer
+import json_provider
+from benchmarks.common import get_bench_connection, run_metadata, write_results
+
+
+def synthetic_profiles(count, seed=11):
+    """Rows shaped like ALL_STUDENT_PROFILES_SQL output"""
+    rng = random.Random(seed)
+    created = datetime(2024, 6, 1, 9, 30)
+    for i in range(count):
+        row = {
+            "profile_id": i + 1, "student_id": i + 1, "roll_no": f"R{i:05d}", "prn_no": f"PRN{i:08d}",
+            "department": rng.choice(["CSE", "IT", "ENTC", "AI & ML", "Mechanical"]),
+            "first_name": f"First{i}", "last_name": f"Last{i}", "gender": rng.choice(["M", "F"]),
+            "dob": date(2003, 1, 1) + timedelta(days=rng.randint(0, 900)),
+            "phone": f"98{rng.randint(10000000, 99999999)}", "email": f"student{i}@bench.local",
+            "tenth_percentage": decimal.Decimal(f"{rng.uniform(60, 99):.2f}"), "tenth_year": 2019,
+            "twelfth_percentage": decimal.Decimal(f"{rng.uniform(55, 98):.2f}"), "twelfth_year": 2021,
+            "average": decimal.Decimal(f"{rng.uniform(6, 9.8):.2f}"), "engg_passing_year": 2025,
+            "live_backlogs": rng.randint(0, 2), "year_gap": 0,
+            "programming_languages": "Python, Java, SQL", "academic_projects": "ERP portal, chatbot",
+            "certificates": "AWS CP", "hobbies": None, "linkedin_url": None, "github_url": None,
+            "created_at": created, "last_updated": created + timedelta(minutes=i),
+            "edited_by_student": 1, "student_name": f"First{i} Last{i}",
+            "student_email": f"student{i}@bench.local", "resume_path": None
+        }
+        for sem in range(1, 9):
+            row[f"sem{sem}"] = decimal.Decimal(f"{rng.uniform(6, 10):.2f}")
+        yield row
+
+
+class RowSource:
+    """Produces a fresh row iterator per run, from the database or synthetically"""
+
+    def __init__(self, use_db, rows):
+        self.use_db = use_db
+        # Generated up front so only encoding is timed
+        self.rows = None if use_db else list(synthetic_profiles(rows))
+
+    def open(self):
+        if not self.use_db:
+            return iter(self.rows), lambda: None
+        conn = get_bench_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(db_layer.ALL_STUDENT_PROFILES_SQL)
+
+        def close():
+            cursor.close()
+            conn.close()
+        return json_provider.iter_cursor_rows(cursor), close
+
+
+def flask_default_fetchall(rows, provider):
+    return [provider.dumps(list(rows)).encode("utf-8")]
+
+
+def provider_fetchall(rows, provider):
+    return [json_provider.dumps_bytes(list(rows))]
+
+
+def provider_stream(rows, provider):
+    return json_provider.stream_json_array(rows)
+
+
+def consume(strategy, source, provider):
+    """Drain one response body, returning (total seconds, seconds until the first row bytes, size)"""
+    rows, close = source.open()
+    started = time.perf_counter()
+    first_rows = None
+    size = 0
+    try:
+        for chunk in strategy(rows, provider):
+            size += len(chunk)
+            if first_rows is None and len(chunk) > 1:
+                first_rows = time.perf_counter() - started
+        return time.perf_counter() - started, first_rows, size
+    finally:
+        close()
+
+
+def median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def run(strategy, source, provider, repeat):
+    timings = [consume(strategy, source, provider) for _ in range(repeat)]
+    # Memory is measured in a separate pass because tracing slows encoding down
+    tracemalloc.start()
+    consume(strategy, source, provider)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "total_ms_median": round(median([t[0] for t in timings]) * 1000, 2),
+        "first_rows_ms_median": round(median([t[1] for t in timings]) * 1000, 2),
+        "peak_mib": round(peak / 2 ** 20, 2),
+        "bytes": timings[-1][2]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="synthetic row count (ignored with --db)")
+    parser.add_argument("--db", action="store_true", help="read rows from the seeded benchmark database")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    source = RowSource(args.db, args.rows)
+    provider = DefaultJSONProvider(Flask(__name__))
+    results = {
+        "meta": run_metadata(),
+        "source": "db" if args.db else f"synthetic:{args.rows}",
+        "encoder": "orjson" if json_provider.orjson is not None else "stdlib",
+    }
+    for strategy in (flask_default_fetchall, provider_fetchall, provider_stream):
+        results[strategy.__name__] = run(strategy, source, provider, args.repeat)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# benchmarks/load_bench.py
+"""Drive the ERP's hot endpoints at fixed concurrency levels and report latency percentiles.
+
+Usage:
+    python -m benchmarks.load_bench --base-url http://127.0.0.1:5000 --scale 10k \
+        --concurrency 1,8,32 --requests 500 --output results.json
+
+Run benchmarks.seed_data at the same --scale first; the load test logs in with
+the seeded accounts.
+"""
+import argparse
+import glob
+import os
+import random
+import threading
+import time
+import uuid
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, HTTPRedirectHandler, Request, build_opener
+
+from benchmarks.common import BENCH_PASSWORD, SCALES, get_bench_connection, run_metadata, summarize, write_results
+from benchmarks.seed_data import fetch_ids, plan_counts
+
+ENDPOINTS = ["login", "student_jobs", "apply_job", "recruiter_applicants",
+             "all_student_profiles", "upload_resume"]
+ENDPOINT_ROLES = {
+    "login": "student",
+    "student_jobs": "student",
+    "apply_job": "student",
+    "recruiter_applicants": "recruiter",
+    "all_student_profiles": "tpo",
+    "upload_resume": "student",
+}
+
+
+class NoRedirect(HTTPRedirectHandler):
+    """Report redirects instead of following them so only the endpoint itself is timed"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class Client:
+    """One simulated user with its own cookie session"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.opener = build_opener(HTTPCookieProcessor(CookieJar()), NoRedirect())
+
+    def request(self, path, data=None, headers=None):
+        req = Request(self.base_url + path, data=data, headers=headers or {})
+        try:
+            with self.opener.open(req, timeout=60) as resp:
+                resp.read()
+                return resp.status
+        except HTTPError as e:
+            e.read()
+            return e.code
+
+    def login(self, email):
+        body = urlencode({"email": email, "password": BENCH_PASSWORD}).encode()
+        return self.request("/login", body, {"Content-Type": "application/x-www-form-urlencoded"})
+
+
+def multipart_body(field, filename, content):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+class Scenario:
+    """Builds the request for one endpoint against the seeded data set"""
+
+    def __init__(self, endpoint, counts, job_ids, resume_files, rng):
+        self.endpoint = endpoint
+        self.counts = counts
+        self.job_ids = job_ids
+        self.resume_files = resume_files
+        self.rng = rng
+
+    def account(self):
+        role = ENDPOINT_ROLES[self.endpoint]
+        key = {"student": "students", "recruiter": "recruiters", "tpo": "tpos"}[role]
+        return f"{role}{self.rng.randrange(self.counts[key])}@bench.local"
+
+    def prepare(self, client):
+        if self.endpoint != "login":
+            client.login(self.account())
+
+    def run(self, client):
+        """Issue one request and return whether it succeeded"""
+        if self.endpoint == "login":
+            return client.login(self.account()) in (200, 302)
+        if self.endpoint == "apply_job":
+            # Repeat applications return 400 by design and still count as served requests
+            body = urlencode({"job_id": self.rng.choice(self.job_ids),
+                              "experience_years": 0, "commitment_hours": 40}).encode()
+            status = client.request("/apply_job", body, {"Content-Type": "application/x-www-form-urlencoded"})
+            return status in (200, 400)
+        if self.endpoint == "upload_resume":
+            path = self.rng.choice(self.resume_files)
+            with open(path, "rb") as fh:
+                body, headers = multipart_body("resume", os.path.basename(path), fh.read())
+            return client.request("/upload_resume", body, headers) in (200, 302)
+        return client.request(f"/{self.endpoint}") == 200
+
+
+def run_level(base_url, scenario_factory, concurrency, total_requests):
+    """Run total_requests split across `concurrency` threads and summarize the results"""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    per_worker = max(1, total_requests // concurrency)
+    ready = threading.Barrier(concurrency + 1)
+
+    def worker(seed):
+        scenario = scenario_factory(random.Random(seed))
+        client = Client(base_url)
+        scenario.prepare(client)
+        ready.wait()
+        local, failed = [], 0
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            try:
+                ok = scenario.run(client)
+            except URLError:
+                ok = False
+            if ok:
+                local.append(time.perf_counter() - start)
+            else:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    ready.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    return summarize(latencies, errors[0], time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint and level")
+    parser.add_argument("--resume-dir", default=os.path.join(os.path.dirname(__file__), "corpus"))
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    counts = plan_counts(SCALES[args.scale])
+    conn = get_bench_connection()
+    try:
+        job_ids = fetch_ids(conn, """
+            SELECT j.job_id FROM jobs j JOIN recruiters r ON j.company_id = r.company_id
+            WHERE r.email LIKE '%@bench.local' AND j.deadline >= CURDATE()
+        """)
+    finally:
+        conn.close()
+    resume_files = sorted(glob.glob(os.path.join(args.resume_dir, "*.pdf")) +
+                          glob.glob(os.path.join(args.resume_dir, "*.docx")))
+    endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    if "upload_resume" in endpoints and not resume_files:
+        parser.error(f"no resumes in {args.resume_dir}; run benchmarks.parse_bench --make-corpus first")
+
+    results = {"meta": run_metadata(), "scale": args.scale, "base_url": args.base_url, "endpoints": {}}
+    for endpoint in endpoints:
+        results["endpoints"][endpoint] = {}
+        for level in [int(c) for c in args.concurrency.split(",")]:
+            factory = lambda rng, endpoint=endpoint: Scenario(endpoint, counts, job_ids, resume_files, rng)
+            summary = run_level(args.base_url, factory, level, args.requests)
+            results["endpoints"][endpoint][str(level)] = summary
+            print(f"{endpoint:<22} c={level:<4} p50={summary['p50_ms']}ms "
+                  f"p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms "
+                  f"rps={summary['throughput_rps']} errors={summary['errors']}")
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
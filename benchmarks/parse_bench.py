@@ -0,0 +1,89 @@
+# benchmarks/parse_bench.py
+"""Micro-benchmark for resume text extraction and regex parsing.
+
+Usage:
+    python -m benchmarks.parse_bench --make-corpus 50       # generate sample .docx resumes
+    python -m benchmarks.parse_bench --repeat 5 --output parse.json
+"""
+import argparse
+import glob
+import os
+import random
+import time
+
+from benchmarks.common import run_metadata, summarize, write_results
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+SKILL_POOL = ["Python", "Java", "SQL", "React", "Flask", "PyTorch", "TensorFlow", "AWS",
+              "Pandas", "NumPy", "OpenCV", "NLP", "LangChain", "FAISS", "MongoDB", "Node.js"]
+
+
+def make_corpus(count, corpus_dir, seed=7):
+    """Write `count` synthetic .docx resumes of varying length into corpus_dir"""
+    from docx import Document
+
+    rng = random.Random(seed)
+    os.makedirs(corpus_dir, exist_ok=True)
+    for i in range(count):
+        doc = Document()
+        doc.add_paragraph(f"Bench Candidate {i}")
+        doc.add_paragraph(f"candidate{i}@example.com | +91 98765 {rng.randint(10000, 99999)}")
+        doc.add_paragraph("Skills: " + ", ".join(rng.sample(SKILL_POOL, rng.randint(3, 10))))
+        for _ in range(rng.randint(5, 60)):
+            doc.add_paragraph(
+                "Built and maintained services using " + ", ".join(rng.sample(SKILL_POOL, 3)) +
+                " with a focus on reliability, testing and measurable performance improvements."
+            )
+        if rng.random() < 0.3:
+            doc.add_paragraph("Certified through Coursera and IEEE workshops.")
+        doc.save(os.path.join(corpus_dir, f"resume_{i:04d}.docx"))
+
+
+def time_calls(func, inputs, repeat):
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in inputs:
+            t0 = time.perf_counter()
+            try:
+                func(item)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - t0)
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=CORPUS_DIR)
+    parser.add_argument("--make-corpus", type=int, metavar="N", help="generate N sample resumes and exit")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    if args.make_corpus:
+        make_corpus(args.make_corpus, args.corpus)
+        print(f"Wrote {args.make_corpus} resumes to {args.corpus}")
+        return
+
+    files = sorted(glob.glob(os.path.join(args.corpus, "*.pdf")) +
+                   glob.glob(os.path.join(args.corpus, "*.docx")))
+    if not files:
+        parser.error(f"no resumes in {args.corpus}; run with --make-corpus first")
+
+    from app1 import extract_resume_text, simple_text_parsing
+
+    texts = [extract_resume_text(path) for path in files]
+    results = {
+        "meta": run_metadata(),
+        "corpus": {"files": len(files), "total_chars": sum(len(t) for t in texts)},
+        "extract_resume_text": time_calls(extract_resume_text, files, args.repeat),
+        "simple_text_parsing": time_calls(simple_text_parsing, texts, args.repeat),
+    }
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/schedule_bench.py
+"""Interview scheduler benchmark on a synthetic placement week.
+
+Builds a plan of --days eight-hour days of 30-minute slots, --panels panels
+spread over rooms of capacity 3, and --candidates shortlisted candidates who
+each already hold a few interviews with other companies. Reports how long
+interview_scheduler.schedule() takes and how many candidates it seats
+against the number of seats, then times refilling a seat after a drop-out.
+
+Usage:
+    python -m benchmarks.schedule_bench --candidates 5000 --repeat 3 --output schedule.json
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import interview_scheduler
+from benchmarks.common import run_metadata, write_results
+
+FIRST_DAY = datetime(2026, 11, 2, 9, 0)
+
+
+def synthetic_round(candidates, days, panels, seed=5):
+    rng = random.Random(seed)
+    rooms = {f"Room {i}": 3 for i in range((panels + 2) // 3)}
+    plan = interview_scheduler.InterviewPlan(
+        slot_minutes=30,
+        buffer_minutes=15,
+        windows=[{"start": FIRST_DAY + timedelta(days=d), "end": FIRST_DAY + timedelta(days=d, hours=8)}
+                 for d in range(days)],
+        rooms=rooms,
+        panels=[{"name": f"Panel {i}", "room": f"Room {i // 3}"} for i in range(panels)],
+    )
+    busy = {}
+    for candidate in range(candidates):
+        intervals = []
+        for _ in range(rng.randint(0, 4)):
+            start = FIRST_DAY + timedelta(days=rng.randrange(days), minutes=30 * rng.randrange(16))
+            intervals.append((start, start + timedelta(minutes=60)))
+        busy[candidate] = intervals
+    # A placement talk on the second afternoon blocks everyone
+    talk = FIRST_DAY + timedelta(days=min(1, days - 1), hours=5)
+    return plan, list(range(candidates)), busy, [(talk, talk + timedelta(hours=2))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--panels", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    plan, candidates, busy, events = synthetic_round(args.candidates, args.days, args.panels)
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        assigned, unassigned = interview_scheduler.schedule(plan, candidates, busy, events)
+        timings.append(time.perf_counter() - started)
+
+    # Drop the first seated candidate and refill with everyone else held fixed
+    dropped = next(iter(assigned))
+    fixed = [(start, panel) for c, (start, _, _, panel) in assigned.items() if c != dropped]
+    started = time.perf_counter()
+    refilled, _ = interview_scheduler.schedule(plan, unassigned, busy, events, fixed)
+    refill_seconds = time.perf_counter() - started
+
+    write_results({
+        "meta": run_metadata(),
+        "candidates": args.candidates,
+        "seats": len(plan.slots()) * len(plan.seats()),
+        "scheduled": len(assigned),
+        "schedule_ms_median": round(sorted(timings)[len(timings) // 2] * 1000, 1),
+        "refill_ms": round(refill_seconds * 1000, 1),
+        "refilled": len(refilled),
+    }, args.output)
+
+
+if __name__ == "__main__":
+    main()
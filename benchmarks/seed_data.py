@@ -0,0 +1,170 @@
+# benchmarks/seed_data.py
+"""Seed a local MySQL (or MySQL-compatible) database with synthetic ERP data.
+
+Usage:
+    python -m benchmarks.seed_data --scale 10k [--seed 42] [--reset]
+
+All seeded accounts use the password in common.BENCH_PASSWORD and emails of the
+form student<N>@bench.local, recruiter<N>@bench.local and tpo<N>@bench.local.
+"""
+import argparse
+import random
+from datetime import date, timedelta
+
+from benchmarks.common import BENCH_PASSWORD, SCALES, get_bench_connection
+
+BRANCHES = ["Computer Engineering", "Information Technology", "AI & ML",
+            "Electronics", "Mechanical", "Civil"]
+SKILLS = ["python", "java", "sql", "react", "flask", "pytorch", "aws", "pandas", "c++", "nlp"]
+STATUSES = ["applied", "shortlisted", "accepted", "rejected"]
+BATCH_SIZE = 1000
+
+
+def plan_counts(students):
+    """Derive the size of every table from the number of students"""
+    return {
+        "students": students,
+        "tpos": max(2, students // 5000),
+        "recruiters": max(10, students // 100),
+        "jobs": max(20, students // 20),
+        "applications": students * 3,
+    }
+
+
+def insert_batches(conn, sql, rows):
+    cursor = conn.cursor()
+    for start in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(sql, rows[start:start + BATCH_SIZE])
+        conn.commit()
+    cursor.close()
+
+
+def reset_bench_data(conn):
+    """Remove rows created by a previous seeding run"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        DELETE a FROM applications a JOIN students s ON a.student_id = s.student_id
+        WHERE s.email LIKE '%@bench.local'
+    """)
+    cursor.execute("""
+        DELETE a FROM applications a JOIN jobs j ON a.job_id = j.job_id
+        JOIN recruiters r ON j.company_id = r.company_id
+        WHERE r.email LIKE '%@bench.local'
+    """)
+    cursor.execute("""
+        DELETE sp FROM student_profile sp JOIN students s ON sp.student_id = s.student_id
+        WHERE s.email LIKE '%@bench.local'
+    """)
+    cursor.execute("""
+        DELETE j FROM jobs j JOIN recruiters r ON j.company_id = r.company_id
+        WHERE r.email LIKE '%@bench.local'
+    """)
+    cursor.execute("DELETE FROM students WHERE email LIKE '%@bench.local'")
+    cursor.execute("DELETE FROM recruiters WHERE email LIKE '%@bench.local'")
+    cursor.execute("DELETE FROM tpos WHERE email LIKE '%@bench.local'")
+    conn.commit()
+    cursor.close()
+
+
+def fetch_ids(conn, sql):
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    ids = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    return ids
+
+
+def seed(conn, students, rng):
+    counts = plan_counts(students)
+    today = date.today()
+
+    insert_batches(conn, "INSERT INTO tpos (name, email, password) VALUES (%s, %s, %s)", [
+        (f"Bench TPO {i}", f"tpo{i}@bench.local", BENCH_PASSWORD) for i in range(counts["tpos"])
+    ])
+    insert_batches(conn, """
+        INSERT INTO recruiters (company_name, email, password, status) VALUES (%s, %s, %s, 'active')
+    """, [
+        (f"Bench Company {i}", f"recruiter{i}@bench.local", BENCH_PASSWORD) for i in range(counts["recruiters"])
+    ])
+    insert_batches(conn, """
+        INSERT INTO students (name, email, password, cgpa, passing_year, branch, phone)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """, [
+        (f"Bench Student {i}", f"student{i}@bench.local", BENCH_PASSWORD,
+         round(rng.uniform(5.0, 10.0), 2), rng.choice([2024, 2025, 2026]),
+         rng.choice(BRANCHES), f"9{rng.randint(100000000, 999999999)}")
+        for i in range(students)
+    ])
+
+    student_ids = fetch_ids(conn, "SELECT student_id FROM students WHERE email LIKE '%@bench.local'")
+    company_ids = fetch_ids(conn, "SELECT company_id FROM recruiters WHERE email LIKE '%@bench.local'")
+
+    profile_rows = []
+    for student_id in student_ids:
+        sems = [round(rng.uniform(5.0, 10.0), 2) for _ in range(8)]
+        profile_rows.append((
+            student_id, f"R{student_id}", f"PRN{student_id}", rng.choice(BRANCHES),
+            "Bench", f"Student{student_id}", f"student{student_id}@bench.local",
+            *sems, round(sum(sems) / len(sems), 2), rng.choice(["2024", "2025", "2026"]),
+            rng.randint(0, 2), rng.randint(0, 1), ", ".join(rng.sample(SKILLS, 4)),
+        ))
+    insert_batches(conn, """
+        INSERT INTO student_profile (
+            student_id, roll_no, prn_no, department, first_name, last_name, email,
+            sem1, sem2, sem3, sem4, sem5, sem6, sem7, sem8, average,
+            engg_passing_year, live_backlogs, year_gap, programming_languages,
+            created_at, edited_by_student
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                  %s, %s, %s, %s, NOW(), FALSE)
+    """, profile_rows)
+
+    insert_batches(conn, """
+        INSERT INTO jobs (company_id, title, description, location, salary, deadline,
+                          eligibility_criteria, eligibility, target_branches)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [
+        (rng.choice(company_ids), f"Bench Role {i}",
+         f"Work with {', '.join(rng.sample(SKILLS, 3))} on production systems.",
+         rng.choice(["Pune", "Mumbai", "Bengaluru", "Remote"]), f"{rng.randint(4, 30)} LPA",
+         today + timedelta(days=rng.randint(-60, 60)), "", round(rng.uniform(5.0, 8.0), 1),
+         ",".join(rng.sample(BRANCHES, rng.randint(1, 3))) if rng.random() < 0.7 else "all")
+        for i in range(counts["jobs"])
+    ])
+    job_ids = fetch_ids(conn, """
+        SELECT j.job_id FROM jobs j JOIN recruiters r ON j.company_id = r.company_id
+        WHERE r.email LIKE '%@bench.local'
+    """)
+
+    pairs = set()
+    target = min(counts["applications"], len(student_ids) * len(job_ids))
+    while len(pairs) < target:
+        pairs.add((rng.choice(job_ids), rng.choice(student_ids)))
+    insert_batches(conn, """
+        INSERT INTO applications (job_id, student_id, submitted_resume_path, status)
+        VALUES (%s, %s, %s, %s)
+    """, [(job_id, student_id, f"bench_{student_id}.pdf", rng.choice(STATUSES))
+          for job_id, student_id in pairs])
+
+    counts["applications"] = len(pairs)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for reproducible data")
+    parser.add_argument("--reset", action="store_true", help="remove previously seeded rows first")
+    args = parser.parse_args()
+
+    conn = get_bench_connection()
+    try:
+        if args.reset:
+            reset_bench_data(conn)
+        counts = seed(conn, SCALES[args.scale], random.Random(args.seed))
+        print(f"Seeded scale {args.scale}: {counts}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
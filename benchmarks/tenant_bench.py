@@ -0,0 +1,126 @@
+# benchmarks/tenant_bench.py
+"""Mixed-tenant load test: students of several colleges hitting one deployment at once.
+
+Each simulated student belongs to one tenant and sends that tenant's host in
+the Host header, so a single server address serves every college. Users are
+spread over tenants by --weights, and latency is reported per tenant so a
+busy college slowing down a quiet one shows up as a p95 gap between them.
+
+Usage:
+    python -m benchmarks.tenant_bench --tenants main=localhost,coep=coep.placements.local \
+        --weights 3,1 --scale 1k --concurrency 32 --requests 2000 --output tenants.json
+
+Seed every tenant's database first (BENCH_DB_NAME=<database> python -m
+benchmarks.seed_data --scale 1k); the seeded accounts are the same in each.
+"""
+import argparse
+import random
+import threading
+import time
+from urllib.error import URLError
+
+from benchmarks.common import SCALES, run_metadata, summarize, write_results
+from benchmarks.load_bench import Client
+from benchmarks.seed_data import plan_counts
+
+PATHS = ["/student_jobs", "/student_events", "/prep_resources_student", "/dashboard_bootstrap"]
+
+
+class TenantClient(Client):
+    """A simulated user whose requests all carry one tenant's Host header"""
+
+    def __init__(self, base_url, host):
+        super().__init__(base_url)
+        self.host = host
+
+    def request(self, path, data=None, headers=None):
+        return super().request(path, data, {**(headers or {}), "Host": self.host})
+
+
+def parse_tenants(spec):
+    """[(slug, host)] from 'slug=host,...'"""
+    tenants = []
+    for entry in filter(None, (e.strip() for e in spec.split(","))):
+        slug, _, host = entry.partition("=")
+        if not host:
+            raise ValueError(f"expected slug=host, got {entry!r}")
+        tenants.append((slug, host))
+    return tenants
+
+
+def run_mixed(base_url, tenants, weights, students, concurrency, total_requests):
+    """Run total_requests over `concurrency` users assigned to tenants by weight; summarize per tenant"""
+    rng = random.Random(7)
+    assignment = rng.choices(range(len(tenants)), weights=weights, k=concurrency)
+    latencies = {slug: [] for slug, _ in tenants}
+    errors = dict.fromkeys(latencies, 0)
+    lock = threading.Lock()
+    per_worker = max(1, total_requests // concurrency)
+    ready = threading.Barrier(concurrency + 1)
+
+    def worker(seed, tenant_index):
+        worker_rng = random.Random(seed)
+        slug, host = tenants[tenant_index]
+        client = TenantClient(base_url, host)
+        client.login(f"student{worker_rng.randrange(students)}@bench.local")
+        ready.wait()
+        local, failed = [], 0
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            try:
+                ok = client.request(worker_rng.choice(PATHS)) == 200
+            except URLError:
+                ok = False
+            if ok:
+                local.append(time.perf_counter() - start)
+            else:
+                failed += 1
+        with lock:
+            latencies[slug].extend(local)
+            errors[slug] += failed
+
+    threads = [threading.Thread(target=worker, args=(i, t)) for i, t in enumerate(assignment)]
+    for t in threads:
+        t.start()
+    ready.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    results = {slug: {"users": assignment.count(i), **summarize(latencies[slug], errors[slug], elapsed)}
+               for i, (slug, _) in enumerate(tenants)}
+    results["all"] = summarize([l for ls in latencies.values() for l in ls], sum(errors.values()), elapsed)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--tenants", required=True, help="comma-separated slug=host pairs")
+    parser.add_argument("--weights", help="comma-separated share of users per tenant (default: equal)")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="requests across all tenants")
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        tenants = parse_tenants(args.tenants)
+    except ValueError as e:
+        parser.error(str(e))
+    weights = [float(w) for w in args.weights.split(",")] if args.weights else [1.0] * len(tenants)
+    if len(weights) != len(tenants):
+        parser.error("--weights needs one value per tenant")
+
+    students = plan_counts(SCALES[args.scale])["students"]
+    results = run_mixed(args.base_url, tenants, weights, students, args.concurrency, args.requests)
+    for slug, summary in results.items():
+        print(f"{slug:<12} users={summary.get('users', args.concurrency):<4} p50={summary['p50_ms']}ms "
+              f"p95={summary['p95_ms']}ms rps={summary['throughput_rps']} errors={summary['errors']}")
+    write_results({"meta": run_metadata(), "scale": args.scale, "base_url": args.base_url,
+                   "concurrency": args.concurrency, "tenants": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
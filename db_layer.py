@@ -0,0 +1,346 @@
+# db_layer.py
+"""Database settings, read queries and row shaping shared by app1.py and asgi_app.py"""
+import os
+import re
+from datetime import date, datetime, timedelta
+
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "BBBB",
+    "password": "XXXXX",
+    "database": "placement_erp"
+}
+
+def replica_configs(spec, base=DB_CONFIG):
+    """Connection configs for 'host[:port],...' read replicas sharing the primary's credentials"""
+    configs = []
+    for entry in filter(None, (e.strip() for e in spec.split(","))):
+        host, _, port = entry.partition(":")
+        configs.append({**base, "host": host, "port": int(port or 3306), "connection_timeout": 2})
+    return configs
+
+# e.g. DB_REPLICAS=127.0.0.1:3307,127.0.0.1:3308; empty means every query goes to the primary
+DB_REPLICA_CONFIGS = replica_configs(os.environ.get("DB_REPLICAS", ""))
+
+# ==================== READ QUERIES ====================
+# Reads the maintained snapshot; the fallback columns only cover students not yet snapshotted
+STUDENT_ELIGIBILITY_SQL = """
+    SELECT 
+        se.branch_code,
+        COALESCE(sp.department, s.branch) AS branch,
+        COALESCE(se.effective_cgpa, sp.average, s.cgpa, 0) AS cgpa
+    FROM students s
+    LEFT JOIN student_eligibility se ON s.student_id = se.student_id
+    LEFT JOIN student_profile sp ON s.student_id = sp.student_id
+    WHERE s.student_id = %s
+"""
+
+# Inputs of the eligibility snapshot for a batch of students ({ids} expands to placeholders)
+ELIGIBILITY_SOURCE_SQL = """
+    SELECT s.student_id, COALESCE(sp.department, s.branch) AS branch,
+           sp.sem1, sp.sem2, sp.sem3, sp.sem4, sp.sem5, sp.sem6, sp.sem7, sp.sem8,
+           sp.average, s.cgpa, sp.live_backlogs, sp.year_gap
+    FROM students s
+    LEFT JOIN student_profile sp ON s.student_id = sp.student_id
+    WHERE s.student_id IN ({ids})
+"""
+
+# student_profile columns read by ELIGIBILITY_SOURCE_SQL; a change to any of them stales the snapshot
+ELIGIBILITY_PROFILE_FIELDS = frozenset({"department", "sem1", "sem2", "sem3", "sem4", "sem5", "sem6", "sem7",
+                                        "sem8", "average", "live_backlogs", "year_gap"})
+
+ACTIVE_JOBS_SQL = """
+    SELECT 
+        j.job_id, j.title, j.description, j.location, j.salary, j.deadline,
+        j.eligibility, j.target_branches, r.company_name, r.status
+    FROM jobs j
+    JOIN recruiters r ON j.company_id = r.company_id
+    WHERE j.deadline >= CURDATE()
+      AND (r.status IS NULL OR r.status = 'active')
+    ORDER BY j.posted_date DESC
+"""
+
+# Active jobs annotated with one student's eligibility (params: branch code, effective CGPA).
+# Branch matching probes job_branch_codes by primary key ('ALL' marks a job open to every
+# branch); branch_codes_known is 0 for a job whose codes are not snapshotted yet.
+STUDENT_JOBS_SQL = """
+    SELECT
+        j.job_id, j.title, j.description, j.location, j.salary, j.deadline,
+        j.eligibility, j.target_branches, r.company_name,
+        EXISTS (
+            SELECT 1 FROM job_branch_codes jb
+            WHERE jb.job_id = j.job_id AND jb.branch_code IN ('ALL', %s)
+        ) AS branch_eligible,
+        COALESCE(j.eligibility, 0) <= %s AS cgpa_eligible,
+        EXISTS (SELECT 1 FROM job_branch_codes jb WHERE jb.job_id = j.job_id) AS branch_codes_known
+    FROM jobs j
+    JOIN recruiters r ON j.company_id = r.company_id
+    WHERE j.deadline >= CURDATE()
+      AND (r.status IS NULL OR r.status = 'active')
+    ORDER BY j.posted_date DESC
+"""
+
+TPO_JOBS_SQL = """
+    SELECT j.*, r.company_name 
+    FROM jobs j 
+    JOIN recruiters r ON j.company_id = r.company_id 
+    ORDER BY j.posted_date DESC
+"""
+
+RECRUITER_APPLICANTS_SQL = """
+    SELECT a.*, j.title as job_title, s.name as student_name, 
+           s.email as student_email, s.branch as student_branch, sp.average as student_cgpa,
+           s.phone as student_phone
+    FROM applications a
+    JOIN jobs j ON a.job_id = j.job_id
+    JOIN students s ON a.student_id = s.student_id
+    LEFT JOIN student_profile sp ON s.student_id = sp.student_id
+    WHERE j.company_id = %s
+    ORDER BY a.applied_date DESC
+"""
+
+RECRUITER_JOBS_SQL = """
+    SELECT j.*, r.company_name 
+    FROM jobs j 
+    JOIN recruiters r ON j.company_id = r.company_id 
+    WHERE j.company_id = %s 
+    ORDER BY j.posted_date DESC
+"""
+
+ALL_STUDENT_PROFILES_SQL = """
+    SELECT sp.*, s.name as student_name, s.email as student_email, s.resume_path
+    FROM student_profile sp
+    JOIN students s ON sp.student_id = s.student_id
+"""
+
+ALL_RESOURCES_SQL = "SELECT * FROM prep_resources ORDER BY resource_id DESC"
+
+APPLICATIONS_TABLE_EXISTS_SQL = "SHOW TABLES LIKE 'applications'"
+
+ALL_APPLICATIONS_SQL = """
+    SELECT a.*, s.name as student_name, s.email as student_email
+    FROM applications a
+    JOIN students s ON a.student_id = s.student_id
+    ORDER BY a.applied_date DESC
+"""
+
+# ==================== EVENT AND RESOURCE FEEDS ====================
+# Students read events through a date window and resources a page at a time, never
+# the full history. Pages are keyset-paginated: an event cursor is "<date>_<key>",
+# a resource cursor is the last resource_id of the previous page.
+FEED_DEFAULT_DAYS = 60
+FEED_MAX_DAYS = 366
+FEED_PAGE_SIZE = 50
+FEED_MAX_PAGE_SIZE = 200
+CALENDAR_MAX_DAYS = 92
+CALENDAR_MAX_EVENTS = 500
+
+# placement_events' key column is read from the schema; this is only the fallback
+DEFAULT_EVENT_KEY = "event_id"
+EVENT_KEY_SQL = "SHOW KEYS FROM placement_events WHERE Key_name = 'PRIMARY'"
+EVENT_DATE_INDEX_SQL = "SHOW INDEX FROM placement_events WHERE Column_name = 'date' AND Seq_in_index = 1"
+CREATE_EVENT_DATE_INDEX_SQL = "CREATE INDEX idx_placement_events_date ON placement_events (date)"
+
+EVENT_WINDOWS = ("upcoming", "past")
+
+def bounded_int(value, default, maximum):
+    """A positive int query parameter clamped to maximum, or default when missing or malformed"""
+    try:
+        return max(1, min(int(value), maximum))
+    except (TypeError, ValueError):
+        return default
+
+def event_window(window, days, today):
+    """(start, end, descending) for the next or last `days` days; end is exclusive"""
+    if window == "upcoming":
+        return today, today + timedelta(days=days), False
+    if window == "past":
+        return today - timedelta(days=days), today, True
+    raise ValueError(f"window must be one of: {', '.join(EVENT_WINDOWS)}")
+
+def calendar_range(start, end):
+    """(start, exclusive end) for inclusive ISO dates, at most CALENDAR_MAX_DAYS apart"""
+    try:
+        start, end = date.fromisoformat(start or ""), date.fromisoformat(end or "")
+    except ValueError:
+        raise ValueError("start and end must be YYYY-MM-DD dates")
+    if end < start:
+        raise ValueError("end is before start")
+    if (end - start).days >= CALENDAR_MAX_DAYS:
+        raise ValueError(f"range is longer than {CALENDAR_MAX_DAYS} days")
+    return start, end + timedelta(days=1)
+
+def event_range_query(key, start, end, limit, descending=False, after=None):
+    """SQL and params for one page of events dated in [start, end).
+
+    Ordered by (date, key), newest first when descending; `after` is a parsed
+    cursor. limit + 1 rows are fetched so feed_page() can tell whether
+    another page follows. Served by idx_placement_events_date.
+    """
+    op, order = ("<", "DESC") if descending else (">", "ASC")
+    where, params = ["e.date >= %s", "e.date < %s"], [start, end]
+    if after:
+        where.append(f"(e.date {op} %s OR (e.date = %s AND e.`{key}` {op} %s))")
+        params += [after[0], after[0], after[1]]
+    sql = f"""
+        SELECT e.title, e.description, e.date, t.name AS created_by_name, e.`{key}` AS feed_key
+        FROM placement_events e
+        LEFT JOIN tpos t ON e.created_by = t.tpo_id
+        WHERE {" AND ".join(where)}
+        ORDER BY e.date {order}, e.`{key}` {order}
+        LIMIT %s
+    """
+    return sql, (*params, limit + 1)
+
+def resource_page_query(limit, after=None):
+    """SQL and params for one page of resources, newest first, after the resource_id cursor"""
+    sql = f"""
+        SELECT r.resource_id, r.title, r.description, r.file_path, t.name AS created_by_name
+        FROM prep_resources r
+        LEFT JOIN tpos t ON r.created_by = t.tpo_id
+        {"WHERE r.resource_id < %s" if after else ""}
+        ORDER BY r.resource_id DESC
+        LIMIT %s
+    """
+    return sql, ((after,) if after else ()) + (limit + 1,)
+
+def event_cursor(row):
+    return f"{row['date'].isoformat()}_{row['feed_key']}"
+
+def parse_event_cursor(value):
+    """(date, key) from an event cursor; ValueError when it is malformed"""
+    day, _, key = value.rpartition("_")
+    try:
+        datetime.fromisoformat(day)
+        return day, int(key)
+    except ValueError:
+        raise ValueError("malformed cursor")
+
+def resource_cursor(row):
+    return str(row["resource_id"])
+
+def parse_resource_cursor(value):
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError("malformed cursor")
+
+def feed_page(rows, limit, cursor_of=None):
+    """The first `limit` of limit + 1 fetched rows and the cursor of the next page (None on the last)"""
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and cursor_of:
+        next_cursor = cursor_of(page[-1])
+    for row in page:
+        row.pop("feed_key", None)
+    return page, next_cursor
+
+# ==================== ELIGIBILITY ====================
+# Spellings seen in student profiles and job postings, keyed by branch_key() output
+BRANCH_ALIASES = {
+    "cse": "CSE", "cs": "CSE", "computer": "CSE", "computer science": "CSE",
+    "computer science and": "CSE", "comp": "CSE",
+    "it": "IT", "information technology": "IT",
+    "entc": "ENTC", "e and tc": "ENTC", "extc": "ENTC",
+    "electronics and telecommunication": "ENTC", "electronics and telecommunications": "ENTC",
+    "ece": "ECE", "electronics and communication": "ECE", "electronics": "ECE",
+    "ee": "EE", "eee": "EE", "electrical": "EE", "electrical and electronics": "EE",
+    "mech": "MECH", "mechanical": "MECH",
+    "civil": "CIVIL",
+    "chem": "CHEM", "chemical": "CHEM",
+    "ai and ml": "AIML", "aiml": "AIML", "artificial intelligence and machine learning": "AIML",
+    "ai and ds": "AIDS", "aids": "AIDS", "artificial intelligence and data science": "AIDS",
+    "all": "ALL"
+}
+
+BRANCH_NOISE_WORDS = {"engineering", "engg", "dept", "department", "of", "branch", "b", "tech", "be"}
+
+def branch_key(name):
+    """Lowercase, '&' -> 'and', punctuation and filler words such as 'engineering' dropped"""
+    words = re.sub(r"[^a-z0-9]+", " ", (name or "").lower().replace("&", " and ")).split()
+    return " ".join(w for w in words if w not in BRANCH_NOISE_WORDS)
+
+def normalize_branch(name):
+    """Canonical branch code for a free-text branch/department name, or None if blank"""
+    key = branch_key(name)
+    if not key:
+        return None
+    return BRANCH_ALIASES.get(key) or key.replace(" ", "").upper()[:16]
+
+def target_branch_codes(target_branches):
+    """Branch codes a job is open to, or None when it is open to all branches"""
+    codes = {normalize_branch(b) for b in (target_branches or "").split(",")} - {None}
+    if not codes or "ALL" in codes:
+        return None
+    return codes
+
+def job_branch_rows(job_id, target_branches):
+    """job_branch_codes rows of one job: its branch codes, or a single 'ALL' when it is open to every branch"""
+    codes = target_branch_codes(target_branches)
+    return [(job_id, code) for code in sorted(codes or {"ALL"})]
+
+def effective_cgpa(row):
+    """Mean of the recorded semester SGPAs, falling back to the stated average, then students.cgpa"""
+    sems = [float(row[f"sem{i}"]) for i in range(1, 9) if row.get(f"sem{i}") not in (None, "")]
+    if sems:
+        return round(sum(sems) / len(sems), 2)
+    for fallback in ("average", "cgpa"):
+        if row.get(fallback) not in (None, ""):
+            return round(float(row[fallback]), 2)
+    return 0.0
+
+def eligibility_snapshot_row(row):
+    """(student_id, branch_code, effective_cgpa, live_backlogs, year_gap) from ELIGIBILITY_SOURCE_SQL"""
+    return (row["student_id"], normalize_branch(row["branch"]), effective_cgpa(row),
+            int(row["live_backlogs"] or 0), int(row["year_gap"] or 0))
+
+def split_target_branches(jobs):
+    """Convert the stored target_branches string into a list for the frontend"""
+    for job in jobs:
+        if job['target_branches']:
+            job['target_branches'] = job['target_branches'].split(',')
+        else:
+            job['target_branches'] = ['all']
+    return jobs
+
+def student_jobs_params(student):
+    """STUDENT_JOBS_SQL parameters for a STUDENT_ELIGIBILITY_SQL row"""
+    return (student.get("branch_code") or normalize_branch(student["branch"]) or "", float(student["cgpa"] or 0.0))
+
+def build_student_job_list(student, jobs):
+    """Shape STUDENT_JOBS_SQL rows for the student job feed.
+
+    Eligibility comes from the query; only jobs whose branch codes are not
+    snapshotted yet have their target branches parsed here.
+    """
+    student_branch, _ = student_jobs_params(student)
+
+    job_list = []
+    for job in jobs:
+        target_branches = [b.strip().lower() for b in (job["target_branches"] or "").split(",") if b.strip()]
+        if not target_branches:
+            target_branches = ["all"]
+
+        if job["branch_codes_known"]:
+            branch_eligible = bool(job["branch_eligible"])
+        else:
+            branch_codes = target_branch_codes(job["target_branches"])
+            branch_eligible = branch_codes is None or student_branch in branch_codes
+        cgpa_eligible = bool(job["cgpa_eligible"])
+        can_apply = branch_eligible and cgpa_eligible
+
+        job_list.append({
+            "job_id": job["job_id"],
+            "title": job["title"],
+            "description": job["description"],
+            "location": job["location"],
+            "salary": job["salary"],
+            "deadline": job["deadline"].strftime("%Y-%m-%d") if job["deadline"] else None,
+            "eligibility": job["eligibility"],
+            "target_branches": target_branches,
+            "company_name": job["company_name"],
+            "branch_eligible": branch_eligible,
+            "cgpa_eligible": cgpa_eligible,
+            "can_apply": can_apply
+        })
+    return job_list
@@ -0,0 +1,259 @@
+# interview_scheduler.py
+"""Conflict-free interview slot assignment: greedy placement repaired with augmenting paths.
+
+A plan cuts its time windows into slots of slot_minutes. At each slot a room
+hosts as many parallel interviews as it has panels, up to its capacity; those
+are the slot's seats. Rooms are shared between jobs: interviews other jobs hold
+in a room count against its capacity. Candidates bring busy intervals
+(interviews with other companies, placement events), padded by buffer_minutes
+on both sides.
+
+schedule() gives each candidate at most one seat that overlaps none of their
+busy intervals, never moving already scheduled interviews. Candidates are
+placed greedily, most constrained first, then every candidate left over is
+retried with an augmenting-path search that may shift earlier picks to other
+slots, so the result seats as many candidates as any assignment could.
+"""
+from collections import deque
+from datetime import datetime, timedelta
+
+
+class PlanError(ValueError):
+    """The plan's windows, rooms or panels are malformed"""
+
+
+def _parse_time(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise PlanError(f"not an ISO 8601 date-time: {value!r}")
+
+
+class InterviewPlan:
+    """Windows, rooms and panels of one job's interview round"""
+
+    def __init__(self, slot_minutes, windows, rooms, panels, buffer_minutes=0):
+        if not isinstance(slot_minutes, int) or not 5 <= slot_minutes <= 480:
+            raise PlanError("slot_minutes must be an integer between 5 and 480")
+        if not isinstance(buffer_minutes, int) or not 0 <= buffer_minutes <= 240:
+            raise PlanError("buffer_minutes must be an integer between 0 and 240")
+        self.slot = timedelta(minutes=slot_minutes)
+        self.buffer = timedelta(minutes=buffer_minutes)
+
+        self.windows = sorted((_parse_time(w["start"]), _parse_time(w["end"])) for w in windows)
+        if not self.windows:
+            raise PlanError("at least one window is required")
+        for (start, end), following in zip(self.windows, self.windows[1:] + [None]):
+            if end <= start:
+                raise PlanError(f"window starting {start.isoformat()} ends before it starts")
+            if following and following[0] < end:
+                raise PlanError(f"windows starting {start.isoformat()} and {following[0].isoformat()} overlap")
+
+        self.rooms = dict(rooms)
+        if any(not isinstance(c, int) or c < 1 for c in self.rooms.values()):
+            raise PlanError("room capacities must be positive integers")
+        self.panels = [(p["name"], p["room"]) for p in panels]
+        if not self.panels:
+            raise PlanError("at least one panel is required")
+        if len({name for name, _ in self.panels}) != len(self.panels):
+            raise PlanError("panel names must be unique")
+        unknown = sorted({room for _, room in self.panels if room not in self.rooms})
+        if unknown:
+            raise PlanError(f"panels use undefined rooms: {', '.join(unknown)}")
+
+    @classmethod
+    def from_dict(cls, data):
+        try:
+            return cls(data["slot_minutes"], data["windows"], data["rooms"], data["panels"],
+                       data.get("buffer_minutes", 0))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise PlanError(f"malformed plan: {e}")
+
+    def to_dict(self):
+        return {
+            "slot_minutes": int(self.slot.total_seconds() // 60),
+            "buffer_minutes": int(self.buffer.total_seconds() // 60),
+            "windows": [{"start": s.isoformat(), "end": e.isoformat()} for s, e in self.windows],
+            "rooms": self.rooms,
+            "panels": [{"name": name, "room": room} for name, room in self.panels],
+        }
+
+    def seats(self):
+        """(room, panel) pairs that can interview in parallel at any one slot"""
+        used = dict.fromkeys(self.rooms, 0)
+        seats = []
+        for name, room in self.panels:
+            if used[room] < self.rooms[room]:
+                used[room] += 1
+                seats.append((room, name))
+        return seats
+
+    def slots(self, not_before=None):
+        """Sorted (start, end) slots of every window, skipping those starting before not_before"""
+        slots = []
+        for start, end in self.windows:
+            t = start
+            while t + self.slot <= end:
+                if not_before is None or t >= not_before:
+                    slots.append((t, t + self.slot))
+                t += self.slot
+        return slots
+
+    @property
+    def start(self):
+        return self.windows[0][0]
+
+    @property
+    def end(self):
+        return self.windows[-1][1]
+
+
+def merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def free_slot_indexes(slots, busy, buffer):
+    """Indexes of slots overlapping no busy interval once padded by buffer (busy must be merged)"""
+    free = []
+    j = 0
+    for i, (start, end) in enumerate(slots):
+        # Busy intervals ending before this padded slot cannot touch it or any later slot
+        while j < len(busy) and busy[j][1] <= start - buffer:
+            j += 1
+        if j < len(busy) and busy[j][0] < end + buffer:
+            continue
+        free.append(i)
+    return free
+
+
+def peak_overlap(intervals, start, end):
+    """Most of intervals (sorted by start) in progress at once between start and end"""
+    edges = []
+    for s, e in intervals:
+        if s >= end:
+            break
+        if e > start:
+            edges += [(max(s, start), 1), (min(e, end), -1)]
+    peak = current = 0
+    for _, step in sorted(edges):
+        current += step
+        peak = max(peak, current)
+    return peak
+
+
+def schedule(plan, candidates, busy=None, common_busy=(), fixed=(), not_before=None, room_busy=()):
+    """Assign candidates to seats of plan.
+
+    candidates: candidate ids in priority order (earlier ones win ties).
+    busy: candidate id -> [(start, end)] the candidate cannot attend.
+    common_busy: [(start, end)] nobody can attend, e.g. placement events.
+    fixed: (start, panel) seats already taken by scheduled interviews.
+    room_busy: (start, end, room) interviews other jobs hold in the plan's rooms.
+
+    Returns (assigned, unassigned): assigned maps candidate id to
+    (start, end, room, panel); unassigned lists the rest in priority order.
+    """
+    busy = busy or {}
+    slots = plan.slots(not_before)
+    seats = plan.seats()
+    taken = {}
+    for start, panel in fixed:
+        taken.setdefault(start, set()).add(panel)
+    open_seats = [[seat for seat in seats if seat[1] not in taken.get(start, ())] for start, _ in slots]
+
+    others = {}
+    for start, end, room in room_busy:
+        others.setdefault(room, []).append((start, end))
+    for room, intervals in others.items():
+        if room not in plan.rooms:
+            continue
+        intervals.sort()
+        for i, (start, end) in enumerate(slots):
+            # Seats of this job already in the room, plus other jobs' interviews, fill its capacity
+            in_room = [seat for seat in open_seats[i] if seat[0] == room]
+            held = sum(1 for seat in seats if seat[0] == room) - len(in_room)
+            allowed = max(plan.rooms[room] - held - peak_overlap(intervals, start, end), 0)
+            if allowed < len(in_room):
+                drop = set(in_room[allowed:])
+                open_seats[i] = [seat for seat in open_seats[i] if seat not in drop]
+    capacity = [len(s) for s in open_seats]
+
+    common = [tuple(i) for i in merge_intervals(common_busy)]
+    common_free = free_slot_indexes(slots, common, plan.buffer)
+    common_slots = [slots[i] for i in common_free]
+    feasible = {}
+    for order, candidate in enumerate(candidates):
+        own = busy.get(candidate)
+        if own:
+            feasible[candidate] = [common_free[i] for i in
+                                   free_slot_indexes(common_slots, merge_intervals(own), plan.buffer)]
+        else:
+            feasible[candidate] = common_free
+        feasible[candidate] = [i for i in feasible[candidate] if capacity[i]]
+
+    # Greedy: most constrained candidates first, each into its earliest slot with room
+    priority = {candidate: order for order, candidate in enumerate(candidates)}
+    slot_of = {}
+    occupants = [[] for _ in slots]
+    leftover = []
+    for candidate in sorted(candidates, key=lambda c: (len(feasible[c]), priority[c])):
+        for i in feasible[candidate]:
+            if len(occupants[i]) < capacity[i]:
+                slot_of[candidate] = i
+                occupants[i].append(candidate)
+                break
+        else:
+            leftover.append(candidate)
+
+    # Repair: search for an augmenting path from each leftover candidate. Slots in a failed
+    # search tree can never lie on an augmenting path again, so they are skipped from then on.
+    dead = set()
+    free_total = sum(capacity) - len(slot_of)
+    for candidate in sorted(leftover, key=priority.get):
+        if free_total == 0:
+            break
+        parent = {}
+        queue = deque([candidate])
+        target = None
+        while queue and target is None:
+            current = queue.popleft()
+            for i in feasible[current]:
+                if i in dead or i in parent:
+                    continue
+                parent[i] = current
+                if len(occupants[i]) < capacity[i]:
+                    target = i
+                    break
+                for occupant in occupants[i]:
+                    queue.append(occupant)
+        if target is None:
+            dead.update(parent)
+            continue
+        # Walk back: each candidate on the path moves into the slot that was opened for it
+        i = target
+        while True:
+            mover = parent[i]
+            previous = slot_of.get(mover)
+            occupants[i].append(mover)
+            slot_of[mover] = i
+            if previous is None:
+                break
+            occupants[previous].remove(mover)
+            i = previous
+        free_total -= 1
+
+    assigned = {}
+    for i, members in enumerate(occupants):
+        start, end = slots[i]
+        for member, (room, panel) in zip(sorted(members, key=priority.get), open_seats[i]):
+            assigned[member] = (start, end, room, panel)
+    unassigned = [c for c in candidates if c not in assigned]
+    return assigned, unassigned
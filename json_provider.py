@@ -0,0 +1,95 @@
+# json_provider.py
+"""JSON encoding shared by app1.py and asgi_app.py: orjson when installed, stdlib json otherwise.
+
+For the string-keyed rows the endpoints return, both encoders produce the same
+bytes: compact, sorted keys, UTF-8, dates and datetimes as ISO 8601 and
+Decimals as strings (so percentages keep their stored precision, as they
+always have).
+"""
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, time, timedelta
+
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STREAM_BATCH_ROWS = 500
+
+
+def json_default(o):
+    """Encode the values MySQL rows contain that JSON has no type for"""
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, (decimal.Decimal, uuid.UUID, timedelta)):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    if isinstance(o, (bytes, bytearray)):
+        return o.decode("utf-8", "replace")
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj):
+        return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS)
+
+    loads = orjson.loads
+else:
+    def dumps_bytes(obj):
+        return json.dumps(obj, default=json_default, sort_keys=True, separators=(",", ":"),
+                          ensure_ascii=False).encode("utf-8")
+
+    loads = json.loads
+
+
+def dumps(obj):
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def stream_json_array(rows, batch_rows=STREAM_BATCH_ROWS):
+    """Yield a JSON array's bytes in pieces of about batch_rows elements from an iterable of rows"""
+    yield b"["
+    batch = []
+    first = True
+    for row in rows:
+        batch.append(dumps_bytes(row))
+        if len(batch) >= batch_rows:
+            yield (b"" if first else b",") + b",".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield (b"" if first else b",") + b",".join(batch)
+    yield b"]\n"
+
+
+def iter_cursor_rows(cursor, batch_rows=STREAM_BATCH_ROWS):
+    """Rows of an executed (unbuffered) cursor, fetched batch_rows at a time"""
+    while True:
+        rows = cursor.fetchmany(batch_rows)
+        if not rows:
+            return
+        yield from rows
+
+
+class FastJSONProvider(JSONProvider):
+    """Flask JSON provider backed by dumps()/loads() above"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj) + b"\n", mimetype="application/json")
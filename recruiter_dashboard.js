@@ -0,0 +1,220 @@
+// Load applicants for recruiter's jobs
+function loadApplications(preloaded) {
+  return (preloaded ? Promise.resolve(preloaded) : fetch("/recruiter_applicants")
+    .then(res => {
+      if (!res.ok) {
+        throw new Error('Network response was not ok');
+      }
+      return res.json();
+    }))
+    .then(data => {
+      let html = "";
+      if (data.error) {
+        html = `<li class="error">Error: ${data.error} - ${data.details || ''}</li>`;
+      } else if (data.length === 0) {
+        html = "<li>No applications yet for your jobs.</li>";
+      } else {
+        data.forEach(app => {
+          const resumeLink = app.submitted_resume_path 
+                             ? `/download_resume/${app.submitted_resume_path}` 
+                             : '#';
+          const statusClass = `status-${app.status || 'applied'}`;
+
+          html += `<li class="application-item">
+                     <div class="application-header">
+                       <strong>${app.student_name || 'N/A'}</strong> 
+                       (<em>${app.student_email || 'N/A'}</em>) 
+                       applied for <strong>${app.job_title || 'N/A'}</strong>
+                     </div>
+                     <div class="application-details">
+                       <strong>Student Details:</strong><br>
+                       - Branch: ${app.student_branch || 'N/A'}<br>
+                       - CGPA: ${app.student_cgpa || 'N/A'}<br>
+                       - Phone: ${app.student_phone || 'N/A'}<br>
+                       <strong>Application Details:</strong><br>
+                       - Status: <span class="status ${statusClass}">${app.status || 'applied'}</span><br>
+                       - Applied On: ${app.applied_date ? new Date(app.applied_date).toLocaleDateString() : 'N/A'}<br>
+                       - Experience: ${app.experience_years || '0'} years<br>
+                       - Availability: ${app.commitment_hours || 'N/A'} hours/day<br>
+                       - Resume: <a href="${resumeLink}" target="_blank">View Resume</a>
+                     </div>
+                     <div class="application-actions">
+                       <button onclick="updateStatus(${app.application_id}, 'shortlisted')">Shortlist</button>
+                       <button onclick="updateStatus(${app.application_id}, 'accepted')">Accept</button>
+                       <button onclick="updateStatus(${app.application_id}, 'rejected')">Reject</button>
+                     </div>
+                   </li>`;
+        });
+      }
+      document.querySelector(".student-list").innerHTML = html;
+    })
+    .catch(error => {
+      console.error('Error fetching recruiter applications:', error);
+      document.querySelector(".student-list").innerHTML = 
+        `<li class="error">Failed to load applications. Please try again.</li>`;
+    });
+}
+
+// Update status function
+function updateStatus(appId, status){
+  fetch("/update_application", {
+    method: "POST",
+    headers: {"Content-Type": "application/x-www-form-urlencoded"},
+    body: `application_id=${appId}&status=${status}`
+  })
+  .then(res => {
+    if (!res.ok) {
+      throw new Error(`HTTP error! status: ${res.status}`);
+    }
+    return res.json();
+  })
+  .then(data => {
+    alert(data.message || "Application status updated!");
+    loadApplications(); // Reload applications instead of full page reload
+  })
+  .catch(error => {
+    console.error("Error updating application status:", error);
+    alert("Failed to update status: " + error.message);
+  });
+}
+
+// Load recruiter's jobs
+function loadJobs(preloaded) {
+  return (preloaded ? Promise.resolve(preloaded) : fetch("/recruiter_jobs").then(res => res.json()))
+    .then(data => {
+      let html = "";
+      if (data.length === 0) {
+        html = "<li>No jobs posted yet.</li>";
+      } else {
+        data.forEach(job => {
+          const branches = job.target_branches ? 
+            (Array.isArray(job.target_branches) ? job.target_branches.join(', ') : job.target_branches) 
+            : 'All Branches';
+
+          html += `<li class="job-item">
+            <div class="application-header">
+              <strong>${job.title}</strong>
+            </div>
+            <div class="job-meta">
+              <strong>Location:</strong> ${job.location} | 
+              <strong>Salary:</strong> ${job.salary} | 
+              <strong>Deadline:</strong> ${new Date(job.deadline).toLocaleDateString()}
+            </div>
+            <div class="job-meta">
+              <strong>Minimum CGPA:</strong> ${job.eligibility} | 
+              <strong>Target Branches:</strong> ${branches}
+            </div>
+            <div class="application-actions">
+              <button onclick="viewJobApplications(${job.job_id})">View Applications</button>
+              <button onclick="deleteJob(${job.job_id})" class="delete-btn">Delete Job</button>
+            </div>
+          </li>`;
+        });
+      }
+      document.querySelector(".job-list").innerHTML = html;
+    })
+    .catch(error => {
+      console.error('Error fetching recruiter jobs:', error);
+      document.querySelector(".job-list").innerHTML = 
+        `<li class="error">Failed to load jobs. Please try again.</li>`;
+    });
+}
+
+// View job applications
+function viewJobApplications(jobId) {
+  // Filter and show only applications for this specific job
+  const applications = document.querySelectorAll('.application-item');
+  let foundApplications = false;
+
+  applications.forEach(app => {
+    // This would need to be implemented based on your data structure
+    // For now, just show a message
+    app.style.display = 'none';
+  });
+
+  // Show a message about filtering (you would implement actual filtering)
+  alert(`Showing applications for Job ID: ${jobId}. In a full implementation, this would filter the applications list.`);
+
+  // Reload all applications for now
+  loadApplications();
+}
+
+// Delete job
+function deleteJob(jobId) {
+  if (confirm("Are you sure you want to delete this job? All applications for this job will also be deleted.")) {
+    fetch(`/delete_job/${jobId}`, { method: "POST" })
+      .then(res => res.json())
+      .then(data => {
+        alert(data.message);
+        loadJobs(); // Reload jobs list
+        loadApplications(); // Reload applications list
+      })
+      .catch(error => {
+        console.error("Error deleting job:", error);
+        alert("Failed to delete job: " + error.message);
+      });
+  }
+}
+
+// Form validation for job posting
+document.getElementById('postJobForm').addEventListener('submit', function(e) {
+  const cgpa = document.getElementById('jobEligibility').value;
+  const branches = document.getElementById('targetBranches');
+  const selectedBranches = Array.from(branches.selectedOptions).map(option => option.value);
+
+  if (cgpa < 0 || cgpa > 10) {
+    alert('Please enter a valid CGPA between 0 and 10');
+    e.preventDefault();
+    return;
+  }
+
+  if (selectedBranches.length === 0) {
+    alert('Please select at least one target branch');
+    e.preventDefault();
+    return;
+  }
+
+  // Simple confirmation
+  if (!confirm('Proceed to post job?')) {
+    e.preventDefault();
+  }
+});
+
+// Initialize dashboard with one bootstrap request (?fanout=1 keeps the old per-widget requests)
+function reportFirstRender(mode) {
+  const ms = performance.now();
+  console.log(`Dashboard first render (${mode}): ${ms.toFixed(0)} ms`);
+  if (navigator.sendBeacon) {
+    navigator.sendBeacon("/rum", JSON.stringify({ page: "recruiter", mode: mode, ms: ms }));
+  }
+}
+
+function loadDashboardFanout() {
+  return Promise.all([loadApplications(), loadJobs()]);
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+  if (new URLSearchParams(window.location.search).has("fanout")) {
+    loadDashboardFanout().then(() => reportFirstRender("fanout"));
+    return;
+  }
+  fetch("/dashboard_bootstrap?fields=applications,jobs")
+    .then(res => {
+      if (!res.ok) {
+        throw new Error('Bootstrap request failed');
+      }
+      return res.json();
+    })
+    .then(data => {
+      const failed = data.errors || {};
+      return Promise.all([
+        failed.applications ? loadApplications() : loadApplications(data.applications),
+        failed.jobs ? loadJobs() : loadJobs(data.jobs)
+      ]);
+    })
+    .then(() => reportFirstRender("bootstrap"))
+    .catch(error => {
+      console.error('Error loading dashboard bootstrap:', error);
+      loadDashboardFanout();
+    });
+});
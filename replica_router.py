@@ -0,0 +1,89 @@
+# replica_router.py
+"""Health-checked, lag-aware choice among MySQL read replicas"""
+import itertools
+import threading
+import time
+
+
+class ReplicaRouter:
+    """Tracks each replica's health and replication lag and picks one for reads.
+
+    A replica is used only when its last check connected, both replication
+    threads were running and lag was at most max_lag seconds. check_all() is
+    meant to be called periodically from a background thread.
+    """
+
+    def __init__(self, configs, connect, max_lag, logger=None):
+        self.connect = connect
+        self.max_lag = max_lag
+        self.logger = logger
+        self.replicas = [{
+            "name": f"{config['host']}:{config.get('port', 3306)}",
+            "config": config,
+            "healthy": False,
+            "lag": None,
+            "error": "not checked yet",
+            "checked_at": None
+        } for config in configs]
+        self._lock = threading.Lock()
+        self._cycle = itertools.count()
+
+    def check(self, replica):
+        healthy, lag, error = False, None, None
+        try:
+            conn = self.connect(**replica["config"])
+            cursor = conn.cursor(dictionary=True)
+            try:
+                try:
+                    cursor.execute("SHOW REPLICA STATUS")          # MySQL 8.0.22+
+                except Exception:
+                    cursor.execute("SHOW SLAVE STATUS")
+                status = cursor.fetchone()
+            finally:
+                cursor.close()
+                conn.close()
+            if not status:
+                error = "replication is not configured"
+            else:
+                lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+                io_running = status.get("Replica_IO_Running", status.get("Slave_IO_Running"))
+                sql_running = status.get("Replica_SQL_Running", status.get("Slave_SQL_Running"))
+                if io_running != "Yes" or sql_running != "Yes":
+                    error = f"replication stopped (io={io_running}, sql={sql_running})"
+                elif lag is None:
+                    error = "replication lag unknown"
+                elif lag > self.max_lag:
+                    error = f"lag {lag}s exceeds {self.max_lag}s"
+                else:
+                    healthy = True
+        except Exception as e:
+            error = str(e)
+
+        with self._lock:
+            if replica["healthy"] != healthy and self.logger:
+                self.logger.warning(f"Replica {replica['name']} is now {'healthy' if healthy else 'unhealthy'}"
+                                    f"{'' if healthy else ': ' + error}")
+            replica.update(healthy=healthy, lag=lag, error=error, checked_at=time.time())
+
+    def check_all(self):
+        for replica in self.replicas:
+            self.check(replica)
+
+    def choose(self):
+        """A healthy replica, round-robin, or None if reads must go to the primary"""
+        with self._lock:
+            healthy = [r for r in self.replicas if r["healthy"]]
+            if not healthy:
+                return None
+            return healthy[next(self._cycle) % len(healthy)]
+
+    def mark_down(self, replica, error):
+        """Take a replica out of rotation until its next successful check"""
+        with self._lock:
+            replica.update(healthy=False, error=str(error))
+        if self.logger:
+            self.logger.warning(f"Replica {replica['name']} marked down: {error}")
+
+    def status(self):
+        with self._lock:
+            return [{k: v for k, v in r.items() if k != "config"} for r in self.replicas]
@@ -0,0 +1,91 @@
+# resume_fingerprint.py
+"""MinHash fingerprints and LSH banding for near-duplicate resume detection"""
+import hashlib
+import random
+import re
+import struct
+
+NUM_PERM = 128
+# 16 bands x 8 rows: a pair with Jaccard s shares a bucket with probability 1 - (1 - s**8)**16,
+# about 0.06 at 0.5, 0.61 at 0.7, 0.95 at DUPLICATE_THRESHOLD (0.8) and over 0.99 from 0.85
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+DUPLICATE_THRESHOLD = 0.8
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures must stay comparable across processes and restarts
+_rng = random.Random(1729)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+                 for _ in range(NUM_PERM)]
+
+
+def _hash64(value):
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Word n-grams of normalized text, so formatting and case changes do not matter"""
+    words = re.findall(r"[a-z0-9]+", (text or "").lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signature(text):
+    """NUM_PERM-value MinHash signature of the text's shingles, or None for empty text"""
+    hashes = [_hash64(s) & _MAX_HASH for s in shingles(text)]
+    if not hashes:
+        return None
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def signature_chunk(chunk):
+    """MinHash signatures for a list of (key, text) pairs; used by bulk jobs' worker processes"""
+    return [(key, minhash_signature(text)) for key, text in chunk]
+
+
+def band_hashes(signature):
+    """One 63-bit bucket hash per band; identical buckets make two resumes candidates"""
+    buckets = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f"<{ROWS_PER_BAND}Q", *chunk), digest_size=8).digest()
+        buckets.append((band, int.from_bytes(digest, "little") >> 1))
+    return buckets
+
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / float(NUM_PERM)
+
+
+def pack_signature(signature):
+    return struct.pack(f"<{NUM_PERM}Q", *signature)
+
+
+def unpack_signature(blob):
+    return list(struct.unpack(f"<{NUM_PERM}Q", bytes(blob)))
+
+
+def cluster_pairs(pairs):
+    """Group (a, b) duplicate pairs into connected clusters with union-find"""
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    clusters = {}
+    for member in parent:
+        clusters.setdefault(find(member), []).append(member)
+    return [sorted(members) for members in clusters.values()]
@@ -0,0 +1,77 @@
+# resume_parser.py
+"""Cheap text -> fields resume parsing stage, importable without the Flask app"""
+import re
+
+# Bump whenever simple_text_parsing changes output (new skills, better regexes) so the
+# reparse backfill refreshes every stored parse made by an older version.
+PARSER_VERSION = 1
+
+
+def simple_text_parsing(text):
+    """Parse resume text using regex patterns"""
+    if not text:
+        return {}
+    
+    parsed = {}
+    
+    # Extract contact information
+    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    if email_match:
+        parsed['email'] = email_match.group(0)
+
+    phone_match = re.search(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]', text.replace(' ', ''))
+    if phone_match:
+        parsed['mobile_number'] = phone_match.group(0)
+
+    # Extract name
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    if lines and len(lines[0].split()) <= 4:
+        parsed['name'] = lines[0]
+
+    # Extract skills
+    common_skills = [
+        'python', 'java', 'javascript', 'sql', 'html', 'css', 'c++', 'react', 
+        'node.js', 'mongodb', 'mysql', 'php', 'angular', 'vue', 'django', 
+        'flask', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 
+        'opencv', 'computer vision', 'nlp', 'gan', 'predictive analysis', 
+        'hugging face', 'aws', 'ec2', 's3', 'langchain', 'faiss'
+    ]
+    
+    found_skills = []
+    for skill in common_skills:
+        if re.search(r'\b' + re.escape(skill) + r'\b', text.lower()):
+            found_skills.append(skill)
+    
+    if found_skills:
+        parsed['skills'] = found_skills
+
+    # Extract projects
+    projects = []
+    project_keywords = {
+        'AI-Powered Placement ERP System': 'AI-Powered Placement ERP System with Flask & MySQL',
+        'RAG-based PDF Chatbot': 'RAG-based PDF Chatbot with LangChain & Hugging Face'
+    }
+    
+    for keyword, project_name in project_keywords.items():
+        if keyword in text:
+            projects.append(project_name)
+    
+    if projects:
+        parsed['projects'] = projects
+
+    # Extract certifications
+    certs = []
+    cert_keywords = ['IIT Kharagpur', 'YHILLS', 'Coursera', 'Forage', 'IEEE']
+    for cert in cert_keywords:
+        if cert in text:
+            certs.append(cert)
+    
+    if certs:
+        parsed['certifications'] = certs
+
+    return parsed
+
+
+def parse_text_chunk(chunk):
+    """Parse a list of (key, text) pairs; used by the reparse backfill's worker processes"""
+    return [(key, simple_text_parsing(text)) for key, text in chunk]
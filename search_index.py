@@ -0,0 +1,158 @@
+# search_index.py
+"""Embedded SQLite FTS5 index over job postings and preparation resources"""
+import re
+import sqlite3
+import threading
+
+
+class SearchIndex:
+    """Full-text index kept in sync by the routes that create and delete jobs and resources.
+
+    Job rows use job_id as their rowid and resource rows use resource_id, so
+    updates and deletes are single-row operations. Each job row also records
+    its recruiter and whether that recruiter is active, so students' searches
+    skip jobs of deactivated recruiters as the job feed does. Queries use
+    prefix matching on every term and bm25 ranking, and are paginated with
+    LIMIT/OFFSET. Ranking scores every matching row, so latency grows with
+    the number of matches; deeper pages add little on top of that.
+    """
+
+    # bm25 column weights: title and company name outrank description text
+    JOB_WEIGHTS = (10.0, 1.0, 2.0, 5.0)
+    RESOURCE_WEIGHTS = (10.0, 1.0)
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(jobs_fts)")]
+        if columns and "active" not in columns:
+            # Indexes built before recruiter status was tracked are dropped and rebuilt on startup
+            conn.execute("DROP TABLE jobs_fts")
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, description, location, company_name, deadline UNINDEXED,
+                company_id UNINDEXED, active UNINDEXED,
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS resources_fts USING fts5(
+                title, description, file_path UNINDEXED,
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+        conn.commit()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=5)
+        return conn
+
+    @staticmethod
+    def build_match_query(text):
+        """Turn free text into an FTS5 query where every term must match as a prefix"""
+        terms = re.findall(r"\w+", text or "", flags=re.UNICODE)
+        return " ".join(f'"{term}"*' for term in terms[:16])
+
+    def is_empty(self):
+        row = self._connect().execute("SELECT COUNT(*) FROM jobs_fts").fetchone()
+        return row[0] == 0
+
+    @staticmethod
+    def recruiter_active(status):
+        return status is None or status == "active"
+
+    def upsert_job(self, job):
+        """Index one job; job["status"] is its recruiter's status (None counts as active)"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM jobs_fts WHERE rowid=?", (job["job_id"],))
+            conn.execute("""
+                INSERT INTO jobs_fts (rowid, title, description, location, company_name, deadline, company_id, active)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (job["job_id"], job.get("title") or "", job.get("description") or "",
+                  job.get("location") or "", job.get("company_name") or "", str(job.get("deadline") or ""),
+                  job.get("company_id"), int(self.recruiter_active(job.get("status")))))
+
+    def delete_jobs(self, job_ids):
+        conn = self._connect()
+        with conn:
+            conn.executemany("DELETE FROM jobs_fts WHERE rowid=?", [(job_id,) for job_id in job_ids])
+
+    def set_recruiter_active(self, company_id, active):
+        """Show or hide every job of one recruiter in students' searches"""
+        conn = self._connect()
+        with conn:
+            conn.execute("UPDATE jobs_fts SET active=? WHERE company_id=?", (int(active), company_id))
+
+    def upsert_resource(self, resource):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM resources_fts WHERE rowid=?", (resource["resource_id"],))
+            conn.execute("""
+                INSERT INTO resources_fts (rowid, title, description, file_path) VALUES (?, ?, ?, ?)
+            """, (resource["resource_id"], resource.get("title") or "", resource.get("description") or "",
+                  resource.get("file_path") or ""))
+
+    def delete_resource(self, resource_id):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM resources_fts WHERE rowid=?", (resource_id,))
+
+    def rebuild(self, jobs, resources):
+        """Replace the whole index with the given job and resource rows"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM jobs_fts")
+            conn.execute("DELETE FROM resources_fts")
+        for job in jobs:
+            self.upsert_job(job)
+        for resource in resources:
+            self.upsert_resource(resource)
+        with conn:
+            conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('optimize')")
+            conn.execute("INSERT INTO resources_fts(resources_fts) VALUES ('optimize')")
+
+    def search_jobs(self, text, limit=20, offset=0, min_deadline=None, active_only=False):
+        """Return (hits, has_more) for jobs matching text, best matches first.
+
+        active_only leaves out jobs of deactivated recruiters.
+        """
+        match = self.build_match_query(text)
+        if not match:
+            return [], False
+        sql = f"""
+            SELECT rowid, title, description, location, company_name, deadline,
+                   bm25(jobs_fts, {", ".join(map(str, self.JOB_WEIGHTS))}) AS score
+            FROM jobs_fts WHERE jobs_fts MATCH ?
+        """
+        params = [match]
+        if min_deadline:
+            sql += " AND deadline >= ?"
+            params.append(str(min_deadline))
+        if active_only:
+            sql += " AND active = 1"
+        sql += " ORDER BY score LIMIT ? OFFSET ?"
+        rows = self._connect().execute(sql, params + [limit + 1, offset]).fetchall()
+        hits = [{"job_id": r[0], "title": r[1], "description": r[2], "location": r[3],
+                 "company_name": r[4], "deadline": r[5] or None, "score": round(-r[6], 4)}
+                for r in rows[:limit]]
+        return hits, len(rows) > limit
+
+    def search_resources(self, text, limit=20, offset=0):
+        """Return (hits, has_more) for resources matching text, best matches first"""
+        match = self.build_match_query(text)
+        if not match:
+            return [], False
+        rows = self._connect().execute(f"""
+            SELECT rowid, title, description, file_path,
+                   bm25(resources_fts, {", ".join(map(str, self.RESOURCE_WEIGHTS))}) AS score
+            FROM resources_fts WHERE resources_fts MATCH ?
+            ORDER BY score LIMIT ? OFFSET ?
+        """, (match, limit + 1, offset)).fetchall()
+        hits = [{"resource_id": r[0], "title": r[1], "description": r[2], "file_path": r[3],
+                 "score": round(-r[4], 4)} for r in rows[:limit]]
+        return hits, len(rows) > limit
@@ -0,0 +1,269 @@
+# semantic_index.py
+"""Local semantic embedding index for resume <-> job matching.
+
+Optional dependencies: numpy, hnswlib and sentence-transformers (CPU only).
+Vectors live in a memory-mapped float32 matrix per collection ("resumes",
+"jobs"); an hnswlib index over the matrix rows answers top-K queries and
+supports incremental add and delete. Embedding runs in a background worker
+that batches queued texts.
+"""
+import json
+import os
+import queue
+import threading
+import time
+
+
+class Embedder:
+    """Lazily loaded CPU sentence-embedding model producing unit-length float32 vectors"""
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name, device="cpu")
+            return self._model
+
+    @property
+    def dim(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts, batch_size=32):
+        vectors = self.model.encode(texts, batch_size=batch_size, normalize_embeddings=True,
+                                    convert_to_numpy=True, show_progress_bar=False)
+        return vectors.astype("float32")
+
+
+class VectorStore:
+    """Memory-mapped float32 vectors plus an hnswlib cosine index, keyed by external integer ids.
+
+    Row i of the matrix is hnswlib label i; ids[i] holds the external id, or -1
+    once the row is deleted. Re-adding an id overwrites its row in place, and
+    new ids take deleted rows before the matrix grows, so the files only grow
+    with the number of live items. compact() renumbers the live rows densely
+    and shrinks the files after mass deletions.
+    """
+
+    def __init__(self, directory, name, dim, initial_capacity=1024):
+        import numpy as np
+
+        self.np = np
+        self.dim = dim
+        self.initial_capacity = initial_capacity
+        self.vectors_path = os.path.join(directory, f"{name}.f32")
+        self.ids_path = os.path.join(directory, f"{name}.ids")
+        self.index_path = os.path.join(directory, f"{name}.hnsw")
+        self.meta_path = os.path.join(directory, f"{name}.json")
+        self._lock = threading.RLock()
+        os.makedirs(directory, exist_ok=True)
+
+        meta = {"count": 0, "capacity": initial_capacity, "dim": dim}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path) as fh:
+                meta = json.load(fh)
+            if meta["dim"] != dim:
+                raise ValueError(f"{name} index has dim {meta['dim']}, model produces {dim}")
+        self.count = meta["count"]
+        self.capacity = meta["capacity"]
+        self.vectors = self._open(self.vectors_path, "float32", (self.capacity, dim))
+        self.ids = self._open(self.ids_path, "int64", (self.capacity,), fill=-1)
+        self.rows = {int(i): row for row, i in enumerate(self.ids[:self.count]) if i >= 0}
+        self.free = [row for row in range(self.count) if self.ids[row] < 0]
+        self.index = self._load_index()
+
+    def _open(self, path, dtype, shape, fill=0):
+        if os.path.exists(path):
+            return self.np.memmap(path, dtype=dtype, mode="r+", shape=shape)
+        array = self.np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+        array[:] = fill
+        return array
+
+    def _load_index(self):
+        import hnswlib
+
+        index = hnswlib.Index(space="cosine", dim=self.dim)
+        if os.path.exists(self.index_path):
+            index.load_index(self.index_path, max_elements=self.capacity)
+        else:
+            index.init_index(max_elements=self.capacity, ef_construction=200, M=16)
+            live = [row for row in range(self.count) if self.ids[row] >= 0]
+            if live:
+                index.add_items(self.vectors[live], live)
+        index.set_ef(64)
+        return index
+
+    def _rewrite(self, capacity, vectors, ids):
+        """Replace both memmaps with files of `capacity` rows starting with the given vectors and ids"""
+        for attr, path, dtype, fill, data in (("vectors", self.vectors_path, "float32", 0, vectors),
+                                              ("ids", self.ids_path, "int64", -1, ids)):
+            shape = (capacity, self.dim) if attr == "vectors" else (capacity,)
+            tmp_path = path + ".tmp"
+            new = self.np.memmap(tmp_path, dtype=dtype, mode="w+", shape=shape)
+            new[:] = fill
+            new[:len(data)] = data
+            new.flush()
+            del new
+            os.replace(tmp_path, path)
+            setattr(self, attr, self.np.memmap(path, dtype=dtype, mode="r+", shape=shape))
+        self.capacity = capacity
+
+    def _grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        self.vectors.flush()
+        self.ids.flush()
+        self._rewrite(capacity, self.np.array(self.vectors), self.np.array(self.ids))
+        self.index.resize_index(capacity)
+
+    def add(self, item_ids, vectors):
+        """Insert or replace vectors for the given external ids, reusing their rows or deleted ones"""
+        with self._lock:
+            latest = {}
+            for n, item_id in enumerate(item_ids):
+                latest[int(item_id)] = n
+            item_ids, vectors = list(latest), self.np.asarray(vectors)[list(latest.values())]
+            rows = [self.rows.get(item_id) for item_id in item_ids]
+            fresh = sum(row is None for row in rows) - len(self.free)
+            if fresh > 0 and self.count + fresh > self.capacity:
+                self._grow(self.count + fresh)
+            for n, row in enumerate(rows):
+                if row is None:
+                    if self.free:
+                        rows[n] = self.free.pop()
+                    else:
+                        rows[n] = self.count
+                        self.count += 1
+            self.vectors[rows] = vectors
+            self.ids[rows] = item_ids
+            # hnswlib updates an existing label in place, un-deleting it if it was marked deleted
+            self.index.add_items(vectors, rows)
+            for item_id, row in zip(item_ids, rows):
+                self.rows[item_id] = row
+
+    def delete(self, item_ids):
+        with self._lock:
+            for item_id in item_ids:
+                row = self.rows.pop(int(item_id), None)
+                if row is not None:
+                    self.ids[row] = -1
+                    self.index.mark_deleted(row)
+                    self.free.append(row)
+
+    def get(self, item_id):
+        with self._lock:
+            row = self.rows.get(int(item_id))
+            return None if row is None else self.np.array(self.vectors[row])
+
+    def query(self, vector, k=10, exclude=()):
+        """Return [(id, similarity)] for the k nearest live vectors"""
+        with self._lock:
+            live = len(self.rows)
+            if live == 0:
+                return []
+            exclude = {int(e) for e in exclude}
+            labels, distances = self.index.knn_query(vector, k=min(k + len(exclude), live))
+            results = []
+            for row, distance in zip(labels[0], distances[0]):
+                item_id = int(self.ids[row])
+                if item_id >= 0 and item_id not in exclude:
+                    results.append((item_id, round(1.0 - float(distance), 4)))
+            return results[:k]
+
+    def compact(self):
+        """Renumber live vectors into rows 0..n-1, shrink the files and rebuild the index; returns rows freed"""
+        with self._lock:
+            live = sorted(self.rows.items(), key=lambda item: item[1])
+            freed = self.count - len(live)
+            capacity = self.initial_capacity
+            while capacity < len(live):
+                capacity *= 2
+            vectors = self.vectors[[row for _, row in live]] if live else self.np.empty((0, self.dim), "float32")
+            self._rewrite(capacity, self.np.array(vectors), self.np.array([item_id for item_id, _ in live], "int64"))
+            self.count = len(live)
+            self.rows = {item_id: row for row, (item_id, _) in enumerate(live)}
+            self.free = []
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+            self.index = self._load_index()
+            self.flush()
+            return freed
+
+    def flush(self):
+        """Persist vectors, ids, index and bookkeeping so a restart resumes from disk"""
+        with self._lock:
+            self.vectors.flush()
+            self.ids.flush()
+            self.index.save_index(self.index_path)
+            tmp_path = self.meta_path + ".tmp"
+            with open(tmp_path, "w") as fh:
+                json.dump({"count": self.count, "capacity": self.capacity, "dim": self.dim}, fh)
+            os.replace(tmp_path, self.meta_path)
+
+
+class EmbeddingWorker:
+    """Background thread that embeds queued texts in batches and adds them to their store"""
+
+    def __init__(self, embedder, stores, batch_size=32, max_wait=0.5, logger=None):
+        self.embedder = embedder
+        self.stores = stores
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.logger = logger
+        self.queue = queue.Queue(maxsize=10000)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, collection, item_id, text):
+        """Queue text for embedding; returns False if the queue is full"""
+        if not text or not text.strip():
+            return True
+        try:
+            self.queue.put_nowait((collection, item_id, text[:20000]))
+            return True
+        except queue.Full:
+            return False
+
+    def _next_batch(self):
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                vectors = self.embedder.encode([text for _, _, text in batch], self.batch_size)
+                by_collection = {}
+                for (collection, item_id, _), vector in zip(batch, vectors):
+                    ids, vecs = by_collection.setdefault(collection, ([], []))
+                    # A later entry for the same id in one batch wins
+                    if item_id in ids:
+                        vecs[ids.index(item_id)] = vector
+                    else:
+                        ids.append(item_id)
+                        vecs.append(vector)
+                for collection, (ids, vecs) in by_collection.items():
+                    store = self.stores[collection]
+                    store.add(ids, store.np.stack(vecs))
+                    store.flush()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error embedding batch of {len(batch)}: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
@@ -0,0 +1,186 @@
+# session_store.py
+"""Server-side session storage shared by the Flask app and the ASGI read app"""
+import sqlite3
+import time
+
+from flask.json.tag import TaggedJSONSerializer
+
+
+class SessionStore:
+    """Pluggable backend for server-side sessions.
+
+    A session is a small dict loaded on every request. Large values (such as
+    parsed resume data) are kept as separate items and only loaded on demand.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def load(self, sid):
+        """Return (data, expires_at) for a live session, or None"""
+        raise NotImplementedError
+
+    def save(self, sid, data, expires_at):
+        raise NotImplementedError
+
+    def touch(self, sid, expires_at):
+        raise NotImplementedError
+
+    def delete(self, sid):
+        raise NotImplementedError
+
+    def load_item(self, sid, key):
+        raise NotImplementedError
+
+    def save_item(self, sid, key, value):
+        raise NotImplementedError
+
+    def sweep(self, now):
+        """Delete expired sessions and their items, returning how many sessions were removed"""
+        raise NotImplementedError
+
+
+class SQLiteSessionStore(SessionStore):
+    """Session store backed by a local SQLite file (WAL mode, safe across worker processes)"""
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions(expires_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS session_items (
+                    sid TEXT NOT NULL, item_key TEXT NOT NULL, value TEXT NOT NULL,
+                    PRIMARY KEY (sid, item_key)
+                )
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def load(self, sid):
+        with self._connect() as conn:
+            row = conn.execute("SELECT data, expires_at FROM sessions WHERE sid=? AND expires_at > ?",
+                               (sid, time.time())).fetchone()
+        return (self.serializer.loads(row[0]), row[1]) if row else None
+
+    def save(self, sid, data, expires_at):
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO sessions (sid, data, expires_at) VALUES (?, ?, ?)",
+                         (sid, self.serializer.dumps(data), expires_at))
+
+    def touch(self, sid, expires_at):
+        with self._connect() as conn:
+            conn.execute("UPDATE sessions SET expires_at=? WHERE sid=?", (expires_at, sid))
+
+    def delete(self, sid):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM session_items WHERE sid=?", (sid,))
+            conn.execute("DELETE FROM sessions WHERE sid=?", (sid,))
+
+    def load_item(self, sid, key):
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM session_items WHERE sid=? AND item_key=?",
+                               (sid, key)).fetchone()
+        return self.serializer.loads(row[0]) if row else None
+
+    def save_item(self, sid, key, value):
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO session_items (sid, item_key, value) VALUES (?, ?, ?)",
+                         (sid, key, self.serializer.dumps(value)))
+
+    def sweep(self, now):
+        with self._connect() as conn:
+            conn.execute("""
+                DELETE FROM session_items WHERE sid IN (SELECT sid FROM sessions WHERE expires_at <= ?)
+            """, (now,))
+            return conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,)).rowcount
+
+
+class MySQLSessionStore(SessionStore):
+    """Session store kept in the placement_erp database, for deployments spanning several hosts"""
+
+    def __init__(self, connect):
+        self.connect = connect
+        conn = connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS server_sessions (
+                sid VARCHAR(64) PRIMARY KEY,
+                data MEDIUMTEXT NOT NULL,
+                expires_at DOUBLE NOT NULL,
+                INDEX idx_server_sessions_expires (expires_at)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS server_session_items (
+                sid VARCHAR(64) NOT NULL,
+                item_key VARCHAR(64) NOT NULL,
+                value MEDIUMTEXT NOT NULL,
+                PRIMARY KEY (sid, item_key)
+            )
+        """)
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+    def _execute(self, sql, params, fetch=False):
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            if fetch:
+                return cursor.fetchone()
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            cursor.close()
+            conn.close()
+
+    def load(self, sid):
+        row = self._execute("SELECT data, expires_at FROM server_sessions WHERE sid=%s AND expires_at > %s",
+                            (sid, time.time()), fetch=True)
+        return (self.serializer.loads(row[0]), row[1]) if row else None
+
+    def save(self, sid, data, expires_at):
+        self._execute("""
+            INSERT INTO server_sessions (sid, data, expires_at) VALUES (%s, %s, %s)
+            ON DUPLICATE KEY UPDATE data=VALUES(data), expires_at=VALUES(expires_at)
+        """, (sid, self.serializer.dumps(data), expires_at))
+
+    def touch(self, sid, expires_at):
+        self._execute("UPDATE server_sessions SET expires_at=%s WHERE sid=%s", (expires_at, sid))
+
+    def delete(self, sid):
+        self._execute("DELETE FROM server_session_items WHERE sid=%s", (sid,))
+        self._execute("DELETE FROM server_sessions WHERE sid=%s", (sid,))
+
+    def load_item(self, sid, key):
+        row = self._execute("SELECT value FROM server_session_items WHERE sid=%s AND item_key=%s",
+                            (sid, key), fetch=True)
+        return self.serializer.loads(row[0]) if row else None
+
+    def save_item(self, sid, key, value):
+        self._execute("""
+            INSERT INTO server_session_items (sid, item_key, value) VALUES (%s, %s, %s)
+            ON DUPLICATE KEY UPDATE value=VALUES(value)
+        """, (sid, key, self.serializer.dumps(value)))
+
+    def sweep(self, now):
+        self._execute("""
+            DELETE i FROM server_session_items i
+            JOIN server_sessions s ON i.sid = s.sid
+            WHERE s.expires_at <= %s
+        """, (now,))
+        return self._execute("DELETE FROM server_sessions WHERE expires_at <= %s", (now,))
+
+
+def create_session_store(backend, sqlite_path, connect):
+    """Build the configured SessionStore ('sqlite' or 'mysql')"""
+    if backend == 'mysql':
+        return MySQLSessionStore(connect)
+    return SQLiteSessionStore(sqlite_path)
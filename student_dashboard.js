@@ -0,0 +1,384 @@
+// Multi-step form logic
+let currentStep = 0;
+const steps = document.querySelectorAll(".form-step");
+
+function showStep(step) {
+  steps.forEach((s, i) => s.classList.toggle("active", i === step));
+}
+function nextStep() {
+  if (currentStep < steps.length - 1) {
+    currentStep++;
+    showStep(currentStep);
+  }
+}
+function prevStep() {
+  if (currentStep > 0) {
+    currentStep--;
+    showStep(currentStep);
+  }
+}
+showStep(currentStep);
+
+// Profile form: an existing profile is saved with PATCH, sending only the changed fields
+// with the row version it was loaded at; a new profile is posted as a full form.
+const profileForm = document.getElementById("profileForm");
+let profileSnapshot = profileFormValues();
+
+function profileFormValues() {
+  const values = {};
+  new FormData(profileForm).forEach((value, name) => { values[name] = value; });
+  return values;
+}
+
+profileForm.addEventListener("submit", async function(e) {
+  if (profileForm.dataset.rowVersion === "") return;
+  e.preventDefault();
+
+  const current = profileFormValues();
+  const fields = {};
+  Object.keys(current).forEach(name => {
+    if (current[name] !== profileSnapshot[name]) fields[name] = current[name];
+  });
+  if (Object.keys(fields).length === 0) {
+    alert("No changes to save.");
+    return;
+  }
+
+  try {
+    const res = await fetch("/student/profile", {
+      method: "PATCH",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ row_version: Number(profileForm.dataset.rowVersion), fields: fields })
+    });
+    const data = await res.json();
+    if (res.status === 409) {
+      if (confirm(`${data.error}\n\nReload the latest profile now?`)) window.location.reload();
+      return;
+    }
+    if (!res.ok) throw new Error(data.error || "Failed to save profile");
+    profileForm.dataset.rowVersion = data.row_version;
+    profileSnapshot = current;
+    alert("Profile updated successfully!");
+  } catch (error) {
+    console.error("Error saving profile:", error);
+    alert("❌ " + error.message);
+  }
+});
+
+// Load Events and Resources
+const EVENT_WINDOW_DAYS = 60;      // matches db_layer.FEED_DEFAULT_DAYS, so the server answers from its cache
+const RESOURCE_PAGE_SIZE = 50;     // db_layer.FEED_PAGE_SIZE
+
+function isoDate(d) {
+  return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}-${String(d.getDate()).padStart(2, "0")}`;
+}
+
+function loadEvents(preloaded) {
+  const start = new Date();
+  const end = new Date();
+  end.setDate(end.getDate() + EVENT_WINDOW_DAYS - 1);
+  const url = `/student_events/calendar?start=${isoDate(start)}&end=${isoDate(end)}`;
+  return (preloaded ? Promise.resolve(preloaded) : fetch(url).then(res => res.json()))
+    .then(data => {
+      let html = "";
+      if (data.length === 0) {
+        html = "<li>No upcoming events scheduled.</li>";
+      } else {
+        data.forEach(event => {
+          html += `<li class="event-item">
+                     <h4>${event.title}</h4>
+                     <p>${event.description}</p>
+                     <p><strong>Date:</strong> ${new Date(event.date).toLocaleDateString()}</p>
+                     <p><strong>Posted by:</strong> ${event.created_by_name || 'TPO'}</p>
+                   </li>`;
+        });
+      }
+      document.querySelector(".events-list").innerHTML = html;
+    })
+    .catch(error => {
+      console.error('Error loading events:', error);
+      document.querySelector(".events-list").innerHTML = '<li>Error loading events</li>';
+    });
+}
+
+// Without `after` this renders the first page; with it, appends the next page
+function loadResources(preloaded, after) {
+  const url = after ? `/prep_resources_student?after=${after}` : "/prep_resources_student";
+  return (preloaded ? Promise.resolve(preloaded) : fetch(url).then(res => res.json()))
+    .then(data => {
+      const list = document.querySelector(".resource-list");
+      const more = list.querySelector(".load-more");
+      if (more) more.remove();
+      if (!after && data.length === 0) {
+        list.innerHTML = "<li>No resources available.</li>";
+        return;
+      }
+      let html = "";
+      data.forEach(resource => {
+        html += `<li>
+                   <h4>${resource.title}</h4>
+                   <p>${resource.description}</p>
+                   <a href="/download_resource/${resource.file_path}" target="_blank">Download</a>
+                 </li>`;
+      });
+      if (data.length === RESOURCE_PAGE_SIZE) {
+        html += `<li class="load-more">
+                   <button type="button" onclick="loadResources(null, ${data[data.length - 1].resource_id})">Load more</button>
+                 </li>`;
+      }
+      if (after) {
+        list.insertAdjacentHTML("beforeend", html);
+      } else {
+        list.innerHTML = html;
+      }
+    })
+    .catch(error => {
+      console.error('Error loading resources:', error);
+      document.querySelector(".resource-list").innerHTML = '<li>Error loading resources</li>';
+    });
+}
+
+// CGPA Calculation Functions
+function calculateCGPA() {
+  console.log('Calculate CGPA clicked');
+  const sgpaInputs = document.querySelectorAll('.sgpa-input');
+  let totalSGPA = 0;
+  let semestersCount = 0;
+
+  sgpaInputs.forEach(input => {
+    const value = parseFloat(input.value);
+    console.log(`Input: ${input.value}, parsed: ${value}`);
+
+    if (input.value !== '' && !isNaN(value) && value >= 0 && value <= 10) {
+      totalSGPA += value;
+      semestersCount++;
+      input.style.borderColor = '#28a745';
+    } else if (input.value !== '') {
+      input.style.borderColor = '#dc3545';
+      alert(`Invalid SGPA in ${input.previousElementSibling.textContent}. Please enter value between 0-10.`);
+      return;
+    } else {
+      input.style.borderColor = '#ccc';
+    }
+  });
+
+  console.log(`Total SGPA: ${totalSGPA}, Semesters: ${semestersCount}`);
+
+  if (semestersCount > 0) {
+    const cgpa = totalSGPA / semestersCount;
+    const roundedCGPA = cgpa.toFixed(2);
+
+    document.getElementById('calculatedCGPA').textContent = roundedCGPA;
+    document.getElementById('calculatedCGPA').style.color = '#155724';
+    document.getElementById('calculatedAverage').value = roundedCGPA;
+
+    const averageInput = document.querySelector('input[name="average"]');
+    if (averageInput) {
+      averageInput.value = roundedCGPA;
+    }
+
+    alert(`CGPA Calculated: ${roundedCGPA}`);
+  } else {
+    alert('Please enter at least one SGPA value');
+  }
+}
+
+function clearCGPA() {
+  console.log('Clear clicked');
+  const sgpaInputs = document.querySelectorAll('.sgpa-input');
+  sgpaInputs.forEach(input => {
+    input.value = '';
+    input.style.borderColor = '#ccc';
+  });
+
+  document.getElementById('calculatedCGPA').textContent = '0.00';
+  document.getElementById('calculatedCGPA').style.color = '#6c757d';
+  document.getElementById('calculatedAverage').value = '';
+
+  const averageInput = document.querySelector('input[name="average"]');
+  if (averageInput) {
+    averageInput.value = '';
+  }
+
+  alert('All SGPA fields cleared');
+}
+
+// Job Management Functions
+let currentJobData = null;
+
+function loadJobs(preloaded) {
+  return (preloaded ? Promise.resolve(preloaded) : fetch("/student_jobs").then(res => res.json()))
+    .then(jobs => {
+      let html = "";
+      if (jobs.length === 0) {
+        html = "<p>No jobs available at the moment.</p>";
+      } else {
+        jobs.forEach(job => {
+          const canApply = job.can_apply;
+          const branches = job.target_branches ? 
+              (Array.isArray(job.target_branches) ? job.target_branches.join(', ') : job.target_branches) 
+              : 'All Branches';
+
+          const jobClass = canApply ? 'job-item eligible' : 'job-item not-eligible';
+
+          html += `
+            <div class="${jobClass}">
+              <div class="job-header">
+                <div>
+                  <div class="job-title">${job.title}</div>
+                  <div class="company-name">${job.company_name}</div>
+                </div>
+              </div>
+              <div class="job-meta">
+                <strong>📍 Location:</strong> ${job.location} | 
+                <strong>💰 Salary:</strong> ${job.salary}
+              </div>
+              <div class="job-meta">
+                <strong>📅 Deadline:</strong> ${new Date(job.deadline).toLocaleDateString()} | 
+                <strong>🎯 Min CGPA:</strong> ${job.eligibility} | 
+                <strong>🎓 Branches:</strong> ${branches}
+              </div>
+              <p>${job.description}</p>
+
+              ${canApply ? 
+                `<button onclick="applyForJob(${job.job_id}, '${job.title.replace(/'/g, "\\'")}', '${job.company_name.replace(/'/g, "\\'")}')" class="apply-btn">Apply Now</button>` :
+                `<div class="eligibility-warning">
+                  ${!job.branch_eligible ? '❌ Not eligible for your branch' : ''}
+                  ${!job.branch_eligible && !job.cgpa_eligible ? ' | ' : ''}
+                  ${!job.cgpa_eligible ? '❌ CGPA below requirement' : ''}
+                </div>`
+              }
+            </div>
+          `;
+        });
+      }
+      document.getElementById("jobsList").innerHTML = html;
+    })
+    .catch(error => {
+      console.error('Error loading jobs:', error);
+      document.getElementById("jobsList").innerHTML = '<p>Error loading jobs. Please try again later.</p>';
+    });
+}
+
+function applyForJob(jobId, jobTitle, companyName) {
+  if (!confirm("Do you want to apply for this position?")) {
+    return;
+  }
+
+  // Store job data
+  currentJobData = { jobId, jobTitle, companyName };
+
+  // Check if resume is uploaded
+  const hasResume = document.getElementById('currentResumeName').textContent !== 'No resume uploaded';
+
+  if (!hasResume) {
+    alert('Please upload your resume before applying for jobs.');
+    return;
+  }
+
+  // Populate modal
+  document.getElementById('modalJobTitle').textContent = jobTitle;
+  document.getElementById('modalCompanyName').textContent = companyName;
+  document.getElementById('modalJobId').value = jobId;
+
+  // Show modal
+  document.getElementById('applicationModal').style.display = 'block';
+}
+
+function closeApplicationModal() {
+  document.getElementById('applicationModal').style.display = 'none';
+  document.getElementById('jobApplicationForm').reset();
+  currentJobData = null;
+}
+
+// Handle form submission
+document.getElementById('jobApplicationForm').addEventListener('submit', async function(e) {
+  e.preventDefault();
+
+  if (!currentJobData) {
+    alert('Error: No job selected.');
+    return;
+  }
+
+  const submitBtn = document.getElementById('submitApplicationBtn');
+  const originalText = submitBtn.textContent;
+
+  try {
+    // Disable button and show loading
+    submitBtn.disabled = true;
+    submitBtn.textContent = 'Submitting...';
+
+    const formData = new FormData(this);
+
+    const response = await fetch("/apply_job", {
+      method: "POST",
+      body: formData
+    });
+
+    const data = await response.json();
+
+    if (!response.ok) {
+      throw new Error(data.error || 'Failed to submit application');
+    }
+
+    alert('✅ ' + data.message);
+    closeApplicationModal();
+    loadJobs(); // Reload jobs to update UI
+
+  } catch (error) {
+    console.error('Error submitting application:', error);
+    alert('❌ ' + error.message);
+  } finally {
+    // Re-enable button
+    submitBtn.disabled = false;
+    submitBtn.textContent = originalText;
+  }
+});
+
+// Close modal when clicking outside
+window.addEventListener('click', function(event) {
+  const modal = document.getElementById('applicationModal');
+  if (event.target === modal) {
+    closeApplicationModal();
+  }
+});
+
+// Load when page is ready: one bootstrap request for every widget (?fanout=1 keeps the old per-widget requests)
+function reportFirstRender(mode) {
+  const ms = performance.now();
+  console.log(`Dashboard first render (${mode}): ${ms.toFixed(0)} ms`);
+  if (navigator.sendBeacon) {
+    navigator.sendBeacon("/rum", JSON.stringify({ page: "student", mode: mode, ms: ms }));
+  }
+}
+
+function loadDashboardFanout() {
+  return Promise.all([loadEvents(), loadResources(), loadJobs()]);
+}
+
+document.addEventListener("DOMContentLoaded", function() {
+  if (new URLSearchParams(window.location.search).has("fanout")) {
+    loadDashboardFanout().then(() => reportFirstRender("fanout"));
+    return;
+  }
+  fetch("/dashboard_bootstrap?fields=events,resources,jobs")
+    .then(res => {
+      if (!res.ok) {
+        throw new Error('Bootstrap request failed');
+      }
+      return res.json();
+    })
+    .then(data => {
+      const failed = data.errors || {};
+      return Promise.all([
+        failed.events ? loadEvents() : loadEvents(data.events),
+        failed.resources ? loadResources() : loadResources(data.resources),
+        failed.jobs ? loadJobs() : loadJobs(data.jobs)
+      ]);
+    })
+    .then(() => reportFirstRender("bootstrap"))
+    .catch(error => {
+      console.error('Error loading dashboard bootstrap:', error);
+      loadDashboardFanout();
+    });
+});
@@ -0,0 +1,182 @@
+# tenants.py
+"""Multi-college tenancy: resolve a request's host to its college's database and local paths.
+
+Tenants are listed in a JSON file (TENANTS_FILE, default tenants.json):
+
+    {
+      "base_domain": "placements.example.edu",
+      "default": "main",
+      "tenants": [
+        {"slug": "main", "database": "placement_erp", "hosts": ["localhost", "127.0.0.1"]},
+        {"slug": "coep", "database": "placement_erp_coep", "hosts": ["placements.coep.edu"],
+         "db": {"host": "10.0.0.12"}}
+      ]
+    }
+
+A host matches a tenant by exact name, or as <slug>.<base_domain>. Unknown
+hosts go to the default tenant, or are refused when there is none. "db"
+overrides connection settings of the base config per tenant.
+
+The default tenant keeps the original file paths (upload folder, search
+index, vector index); every other tenant's files live under
+TENANT_DATA_DIR/<slug>/. Without a tenants file there is a single default
+tenant on the base config, which behaves exactly like a one-college install.
+"""
+import contextvars
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+
+TENANT_DATA_DIR = "tenants"
+SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9-]{0,31}$")
+
+_current = contextvars.ContextVar("tenant", default=None)
+
+
+class TenantError(ValueError):
+    """The tenants file is malformed"""
+
+
+class Tenant:
+    def __init__(self, slug, db_config, hosts=(), namespaced=True):
+        self.slug = slug
+        self.db_config = db_config
+        self.database = db_config["database"]
+        self.hosts = tuple(h.lower() for h in hosts)
+        self.namespaced = namespaced
+
+    def path(self, base):
+        """This tenant's copy of a local file or directory path"""
+        return os.path.join(TENANT_DATA_DIR, self.slug, base) if self.namespaced else base
+
+    def lock_name(self, name):
+        """A MySQL named lock (server-wide) scoped to this tenant's database"""
+        return f"{self.database}_{name}"
+
+    def __repr__(self):
+        return f"Tenant({self.slug!r}, database={self.database!r})"
+
+
+class TenantRegistry:
+    def __init__(self, tenants, default=None, base_domain=None):
+        self.tenants = {t.slug: t for t in tenants}
+        self.default = self.tenants.get(default)
+        self.base_domain = base_domain.lower().strip(".") if base_domain else None
+        self._by_host = {host: t for t in tenants for host in t.hosts}
+
+    @classmethod
+    def load(cls, path, base_config):
+        """Registry from the tenants file at path, or a single default tenant if it does not exist"""
+        if not path or not os.path.exists(path):
+            return cls([Tenant("default", dict(base_config), namespaced=False)], default="default")
+        with open(path) as f:
+            spec = json.load(f)
+
+        default = spec.get("default")
+        tenants, databases = [], set()
+        for entry in spec.get("tenants", []):
+            slug = entry.get("slug", "")
+            if not SLUG_RE.match(slug):
+                raise TenantError(f"invalid tenant slug {slug!r}")
+            config = {**base_config, **entry.get("db", {}), "database": entry.get("database", base_config["database"])}
+            key = (config.get("host"), config.get("port", 3306), config["database"])
+            if key in databases:
+                raise TenantError(f"tenant {slug!r} shares a database with another tenant")
+            databases.add(key)
+            tenants.append(Tenant(slug, config, entry.get("hosts", ()), namespaced=slug != default))
+        if not tenants:
+            raise TenantError(f"{path} defines no tenants")
+        if default is not None and default not in {t.slug for t in tenants}:
+            raise TenantError(f"default tenant {default!r} is not defined")
+        return cls(tenants, default, spec.get("base_domain"))
+
+    def resolve(self, host):
+        """The tenant serving host (a Host header, port allowed), or None if it serves no tenant"""
+        host = (host or "").lower()
+        if host.count(":") == 1:
+            host = host.split(":")[0]
+        tenant = self._by_host.get(host)
+        if tenant is None and self.base_domain and host.endswith("." + self.base_domain):
+            tenant = self.tenants.get(host[:-len(self.base_domain) - 1])
+        return tenant or self.default
+
+    def get(self, slug):
+        return self.tenants.get(slug)
+
+    def __iter__(self):
+        return iter(self.tenants.values())
+
+    def __len__(self):
+        return len(self.tenants)
+
+
+def current():
+    """The tenant selected for this request, thread or command, or None"""
+    return _current.get()
+
+
+@contextmanager
+def use(tenant):
+    """Select tenant for the enclosed block (background jobs, CLI commands)"""
+    token = _current.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _current.reset(token)
+
+
+def enter(tenant):
+    """Select tenant for one request; pass the returned token to leave() when it ends"""
+    return _current.set(tenant)
+
+
+def leave(token):
+    _current.reset(token)
+
+
+def bound(fn):
+    """fn wrapped to run under the tenant current now, for threads started from a request"""
+    tenant = current()
+
+    def run(*args, **kwargs):
+        with use(tenant):
+            return fn(*args, **kwargs)
+    return run
+
+
+class ConnectionPools:
+    """One lazily created MySQL connection pool per tenant.
+
+    When a tenant's pool is exhausted, connect() opens a plain connection
+    instead of blocking, and reports it as overflow so pool sizes can be tuned.
+    """
+
+    def __init__(self, size, connect):
+        self.size = size
+        self.connect_direct = connect
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, tenant):
+        pool = self._pools.get(tenant.slug)
+        if pool is None:
+            from mysql.connector import pooling
+            with self._lock:
+                pool = self._pools.get(tenant.slug)
+                if pool is None:
+                    pool = pooling.MySQLConnectionPool(pool_name=f"erp_{tenant.slug}", pool_size=self.size,
+                                                       **tenant.db_config)
+                    self._pools[tenant.slug] = pool
+        return pool
+
+    def connect(self, tenant):
+        """(connection, pooled) for tenant; closing a pooled connection returns it to the pool"""
+        from mysql.connector.errors import PoolError
+        if self.size <= 0:
+            return self.connect_direct(**tenant.db_config), False
+        try:
+            return self._pool(tenant).get_connection(), True
+        except PoolError:
+            return self.connect_direct(**tenant.db_config), False
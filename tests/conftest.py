@@ -0,0 +1,114 @@
+# tests/conftest.py
+import os
+import re
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def app1():
+    """The Flask app module; skipped when its dependencies are not installed"""
+    os.chdir(ROOT)
+    return pytest.importorskip("app1")
+
+
+@pytest.fixture
+def client(app1):
+    app1.app.config["TESTING"] = True
+    return app1.app.test_client()
+
+
+@pytest.fixture
+def store(app1, tmp_path, monkeypatch):
+    """A fresh SQLite session store behind the Flask app"""
+    from session_store import SQLiteSessionStore
+    store = SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"))
+    monkeypatch.setattr(app1.app.session_interface, "store", store)
+    return store
+
+
+def sqlite_sql(sql):
+    """sql with mysql.connector's %s and %(name)s placeholders rewritten for sqlite3"""
+    return re.sub(r"%\((\w+)\)s", r":\1", sql).replace("%s", "?")
+
+
+class SQLiteCursor:
+    """mysql.connector-style cursor over sqlite3: %s and %(name)s placeholders, dict rows on request"""
+
+    def __init__(self, db, dictionary=False):
+        self.cursor = db.cursor()
+        self.dictionary = dictionary
+
+    def execute(self, sql, params=()):
+        self.cursor.execute(sqlite_sql(sql), params)
+
+    def executemany(self, sql, rows):
+        self.cursor.executemany(sqlite_sql(sql), rows)
+
+    @property
+    def rowcount(self):
+        return self.cursor.rowcount
+
+    def _row(self, row):
+        if row is None:
+            return None
+        return dict(row) if self.dictionary else tuple(row)
+
+    def fetchone(self):
+        return self._row(self.cursor.fetchone())
+
+    def fetchall(self):
+        return [self._row(row) for row in self.cursor.fetchall()]
+
+    def close(self):
+        self.cursor.close()
+
+
+class SQLiteConnection:
+    def __init__(self, db):
+        self.db = db
+        self.closed = False
+
+    def cursor(self, dictionary=False, **kwargs):
+        return SQLiteCursor(self.db, dictionary)
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sqlite_db(app1, monkeypatch):
+    """An in-memory SQLite database behind get_db_connection"""
+    db = sqlite3.connect(":memory:")
+    db.row_factory = sqlite3.Row
+    db.create_function("NOW", 0, lambda: "2030-01-02 03:04:05")
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: SQLiteConnection(db))
+    return db
+
+
+@pytest.fixture
+def profile_db(app1, sqlite_db, monkeypatch):
+    """A student_profile table in sqlite_db; derived data and auditing are off"""
+    columns = ", ".join(f"{field} TEXT" for field in app1.STUDENT_PROFILE_FIELDS)
+    sqlite_db.execute(f"""
+        CREATE TABLE student_profile (
+            profile_id INTEGER PRIMARY KEY, student_id INTEGER UNIQUE, {columns},
+            created_at TEXT, last_updated TEXT, edited_by_student BOOLEAN DEFAULT FALSE,
+            row_version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    monkeypatch.setattr(app1, "ensure_profile_version_column", lambda cursor: None)
+    monkeypatch.setattr(app1, "refresh_eligibility_snapshot", lambda conn, student_ids: None)
+    monkeypatch.setattr(app1, "audit", lambda *args, **kwargs: None)
+    return sqlite_db
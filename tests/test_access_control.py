@@ -0,0 +1,15 @@
+# tests/test_access_control.py
+import pytest
+
+
+def no_database(*args, **kwargs):
+    pytest.fail("queried the database")
+
+
+@pytest.mark.parametrize("role", [None, "student", "recruiter"])
+def test_all_applications_requires_tpo(app1, client, store, monkeypatch, role):
+    monkeypatch.setattr(app1, "get_db_connection", no_database)
+    if role:
+        with client.session_transaction() as sess:
+            sess["role"] = role
+    assert client.get("/all_applications").get_json() == []
@@ -0,0 +1,90 @@
+# tests/test_admission.py
+import pytest
+
+from admission import ConcurrencyLimiter, MemoryTokenBucketStore, SQLiteTokenBucketStore, create_bucket_store
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def buckets(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteTokenBucketStore(str(tmp_path / "buckets.sqlite3"), idle_seconds=60)
+    return MemoryTokenBucketStore(idle_seconds=60)
+
+
+def test_burst_is_admitted_then_the_wait_is_reported(buckets):
+    assert [buckets.take("u1", 1.0, 3, now=100.0) for _ in range(3)] == [0, 0, 0]
+    assert buckets.take("u1", 1.0, 3, now=100.0) == pytest.approx(1.0)
+    assert buckets.take("u1", 2.0, 3, now=100.25) == pytest.approx(0.25)
+
+
+def test_buckets_refill_at_rate_up_to_burst(buckets):
+    for _ in range(2):
+        buckets.take("u1", 0.5, 2, now=0.0)
+    assert buckets.take("u1", 0.5, 2, now=2.0) == 0
+    assert buckets.take("u1", 0.5, 2, now=2.0) == pytest.approx(2.0)
+    assert [buckets.take("u1", 0.5, 2, now=1000.0) for _ in range(3)][-1] == pytest.approx(2.0)
+
+
+def test_keys_are_independent(buckets):
+    buckets.take("u1", 1.0, 1, now=0.0)
+    assert buckets.take("u1", 1.0, 1, now=0.0) > 0
+    assert buckets.take("u2", 1.0, 1, now=0.0) == 0
+
+
+def test_sweep_forgets_idle_buckets(buckets):
+    buckets.take("old", 1.0, 1, now=0.0)
+    buckets.take("new", 1.0, 1, now=50.0)
+    assert buckets.sweep(now=70.0) == 1
+    assert buckets.take("new", 1.0, 1, now=50.0) > 0
+
+
+def test_sqlite_buckets_are_shared_between_stores(tmp_path):
+    path = str(tmp_path / "buckets.sqlite3")
+    SQLiteTokenBucketStore(path).take("u1", 1.0, 1, now=0.0)
+    assert SQLiteTokenBucketStore(path).take("u1", 1.0, 1, now=0.0) > 0
+
+
+def test_create_bucket_store(tmp_path):
+    assert isinstance(create_bucket_store("memory", None), MemoryTokenBucketStore)
+    assert isinstance(create_bucket_store("sqlite", str(tmp_path / "b.sqlite3")), SQLiteTokenBucketStore)
+
+
+def test_concurrency_limiter_reserves_slots_for_priority():
+    limiter = ConcurrencyLimiter(3, reserved=1)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert limiter.try_acquire(priority=True)
+    assert not limiter.try_acquire(priority=True)
+    limiter.release()
+    assert limiter.try_acquire(priority=True)
+    limiter.release()
+    limiter.release()
+    assert limiter.try_acquire()
+
+
+def test_reserved_slots_never_exceed_the_limit():
+    limiter = ConcurrencyLimiter(1, reserved=5)
+    assert not limiter.try_acquire()
+    assert limiter.try_acquire(priority=True)
+
+
+@pytest.fixture
+def anonymous_limits(app1, monkeypatch):
+    monkeypatch.setattr(app1, "render_template", lambda template, **context: template)
+    monkeypatch.setattr(app1, "ADMISSION_BUCKETS", MemoryTokenBucketStore())
+    monkeypatch.setitem(app1.app.config, "ADMISSION_ENABLED", True)
+    monkeypatch.setitem(app1.app.config, "ADMISSION_RATE_LIMITS",
+                        {**app1.app.config["ADMISSION_RATE_LIMITS"], "anonymous": (0.001, 2), "login": (0.001, 1)})
+
+
+def test_login_has_its_own_anonymous_budget(client, anonymous_limits):
+    assert [client.get("/about").status_code for _ in range(3)] == [200, 200, 429]
+    assert client.get("/login").status_code == 200
+    assert client.get("/login").status_code == 429
+
+
+def test_anonymous_buckets_are_per_client_address(client, anonymous_limits):
+    for _ in range(2):
+        client.get("/about", environ_base={"REMOTE_ADDR": "10.0.0.1"})
+    assert client.get("/about", environ_base={"REMOTE_ADDR": "10.0.0.1"}).status_code == 429
+    assert client.get("/about", environ_base={"REMOTE_ADDR": "10.0.0.2"}).status_code == 200
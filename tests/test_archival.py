@@ -0,0 +1,61 @@
+# tests/test_archival.py
+import pytest
+
+
+class RecordingCursor:
+    """Answers SHOW COLUMNS for every table and records the statements it runs"""
+
+    def __init__(self, columns, rowcount=1):
+        self.columns = columns
+        self.rowcount = rowcount
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(" ".join(sql.split()))
+
+    def fetchall(self):
+        last = self.statements[-1]
+        return [(c,) for c in self.columns] + ([("archived_at",)] if "_archive" in last else [])
+
+
+class IdleConnection:
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("table, indexed", [
+    ("students", ["student_id"]),
+    ("applications", ["application_id", "student_id", "job_id"]),
+    ("jobs", ["job_id", "company_id"]),
+])
+def test_archive_table_has_a_stamp_default_and_lookup_indexes(app1, table, indexed):
+    sql = app1.archive_table_sql(table)
+    assert f"CREATE TABLE {table}_archive (archived_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP" in sql
+    for column in indexed:
+        assert f"INDEX idx_archive_{column} ({column})" in sql
+    assert sql.endswith(f"AS SELECT t.* FROM {table} t WHERE 1 = 0")
+
+
+def test_move_to_archive_stamps_archived_at(app1):
+    cursor = RecordingCursor(["student_id", "name"], rowcount=2)
+    moved = app1.move_to_archive(cursor, (("students", "student_id IN ({ids})"),), "%s, %s", (1, 2))
+
+    insert = next(s for s in cursor.statements if s.startswith("INSERT"))
+    assert insert == ("INSERT INTO students_archive (`student_id`, `name`, archived_at) "
+                      "SELECT `student_id`, `name`, NOW() FROM students WHERE student_id IN (%s, %s)")
+    assert moved == 2
+
+
+def test_delete_student_returns_404_for_unknown_student(app1, client, store, monkeypatch):
+    audited = []
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: IdleConnection())
+    monkeypatch.setattr(app1, "ensure_archive_tables", lambda conn: None)
+    monkeypatch.setattr(app1, "archive_student_chunk", lambda conn, ids: 0)
+    monkeypatch.setattr(app1, "audit", lambda *args, **kwargs: audited.append(args))
+    with client.session_transaction() as sess:
+        sess["role"] = "tpo"
+
+    response = client.post("/delete_student/404")
+
+    assert response.status_code == 404
+    assert audited == []
@@ -0,0 +1,53 @@
+# tests/test_asgi_app.py
+import time
+
+import pytest
+
+from session_store import SQLiteSessionStore
+
+pytest.importorskip("starlette")
+pytest.importorskip("aiomysql")
+pytest.importorskip("httpx")
+
+import asgi_app
+from starlette.testclient import TestClient
+
+APPLICATION = {"application_id": 1, "student_name": "Asha", "student_email": "asha@example.com"}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    store = SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"))
+    monkeypatch.setattr(asgi_app, "session_store", store)
+
+    async def fetch_one(sql, params=()):
+        return {"exists": 1}
+
+    async def fetch_all(sql, params=()):
+        return [APPLICATION]
+
+    monkeypatch.setattr(asgi_app, "fetch_one", fetch_one)
+    monkeypatch.setattr(asgi_app, "fetch_all", fetch_all)
+    client = TestClient(asgi_app.app)
+    client.store = store
+    return client
+
+
+def log_in(client, role):
+    client.store.save("sid-" + role, {"role": role, "user_id": 1}, time.time() + 60)
+    client.cookies.set(asgi_app.SESSION_COOKIE_NAME, "sid-" + role)
+
+
+def test_all_applications_hidden_from_anonymous_users(client):
+    assert client.get("/all_applications").json() == []
+
+
+@pytest.mark.parametrize("role", ["student", "recruiter"])
+def test_all_applications_hidden_from_other_roles(client, role):
+    log_in(client, role)
+    assert client.get("/all_applications").json() == []
+
+
+def test_all_applications_served_to_tpo(client):
+    log_in(client, "tpo")
+    assert client.get("/all_applications").json() == [APPLICATION]
@@ -0,0 +1,65 @@
+# tests/test_asset_pipeline.py
+import gzip
+import json
+import re
+
+import pytest
+
+import asset_pipeline
+
+
+def test_hashed_name_is_content_addressed():
+    name = asset_pipeline.hashed_name("main.js", b"let a = 1;")
+    assert re.fullmatch(r"main\.[0-9a-f]{12}\.min\.js", name)
+    assert asset_pipeline.hashed_name("main.js", b"let a = 1;") == name
+    assert asset_pipeline.hashed_name("main.js", b"let a = 2;") != name
+    assert asset_pipeline.hashed_name("style.css", b"").endswith(".min.css")
+
+
+def test_minify_without_a_minifier_ships_the_source(monkeypatch):
+    monkeypatch.setattr(asset_pipeline, "rjsmin", None)
+    assert asset_pipeline.minify("main.js", "let a = 1;") == ("let a = 1;", None)
+    assert asset_pipeline.minify("notes.txt", "x") == ("x", None)
+
+
+@pytest.fixture(scope="module")
+def built(tmp_path_factory):
+    dist = tmp_path_factory.mktemp("dist")
+    (dist / "main.000000000000.min.js").write_text("stale")
+    return dist, asset_pipeline.build(str(dist))
+
+
+def test_build_writes_hashed_bundles_and_their_manifest(built):
+    dist, report = built
+    manifest = asset_pipeline.load_manifest(str(dist))
+    assert set(manifest) == set(asset_pipeline.ASSET_BUNDLES)
+    for name, filename in manifest.items():
+        data = (dist / filename).read_bytes()
+        assert filename == asset_pipeline.hashed_name(name, data)
+        assert gzip.decompress((dist / f"{filename}.gz").read_bytes()) == data
+        assert report["bundles"][name]["minified_bytes"] == len(data)
+
+
+def test_build_removes_files_of_earlier_builds(built):
+    dist, _ = built
+    assert not (dist / "main.000000000000.min.js").exists()
+
+
+def test_build_is_reproducible(built, tmp_path):
+    dist, _ = built
+    asset_pipeline.build(str(tmp_path))
+    for filename in asset_pipeline.load_manifest(str(dist)).values():
+        assert (tmp_path / f"{filename}.gz").read_bytes() == (dist / f"{filename}.gz").read_bytes()
+
+
+def test_page_weight_counts_the_bundles_each_page_uses(built):
+    dist, report = built
+    assert json.loads((dist / asset_pipeline.REPORT_NAME).read_text()) == report
+    for template, page in report["pages"].items():
+        expected = sum(report["bundles"][n]["gzip_bytes"] for n in page["assets"] if n in report["bundles"])
+        assert page["assets_gzip_bytes"] == expected
+    assert asset_pipeline.format_report(report).splitlines()[0].startswith("bundle")
+
+
+def test_load_manifest_without_a_build(tmp_path):
+    assert asset_pipeline.load_manifest(str(tmp_path)) == {}
@@ -0,0 +1,118 @@
+# tests/test_audit_log.py
+import json
+import threading
+from datetime import date, datetime
+
+import pytest
+
+import audit_log
+
+
+def test_create_table_sql_partitions_this_month_and_the_next_ones():
+    sql = audit_log.create_table_sql(date(2030, 11, 17))
+    assert "PARTITION p203011 VALUES LESS THAN (TO_DAYS('2030-12-01'))" in sql
+    assert "PARTITION p203012 VALUES LESS THAN (TO_DAYS('2031-01-01'))" in sql
+    assert "PARTITION p203101 VALUES LESS THAN (TO_DAYS('2031-02-01'))" in sql
+    assert sql.rstrip().endswith("PARTITION pmax VALUES LESS THAN MAXVALUE)")
+
+
+def test_add_partitions_sql_splits_only_newer_months_out_of_pmax():
+    assert audit_log.add_partitions_sql(["p203011", "p203012", "p203101", "pmax"], date(2030, 11, 2)) is None
+    sql = audit_log.add_partitions_sql(["p203011", "p203012", "pmax"], date(2030, 12, 2))
+    assert sql.startswith("ALTER TABLE audit_log REORGANIZE PARTITION pmax INTO (PARTITION p203101 ")
+    assert "p203012 VALUES" not in sql
+    assert sql.endswith("PARTITION pmax VALUES LESS THAN MAXVALUE)")
+
+
+def test_event_row_serializes_target_and_details():
+    row = audit_log.event_row(datetime(2030, 1, 2), "tpo", 1, "delete_student", "student", 42,
+                              {"b": date(2030, 1, 2), "a": 1}, "10.0.0.1")
+    assert row[5] == "42"
+    assert json.loads(row[6]) == {"a": 1, "b": "2030-01-02"}
+    assert audit_log.event_row(datetime(2030, 1, 2), None, None, "x", "job", None)[5:] == (None, None, None)
+
+
+def test_audit_range_defaults_to_the_last_days():
+    start, end = audit_log.audit_range(None, None, date(2030, 1, 30))
+    assert (start, end) == (date(2030, 1, 1), date(2030, 1, 31))
+    assert audit_log.audit_range("2030-01-05", "2030-01-05", date(2030, 3, 1)) == (date(2030, 1, 5), date(2030, 1, 6))
+
+
+@pytest.mark.parametrize("since, until, message", [
+    ("yesterday", None, "YYYY-MM-DD"),
+    ("2030-01-05", "2030-01-04", "before since"),
+    ("2028-01-01", "2030-01-01", "longer than"),
+])
+def test_audit_range_rejects_bad_ranges(since, until, message):
+    with pytest.raises(ValueError, match=message):
+        audit_log.audit_range(since, until, date(2030, 1, 30))
+
+
+def test_audit_page_query_filters_pages_and_bounds_partitions():
+    after = (datetime(2030, 1, 2, 3, 4, 5, 6), 9)
+    sql, params = audit_log.audit_page_query(date(2030, 1, 1), date(2030, 2, 1), 50,
+                                             {"action": "delete_student", "actor_id": 3}, after)
+    where = " ".join(sql.split())
+    assert "occurred_at >= %s AND occurred_at < %s AND action = %s AND actor_id = %s" in where
+    assert "(occurred_at < %s OR (occurred_at = %s AND audit_id < %s))" in where
+    assert where.endswith("ORDER BY occurred_at DESC, audit_id DESC LIMIT %s")
+    assert params == [date(2030, 1, 1), date(2030, 2, 1), "delete_student", 3, after[0], after[0], 9, 51]
+
+
+def test_audit_page_query_rejects_unknown_filters():
+    with pytest.raises(KeyError):
+        audit_log.audit_page_query(date(2030, 1, 1), date(2030, 2, 1), 50, {"details": "x"})
+
+
+def test_audit_cursor_round_trips():
+    row = {"occurred_at": datetime(2030, 1, 2, 3, 4, 5, 6), "audit_id": 77}
+    assert audit_log.parse_audit_cursor(audit_log.audit_cursor(row)) == (row["occurred_at"], 77)
+    with pytest.raises(ValueError, match="malformed cursor"):
+        audit_log.parse_audit_cursor("2030-01-02_x")
+
+
+def test_shape_audit_row_decodes_details():
+    assert audit_log.shape_audit_row({"details": '{"a": 1}'})["details"] == {"a": 1}
+    assert audit_log.shape_audit_row({"details": None})["details"] is None
+
+
+def test_writer_batches_by_group_and_flushes_on_close():
+    written = []
+    writer = audit_log.AuditWriter(lambda group, rows: written.append((group, rows)),
+                                   batch_size=10, flush_interval=5)
+    for i in range(3):
+        assert writer.submit("main" if i != 1 else "coep", i)
+    assert writer.close()
+    assert sorted(written) == [("coep", [1]), ("main", [0, 2])]
+    assert not writer.submit("main", 3)
+
+
+def test_writer_drops_events_when_the_buffer_is_full():
+    release = threading.Event()
+    dropped = []
+    writer = audit_log.AuditWriter(lambda group, rows: release.wait(), max_pending=1, batch_size=1,
+                                   submit_timeout=0.01, on_drop=lambda count, reason: dropped.append(reason))
+    writer.submit("main", 0)   # taken by the writer thread, which then blocks
+    submitted = [writer.submit("main", i) for i in range(1, 4)]
+    release.set()
+    writer.close()
+    assert submitted.count(False) == len(dropped) >= 1
+    assert set(dropped) == {"buffer_full"}
+
+
+def test_writer_retries_then_reports_failed_batches(monkeypatch):
+    monkeypatch.setattr(audit_log.time, "sleep", lambda seconds: None)
+    attempts, dropped = [], []
+
+    def fail(group, rows):
+        attempts.append(rows)
+        raise RuntimeError("database down")
+
+    writer = audit_log.AuditWriter(fail, flush_interval=0.01, attempts=3,
+                                   on_drop=lambda count, reason: dropped.append((count, reason)))
+    writer.submit("main", 0)
+    writer.submit("main", 1)
+    writer.close()
+    assert sum(len(rows) for rows in attempts) == 6
+    assert sum(count for count, _ in dropped) == 2
+    assert {reason for _, reason in dropped} == {"write_failed"}
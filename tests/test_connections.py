@@ -0,0 +1,46 @@
+# tests/test_connections.py
+import pytest
+
+
+@pytest.fixture
+def opened(app1, sqlite_db, monkeypatch):
+    """Every connection a request opens; the schema holds only what the routes below read"""
+    sqlite_db.executescript("""
+        CREATE TABLE students (student_id INTEGER PRIMARY KEY, resume_path TEXT);
+        CREATE TABLE applications (application_id INTEGER PRIMARY KEY, job_id INTEGER, student_id INTEGER);
+        CREATE TABLE jobs (job_id INTEGER PRIMARY KEY, company_id INTEGER, title TEXT);
+        INSERT INTO students VALUES (7, NULL), (8, 'r.pdf');
+        INSERT INTO applications VALUES (1, 5, 8);
+        INSERT INTO jobs VALUES (5, 2, 'Analyst');
+    """)
+    connections = []
+    connect_sqlite = app1.get_db_connection
+
+    def connect(*args, **kwargs):
+        connections.append(connect_sqlite())
+        return connections[-1]
+    monkeypatch.setattr(app1, "get_db_connection", connect)
+    monkeypatch.setattr(app1, "ensure_tables_exist", lambda: None)
+    return connections
+
+
+def login(client, role, user_id):
+    with client.session_transaction() as sess:
+        sess["role"] = role
+        sess["user_id"] = user_id
+
+
+@pytest.mark.parametrize("role, user_id, method, path, data, status", [
+    ("student", 8, "post", "/apply_job", {"job_id": 5}, 400),
+    ("student", 7, "post", "/apply_job", {"job_id": 5}, 400),
+    ("recruiter", 3, "post", "/delete_job/5", None, 404),
+    ("tpo", 1, "get", "/all_student_profiles", None, 200),
+    ("student", 7, "get", "/student_jobs", None, 500),
+])
+def test_early_returns_and_errors_close_the_connection(client, store, opened, role, user_id, method, path, data,
+                                                       status):
+    login(client, role, user_id)
+    response = getattr(client, method)(path, data=data)
+
+    assert response.status_code == status
+    assert opened and all(conn.closed for conn in opened)
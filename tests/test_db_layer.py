@@ -0,0 +1,140 @@
+# tests/test_db_layer.py
+from datetime import date
+
+import pytest
+
+import db_layer
+
+
+@pytest.mark.parametrize("name, code", [
+    ("Computer Science & Engineering", "CSE"),
+    ("B.Tech CSE", "CSE"),
+    ("E&TC", "ENTC"),
+    ("Electronics and Telecommunication Engg", "ENTC"),
+    ("Mechanical Dept.", "MECH"),
+    ("Biotech", "BIOTECH"),
+    ("", None),
+    (None, None),
+])
+def test_normalize_branch(name, code):
+    assert db_layer.normalize_branch(name) == code
+
+
+def test_target_branch_codes():
+    assert db_layer.target_branch_codes("cse, IT ,") == {"CSE", "IT"}
+    assert db_layer.target_branch_codes("cse,all") is None
+    assert db_layer.target_branch_codes("") is None
+    assert db_layer.target_branch_codes(None) is None
+
+
+def test_job_branch_rows():
+    assert db_layer.job_branch_rows(7, "it,cse,Computer Science") == [(7, "CSE"), (7, "IT")]
+    assert db_layer.job_branch_rows(7, "") == [(7, "ALL")]
+
+
+def test_effective_cgpa_prefers_semesters_then_average_then_cgpa():
+    assert db_layer.effective_cgpa({"sem1": "8", "sem2": 9.0, "sem3": "", "average": 5, "cgpa": 4}) == 8.5
+    assert db_layer.effective_cgpa({"sem1": None, "average": "7.456", "cgpa": 4}) == 7.46
+    assert db_layer.effective_cgpa({"cgpa": 6}) == 6.0
+    assert db_layer.effective_cgpa({}) == 0.0
+
+
+def test_eligibility_snapshot_row():
+    row = {"student_id": 3, "branch": "Information Technology", "sem1": 9, "live_backlogs": None, "year_gap": "1"}
+    assert db_layer.eligibility_snapshot_row(row) == (3, "IT", 9.0, 0, 1)
+
+
+def test_student_jobs_params_falls_back_to_the_profile_branch():
+    assert db_layer.student_jobs_params({"branch_code": "IT", "branch": "cse", "cgpa": "7.5"}) == ("IT", 7.5)
+    assert db_layer.student_jobs_params({"branch_code": None, "branch": "Comp Engg", "cgpa": None}) == ("CSE", 0.0)
+    assert db_layer.student_jobs_params({"branch_code": None, "branch": None, "cgpa": 6}) == ("", 6.0)
+
+
+def job(job_id, target_branches, branch_eligible=0, cgpa_eligible=1, branch_codes_known=1):
+    return {"job_id": job_id, "title": "Job", "description": "", "location": "Pune", "salary": 1,
+            "deadline": date(2030, 1, 2), "eligibility": 7, "target_branches": target_branches,
+            "company_name": "Acme", "branch_eligible": branch_eligible, "cgpa_eligible": cgpa_eligible,
+            "branch_codes_known": branch_codes_known}
+
+
+def test_build_student_job_list_uses_the_query_eligibility():
+    student = {"branch_code": "CSE", "branch": "cse", "cgpa": 8}
+    jobs = db_layer.build_student_job_list(student, [
+        job(1, "CSE,IT", branch_eligible=1),
+        job(2, "MECH", branch_eligible=0),
+        job(3, "", branch_eligible=1, cgpa_eligible=0),
+    ])
+    assert [(j["job_id"], j["branch_eligible"], j["cgpa_eligible"], j["can_apply"]) for j in jobs] == [
+        (1, True, True, True), (2, False, True, False), (3, True, False, False)]
+    assert jobs[0]["target_branches"] == ["cse", "it"]
+    assert jobs[2]["target_branches"] == ["all"]
+    assert jobs[0]["deadline"] == "2030-01-02"
+
+
+def test_build_student_job_list_matches_branches_of_jobs_without_codes():
+    student = {"branch_code": None, "branch": "Computer Science", "cgpa": 8}
+    jobs = db_layer.build_student_job_list(student, [
+        job(1, "cse", branch_codes_known=0),
+        job(2, "mech", branch_codes_known=0),
+        job(3, None, branch_codes_known=0),
+    ])
+    assert [j["branch_eligible"] for j in jobs] == [True, False, True]
+
+
+@pytest.mark.parametrize("value, expected", [("20", 20), ("0", 1), ("999", 200), ("x", 50), (None, 50)])
+def test_bounded_int(value, expected):
+    assert db_layer.bounded_int(value, 50, 200) == expected
+
+
+def test_event_window():
+    today = date(2030, 1, 10)
+    assert db_layer.event_window("upcoming", 5, today) == (today, date(2030, 1, 15), False)
+    assert db_layer.event_window("past", 5, today) == (date(2030, 1, 5), today, True)
+    with pytest.raises(ValueError, match="upcoming, past"):
+        db_layer.event_window("soon", 5, today)
+
+
+def test_calendar_range():
+    assert db_layer.calendar_range("2030-01-01", "2030-01-31") == (date(2030, 1, 1), date(2030, 2, 1))
+    for start, end in [("2030-01-31", "2030-01-01"), ("2030-01-01", "2030-06-01"), ("jan", "2030-01-01"), (None, None)]:
+        with pytest.raises(ValueError):
+            db_layer.calendar_range(start, end)
+
+
+def test_event_range_query_seeks_past_the_cursor():
+    sql, params = db_layer.event_range_query("event_id", date(2030, 1, 1), date(2030, 2, 1), 10,
+                                             after=("2030-01-05", 7))
+    where = " ".join(sql.split())
+    assert "(e.date > %s OR (e.date = %s AND e.`event_id` > %s))" in where
+    assert "ORDER BY e.date ASC, e.`event_id` ASC LIMIT %s" in where
+    assert params == (date(2030, 1, 1), date(2030, 2, 1), "2030-01-05", "2030-01-05", 7, 11)
+
+    sql, params = db_layer.event_range_query("id", date(2030, 1, 1), date(2030, 2, 1), 10, descending=True)
+    assert "ORDER BY e.date DESC, e.`id` DESC" in " ".join(sql.split())
+    assert params == (date(2030, 1, 1), date(2030, 2, 1), 11)
+
+
+def test_resource_page_query():
+    sql, params = db_layer.resource_page_query(10, after=30)
+    assert "WHERE r.resource_id < %s" in sql and params == (30, 11)
+    sql, params = db_layer.resource_page_query(10)
+    assert "WHERE" not in sql and params == (11,)
+
+
+def test_cursors_round_trip():
+    event = {"date": date(2030, 1, 5), "feed_key": 7}
+    assert db_layer.parse_event_cursor(db_layer.event_cursor(event)) == ("2030-01-05", 7)
+    assert db_layer.parse_resource_cursor(db_layer.resource_cursor({"resource_id": 30})) == 30
+    for parse, value in [(db_layer.parse_event_cursor, "2030-01-05"), (db_layer.parse_event_cursor, "x_7"),
+                         (db_layer.parse_resource_cursor, "x")]:
+        with pytest.raises(ValueError, match="malformed cursor"):
+            parse(value)
+
+
+def test_feed_page_trims_the_extra_row_and_hides_the_feed_key():
+    rows = [{"date": date(2030, 1, d), "feed_key": d} for d in (1, 2, 3)]
+    page, next_cursor = db_layer.feed_page([dict(r) for r in rows], 2, db_layer.event_cursor)
+    assert page == [{"date": date(2030, 1, 1)}, {"date": date(2030, 1, 2)}]
+    assert next_cursor == "2030-01-02_2"
+    assert db_layer.feed_page([dict(r) for r in rows], 3, db_layer.event_cursor)[1] is None
+
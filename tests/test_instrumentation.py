@@ -0,0 +1,38 @@
+# tests/test_instrumentation.py
+import pytest
+
+
+@pytest.mark.parametrize("sql, expected", [
+    ("SELECT * FROM students WHERE student_id IN (%s, %s, %s)", "SELECT * FROM students WHERE student_id IN (?)"),
+    ("SELECT * FROM students WHERE student_id IN (4, 8, 15, 16)", "SELECT * FROM students WHERE student_id IN (?)"),
+    ("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)", "INSERT INTO t (a, b) VALUES (?)"),
+    ("UPDATE jobs SET title = 'it''s' WHERE job_id = %(id)s", "UPDATE jobs SET title = ? WHERE job_id = ?"),
+    (b"SELECT  1\n   FROM dual", "SELECT ? FROM dual"),
+])
+def test_normalize_statement_folds_literals_and_lists(app1, sql, expected):
+    assert app1.normalize_statement(sql) == expected
+
+
+def test_normalize_statement_caps_label_count(app1, monkeypatch):
+    monkeypatch.setattr(app1, "_statement_labels", set())
+    monkeypatch.setattr(app1, "MAX_STATEMENT_LABELS", 2)
+    assert app1.normalize_statement("SELECT a FROM t") == "SELECT a FROM t"
+    assert app1.normalize_statement("SELECT b FROM t") == "SELECT b FROM t"
+    assert app1.normalize_statement("SELECT c FROM t") == "other"
+    assert app1.normalize_statement("SELECT a FROM t") == "SELECT a FROM t"
+
+
+def test_metrics_disabled_without_token_even_for_loopback(app1, client, monkeypatch):
+    monkeypatch.setitem(app1.app.config, "METRICS_TOKEN", None)
+    assert client.get("/metrics").status_code == 404
+    assert client.get("/metrics", environ_base={"REMOTE_ADDR": "10.1.2.3"}).status_code == 404
+
+
+def test_metrics_requires_token_when_set(app1, client, monkeypatch):
+    monkeypatch.setitem(app1.app.config, "METRICS_TOKEN", "s3cret")
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
+    response = client.get("/metrics", headers={"Authorization": "Bearer s3cret"},
+                          environ_base={"REMOTE_ADDR": "10.1.2.3"})
+    assert response.status_code == 200
+    assert b"erp_http_request_duration_seconds" in response.data
@@ -0,0 +1,151 @@
+# tests/test_interview_scheduler.py
+import queue
+import threading
+from datetime import datetime
+
+import pytest
+
+from interview_scheduler import InterviewPlan, PlanError, free_slot_indexes, merge_intervals, peak_overlap, schedule
+
+
+def at(hour, minute=0):
+    return datetime(2030, 1, 2, hour, minute)
+
+
+def plan(windows=(("09:00", "10:00"),), panels=(("P1", "R1"),), rooms=None, slot_minutes=30, buffer_minutes=0):
+    return InterviewPlan(slot_minutes,
+                         [{"start": f"2030-01-02T{s}", "end": f"2030-01-02T{e}"} for s, e in windows],
+                         rooms or {"R1": 1}, [{"name": n, "room": r} for n, r in panels], buffer_minutes)
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"slot_minutes": 3}, "slot_minutes"),
+    ({"windows": []}, "at least one window"),
+    ({"windows": [{"start": "2030-01-02T10:00", "end": "2030-01-02T09:00"}]}, "ends before it starts"),
+    ({"windows": [{"start": "2030-01-02T09:00", "end": "2030-01-02T10:00"},
+                  {"start": "2030-01-02T09:30", "end": "2030-01-02T11:00"}]}, "overlap"),
+    ({"windows": [{"start": "tomorrow", "end": "2030-01-02T09:00"}]}, "ISO 8601"),
+    ({"rooms": {"R1": 0}}, "positive integers"),
+    ({"panels": [{"name": "P1", "room": "R9"}]}, "undefined rooms: R9"),
+    ({"panels": [{"name": "P1", "room": "R1"}, {"name": "P1", "room": "R1"}]}, "unique"),
+    ({"panels": None}, "malformed plan"),
+])
+def test_malformed_plans_are_rejected(data, message):
+    base = {"slot_minutes": 30, "windows": [{"start": "2030-01-02T09:00", "end": "2030-01-02T10:00"}],
+            "rooms": {"R1": 1}, "panels": [{"name": "P1", "room": "R1"}]}
+    with pytest.raises(PlanError, match=message):
+        InterviewPlan.from_dict({**base, **data})
+
+
+def test_plan_round_trips_through_dict():
+    p = plan(buffer_minutes=10)
+    assert InterviewPlan.from_dict(p.to_dict()).to_dict() == p.to_dict()
+
+
+def test_seats_are_limited_by_room_capacity():
+    p = plan(panels=(("P1", "R1"), ("P2", "R1"), ("P3", "R2")), rooms={"R1": 1, "R2": 2})
+    assert p.seats() == [("R1", "P1"), ("R2", "P3")]
+
+
+def test_slots_fit_inside_windows_and_skip_the_past():
+    p = plan(windows=(("09:00", "10:10"), ("11:00", "11:30")))
+    assert [s for s, _ in p.slots()] == [at(9), at(9, 30), at(11)]
+    assert [s for s, _ in p.slots(not_before=at(9, 15))] == [at(9, 30), at(11)]
+
+
+def test_merge_intervals_joins_overlapping_and_touching():
+    assert merge_intervals([(3, 4), (1, 2), (2, 3), (6, 7)]) == [[1, 4], [6, 7]]
+
+
+def test_free_slot_indexes_pads_busy_intervals():
+    slots = [(0, 10), (10, 20), (20, 30), (30, 40)]
+    assert free_slot_indexes(slots, [[12, 18]], 0) == [0, 2, 3]
+    assert free_slot_indexes(slots, [[12, 18]], 3) == [3]
+
+
+def test_schedule_respects_busy_intervals_and_priority():
+    p = plan(windows=(("09:00", "10:00"),))
+    assigned, unassigned = schedule(p, ["a", "b", "c"], busy={"a": [(at(9), at(9, 30))]})
+    assert assigned == {"a": (at(9, 30), at(10), "R1", "P1"), "b": (at(9), at(9, 30), "R1", "P1")}
+    assert unassigned == ["c"]
+
+
+def test_schedule_shifts_earlier_picks_to_seat_everyone():
+    # Greedy alone seats b at 9:00 and leaves no slot for a, who is free only at 9:00
+    p = plan(windows=(("09:00", "10:00"),))
+    assigned, unassigned = schedule(p, ["b", "a"], busy={"a": [(at(9, 30), at(10))]})
+    assert assigned["a"][0] == at(9) and assigned["b"][0] == at(9, 30)
+    assert unassigned == []
+
+
+def test_schedule_keeps_fixed_seats_and_common_busy_time():
+    p = plan(windows=(("09:00", "10:30"),), panels=(("P1", "R1"), ("P2", "R1")), rooms={"R1": 2})
+    assigned, unassigned = schedule(p, ["a", "b", "c"], common_busy=[(at(10), at(10, 30))],
+                                    fixed=[(at(9), "P1"), (at(9), "P2"), (at(9, 30), "P1")])
+    assert assigned == {"a": (at(9, 30), at(10), "R1", "P2")}
+    assert unassigned == ["b", "c"]
+
+
+def test_schedule_pads_candidate_busy_time_by_the_buffer():
+    busy = {"a": [(at(9, 35), at(9, 40))]}
+    assert schedule(plan(windows=(("09:00", "10:30"),)), ["a"], busy)[0]["a"][0] == at(9)
+    assert schedule(plan(windows=(("09:00", "10:30"),), buffer_minutes=15), ["a"], busy)[0]["a"][0] == at(10)
+
+
+@pytest.fixture
+def run_queue(app1, monkeypatch):
+    runs = queue.Queue()
+    monkeypatch.setattr(app1, "INTERVIEW_RUN_QUEUE", runs)
+    monkeypatch.setattr(app1, "interview_runs_pending", set())
+    with app1.tenants.use(app1.TENANTS.default):
+        yield runs
+
+
+def test_triggers_for_a_job_share_one_queued_run(app1, run_queue, monkeypatch):
+    for job_id in (5, 5, 6, 5):
+        app1.schedule_job_interviews_in_background(job_id)
+    assert [job_id for _, job_id in run_queue.queue] == [5, 6]
+
+    seated = []
+    monkeypatch.setattr(app1, "schedule_job_interviews", lambda job_id: seated.append(job_id))
+    app1.run_queued_interview_schedule(*run_queue.get())
+    # A shortlist committed after the run started needs a run of its own
+    app1.schedule_job_interviews_in_background(5)
+    assert seated == [5]
+    assert [job_id for _, job_id in run_queue.queue] == [6, 5]
+
+
+def test_runs_wait_for_each_other_before_connecting(app1, monkeypatch):
+    connections = []
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: connections.append(1))
+    monkeypatch.setitem(app1.app.config, "INTERVIEW_LOCK_TIMEOUT", 0.01)
+    monkeypatch.setattr(app1, "interview_run_locks", {})
+    with app1.tenants.use(app1.TENANTS.default):
+        slug = app1.current_tenant().slug
+        app1.interview_run_locks[slug] = threading.Lock()
+        with app1.interview_run_locks[slug]:
+            with pytest.raises(RuntimeError, match="still in progress"):
+                app1.schedule_job_interviews(5)
+    assert connections == []
+
+
+def test_peak_overlap():
+    intervals = [(at(9), at(9, 30)), (at(9, 15), at(10)), (at(9, 30), at(10))]
+    assert peak_overlap(intervals, at(9), at(9, 30)) == 2
+    assert peak_overlap(intervals, at(9, 30), at(10)) == 2
+    assert peak_overlap(intervals, at(10), at(11)) == 0
+
+
+def test_schedule_leaves_room_for_other_jobs_interviews():
+    p = plan(panels=(("P1", "R1"), ("P2", "R1")), rooms={"R1": 2})
+    # Another job holds one of the room's two seats at 09:00 and both at 09:30
+    other = [(at(9), at(9, 30), "R1"), (at(9, 30), at(10), "R1"), (at(9, 30), at(10), "R1"), (at(9), at(10), "R9")]
+    assigned, unassigned = schedule(p, ["a", "b", "c"], room_busy=other)
+    assert assigned == {"a": (at(9), at(9, 30), "R1", "P1")}
+    assert unassigned == ["b", "c"]
+
+
+def test_room_capacity_counts_the_jobs_own_fixed_seats():
+    p = plan(panels=(("P1", "R1"), ("P2", "R1")), rooms={"R1": 2})
+    assigned, _ = schedule(p, ["a", "b"], fixed=[(at(9), "P1")], room_busy=[(at(9), at(9, 30), "R1")])
+    assert assigned == {"a": (at(9, 30), at(10), "R1", "P1"), "b": (at(9, 30), at(10), "R1", "P2")}
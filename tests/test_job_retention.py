@@ -0,0 +1,69 @@
+# tests/test_job_retention.py
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+RETENTION_DAYS = 180
+
+
+@pytest.fixture
+def jobs_db(app1, sqlite_db, monkeypatch):
+    sqlite_db.executescript("""
+        CREATE TABLE jobs (job_id INTEGER PRIMARY KEY, deadline DATE);
+        CREATE TABLE applications (application_id INTEGER PRIMARY KEY, job_id INTEGER, applied_date DATETIME);
+    """)
+    for name in ("ensure_archive_tables", "ensure_archive_views", "semantic_delete"):
+        monkeypatch.setattr(app1, name, lambda *args: None)
+    monkeypatch.setattr(app1, "search_index", lambda: SimpleNamespace(delete_jobs=None))
+    monkeypatch.setattr(app1, "sync_search_index", lambda *args: None)
+    monkeypatch.setattr(app1, "measure_hot_tables", lambda conn: {"jobs_rows": 0, "applications_rows": 0})
+    return sqlite_db
+
+
+def days_ago(days):
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def add_job(db, job_id, deadline_days_ago, *applied_days_ago):
+    db.execute("INSERT INTO jobs VALUES (?, ?)", (job_id, days_ago(deadline_days_ago)))
+    db.executemany("INSERT INTO applications (job_id, applied_date) VALUES (?, ?)",
+                   [(job_id, days_ago(days) + " 10:30:00") for days in applied_days_ago])
+    db.commit()
+
+
+def expired(app1, chunk_size=10):
+    cutoff = date.today() - timedelta(days=RETENTION_DAYS)
+    return app1.expired_job_ids(app1.get_db_connection().cursor(), cutoff, chunk_size)
+
+
+def test_jobs_past_the_window_expire_and_the_boundary_day_is_kept(app1, jobs_db):
+    add_job(jobs_db, 1, RETENTION_DAYS + 1)
+    add_job(jobs_db, 2, RETENTION_DAYS)
+    add_job(jobs_db, 3, 0)
+    assert expired(app1) == [1]
+
+
+def test_jobs_with_applications_inside_the_window_are_kept(app1, jobs_db):
+    add_job(jobs_db, 1, RETENTION_DAYS + 30, RETENTION_DAYS + 40)
+    add_job(jobs_db, 2, RETENTION_DAYS + 30, RETENTION_DAYS + 40, RETENTION_DAYS)
+    add_job(jobs_db, 3, RETENTION_DAYS + 30, 5)
+    assert expired(app1) == [1]
+
+
+def test_archive_moves_expired_jobs_in_chunks(app1, jobs_db, monkeypatch):
+    chunks = []
+
+    def move_to_archive(cursor, steps, ids, params):
+        chunks.append(params)
+        cursor.execute(f"DELETE FROM jobs WHERE job_id IN ({ids})", params)
+    monkeypatch.setattr(app1, "move_to_archive", move_to_archive)
+    for job_id in (1, 2, 3):
+        add_job(jobs_db, job_id, RETENTION_DAYS + job_id)
+    add_job(jobs_db, 4, RETENTION_DAYS + 1, 1)
+
+    report = app1.archive_expired_jobs(app1.get_db_connection(), RETENTION_DAYS, chunk_size=2)
+
+    assert chunks == [(1, 2), (3,)]
+    assert report["archived_jobs"] == 3
+    assert [row[0] for row in jobs_db.execute("SELECT job_id FROM jobs")] == [4]
@@ -0,0 +1,105 @@
+# tests/test_json_provider.py
+import decimal
+import json
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import json_provider
+
+
+class RowsCursor:
+    """An unbuffered cursor over canned rows"""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.fetched = 0
+        self.closed = False
+
+    def fetchmany(self, size):
+        batch = self.rows[self.fetched:self.fetched + size]
+        self.fetched += len(batch)
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+class RowsConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.closed = False
+
+    def cursor(self, *args, **kwargs):
+        return self._cursor
+
+    def close(self):
+        self.closed = True
+
+
+def test_dumps_is_compact_sorted_and_encodes_row_values():
+    row = {"b": decimal.Decimal("81.50"), "a": date(2030, 1, 2), "c": datetime(2030, 1, 2, 3, 4),
+           "d": timedelta(hours=1), "e": uuid.UUID(int=1), "f": b"caf\xc3\xa9", "g": "é"}
+    assert json_provider.dumps(row) == (
+        '{"a":"2030-01-02","b":"81.50","c":"2030-01-02T03:04:00","d":"1:00:00",'
+        '"e":"00000000-0000-0000-0000-000000000001","f":"café","g":"é"}')
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        json_provider.dumps({"a": object()})
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 4, 7])
+def test_stream_json_array_is_one_valid_array(count):
+    rows = [{"n": i} for i in range(count)]
+    body = b"".join(json_provider.stream_json_array(iter(rows), batch_rows=3))
+    assert json.loads(body) == rows
+
+
+def test_iter_cursor_rows_fetches_in_batches():
+    cursor = RowsCursor({"n": i} for i in range(5))
+    rows = json_provider.iter_cursor_rows(cursor, batch_rows=2)
+    assert next(rows) == {"n": 0}
+    assert cursor.fetched == 2
+    assert len(list(rows)) == 4
+
+
+def test_flask_responses_use_the_provider(app1):
+    with app1.app.test_request_context():
+        response = app1.jsonify({"b": 1, "a": decimal.Decimal("1.0")})
+    assert response.get_data() == b'{"a":"1.0","b":1}\n'
+
+
+def test_stream_rows_releases_the_connection_after_a_full_read(app1):
+    cursor = RowsCursor({"n": i} for i in range(3))
+    conn = RowsConnection(cursor)
+    with app1.app.test_request_context():
+        response = app1.stream_rows(conn, cursor)
+        assert json.loads(response.get_data()) == [{"n": 0}, {"n": 1}, {"n": 2}]
+    response.close()
+    assert cursor.closed and conn.closed
+
+
+def test_stream_rows_drains_unread_rows_when_the_client_disconnects(app1):
+    cursor = RowsCursor({"n": i} for i in range(3 * json_provider.STREAM_BATCH_ROWS))
+    conn = RowsConnection(cursor)
+    with app1.app.test_request_context():
+        response = app1.stream_rows(conn, cursor)
+        body = iter(response.response)
+        next(body)
+        next(body)
+    response.close()
+    assert cursor.fetched == len(cursor.rows)
+    assert cursor.closed and conn.closed
+
+
+def test_stream_rows_releases_a_response_that_is_never_read(app1):
+    cursor = RowsCursor([{"n": 1}])
+    conn = RowsConnection(cursor)
+    with app1.app.test_request_context():
+        response = app1.stream_rows(conn, cursor)
+    response.close()
+    assert cursor.fetched == 1
+    assert cursor.closed and conn.closed
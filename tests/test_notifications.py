@@ -0,0 +1,165 @@
+# tests/test_notifications.py
+from contextlib import contextmanager
+
+import pytest
+
+import tenants
+
+
+class FakeSMTP:
+    """Collects sent messages; sending to a recipient in `failing` raises"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+
+    def send(self, message):
+        if message.recipients[0] in self.failing:
+            raise OSError("mailbox unavailable")
+        self.sent.append(message)
+
+
+@pytest.fixture
+def clock(app1, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(app1.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def outbox(app1, sqlite_db, monkeypatch, clock):
+    sqlite_db.execute("""
+        CREATE TABLE email_outbox (
+            id INTEGER PRIMARY KEY, recipient TEXT NOT NULL, kind TEXT, subject TEXT NOT NULL, body TEXT NOT NULL,
+            dedupe_key TEXT UNIQUE, sent_at TEXT, attempts INTEGER DEFAULT 0, last_error TEXT
+        )
+    """)
+    monkeypatch.setattr(app1, "ensure_outbox_table", lambda cursor: None)
+    monkeypatch.setattr(app1, "MAIL_RATE_LIMITER", app1.SendRateLimiter(10))
+    smtp = FakeSMTP()
+
+    @contextmanager
+    def connect():
+        yield smtp
+    monkeypatch.setattr(app1.mail, "connect", connect)
+    return sqlite_db, smtp
+
+
+def queue(db, *rows):
+    db.executemany("INSERT INTO email_outbox (recipient, subject, body) VALUES (?, ?, ?)", rows)
+    db.commit()
+
+
+def outbox_rows(db):
+    return [dict(row) for row in db.execute("SELECT id, recipient, sent_at, attempts, last_error FROM email_outbox "
+                                            "ORDER BY id")]
+
+
+def test_build_digest(app1):
+    assert app1.build_digest([{"subject": "S", "body": "B"}]) == ("S", "B")
+    subject, body = app1.build_digest([{"subject": "S1", "body": "B1"}, {"subject": "S2", "body": "B2"}])
+    assert subject == "Placement updates (2)"
+    assert body.splitlines() == ["You have 2 placement updates:", "", "- S1", "  B1", "- S2", "  B2"]
+
+
+def test_rate_limiter_window_slides(app1, clock):
+    limiter = app1.SendRateLimiter(2)
+    limiter.record()
+    clock[0] += 30
+    limiter.record()
+    assert limiter.allowance() == 0
+    clock[0] += 31
+    assert limiter.allowance() == 1
+    clock[0] += 30
+    assert limiter.allowance() == 2
+
+
+def test_each_recipient_gets_one_digest(app1, outbox):
+    db, smtp = outbox
+    queue(db, ("a@x.edu", "S1", "B1"), ("b@x.edu", "S2", "B2"), ("a@x.edu", "S3", "B3"))
+
+    assert app1.send_outbox_batch() == 2
+
+    assert sorted(m.recipients[0] for m in smtp.sent) == ["a@x.edu", "b@x.edu"]
+    assert all(row["sent_at"] for row in outbox_rows(db))
+
+
+def test_sends_stop_at_the_rate_limit(app1, outbox, clock, monkeypatch):
+    db, smtp = outbox
+    monkeypatch.setattr(app1, "MAIL_RATE_LIMITER", app1.SendRateLimiter(1))
+    queue(db, ("a@x.edu", "S1", "B1"), ("b@x.edu", "S2", "B2"))
+
+    assert app1.send_outbox_batch() == 1
+    assert app1.send_outbox_batch() == 0
+    assert len([row for row in outbox_rows(db) if row["sent_at"]]) == 1
+
+    clock[0] += 61
+    assert app1.send_outbox_batch() == 1
+    assert len(smtp.sent) == 2
+
+
+def test_a_failed_send_stays_pending_with_its_attempt_counted(app1, outbox):
+    db, smtp = outbox
+    smtp.failing.add("b@x.edu")
+    queue(db, ("a@x.edu", "S1", "B1"), ("b@x.edu", "S2", "B2"))
+
+    assert app1.send_outbox_batch() == 1
+
+    sent, failed = outbox_rows(db)
+    assert sent["sent_at"] and sent["attempts"] == 0
+    assert failed["sent_at"] is None
+    assert (failed["attempts"], failed["last_error"]) == (1, "mailbox unavailable")
+
+
+def test_rows_out_of_attempts_are_not_retried(app1, outbox):
+    db, smtp = outbox
+    queue(db, ("a@x.edu", "S1", "B1"))
+    db.execute("UPDATE email_outbox SET attempts = ?", (app1.app.config["MAIL_MAX_ATTEMPTS"],))
+    db.commit()
+
+    assert app1.send_outbox_batch() == 0
+    assert smtp.sent == []
+
+
+class LockCursor:
+    def __init__(self, acquired):
+        self.acquired = acquired
+        self.statements = []
+
+    def execute(self, sql, params=()):
+        self.statements.append(sql.split("(")[0])
+
+    def fetchone(self):
+        return (self.acquired,)
+
+    def close(self):
+        pass
+
+
+class LockConnection:
+    def __init__(self, cursor):
+        self.cursor_ = cursor
+
+    def cursor(self, *args, **kwargs):
+        return self.cursor_
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("acquired", [0, 1])
+def test_only_the_lock_holder_sends(app1, monkeypatch, acquired):
+    cursor = LockCursor(acquired)
+    batches = []
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: LockConnection(cursor))
+    monkeypatch.setattr(app1, "enqueue_scheduled_reminders", lambda cursor: None)
+    monkeypatch.setattr(app1, "send_outbox_batch", lambda: batches.append(1))
+
+    with tenants.use(tenants.Tenant("main", {"database": "placement_erp"})):
+        app1.send_notifications()
+
+    assert batches == [1] * acquired
+    assert cursor.statements == ["SELECT GET_LOCK"] + ["SELECT RELEASE_LOCK"] * acquired
@@ -0,0 +1,52 @@
+# tests/test_profiler.py
+import threading
+import time
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+def test_sampler_catches_a_busy_function_in_speedscope_form(app1):
+    sampler = app1.StackSampler(threading.get_ident(), 0.002)
+    sampler.start()
+    busy_loop(0.2)
+    sampler.stop()
+
+    doc = sampler.to_speedscope("GET /busy", 0.2, {"route": "/busy"})
+
+    assert doc["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    assert doc["metadata"] == {"route": "/busy"}
+    frames = doc["shared"]["frames"]
+    assert all(set(frame) == {"name", "file", "line"} for frame in frames)
+    assert len({(f["name"], f["file"], f["line"]) for f in frames}) == len(frames)
+
+    profile, = doc["profiles"]
+    assert (profile["type"], profile["unit"], profile["startValue"], profile["endValue"]) == ("sampled", "seconds", 0, 0.2)
+    samples = profile["samples"]
+    assert len(samples) > 5
+    assert profile["weights"] == [0.002] * len(samples)
+    assert all(0 <= index < len(frames) for stack in samples for index in stack)
+
+    busy = next(i for i, frame in enumerate(frames) if frame["name"] == "busy_loop")
+    assert frames[busy]["file"] == __file__
+    assert sum(stack[-1] == busy for stack in samples) > len(samples) / 2
+    # Stacks run from the outermost frame to the innermost one
+    test = next(i for i, frame in enumerate(frames)
+                if frame["name"] == "test_sampler_catches_a_busy_function_in_speedscope_form")
+    assert all(stack.index(test) < stack.index(busy) for stack in samples if busy in stack)
+
+
+def test_samples_share_frames(app1):
+    sampler = app1.StackSampler(0, 0.01)
+    sampler.samples = [[("main", "a.py", 1), ("work", "a.py", 5)], [("main", "a.py", 1), ("idle", "a.py", 9)]]
+
+    doc = sampler.to_speedscope("x", 0.02, {})
+
+    assert [f["name"] for f in doc["shared"]["frames"]] == ["main", "work", "idle"]
+    assert doc["profiles"][0]["samples"] == [[0, 1], [0, 2]]
+    assert doc["profiles"][0]["weights"] == [0.01, 0.01]
@@ -0,0 +1,39 @@
+# tests/test_reparse.py
+PARSED = {"name": "Parsed Person", "email": "parsed@x.edu", "mobile_number": "9999999999",
+          "skills": ["Go"], "projects": ["Parser"], "certifications": ["Cert"]}
+
+
+def profile(db, student_id=7):
+    return dict(db.execute("SELECT * FROM student_profile WHERE student_id = ?", (student_id,)).fetchone())
+
+
+def apply_parse(app1, db, student_id=7):
+    conn = app1.get_db_connection()
+    app1.apply_parse_to_profile(conn.cursor(), student_id, PARSED)
+    conn.commit()
+
+
+def test_a_profile_saved_by_the_student_is_never_overwritten(app1, client, store, profile_db):
+    with client.session_transaction() as sess:
+        sess["role"] = "student"
+        sess["user_id"] = 7
+    form = dict.fromkeys(app1.STUDENT_PROFILE_FIELDS, "")
+    form.update(first_name="Asha", last_name="Rao", email="asha@x.edu", phone="", programming_languages="Python")
+
+    client.post("/student/profile", data=form)
+    saved = profile(profile_db)
+    assert saved["edited_by_student"] == 1
+
+    apply_parse(app1, profile_db)
+    assert profile(profile_db) == saved
+
+
+def test_parses_only_fill_empty_columns_of_unedited_profiles(app1, profile_db):
+    profile_db.execute("INSERT INTO student_profile (student_id, first_name, email, phone) "
+                       "VALUES (7, 'Asha', 'asha@x.edu', '')")
+
+    apply_parse(app1, profile_db)
+
+    filled = profile(profile_db)
+    assert (filled["first_name"], filled["email"]) == ("Asha", "asha@x.edu")
+    assert (filled["last_name"], filled["phone"], filled["programming_languages"]) == ("Person", "9999999999", "Go")
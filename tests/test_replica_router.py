@@ -0,0 +1,124 @@
+# tests/test_replica_router.py
+import pytest
+from flask import Response, g, session
+
+from replica_router import ReplicaRouter
+
+HEALTHY = {"Seconds_Behind_Source": 0, "Replica_IO_Running": "Yes", "Replica_SQL_Running": "Yes"}
+
+
+class StatusCursor:
+    def __init__(self, status):
+        self.status = status
+
+    def execute(self, sql, params=()):
+        pass
+
+    def fetchone(self):
+        return self.status
+
+    def close(self):
+        pass
+
+
+class StatusConnection:
+    def __init__(self, status):
+        self.status = status
+
+    def cursor(self, *args, **kwargs):
+        return StatusCursor(self.status)
+
+    def close(self):
+        pass
+
+
+def router(statuses, max_lag=5):
+    """A router over one replica per host in statuses, whose checks report those statuses"""
+    def connect(host, **config):
+        status = statuses[host]
+        if isinstance(status, Exception):
+            raise status
+        return StatusConnection(status)
+    router = ReplicaRouter([{"host": host} for host in statuses], connect, max_lag)
+    router.check_all()
+    return router
+
+
+@pytest.mark.parametrize("status, error", [
+    (None, "replication is not configured"),
+    ({**HEALTHY, "Replica_SQL_Running": "No"}, "replication stopped (io=Yes, sql=No)"),
+    ({**HEALTHY, "Seconds_Behind_Source": None}, "replication lag unknown"),
+    ({**HEALTHY, "Seconds_Behind_Source": 9}, "lag 9s exceeds 5s"),
+    (ConnectionError("refused"), "refused"),
+])
+def test_unhealthy_replicas_are_not_chosen(status, error):
+    r = router({"db1": status})
+    assert r.choose() is None
+    assert r.status()[0]["error"] == error
+
+
+def test_choose_round_robins_over_healthy_replicas():
+    r = router({"db1": HEALTHY, "db2": {"Seconds_Behind_Master": 1, "Slave_IO_Running": "Yes",
+                                        "Slave_SQL_Running": "Yes"}, "db3": None})
+    assert sorted(r.choose()["name"] for _ in range(4)) == ["db1:3306", "db1:3306", "db2:3306", "db2:3306"]
+
+
+def test_mark_down_until_the_next_check():
+    r = router({"db1": HEALTHY})
+    r.mark_down(r.replicas[0], "gone")
+    assert r.choose() is None
+    r.check_all()
+    assert r.choose()["name"] == "db1:3306"
+
+
+@pytest.fixture
+def replicas(app1, monkeypatch):
+    monkeypatch.setattr(app1.REPLICA_ROUTER, "replicas", [{"name": "db1:3306"}])
+
+
+@pytest.mark.parametrize("user_id, committed, status, sticky", [
+    (7, True, 302, True),
+    (7, False, 302, False),
+    (7, True, 400, False),
+    (None, True, 302, False),
+])
+def test_only_committed_writes_of_logged_in_users_stick_to_the_primary(app1, replicas, user_id, committed,
+                                                                     status, sticky):
+    with app1.app.test_request_context("/login", method="POST"):
+        if user_id is not None:
+            session["user_id"] = user_id
+        if committed:
+            g.db_committed = True
+        app1.stick_to_primary_after_write(Response(status=status))
+        assert ("db_primary_until" in session) is sticky
+
+
+def test_commit_is_recorded_on_the_request(app1):
+    class Committing:
+        def commit(self):
+            pass
+
+    with app1.app.test_request_context("/", method="POST"):
+        app1.InstrumentedConnection(Committing()).commit()
+        assert g.db_committed
+
+
+def test_read_only_views_run_no_ddl(app1, client, store, sqlite_db, monkeypatch):
+    def ddl(cursor):
+        raise AssertionError("DDL on a read path")
+    monkeypatch.setattr(app1, "ensure_interview_tables", ddl)
+    monkeypatch.setattr(app1, "ensure_eligibility_table", ddl)
+    sqlite_db.executescript("""
+        CREATE TABLE interview_slots (slot_id INTEGER, job_id INTEGER, student_id INTEGER, starts_at TEXT,
+                                      ends_at TEXT, room TEXT, panel TEXT, status TEXT);
+        CREATE TABLE jobs (job_id INTEGER, title TEXT);
+        CREATE TABLE students (student_id INTEGER, branch TEXT, cgpa REAL);
+        CREATE TABLE student_eligibility (student_id INTEGER, branch_code TEXT, effective_cgpa REAL);
+        CREATE TABLE student_profile (student_id INTEGER, department TEXT, average REAL);
+    """)
+    with client.session_transaction() as sess:
+        sess["role"] = "student"
+        sess["user_id"] = 7
+
+    assert client.get("/my_interviews").get_json() == []
+    assert client.get("/dashboard_bootstrap?fields=jobs").get_json() == {"jobs": []}
@@ -0,0 +1,95 @@
+# tests/test_resume_fingerprint.py
+import resume_fingerprint as rf
+
+RESUME = ("Asha Rao. Computer engineering student with internships in backend development, "
+          "Python, Flask and MySQL. Built a placement portal, a chat service and a compiler project. "
+          "Contributed to open source data tooling and led the college coding club for two years.")
+
+
+def test_signature_ignores_case_and_formatting():
+    assert rf.minhash_signature(RESUME) == rf.minhash_signature("  " + RESUME.upper().replace(" ", "\n"))
+
+
+def test_empty_text_has_no_signature():
+    assert rf.minhash_signature("") is None
+    assert rf.minhash_signature("  ,. ") is None
+
+
+def test_near_duplicates_share_a_band_and_score_high():
+    original = rf.minhash_signature(RESUME)
+    edited = rf.minhash_signature(RESUME.replace("two years", "three years"))
+    assert rf.estimate_similarity(original, edited) >= rf.DUPLICATE_THRESHOLD
+    assert set(rf.band_hashes(original)) & set(rf.band_hashes(edited))
+
+
+def test_unrelated_resumes_score_low():
+    other = rf.minhash_signature("Mechanical engineering graduate experienced in CAD, thermal analysis, "
+                                 "manufacturing lines and quality audits at an automotive supplier.")
+    assert rf.estimate_similarity(rf.minhash_signature(RESUME), other) < 0.2
+
+
+def test_band_hashes_fit_a_signed_bigint():
+    bands = rf.band_hashes(rf.minhash_signature(RESUME))
+    assert [band for band, _ in bands] == list(range(rf.BANDS))
+    assert all(0 <= bucket < 2 ** 63 for _, bucket in bands)
+
+
+def test_signature_round_trips_through_blob():
+    signature = rf.minhash_signature(RESUME)
+    assert rf.unpack_signature(rf.pack_signature(signature)) == signature
+
+
+def test_cluster_pairs_joins_transitive_duplicates():
+    clusters = rf.cluster_pairs([(1, 2), (2, 3), (7, 8)])
+    assert sorted(clusters) == [[1, 2, 3], [7, 8]]
+
+
+class ResumeCursor:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(" ".join(sql.split()))
+
+    def fetchone(self):
+        return ("asha_resume.pdf",)
+
+    def close(self):
+        pass
+
+
+class ResumeConnection:
+    def __init__(self):
+        self.cursor_ = ResumeCursor()
+        self.committed_after = None
+
+    def cursor(self, *args, **kwargs):
+        return self.cursor_
+
+    def commit(self):
+        self.committed_after = len(self.cursor_.statements)
+
+    def close(self):
+        pass
+
+
+def test_delete_resume_drops_fingerprint_bands_and_pairs(app1, client, store, monkeypatch):
+    conn = ResumeConnection()
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: conn)
+    monkeypatch.setattr(app1, "semantic_delete", lambda collection, ids: None)
+    with client.session_transaction() as sess:
+        sess["role"] = "student"
+        sess["user_id"] = 7
+
+    client.post("/delete_resume")
+
+    committed = conn.cursor_.statements[:conn.committed_after]
+    for table in ("resume_lsh_bands", "resume_duplicate_pairs", "resume_fingerprints",
+                  "resume_parses", "resume_texts"):
+        assert any(s.startswith(f"DELETE FROM {table} WHERE") for s in committed), table
+
+
+def test_reprocessing_jobs_read_only_live_resumes(app1):
+    for sql in app1.MATCH_INDEX_SOURCES["resumes"]:
+        assert app1.LIVE_RESUME_TEXTS in sql
+    assert "s.resume_path IS NOT NULL" in app1.LIVE_RESUME_TEXTS
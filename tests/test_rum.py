@@ -0,0 +1,54 @@
+# tests/test_rum.py
+import pytest
+
+RENDER_KEY = ("erp_client_render_seconds", (("mode", "bootstrap"), ("page", "student")))
+
+
+@pytest.fixture
+def metrics(app1, monkeypatch):
+    metrics = app1.Metrics()
+    monkeypatch.setattr(app1, "METRICS", metrics)
+    monkeypatch.setattr(app1, "ADMISSION_BUCKETS", app1.create_bucket_store("memory", None))
+    return metrics
+
+
+def log_in(client, role="student"):
+    with client.session_transaction() as sess:
+        sess["role"] = role
+        sess["user_id"] = 7
+
+
+def beacon(client, **payload):
+    return client.post("/rum", json={"page": "student", "mode": "bootstrap", "ms": 850, **payload})
+
+
+def test_rum_rejects_anonymous_beacons(client, store, metrics):
+    assert beacon(client).status_code == 403
+    assert RENDER_KEY not in metrics._histograms
+
+
+def test_rum_only_accepts_the_users_own_dashboard(client, store, metrics):
+    log_in(client)
+    assert beacon(client, page="tpo").status_code == 400
+
+
+@pytest.mark.parametrize("ms", ["-1", "nan", "inf", "soon"])
+def test_rum_rejects_invalid_timings(client, store, metrics, ms):
+    log_in(client)
+    assert beacon(client, ms=ms).status_code == 400
+
+
+def test_rum_clamps_long_timings(app1, client, store, metrics):
+    log_in(client)
+    assert beacon(client).status_code == 204
+    assert beacon(client, ms=3_600_000).status_code == 204
+    _, total, count = metrics._histograms[RENDER_KEY]
+    assert count == 2
+    assert total == pytest.approx(0.85 + app1.app.config["RUM_MAX_SECONDS"])
+
+
+def test_rum_is_rate_limited_per_user(app1, client, store, metrics):
+    log_in(client)
+    _, burst = app1.app.config["RUM_RATE_LIMIT"]
+    statuses = [beacon(client).status_code for _ in range(burst + 1)]
+    assert statuses == [204] * burst + [429]
@@ -0,0 +1,72 @@
+# tests/test_search_index.py
+import sqlite3
+
+import pytest
+
+from search_index import SearchIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.sqlite3"))
+    index.rebuild([
+        {"job_id": 1, "title": "Python developer", "company_id": 10, "company_name": "Acme",
+         "deadline": "2030-01-01", "status": "active"},
+        {"job_id": 2, "title": "Python intern", "company_id": 20, "company_name": "Globex",
+         "deadline": "2030-01-01", "status": None},
+        {"job_id": 3, "title": "Python analyst", "company_id": 30, "company_name": "Initech",
+         "deadline": "2030-01-01", "status": "inactive"},
+        {"job_id": 4, "title": "Python lead", "company_id": 10, "company_name": "Acme",
+         "deadline": "2001-01-01", "status": "active"},
+    ], [{"resource_id": 1, "title": "Python interview guide"}])
+    return index
+
+
+def job_ids(index, text="pyth", **kwargs):
+    hits, _ = index.search_jobs(text, **kwargs)
+    return sorted(hit["job_id"] for hit in hits)
+
+
+def test_build_match_query_prefixes_every_term():
+    assert SearchIndex.build_match_query('data "sci') == '"data"* "sci"*'
+    assert SearchIndex.build_match_query("  ") == ""
+
+
+def test_search_jobs_matches_prefixes(index):
+    assert job_ids(index) == [1, 2, 3, 4]
+    assert job_ids(index, "python dev") == [1]
+
+
+def test_active_only_skips_jobs_of_inactive_recruiters(index):
+    assert job_ids(index, active_only=True) == [1, 2, 4]
+    assert job_ids(index, active_only=True, min_deadline="2026-01-01") == [1, 2]
+
+
+def test_set_recruiter_active_toggles_all_their_jobs(index):
+    index.set_recruiter_active(10, False)
+    assert job_ids(index, active_only=True) == [2]
+    index.set_recruiter_active(30, True)
+    assert job_ids(index, active_only=True) == [2, 3]
+
+
+def test_search_pages_with_has_more(index):
+    first, more = index.search_jobs("pyth", limit=3)
+    second, last_more = index.search_jobs("pyth", limit=3, offset=3)
+    assert more and not last_more
+    assert len(first) == 3 and len(second) == 1
+    assert {h["job_id"] for h in first + second} == {1, 2, 3, 4}
+
+
+def test_index_without_recruiter_columns_is_recreated(tmp_path):
+    path = str(tmp_path / "old.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE VIRTUAL TABLE jobs_fts USING fts5(title, description, location, company_name, deadline UNINDEXED)")
+    conn.execute("INSERT INTO jobs_fts (rowid, title) VALUES (1, 'Python developer')")
+    conn.commit()
+    conn.close()
+
+    index = SearchIndex(path)
+
+    assert index.is_empty()
+    index.upsert_job({"job_id": 1, "title": "Python developer", "company_id": 10})
+    assert job_ids(index, active_only=True) == [1]
@@ -0,0 +1,81 @@
+# tests/test_semantic_index.py
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("hnswlib")
+
+from semantic_index import VectorStore
+
+DIM = 8
+
+
+def unit(seed):
+    vector = np.random.default_rng(seed).standard_normal(DIM).astype("float32")
+    return vector / np.linalg.norm(vector)
+
+
+def add(store, *item_ids, seed=0):
+    store.add(list(item_ids), np.stack([unit(seed + i) for i in item_ids]))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return VectorStore(str(tmp_path), "resumes", DIM, initial_capacity=4)
+
+
+def test_readding_an_id_overwrites_its_row(store):
+    add(store, 1, 2, 3)
+    store.add([2], unit(99)[None, :])
+
+    assert store.count == 3
+    assert store.index.get_current_count() == 3
+    assert np.allclose(store.get(2), unit(99))
+    assert store.query(unit(99), k=1) == [(2, pytest.approx(1.0, abs=1e-3))]
+
+
+def test_new_ids_reuse_deleted_rows(store):
+    add(store, 1, 2, 3)
+    store.delete([1, 2])
+    add(store, 4, 5, 6)
+
+    assert store.count == 4
+    assert store.index.get_current_count() == 4
+    assert sorted(store.rows) == [3, 4, 5, 6]
+    assert {item_id for item_id, _ in store.query(unit(5), k=4)} == {3, 4, 5, 6}
+
+
+def test_duplicate_ids_in_one_batch_keep_the_last_vector(store):
+    store.add([7, 7], np.stack([unit(1), unit(2)]))
+    assert store.count == 1
+    assert np.allclose(store.get(7), unit(2))
+
+
+def test_grows_past_initial_capacity_and_reloads(tmp_path, store):
+    add(store, *range(1, 11))
+    store.delete([3])
+    store.flush()
+
+    reopened = VectorStore(str(tmp_path), "resumes", DIM, initial_capacity=4)
+
+    assert reopened.capacity == 16 and reopened.count == 10
+    assert reopened.free == [2]
+    assert reopened.query(unit(7), k=1)[0][0] == 7
+    assert reopened.get(3) is None
+
+
+def test_compact_renumbers_live_rows_and_shrinks_files(tmp_path, store):
+    add(store, *range(1, 11))
+    store.delete(list(range(1, 9)))
+    store.flush()
+    size_before = os.path.getsize(store.vectors_path)
+
+    assert store.compact() == 8
+
+    assert store.count == 2 and store.capacity == 4 and store.free == []
+    assert os.path.getsize(store.vectors_path) < size_before
+    assert sorted(store.rows.values()) == [0, 1]
+    assert store.query(unit(10), k=1)[0][0] == 10
+    reopened = VectorStore(str(tmp_path), "resumes", DIM, initial_capacity=4)
+    assert sorted(reopened.rows) == [9, 10]
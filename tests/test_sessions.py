@@ -0,0 +1,68 @@
+# tests/test_sessions.py
+import pytest
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.result = None
+
+    def execute(self, sql, params=None):
+        self.result = self.rows.pop(0) if self.rows else None
+
+    def fetchone(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self.rows)
+
+    def close(self):
+        pass
+
+
+def sid_of(client):
+    cookie = client.get_cookie("session")
+    return cookie.value if cookie else None
+
+
+def log_in(app1, client, monkeypatch):
+    student = {"user_id": 7, "name": "Asha", "email": "asha@example.com", "password": "pw"}
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: FakeConnection([student]))
+    return client.post("/login", data={"email": "asha@example.com", "password": "pw"})
+
+
+def test_login_issues_a_fresh_session_id(app1, client, store, monkeypatch):
+    with client.session_transaction() as sess:
+        sess["planted"] = True
+    planted_sid = sid_of(client)
+    store.save_item(planted_sid, "parsed_profile_data", {"phone": "999"})
+
+    response = log_in(app1, client, monkeypatch)
+
+    assert response.status_code == 302
+    sid = sid_of(client)
+    assert sid and sid != planted_sid
+    assert store.load(planted_sid) is None
+    assert store.load_item(planted_sid, "parsed_profile_data") is None
+    data, _ = store.load(sid)
+    assert data["user_id"] == 7 and "planted" not in data
+
+
+def test_logout_deletes_the_session(app1, client, store, monkeypatch):
+    log_in(app1, client, monkeypatch)
+    sid = sid_of(client)
+    store.save_item(sid, "parsed_profile_data", {"phone": "999"})
+
+    client.get("/logout")
+
+    assert store.load(sid) is None
+    assert store.load_item(sid, "parsed_profile_data") is None
+    assert sid_of(client) is None
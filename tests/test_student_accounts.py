@@ -0,0 +1,101 @@
+# tests/test_student_accounts.py
+import pytest
+from werkzeug.security import check_password_hash
+
+
+class StudentsCursor:
+    def __init__(self):
+        self.inserted = []
+        self.next_id = 100
+
+    def executemany(self, sql, rows):
+        self.inserted += rows
+
+    def execute(self, sql, params=()):
+        self.selected = [(self.next_id + i,) for i in range(len(params))]
+
+    def fetchall(self):
+        return self.selected
+
+    def close(self):
+        pass
+
+
+class StudentsConnection:
+    def __init__(self):
+        self.cursor_ = StudentsCursor()
+        self.commits = 0
+
+    def cursor(self, *args, **kwargs):
+        return self.cursor_
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def conn(app1, monkeypatch):
+    conn = StudentsConnection()
+    conn.snapshotted = []
+    monkeypatch.setattr(app1, "get_db_connection", lambda *args, **kwargs: conn)
+    monkeypatch.setattr(app1, "refresh_eligibility_snapshot", lambda c, ids: conn.snapshotted.extend(ids))
+    return conn
+
+
+def test_student_account_row_hashes_the_password_and_nulls_blanks(app1):
+    row = app1.student_account_row({"name": "Asha", "email": "asha@x.edu", "password": "s3cret",
+                                    "cgpa": "8.1", "passing_year": "", "branch": "CSE"})
+    assert row[:2] == ("Asha", "asha@x.edu")
+    assert check_password_hash(row[2], "s3cret")
+    assert row[3:] == ("8.1", None, "CSE", None)
+
+
+def test_student_account_row_makes_up_a_password_when_blank(app1):
+    row = app1.student_account_row({"name": "Asha", "email": "asha@x.edu", "password": ""})
+    assert row[2].startswith(("pbkdf2:", "scrypt:"))
+    assert not check_password_hash(row[2], "")
+
+
+def test_add_student_hashes_and_snapshots(app1, client, store, conn):
+    with client.session_transaction() as sess:
+        sess["role"] = "tpo"
+        sess["user_id"] = 1
+
+    client.post("/add_student", data={"name": "Asha", "email": "asha@x.edu", "password": "s3cret", "cgpa": "8.1"})
+
+    [row] = conn.cursor_.inserted
+    assert check_password_hash(row[2], "s3cret")
+    assert conn.snapshotted == [100]
+    assert conn.commits == 1
+
+
+def test_add_student_requires_name_and_email(app1, client, store, conn):
+    with client.session_transaction() as sess:
+        sess["role"] = "tpo"
+
+    client.post("/add_student", data={"name": "Asha"})
+
+    assert conn.cursor_.inserted == []
+
+
+def test_import_students_uses_the_same_helper(app1, conn, tmp_path, monkeypatch):
+    monkeypatch.setitem(app1.app.config, "CLI_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    csv_file = tmp_path / "students.csv"
+    csv_file.write_text("name,email,password,cgpa,passing_year,branch,phone\n"
+                        "Asha,asha@x.edu,s3cret,8.1,2026,CSE,\n"
+                        "Ravi,ravi@x.edu,,7.0,2026,IT,\n")
+
+    result = app1.app.test_cli_runner().invoke(args=["admin", "import-students", str(csv_file), "--chunk-size", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert [row[:2] for row in conn.cursor_.inserted] == [("Asha", "asha@x.edu"), ("Ravi", "ravi@x.edu")]
+    assert check_password_hash(conn.cursor_.inserted[0][2], "s3cret")
+    assert conn.cursor_.inserted[1][6] is None
+    assert conn.snapshotted == [100, 100]
+    assert conn.commits == 2
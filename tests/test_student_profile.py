@@ -0,0 +1,83 @@
+# tests/test_student_profile.py
+import decimal
+from datetime import date
+
+import pytest
+
+
+@pytest.mark.parametrize("current, value, changed", [
+    (None, "", False),
+    (None, None, False),
+    ("", None, True),
+    (None, "x", True),
+    ("x", "", True),
+    (decimal.Decimal("8.50"), "8.5", False),
+    (decimal.Decimal("8.50"), 8.5, False),
+    (decimal.Decimal("8.50"), "8.6", True),
+    (7, "seven", True),
+    (date(2004, 5, 6), "2004-05-06", False),
+    ("Asha", "Asha", False),
+    ("Asha", "asha", True),
+])
+def test_profile_value_changed(app1, current, value, changed):
+    assert app1.profile_value_changed(current, value) is changed
+
+
+@pytest.fixture
+def student(client, store, profile_db):
+    profile_db.execute("INSERT INTO student_profile (student_id, first_name, phone, row_version) "
+                       "VALUES (7, 'Asha', '111', 3)")
+    profile_db.commit()
+    with client.session_transaction() as sess:
+        sess["role"] = "student"
+        sess["user_id"] = 7
+    return profile_db
+
+
+def stored(db):
+    return dict(db.execute("SELECT * FROM student_profile WHERE student_id = 7").fetchone())
+
+
+def test_matching_version_saves_changed_fields_and_bumps_the_version(client, student):
+    response = client.patch("/student/profile", json={"row_version": 3, "fields": {"phone": "222", "first_name": "Asha"}})
+
+    assert response.status_code == 200
+    assert response.get_json() == {"row_version": 4, "updated": ["phone"], "refreshed": []}
+    row = stored(student)
+    assert (row["phone"], row["row_version"], row["edited_by_student"]) == ("222", 4, 1)
+
+
+def test_stale_version_is_a_conflict_and_changes_nothing(client, student):
+    response = client.patch("/student/profile", json={"row_version": 2, "fields": {"phone": "222"}})
+
+    assert response.status_code == 409
+    assert response.get_json()["row_version"] == 3
+    assert response.get_json()["profile"]["phone"] == "111"
+    assert stored(student)["phone"] == "111"
+
+
+def test_unchanged_fields_are_a_no_op(client, student):
+    before = stored(student)
+    response = client.patch("/student/profile", json={"row_version": 3, "fields": {"phone": "111", "gender": ""}})
+
+    assert response.get_json() == {"row_version": 3, "updated": [], "refreshed": []}
+    assert stored(student) == before
+
+
+def test_eligibility_fields_refresh_the_snapshot(app1, client, student, monkeypatch):
+    refreshed = []
+    monkeypatch.setattr(app1, "refresh_eligibility_snapshot", lambda conn, ids: refreshed.extend(ids))
+    response = client.patch("/student/profile", json={"row_version": 3, "fields": {"sem1": "9.1"}})
+
+    assert response.get_json()["refreshed"] == ["eligibility"]
+    assert refreshed == [7]
+
+
+@pytest.mark.parametrize("body", [
+    {"fields": {"phone": "1"}},
+    {"row_version": True, "fields": {}},
+    {"row_version": 3, "fields": {"password": "x"}},
+    {"row_version": 3, "fields": {"phone": ["1"]}},
+])
+def test_malformed_patches_are_rejected(client, student, body):
+    assert client.patch("/student/profile", json=body).status_code == 400
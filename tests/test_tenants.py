@@ -0,0 +1,109 @@
+# tests/test_tenants.py
+import json
+import os
+import threading
+
+import pytest
+
+import tenants
+from tenants import Tenant, TenantError, TenantRegistry
+
+BASE = {"host": "localhost", "user": "root", "database": "placement_erp"}
+
+
+def registry(tmp_path, spec):
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps(spec))
+    return TenantRegistry.load(str(path), BASE)
+
+
+@pytest.fixture
+def colleges(tmp_path):
+    return registry(tmp_path, {
+        "base_domain": "Placements.Example.edu.",
+        "default": "main",
+        "tenants": [
+            {"slug": "main", "hosts": ["localhost", "127.0.0.1"]},
+            {"slug": "coep", "database": "placement_erp_coep", "hosts": ["Placements.COEP.edu"],
+             "db": {"host": "10.0.0.12"}},
+        ],
+    })
+
+
+def test_without_a_file_there_is_one_tenant_on_the_base_config(tmp_path):
+    single = TenantRegistry.load(str(tmp_path / "missing.json"), BASE)
+    assert len(single) == 1
+    assert single.resolve("anything.example.com").db_config == BASE
+    assert single.default.path("uploads") == "uploads"
+
+
+@pytest.mark.parametrize("host, slug", [
+    ("localhost", "main"),
+    ("127.0.0.1:5000", "main"),
+    ("placements.coep.edu", "coep"),
+    ("PLACEMENTS.COEP.EDU:443", "coep"),
+    ("coep.placements.example.edu", "coep"),
+    ("nope.placements.example.edu", "main"),
+    ("", "main"),
+    (None, "main"),
+])
+def test_resolve(colleges, host, slug):
+    assert colleges.resolve(host).slug == slug
+
+
+def test_resolve_refuses_unknown_hosts_without_a_default(tmp_path):
+    r = registry(tmp_path, {"tenants": [{"slug": "coep", "hosts": ["placements.coep.edu"]}]})
+    assert r.resolve("placements.coep.edu").slug == "coep"
+    assert r.resolve("localhost") is None
+
+
+def test_ipv6_hosts_keep_their_colons(tmp_path):
+    r = registry(tmp_path, {"tenants": [{"slug": "main", "hosts": ["::1"]}]})
+    assert r.resolve("::1").slug == "main"
+
+
+def test_tenant_db_config_overrides_the_base(colleges):
+    coep = colleges.get("coep")
+    assert coep.db_config == {**BASE, "host": "10.0.0.12", "database": "placement_erp_coep"}
+    assert colleges.get("main").database == "placement_erp"
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"tenants": [{"slug": "Bad Slug"}]}, "invalid tenant slug"),
+    ({"tenants": [{"slug": "a"}, {"slug": "b"}]}, "shares a database"),
+    ({"tenants": []}, "defines no tenants"),
+    ({"default": "x", "tenants": [{"slug": "a"}]}, "default tenant 'x'"),
+])
+def test_malformed_files_are_rejected(tmp_path, spec, message):
+    with pytest.raises(TenantError, match=message):
+        registry(tmp_path, spec)
+
+
+def test_only_non_default_tenants_are_namespaced(colleges):
+    assert colleges.get("main").path("search.sqlite3") == "search.sqlite3"
+    assert colleges.get("coep").path("search.sqlite3") == os.path.join("tenants", "coep", "search.sqlite3")
+    assert colleges.get("coep").lock_name("reparse") == "placement_erp_coep_reparse"
+
+
+def test_use_and_bound_select_the_current_tenant():
+    a, b = Tenant("a", {"database": "a"}), Tenant("b", {"database": "b"})
+    seen = []
+    outer = tenants.current()
+    with tenants.use(a):
+        run = tenants.bound(lambda: seen.append(tenants.current()))
+        with tenants.use(b):
+            assert tenants.current() is b
+        assert tenants.current() is a
+    assert tenants.current() is outer
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert seen == [a]
+
+
+def test_connection_pools_connect_directly_when_disabled():
+    calls = []
+    pools = tenants.ConnectionPools(0, lambda **config: calls.append(config) or "conn")
+    assert pools.connect(Tenant("a", dict(BASE))) == ("conn", False)
+    assert calls == [BASE]
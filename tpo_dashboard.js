@@ -0,0 +1,872 @@
+// ========== UTILITY FUNCTIONS ==========
+
+let studentData = []; // Store student data for export
+let currentExportType = '';
+let selectedColumns = [];
+
+async function fetchData(url, options = {}) {
+    try {
+        const response = await fetch(url, options);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return await response.json();
+    } catch (error) {
+        console.error(`Fetch error for ${url}:`, error);
+        throw error;
+    }
+}
+
+function confirmAction(message) {
+    return confirm(message);
+}
+
+function formatValue(value) {
+    if (value === null || value === undefined || value === '') {
+        return '<span class="empty-data">-</span>';
+    }
+    return value;
+}
+
+function truncateText(text, maxLength = 30) {
+    if (!text) return '-';
+    if (text.length <= maxLength) return text;
+    return text.substring(0, maxLength) + '...';
+}
+
+// ========== COLUMN SELECTION MODAL FUNCTIONS ==========
+
+function openColumnModal(exportType) {
+    currentExportType = exportType;
+    document.getElementById('columnModal').style.display = 'block';
+
+    // Set default selections
+    const defaultColumns = ['student_id', 'first_name', 'last_name', 'department', 'average', 'email'];
+    document.querySelectorAll('input[name="export_columns"]').forEach(checkbox => {
+        checkbox.checked = defaultColumns.includes(checkbox.value);
+    });
+
+    updateSelectedCount();
+    updateExportFormat('Excel');
+}
+
+function closeColumnModal() {
+    document.getElementById('columnModal').style.display = 'none';
+    currentExportType = '';
+}
+
+function updateSelectedCount() {
+    const selected = document.querySelectorAll('input[name="export_columns"]:checked').length;
+    document.getElementById('selectedCount').textContent = selected;
+}
+
+function updateExportFormat(format) {
+    document.getElementById('exportFormat').textContent = format;
+}
+
+function selectAllColumns() {
+    document.querySelectorAll('input[name="export_columns"]').forEach(checkbox => {
+        checkbox.checked = true;
+    });
+    updateSelectedCount();
+}
+
+function deselectAllColumns() {
+    document.querySelectorAll('input[name="export_columns"]').forEach(checkbox => {
+        checkbox.checked = false;
+    });
+    updateSelectedCount();
+}
+
+function selectPersonalInfo() {
+    deselectAllColumns();
+    const personalColumns = ['student_id', 'first_name', 'last_name', 'roll_no', 'prn_no', 'dob', 'gender'];
+    document.querySelectorAll('input[name="export_columns"]').forEach(checkbox => {
+        if (personalColumns.includes(checkbox.value)) {
+            checkbox.checked = true;
+        }
+    });
+    updateSelectedCount();
+}
+
+function selectAcademicInfo() {
+    deselectAllColumns();
+    const academicColumns = ['student_id', 'first_name', 'last_name', 'department', 'average', 'live_backlogs', 'tenth_percentage', 'twelfth_percentage'];
+    document.querySelectorAll('input[name="export_columns"]').forEach(checkbox => {
+        if (academicColumns.includes(checkbox.value)) {
+            checkbox.checked = true;
+        }
+    });
+    updateSelectedCount();
+}
+
+function selectContactInfo() {
+    deselectAllColumns();
+    const contactColumns = ['student_id', 'first_name', 'last_name', 'email', 'phone', 'linkedin_url', 'github_url'];
+    document.querySelectorAll('input[name="export_columns"]').forEach(checkbox => {
+        if (contactColumns.includes(checkbox.value)) {
+            checkbox.checked = true;
+        }
+    });
+    updateSelectedCount();
+}
+
+// Add event listeners to update count when checkboxes change
+document.addEventListener('DOMContentLoaded', function() {
+    document.addEventListener('change', function(e) {
+        if (e.target.name === 'export_columns') {
+            updateSelectedCount();
+        }
+    });
+});
+
+function proceedWithSelectedColumns() {
+    selectedColumns = Array.from(document.querySelectorAll('input[name="export_columns"]:checked'))
+        .map(checkbox => checkbox.value);
+
+    if (selectedColumns.length === 0) {
+        alert('Please select at least one column to export.');
+        return;
+    }
+
+    const exportType = document.querySelector('input[name="export_type"]:checked').value;
+
+    closeColumnModal();
+
+    if (exportType === 'excel') {
+        exportCustomExcel();
+    } else if (exportType === 'pdf') {
+        exportCustomPDF();
+    }
+}
+
+// ========== QUICK EXPORT PRESETS ==========
+
+const exportPresets = {
+    basic: ['student_id', 'first_name', 'last_name', 'department', 'average', 'email', 'phone'],
+    academic: ['student_id', 'first_name', 'last_name', 'department', 'average', 'live_backlogs', 'tenth_percentage', 'twelfth_percentage', 'engg_passing_year'],
+    contact: ['student_id', 'first_name', 'last_name', 'email', 'phone', 'linkedin_url', 'github_url'],
+    technical: ['student_id', 'first_name', 'last_name', 'programming_languages', 'academic_projects', 'certificates', 'department', 'average'],
+    placement: ['student_id', 'first_name', 'last_name', 'department', 'average', 'email', 'phone', 'programming_languages', 'academic_projects', 'resume_path']
+};
+
+function exportBasicInfo() {
+    selectedColumns = exportPresets.basic;
+    exportCustomExcel();
+}
+
+function exportAcademicInfo() {
+    selectedColumns = exportPresets.academic;
+    exportCustomExcel();
+}
+
+function exportContactInfo() {
+    selectedColumns = exportPresets.contact;
+    exportCustomExcel();
+}
+
+function exportFullTechnical() {
+    selectedColumns = exportPresets.technical;
+    exportCustomExcel();
+}
+
+function exportForPlacement() {
+    selectedColumns = exportPresets.placement;
+    exportCustomExcel();
+}
+
+// ========== CUSTOM EXPORT FUNCTIONALITY ==========
+
+/**
+ * Export selected columns to Excel
+ */
+function exportCustomExcel() {
+    if (studentData.length === 0) {
+        alert('No data available to export');
+        return;
+    }
+
+    try {
+        const columnMapping = {
+            'student_id': 'Student ID',
+            'first_name': 'First Name',
+            'last_name': 'Last Name',
+            'roll_no': 'Roll No',
+            'prn_no': 'PRN No',
+            'dob': 'Date of Birth',
+            'gender': 'Gender',
+            'phone': 'Phone',
+            'email': 'Email',
+            'department': 'Department',
+            'average': 'Average %',
+            'live_backlogs': 'Live Backlogs',
+            'year_gap': 'Year Gap',
+            'engg_passing_year': 'Passing Year',
+            'tenth_percentage': '10th Percentage',
+            'tenth_year': '10th Year',
+            'tenth_board': '10th Board',
+            'twelfth_percentage': '12th Percentage',
+            'twelfth_year': '12th Year',
+            'twelfth_board': '12th Board',
+            'diploma_percentage': 'Diploma Percentage',
+            'diploma_year': 'Diploma Year',
+            'diploma_branch': 'Diploma Branch',
+            'sem1': 'SEM 1 GPA',
+            'sem2': 'SEM 2 GPA',
+            'sem3': 'SEM 3 GPA',
+            'sem4': 'SEM 4 GPA',
+            'sem5': 'SEM 5 GPA',
+            'sem6': 'SEM 6 GPA',
+            'sem7': 'SEM 7 GPA',
+            'sem8': 'SEM 8 GPA',
+            'programming_languages': 'Programming Languages',
+            'academic_projects': 'Academic Projects',
+            'certificates': 'Certificates',
+            'extracurricular': 'Extracurricular',
+            'hobbies': 'Hobbies',
+            'linkedin_url': 'LinkedIn URL',
+            'github_url': 'GitHub URL',
+            'local_address': 'Local Address',
+            'permanent_address': 'Permanent Address',
+            'native_place': 'Native Place',
+            'resume_path': 'Resume Available',
+            'created_at': 'Created At',
+            'last_updated': 'Last Updated'
+        };
+
+        const excelData = studentData.map(student => {
+            const row = {};
+            selectedColumns.forEach(col => {
+                const displayName = columnMapping[col] || col;
+                if (col === 'resume_path') {
+                    row[displayName] = student[col] ? 'Yes' : 'No';
+                } else {
+                    row[displayName] = student[col] || '';
+                }
+            });
+            return row;
+        });
+
+        const ws = XLSX.utils.json_to_sheet(excelData);
+        const wb = XLSX.utils.book_new();
+        XLSX.utils.book_append_sheet(wb, ws, 'Selected Student Data');
+
+        const currentDate = new Date().toISOString().split('T')[0];
+        XLSX.writeFile(wb, `student_selected_data_${currentDate}.xlsx`);
+
+        alert(`✅ Downloaded ${selectedColumns.length} columns for ${studentData.length} students!`);
+
+    } catch (error) {
+        console.error('Error exporting custom Excel:', error);
+        alert('Error exporting to Excel: ' + error.message);
+    }
+}
+
+/**
+ * Export selected columns to PDF
+ */
+function exportCustomPDF() {
+    if (studentData.length === 0) {
+        alert('No data available to export');
+        return;
+    }
+
+    try {
+        const { jsPDF } = window.jspdf;
+        const doc = new jsPDF('landscape');
+
+        const columnMapping = {
+            'student_id': 'ID',
+            'first_name': 'First Name',
+            'last_name': 'Last Name',
+            'roll_no': 'Roll No',
+            'prn_no': 'PRN No',
+            'email': 'Email',
+            'phone': 'Phone',
+            'department': 'Department',
+            'average': 'Avg %',
+            'live_backlogs': 'Backlogs',
+            'tenth_percentage': '10th %',
+            'twelfth_percentage': '12th %',
+            'engg_passing_year': 'Pass Year',
+            'programming_languages': 'Programming',
+            'academic_projects': 'Projects',
+            'certificates': 'Certificates',
+            'linkedin_url': 'LinkedIn',
+            'github_url': 'GitHub',
+            'resume_path': 'Resume'
+        };
+
+        const tableHeaders = selectedColumns.map(col => columnMapping[col] || col);
+        const tableData = studentData.map(student => 
+            selectedColumns.map(col => {
+                if (col === 'resume_path') {
+                    return student[col] ? 'Yes' : 'No';
+                }
+                return truncateText(student[col] || '', 15);
+            })
+        );
+
+        doc.text(`Custom Student Data - ${new Date().toISOString().split('T')[0]}`, 14, 15);
+        doc.text(`Selected ${selectedColumns.length} columns for ${studentData.length} students`, 14, 22);
+
+        doc.autoTable({
+            head: [tableHeaders],
+            body: tableData,
+            startY: 30,
+            styles: { fontSize: 7 },
+            headStyles: { fillColor: [0, 170, 255] },
+            margin: { top: 30 }
+        });
+
+        doc.save(`student_custom_data_${new Date().toISOString().split('T')[0]}.pdf`);
+
+        alert(`✅ Downloaded ${selectedColumns.length} columns for ${studentData.length} students as PDF!`);
+
+    } catch (error) {
+        console.error('Error exporting custom PDF:', error);
+        alert('Error exporting to PDF: ' + error.message);
+    }
+}
+
+// ========== EXISTING EXPORT FUNCTIONALITY ==========
+
+/**
+ * Export table data to Excel
+ */
+function exportToExcel() {
+    if (studentData.length === 0) {
+        alert('No data available to export');
+        return;
+    }
+
+    try {
+        // Prepare data for Excel with ALL attributes
+        const excelData = studentData.map(student => ({
+            'Student ID': student.student_id || '',
+            'First Name': student.first_name || '',
+            'Last Name': student.last_name || '',
+            'Roll No': student.roll_no || '',
+            'PRN No': student.prn_no || '',
+            'Date of Birth': student.dob || '',
+            'Gender': student.gender || '',
+            'Phone': student.phone || '',
+            'Email': student.email || '',
+            '10th Percentage': student.tenth_percentage || '',
+            '10th Year': student.tenth_year || '',
+            '10th Board': student.tenth_board || '',
+            '12th Percentage': student.twelfth_percentage || '',
+            '12th Year': student.twelfth_year || '',
+            '12th Board': student.twelfth_board || '',
+            'Diploma Percentage': student.diploma_percentage || '',
+            'Diploma Year': student.diploma_year || '',
+            'Diploma Branch': student.diploma_branch || '',
+            'Department': student.department || '',
+            'Passing Year': student.engg_passing_year || '',
+            'Average %': student.average || '',
+            'Live Backlogs': student.live_backlogs || '',
+            'Year Gap': student.year_gap || '',
+            'SEM 1 GPA': student.sem1 || '',
+            'SEM 2 GPA': student.sem2 || '',
+            'SEM 3 GPA': student.sem3 || '',
+            'SEM 4 GPA': student.sem4 || '',
+            'SEM 5 GPA': student.sem5 || '',
+            'SEM 6 GPA': student.sem6 || '',
+            'SEM 7 GPA': student.sem7 || '',
+            'SEM 8 GPA': student.sem8 || '',
+            'Programming Languages': student.programming_languages || '',
+            'Academic Projects': student.academic_projects || '',
+            'Certificates': student.certificates || '',
+            'Extracurricular': student.extracurricular || '',
+            'Hobbies': student.hobbies || '',
+            'LinkedIn': student.linkedin_url || '',
+            'GitHub': student.github_url || '',
+            'Local Address': student.local_address || '',
+            'Permanent Address': student.permanent_address || '',
+            'Native Place': student.native_place || '',
+            'Resume Available': student.resume_path ? 'Yes' : 'No',
+            'Created At': student.created_at || '',
+            'Last Updated': student.last_updated || ''
+        }));
+
+        // Create worksheet
+        const ws = XLSX.utils.json_to_sheet(excelData);
+
+        // Create workbook
+        const wb = XLSX.utils.book_new();
+        XLSX.utils.book_append_sheet(wb, ws, 'Student Complete Data');
+
+        // Generate Excel file and download
+        const currentDate = new Date().toISOString().split('T')[0];
+        XLSX.writeFile(wb, `student_complete_database_${currentDate}.xlsx`);
+
+    } catch (error) {
+        console.error('Error exporting to Excel:', error);
+        alert('Error exporting to Excel: ' + error.message);
+    }
+}
+
+/**
+ * Export table data to PDF
+ */
+function exportToPDF() {
+    if (studentData.length === 0) {
+        alert('No data available to export');
+        return;
+    }
+
+    try {
+        const { jsPDF } = window.jspdf;
+        const doc = new jsPDF('landscape');
+
+        // Add title
+        const currentDate = new Date().toISOString().split('T')[0];
+        doc.text(`Complete Student Database - ${currentDate}`, 14, 15);
+
+        // Prepare table data for PDF with key attributes
+        const tableData = studentData.map(student => [
+            student.student_id || '',
+            truncateText(student.first_name || ''),
+            truncateText(student.last_name || ''),
+            student.roll_no || '',
+            student.prn_no || '',
+            student.dob || '',
+            student.gender || '',
+            student.phone || '',
+            truncateText(student.email || ''),
+            student.tenth_percentage || '',
+            student.twelfth_percentage || '',
+            student.department || '',
+            student.average ? student.average + '%' : '',
+            student.live_backlogs || '',
+            student.resume_path ? 'Yes' : 'No'
+        ]);
+
+        // Define table columns
+        const tableHeaders = [
+            'ID', 'First Name', 'Last Name', 'Roll No', 'PRN No', 'DOB', 
+            'Gender', 'Phone', 'Email', '10th %', '12th %', 'Department', 
+            'Average %', 'Backlogs', 'Resume'
+        ];
+
+        // Create table
+        doc.autoTable({
+            head: [tableHeaders],
+            body: tableData,
+            startY: 20,
+            styles: { fontSize: 6 },
+            headStyles: { fillColor: [0, 170, 255] }
+        });
+
+        // Save PDF
+        doc.save(`student_database_${currentDate}.pdf`);
+
+    } catch (error) {
+        console.error('Error exporting to PDF:', error);
+        alert('Error exporting to PDF: ' + error.message);
+    }
+}
+
+// ========== STUDENT DATABASE TABLE MANAGEMENT ==========
+
+/**
+ * Load and display ALL student records from database
+ */
+async function loadStudentProfiles(preloaded) {
+    try {
+        const data = preloaded || await fetchData("/all_student_profiles");
+        studentData = data; // Store data for export
+        const tableBody = document.getElementById('studentTableBody');
+
+        let html = "";
+        if (data.length === 0) {
+            html = `<tr>
+                <td colspan="42" style="text-align: center; padding: 20px;">
+                    No student records found in database.
+                </td>
+            </tr>`;
+        } else {
+            // Create rows with ALL attributes
+            data.forEach(student => {
+                html += `
+                    <tr>
+                        <!-- Personal Information -->
+                        <td>${formatValue(student.student_id)}</td>
+                        <td>${formatValue(student.first_name)}</td>
+                        <td>${formatValue(student.last_name)}</td>
+                        <td>${formatValue(student.roll_no)}</td>
+                        <td>${formatValue(student.prn_no)}</td>
+                        <td>${formatValue(student.dob)}</td>
+                        <td>${formatValue(student.gender)}</td>
+                        <td>${formatValue(student.phone)}</td>
+                        <td title="${student.email || ''}">${truncateText(student.email)}</td>
+
+                        <!-- 10th Grade -->
+                        <td>${formatValue(student.tenth_percentage)}</td>
+                        <td>${formatValue(student.tenth_year)}</td>
+                        <td>${formatValue(student.tenth_board)}</td>
+
+                        <!-- 12th Grade -->
+                        <td>${formatValue(student.twelfth_percentage)}</td>
+                        <td>${formatValue(student.twelfth_year)}</td>
+                        <td>${formatValue(student.twelfth_board)}</td>
+
+                        <!-- Diploma -->
+                        <td>${formatValue(student.diploma_percentage)}</td>
+                        <td>${formatValue(student.diploma_year)}</td>
+                        <td>${formatValue(student.diploma_branch)}</td>
+
+                        <!-- Engineering -->
+                        <td>${formatValue(student.department)}</td>
+                        <td>${formatValue(student.engg_passing_year)}</td>
+                        <td>${formatValue(student.average)}</td>
+                        <td>${formatValue(student.live_backlogs)}</td>
+                        <td>${formatValue(student.year_gap)}</td>
+
+                        <!-- Semester GPA -->
+                        <td>${formatValue(student.sem1)}</td>
+                        <td>${formatValue(student.sem2)}</td>
+                        <td>${formatValue(student.sem3)}</td>
+                        <td>${formatValue(student.sem4)}</td>
+                        <td>${formatValue(student.sem5)}</td>
+                        <td>${formatValue(student.sem6)}</td>
+                        <td>${formatValue(student.sem7)}</td>
+                        <td>${formatValue(student.sem8)}</td>
+
+                        <!-- Skills & Projects -->
+                        <td title="${student.programming_languages || ''}">${truncateText(student.programming_languages)}</td>
+                        <td title="${student.academic_projects || ''}">${truncateText(student.academic_projects)}</td>
+                        <td title="${student.certificates || ''}">${truncateText(student.certificates)}</td>
+                        <td title="${student.extracurricular || ''}">${truncateText(student.extracurricular)}</td>
+                        <td title="${student.hobbies || ''}">${truncateText(student.hobbies)}</td>
+
+                        <!-- Online Presence -->
+                        <td title="${student.linkedin_url || ''}">${truncateText(student.linkedin_url)}</td>
+                        <td title="${student.github_url || ''}">${truncateText(student.github_url)}</td>
+
+                        <!-- Address -->
+                        <td title="${student.local_address || ''}">${truncateText(student.local_address)}</td>
+                        <td title="${student.permanent_address || ''}">${truncateText(student.permanent_address)}</td>
+                        <td>${formatValue(student.native_place)}</td>
+
+                        <!-- System Info -->
+                        <td>${student.resume_path ? '✅' : '❌'}</td>
+                        <td>${formatValue(student.created_at)}</td>
+                        <td>${formatValue(student.last_updated)}</td>
+
+                        <!-- Actions -->
+                        <td>
+                            <button onclick="viewFullProfile(${student.student_id})" class="view-btn" title="View Full Profile">View</button>
+                            <button onclick="viewResume('${student.resume_path}')" class="view-btn" title="View Resume">Resume</button>
+                            <button onclick="deleteStudent(${student.student_id})" class="delete-btn" title="Delete Student">Delete</button>
+                        </td>
+                    </tr>`;
+            });
+        }
+        tableBody.innerHTML = html;
+    } catch (error) {
+        console.error('Error loading student profiles:', error);
+        document.getElementById('studentTableBody').innerHTML = 
+            `<tr>
+                <td colspan="42" style="text-align: center; padding: 20px; color: red;">
+                    Error loading student records: ${error.message}
+                </td>
+            </tr>`;
+    }
+}
+
+/**
+ * View full student profile in modal
+ */
+async function viewFullProfile(studentId) {
+    try {
+        const student = await fetchData(`/get_student_profile/${studentId}`);
+        const modal = document.getElementById('profileModal');
+        const content = document.getElementById('modalContent');
+
+        content.innerHTML = `
+            <h3>Complete Profile - ${student.first_name || ''} ${student.last_name || ''}</h3>
+            <div class="profile-details">
+
+                <div class="profile-section">
+                    <h4>Personal Information</h4>
+                    <p><strong>Student ID:</strong> ${student.student_id || 'N/A'}</p>
+                    <p><strong>Name:</strong> ${student.first_name || ''} ${student.last_name || ''}</p>
+                    <p><strong>Roll No:</strong> ${student.roll_no || 'N/A'}</p>
+                    <p><strong>PRN No:</strong> ${student.prn_no || 'N/A'}</p>
+                    <p><strong>Date of Birth:</strong> ${student.dob || 'N/A'}</p>
+                    <p><strong>Gender:</strong> ${student.gender || 'N/A'}</p>
+                    <p><strong>Email:</strong> ${student.email || 'N/A'}</p>
+                    <p><strong>Phone:</strong> ${student.phone || 'N/A'}</p>
+                </div>
+
+                <div class="profile-section">
+                    <h4>Academic Information</h4>
+                    <p><strong>10th Percentage:</strong> ${student.tenth_percentage || 'N/A'}%</p>
+                    <p><strong>10th Year:</strong> ${student.tenth_year || 'N/A'}</p>
+                    <p><strong>10th Board:</strong> ${student.tenth_board || 'N/A'}</p>
+                    <p><strong>12th Percentage:</strong> ${student.twelfth_percentage || 'N/A'}%</p>
+                    <p><strong>12th Year:</strong> ${student.twelfth_year || 'N/A'}</p>
+                    <p><strong>12th Board:</strong> ${student.twelfth_board || 'N/A'}</p>
+                    <p><strong>Diploma Percentage:</strong> ${student.diploma_percentage || 'N/A'}%</p>
+                    <p><strong>Diploma Year:</strong> ${student.diploma_year || 'N/A'}</p>
+                    <p><strong>Diploma Branch:</strong> ${student.diploma_branch || 'N/A'}</p>
+                </div>
+
+                <div class="profile-section">
+                    <h4>Engineering Details</h4>
+                    <p><strong>Department:</strong> ${student.department || 'N/A'}</p>
+                    <p><strong>Passing Year:</strong> ${student.engg_passing_year || 'N/A'}</p>
+                    <p><strong>Average %:</strong> ${student.average || 'N/A'}%</p>
+                    <p><strong>Live Backlogs:</strong> ${student.live_backlogs || '0'}</p>
+                    <p><strong>Year Gap:</strong> ${student.year_gap || '0'}</p>
+                </div>
+
+                <div class="profile-section">
+                    <h4>Semester-wise GPA</h4>
+                    <p><strong>SEM 1:</strong> ${student.sem1 || 'N/A'}</p>
+                    <p><strong>SEM 2:</strong> ${student.sem2 || 'N/A'}</p>
+                    <p><strong>SEM 3:</strong> ${student.sem3 || 'N/A'}</p>
+                    <p><strong>SEM 4:</strong> ${student.sem4 || 'N/A'}</p>
+                    <p><strong>SEM 5:</strong> ${student.sem5 || 'N/A'}</p>
+                    <p><strong>SEM 6:</strong> ${student.sem6 || 'N/A'}</p>
+                    <p><strong>SEM 7:</strong> ${student.sem7 || 'N/A'}</p>
+                    <p><strong>SEM 8:</strong> ${student.sem8 || 'N/A'}</p>
+                </div>
+
+                <div class="profile-section">
+                    <h4>Skills & Projects</h4>
+                    <p><strong>Programming Languages:</strong> ${student.programming_languages || 'N/A'}</p>
+                    <p><strong>Academic Projects:</strong> ${student.academic_projects || 'N/A'}</p>
+                    <p><strong>Certificates:</strong> ${student.certificates || 'N/A'}</p>
+                    <p><strong>Extracurricular:</strong> ${student.extracurricular || 'N/A'}</p>
+                    <p><strong>Hobbies:</strong> ${student.hobbies || 'N/A'}</p>
+                </div>
+
+                <div class="profile-section">
+                    <h4>Online Presence & Address</h4>
+                    <p><strong>LinkedIn:</strong> ${student.linkedin_url || 'N/A'}</p>
+                    <p><strong>GitHub:</strong> ${student.github_url || 'N/A'}</p>
+                    <p><strong>Local Address:</strong> ${student.local_address || 'N/A'}</p>
+                    <p><strong>Permanent Address:</strong> ${student.permanent_address || 'N/A'}</p>
+                    <p><strong>Native Place:</strong> ${student.native_place || 'N/A'}</p>
+                </div>
+
+            </div>
+        `;
+
+        modal.style.display = 'block';
+    } catch (error) {
+        console.error('Error loading full profile:', error);
+        alert('Failed to load student profile');
+    }
+}
+
+function viewResume(resumePath) {
+    if (resumePath) {
+        window.open(`/download_resume/${resumePath}`, '_blank');
+    } else {
+        alert('No resume available for this student.');
+    }
+}
+
+async function deleteStudent(studentId) {
+    if (!confirmAction("Are you sure you want to delete this student and all their profile data?")) return;
+
+    try {
+        const data = await fetchData(`/delete_student/${studentId}`, { method: "POST" });
+        alert(data.message);
+        loadStudentProfiles();
+    } catch (error) {
+        console.error("Error deleting student:", error);
+        alert("Failed to delete student");
+    }
+}
+
+// ========== RESOURCE MANAGEMENT ==========
+
+async function loadResources(preloaded) {
+    try {
+        const data = preloaded || await fetchData("/all_resources");
+        const resourceList = document.querySelector(".resource-list");
+
+        let html = "";
+        if (data.length === 0) {
+            html = "<li>No resources available.</li>";
+        } else {
+            data.forEach(resource => {
+                html += `<li>
+                    <strong>${resource.title}</strong> - ${resource.description || 'No description'} 
+                    <a href="/download_resource/${resource.file_path}" target="_blank">Download</a> | 
+                    <button onclick="deleteResource(${resource.resource_id})" class="delete-btn">Delete</button>
+                </li>`;
+            });
+        }
+        resourceList.innerHTML = html;
+    } catch (error) {
+        console.error('Error loading resources:', error);
+        document.querySelector(".resource-list").innerHTML = '<li>Error loading resources</li>';
+    }
+}
+
+async function deleteResource(resourceId) {
+    if (!confirmAction("Are you sure you want to delete this resource?")) return;
+
+    try {
+        const data = await fetchData(`/delete_resource/${resourceId}`, { method: "POST" });
+        alert(data.message);
+        loadResources();
+    } catch (error) {
+        console.error("Error deleting resource:", error);
+        alert("Failed to delete resource");
+    }
+}
+
+// ========== APPLICATION MANAGEMENT ==========
+
+async function loadApplications(preloaded) {
+    try {
+        const data = preloaded || await fetchData("/all_applications");
+        const applicationList = document.querySelector(".application-list");
+
+        let html = "";
+        if (data.length === 0) {
+            html = "<li>No applications available.</li>";
+        } else {
+            data.forEach(app => {
+                const statusColor = app.status === 'accepted' ? 'green' : 
+                                  app.status === 'rejected' ? 'red' : 'orange';
+
+                html += `<li>
+                    <strong>${app.student_name}</strong> (${app.student_email}) applied for <strong>${app.job_title}</strong><br>
+                    Status: <span style="color: ${statusColor}">${app.status || 'Applied'}</span> | 
+                    Applied: ${new Date(app.applied_date).toLocaleDateString()}
+                </li>`;
+            });
+        }
+        applicationList.innerHTML = html;
+    } catch (error) {
+        console.error('Error loading applications:', error);
+        document.querySelector(".application-list").innerHTML = '<li>Error loading applications</li>';
+    }
+}
+
+// ========== AUDIT LOG ==========
+
+let auditNextCursor = null;
+
+function auditQuery(after) {
+    const params = new URLSearchParams();
+    new FormData(document.getElementById("auditFilterForm")).forEach((value, key) => {
+        if (value) params.set(key, value);
+    });
+    if (after) params.set("after", after);
+    return params.toString();
+}
+
+function formatAuditDetails(details) {
+    if (!details) return formatValue(null);
+    return Object.entries(details)
+        .map(([key, value]) => `${key}: ${Array.isArray(value) ? value.join(", ") : value}`)
+        .join("<br>");
+}
+
+async function loadAuditLog(after) {
+    const body = document.getElementById("auditLogBody");
+    const more = document.getElementById("auditLoadMore");
+    try {
+        const response = await fetch(`/audit_log?${auditQuery(after)}`);
+        const data = await response.json();
+        if (!response.ok) {
+            throw new Error(data.error || `HTTP error! status: ${response.status}`);
+        }
+        auditNextCursor = response.headers.get("X-Next-Cursor");
+        more.style.display = auditNextCursor ? "" : "none";
+
+        if (!after && data.length === 0) {
+            body.innerHTML = '<tr><td colspan="5">No audit events in this range.</td></tr>';
+            return;
+        }
+        let html = "";
+        data.forEach(event => {
+            html += `<tr>
+                <td>${new Date(event.occurred_at).toLocaleString()}</td>
+                <td>${formatValue(event.actor_role)} ${formatValue(event.actor_id)}</td>
+                <td>${event.action}</td>
+                <td>${event.target_type} ${formatValue(event.target_id)}</td>
+                <td>${formatAuditDetails(event.details)}</td>
+            </tr>`;
+        });
+        if (after) {
+            body.insertAdjacentHTML("beforeend", html);
+        } else {
+            body.innerHTML = html;
+        }
+    } catch (error) {
+        console.error('Error loading audit log:', error);
+        more.style.display = "none";
+        body.innerHTML = `<tr><td colspan="5">Error loading audit log: ${error.message}</td></tr>`;
+    }
+}
+
+document.addEventListener("DOMContentLoaded", function() {
+    document.getElementById("auditFilterForm").addEventListener("submit", function(event) {
+        event.preventDefault();
+        loadAuditLog();
+    });
+    document.getElementById("auditLoadMore").addEventListener("click", () => loadAuditLog(auditNextCursor));
+    loadAuditLog();
+});
+
+// ========== MODAL MANAGEMENT ==========
+
+function closeModal() {
+    document.getElementById('profileModal').style.display = 'none';
+}
+
+window.onclick = function(event) {
+    const modal = document.getElementById('profileModal');
+    if (event.target === modal) {
+        closeModal();
+    }
+    const columnModal = document.getElementById('columnModal');
+    if (event.target === columnModal) {
+        closeColumnModal();
+    }
+}
+
+// ========== INITIALIZATION ==========
+
+function reportFirstRender(mode) {
+    const ms = performance.now();
+    console.log(`Dashboard first render (${mode}): ${ms.toFixed(0)} ms`);
+    if (navigator.sendBeacon) {
+        navigator.sendBeacon("/rum", JSON.stringify({ page: "tpo", mode: mode, ms: ms }));
+    }
+}
+
+async function initializeDashboard() {
+    // One bootstrap request for every widget; ?fanout=1 keeps the old per-widget requests
+    if (new URLSearchParams(window.location.search).has("fanout")) {
+        await Promise.all([loadStudentProfiles(), loadApplications(), loadResources()]);
+        reportFirstRender("fanout");
+        return;
+    }
+    try {
+        const data = await fetchData("/dashboard_bootstrap?fields=students,applications,resources");
+        const failed = data.errors || {};
+        await Promise.all([
+            failed.students ? loadStudentProfiles() : loadStudentProfiles(data.students),
+            failed.applications ? loadApplications() : loadApplications(data.applications),
+            failed.resources ? loadResources() : loadResources(data.resources)
+        ]);
+        reportFirstRender("bootstrap");
+    } catch (error) {
+        console.error('Error loading dashboard bootstrap:', error);
+        loadStudentProfiles();
+        loadApplications();
+        loadResources();
+    }
+}
+
+document.addEventListener("DOMContentLoaded", initializeDashboard);